@@ -10,6 +10,7 @@ from starlette.routing import Route
 # Import the MCP server instance from existing server
 from server import mcp
 from src.logging_config import get_logger, log_mcp_message
+from src.services.prewarm import create_prewarm_scheduler
 
 # Load environment variables
 load_dotenv()
@@ -109,6 +110,16 @@ if __name__ == "__main__":
         # Insert all routes at the beginning
         app.router.routes = health_routes + app.router.routes
 
+        # Prewarm the patient cache from clinic schedules while the server runs
+        prewarm = create_prewarm_scheduler()
+        if prewarm is not None:
+            app.router.lifespan_context = prewarm.lifespan(app.router.lifespan_context)
+            log_mcp_message(
+                mcp,
+                "info",
+                f"Cache prewarming enabled for {len(prewarm.clinics)} clinics",
+            )
+
         # Root path is handled by uvicorn, not the app directly
         if root_path:
             log_mcp_message(
@@ -0,0 +1,47 @@
+"""Vista API MCP Server - Cache prewarm worker
+
+Reads the schedules of the PREWARM_CLINICS and loads patients with upcoming
+appointments into the shared patient cache, outside the MCP server process.
+Only useful with a cache backend the server shares (Redis, DynamoDB).
+
+Usage:
+    python prewarm_worker.py [--once]
+"""
+
+import asyncio
+import json
+import sys
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from src.logging_config import get_logger  # noqa: E402
+from src.services.prewarm import create_prewarm_scheduler  # noqa: E402
+
+logger = get_logger("mcp-prewarm-worker")
+
+
+async def main(once: bool) -> None:
+    scheduler = create_prewarm_scheduler()
+    if scheduler is None:
+        print("Prewarming is off: set PREWARM_ENABLED=true and PREWARM_CLINICS")
+        sys.exit(1)
+
+    try:
+        if once:
+            await scheduler.run_cycle()
+            print(json.dumps(scheduler.get_stats(), indent=2))
+        else:
+            logger.info(f"Prewarming {len(scheduler.clinics)} clinics")
+            await scheduler.run()
+    finally:
+        await scheduler.vista_client.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(once="--once" in sys.argv[1:]))
+    except KeyboardInterrupt:
+        print("\nPrewarm worker stopped by user")
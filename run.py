@@ -752,6 +752,14 @@ def run_http():
     run_command([python_exe, "http_server.py"], env=env)
 
 
+def run_prewarm():
+    """Run the cache prewarm worker"""
+    print("🔥 Starting cache prewarm worker...")
+
+    python_exe = get_python_exe()
+    run_command([python_exe, "prewarm_worker.py", *sys.argv[2:]])
+
+
 def run_http_with_mock():
     """Run HTTP server with mock"""
     # Ensure Podman machine is running on Windows
@@ -934,6 +942,7 @@ Commands:
   logs                     - View mock server logs
   http                     - Run HTTP server only (no stdio)
   http-with-mock           - Run HTTP server with mock Vista API
+  prewarm                  - Run the cache prewarm worker (--once for one cycle)
   check-windows            - Check Windows development requirements
   help                     - Show this help message
 
@@ -972,6 +981,7 @@ def main():
         "logs": run_logs,
         "http": run_http,
         "http-with-mock": run_http_with_mock,
+        "prewarm": run_prewarm,
         "check-windows": check_windows,
         "help": show_help,
     }
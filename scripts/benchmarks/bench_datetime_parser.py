@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark VistA datetime parsing
+
+Collects the timestamps of the mock server's VPR record (or another VPR JSON
+file) - FileMan-style integers as the parser sees them, and ISO strings as
+cache rehydration sees them - and reports the time per value of the regex
+path, the digit fast path, memoized parse_datetime and the parse_datetimes
+column API.
+
+Usage:
+    python scripts/benchmarks/bench_datetime_parser.py [vpr_json_file]
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parsers.patient.datetime_parser import (  # noqa: E402
+    _parse_text,
+    _parse_value,
+    parse_datetime,
+    parse_datetimes,
+)
+
+DEFAULT_RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+REPEAT = 20
+
+
+def timestamps(data: Any) -> list[int]:
+    """Integer values of the record shaped like YYYYMMDD[HHMM[SS]]"""
+    found: list[int] = []
+    if isinstance(data, dict):
+        for value in data.values():
+            found.extend(timestamps(value))
+    elif isinstance(data, list):
+        for value in data:
+            found.extend(timestamps(value))
+    elif type(data) is int and len(str(data)) in (8, 12, 14) and data > 19000000:
+        try:
+            _parse_text(str(data))
+        except ValueError:
+            return found  # an identifier, not a date
+        found.append(data)
+    return found
+
+
+def ns_per_value(
+    parse: Callable[[list[Any]], Any], values: list[Any], warm: bool
+) -> float:
+    """Mean nanoseconds per value, memo cleared before each pass unless warm"""
+    elapsed = 0.0
+    for _ in range(REPEAT):
+        if not warm:
+            _parse_value.cache_clear()
+        start = time.perf_counter()
+        parse(values)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1e9 / REPEAT / len(values)
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORD
+    numbers = timestamps(json.loads(path.read_text()))
+    iso = [
+        parsed.isoformat()
+        for parsed in parse_datetimes(numbers)
+        if isinstance(parsed, datetime)
+    ]
+    unparsed = _parse_value.__wrapped__
+
+    methods: list[tuple[str, Callable[[list[Any]], Any], bool]] = [
+        ("regex", lambda values: [_parse_text(str(v).strip()) for v in values], False),
+        ("digit fast path", lambda values: [unparsed(v) for v in values], False),
+        ("parse_datetime", lambda values: [parse_datetime(v) for v in values], False),
+        ("parse_datetimes", parse_datetimes, False),
+        ("warm memo", lambda values: [parse_datetime(v) for v in values], True),
+    ]
+    workloads = [("VPR integers", numbers), ("ISO strings", iso)]
+
+    for name, values in workloads:
+        print(f"{name}: {len(values)} values, {len(set(values))} distinct")
+    print(f"\n{'ns per value':<18}" + "".join(f"{name:>15}" for name, _ in workloads))
+    for method, parse, warm in methods:
+        print(
+            f"{method:<18}"
+            + "".join(
+                f"{ns_per_value(parse, values, warm):>15.0f}" for _, values in workloads
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
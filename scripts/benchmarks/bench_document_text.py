@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark caching document text bodies out of line
+
+Writes a synthetic patient to an in-memory patient cache the way a VistA
+fetch does, with document text inline and out of line, and reports the size
+of the patient entry and the time to serialize it and to rehydrate it (what
+every cached tool call pays), plus loading the text of one page of documents.
+
+Usage:
+    python scripts/benchmarks/bench_document_text.py [documents] [words_per_note]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import (  # noqa: E402
+    ICN,
+    STATION,
+    build_collection,
+    build_documents,
+)
+
+import src.services.data.patient_data as patient_data  # noqa: E402
+from src.models.patient.document import Document  # noqa: E402
+from src.services.cache.base import PatientDataCache  # noqa: E402
+from src.services.cache.memory import MemoryCacheBackend  # noqa: E402
+
+REPEAT = 20
+PAGE = 10
+DUZ = "10000000219"
+
+
+def timed(work) -> float:
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        work()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+async def measure(out_of_line: bool, documents: int, words: int) -> dict[str, float]:
+    collection = build_collection(vitals=100, labs=200)
+    collection.documents_dict = build_documents(documents, words=words)
+    collection.rebuild_indexes(["documents_dict"])
+
+    cache = PatientDataCache(MemoryCacheBackend())
+    with (
+        patch.object(patient_data, "_cache_instance", cache),
+        patch.object(patient_data, "DOCUMENT_TEXT_OUT_OF_LINE", out_of_line),
+    ):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            await patient_data._write_patient_data(cache, STATION, ICN, DUZ, collection)
+        write_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+        cached = await cache.get_patient_data(STATION, ICN, DUZ)
+        read_ms = timed(lambda: patient_data._rehydrate(cached))
+
+        restored = patient_data._rehydrate(cached)
+        page: list[Document] = restored.documents[:PAGE]
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            await patient_data.load_document_text(page)
+        load_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+    return {
+        "entry_kb": len(json.dumps(cached)) / 1024,
+        "write_ms": write_ms,
+        "read_ms": read_ms,
+        "load_ms": load_ms,
+    }
+
+
+async def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+
+    print(
+        f"{documents} notes of {words} words, 100 vitals, 200 labs; "
+        f"{REPEAT} runs, text loaded for {PAGE} documents\n"
+    )
+    print(
+        f"{'text':<13}{'entry KB':>10}{'write ms':>10}{'rehydrate ms':>14}"
+        f"{'page text ms':>14}"
+    )
+    results = {}
+    for name, out_of_line in (("inline", False), ("out of line", True)):
+        results[name] = result = await measure(out_of_line, documents, words)
+        print(
+            f"{name:<13}{result['entry_kb']:>10.0f}{result['write_ms']:>10.1f}"
+            f"{result['read_ms']:>14.1f}{result['load_ms']:>14.2f}"
+        )
+    inline, offloaded = results["inline"], results["out of line"]
+    print(
+        f"\nentry {inline['entry_kb'] / offloaded['entry_kb']:.1f}x smaller, "
+        f"rehydrate {inline['read_ms'] / offloaded['read_ms']:.1f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Benchmark validating each domain's items in one batch
+
+Runs every domain parser of PatientDataParser over the mock server's VPR
+record (or another VPR JSON file) validating items one model at a time and
+through one TypeAdapter call per domain, and reports items per second, then
+the time to parse the whole record both ways.
+
+Usage:
+    python scripts/benchmarks/bench_domain_parse.py [vpr_json_file]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parsers.patient import patient_parser  # noqa: E402
+from src.services.parsers.patient.batch import _validate_each  # noqa: E402
+from src.services.parsers.patient.patient_parser import (  # noqa: E402
+    PatientDataParser,
+    parse_vpr_patient_data,
+)
+
+DEFAULT_RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+REPEAT = 10
+ROUNDS = 5
+
+DOMAINS = {
+    "vital": "_parse_vital_signs",
+    "lab": "_parse_lab_results",
+    "consult": "_parse_consults",
+    "med": "_parse_medications",
+    "order": "_parse_orders",
+    "visit": "_parse_visits",
+    "factor": "_parse_health_factors",
+    "treatment": "_parse_treatments",
+    "document": "_parse_documents",
+    "cpt": "_parse_cpt_codes",
+    "allergy": "_parse_allergies",
+    "pov": "_parse_povs",
+    "problem": "_parse_problems",
+    "appointment": "_parse_appointments",
+}
+
+
+def seconds(parse, items) -> float:
+    """Mean seconds per call in the fastest of ROUNDS rounds, after a warm-up"""
+    parse(items)
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            parse(items)
+        best = min(best, (time.perf_counter() - start) / REPEAT)
+    return best
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORD
+    vpr_data = json.loads(path.read_text())
+    parser = PatientDataParser("500", "1008684701V329302")
+    grouped = parser._group_items_by_uid_type(
+        parser._extract_items(vpr_data.get("payload", vpr_data))
+    )
+
+    print(f"{path.name}, best of {ROUNDS} rounds of {REPEAT} runs\n")
+    print(f"{'domain':<13}{'items':>7}{'per item/s':>12}{'batch/s':>10}{'speedup':>9}")
+    totals = [0, 0.0, 0.0]
+    for domain, method in DOMAINS.items():
+        items = grouped.get(domain, [])
+        if not items:
+            continue
+        parse = getattr(parser, method)
+        with patch.object(patient_parser, "validate_items", _validate_each):
+            each = seconds(parse, items)
+        batch = seconds(parse, items)
+        totals[0] += len(items)
+        totals[1] += each
+        totals[2] += batch
+        print(
+            f"{domain:<13}{len(items):>7}{len(items) / each:>12.0f}"
+            f"{len(items) / batch:>10.0f}{each / batch:>8.2f}x"
+        )
+    count, each, batch = totals
+    print(
+        f"{'all':<13}{count:>7}{count / each:>12.0f}{count / batch:>10.0f}"
+        f"{each / batch:>8.2f}x"
+    )
+
+    def parse(data):
+        return parse_vpr_patient_data(data, "500", "1008684701V329302")
+
+    with patch.object(patient_parser, "validate_items", _validate_each):
+        each = seconds(parse, vpr_data)
+    batch = seconds(parse, vpr_data)
+    print(f"\nwhole record: {each * 1000:.1f} ms per item, {batch * 1000:.1f} ms batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Benchmark memoized item fragments in tool response serialization
+
+Serializes a page of labs and documents the way FastMCP does (to_json and
+to_jsonable_python on the ToolResponse) for three cases: items of a plain
+collection, the first response from a memoized collection (fills the fragment
+cache) and a repeat response built from a rehydrated copy of the same
+snapshot, as a later tool call gets it from the patient cache.
+
+Usage:
+    python scripts/benchmarks/bench_fragments.py [items_per_page]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pydantic_core
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+from src.models.patient import PatientDataCollection  # noqa: E402
+from src.models.patient.fragments import _fragments  # noqa: E402
+from src.models.responses.tool_responses import (  # noqa: E402
+    DocumentsResponse,
+    DocumentsResponseData,
+    LabResultsResponse,
+    LabResultsResponseData,
+)
+
+REPEAT = 50
+
+
+def serialize(response) -> bytes:
+    """Both serializations FastMCP runs on a tool result"""
+    pydantic_core.to_jsonable_python(response)
+    return pydantic_core.to_json(response)
+
+
+def timed(build, collection: PatientDataCollection) -> float:
+    """Mean milliseconds to build and serialize a response"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        serialize(build(collection))
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def rehydrate(collection: PatientDataCollection) -> PatientDataCollection:
+    """Copy of the collection as read back from the patient cache"""
+    copy = PatientDataCollection.model_validate_json(collection.model_dump_json())
+    copy.memoize_fragments()
+    return copy
+
+
+def main():
+    page = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    cases = [
+        (
+            "labs",
+            lambda collection: LabResultsResponse(
+                success=True,
+                data=LabResultsResponseData(labs=collection.lab_results[:page]),
+            ),
+        ),
+        (
+            "documents",
+            lambda collection: DocumentsResponse(
+                success=True,
+                data=DocumentsResponseData(documents=collection.documents[:page]),
+            ),
+        ),
+    ]
+
+    print(f"{page} items per response, {REPEAT} responses each\n")
+    print(
+        f"{'tool':<12}{'plain ms':>10}{'first ms':>10}{'repeat ms':>11}{'speedup':>9}"
+    )
+    for name, build in cases:
+        plain = build_collection(labs=page, documents=page)
+        memoized = rehydrate(plain)
+
+        plain_ms = timed(build, plain)
+        _fragments.clear()
+        start = time.perf_counter()
+        first = serialize(build(memoized))
+        first_ms = (time.perf_counter() - start) * 1000
+        repeat = rehydrate(plain)
+        repeat_ms = timed(build, repeat)
+
+        assert first == serialize(build(plain)), "memoized output differs"
+        print(
+            f"{name:<12}{plain_ms:>10.2f}{first_ms:>10.2f}{repeat_ms:>11.2f}"
+            f"{plain_ms / repeat_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
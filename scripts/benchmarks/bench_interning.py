@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""Benchmark sharing repeated values across parsed patient items
+
+Parses the mock server's VPR record (or another VPR JSON file) with and
+without the value sharing pass and reports, per collection, the memory held
+by the parsed models, by a rehydrated copy, and by the dict the in-process
+patient cache keeps, along with what the pass costs in time.
+
+Usage:
+    python scripts/benchmarks/bench_interning.py [vpr_json_file]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.patient import PatientDataCollection  # noqa: E402
+from src.models.patient.interning import ValueTable  # noqa: E402
+from src.services.parsers.patient.patient_parser import (  # noqa: E402
+    parse_vpr_patient_data,
+)
+
+DEFAULT_RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+REPEAT = 10
+
+
+def deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Bytes of an object graph, counting each shared object once"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, BaseModel):
+        size += deep_size(obj.__dict__, seen)
+        size += deep_size(obj.__pydantic_fields_set__, seen)
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_size(key, seen) + deep_size(value, seen)
+    elif isinstance(obj, list | tuple | set | frozenset):
+        for value in obj:
+            size += deep_size(value, seen)
+    return size
+
+
+def collection_size(collection: PatientDataCollection) -> int:
+    """Bytes held by a collection's demographics and items"""
+    return deep_size([collection.demographics, *collection.all_items.values()])
+
+
+def timed(work) -> float:
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        work()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def rehydrate(data: dict[str, Any], share: bool) -> PatientDataCollection:
+    """Collection read back from the cache the way _rehydrate does"""
+    collection = PatientDataCollection.model_validate_json(json.dumps(data))
+    if share:
+        collection.share_values(share_strings=False)
+    return collection
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORD
+    vpr_json = json.loads(path.read_text())
+
+    with patch.object(PatientDataCollection, "share_values", lambda *args: None):
+        plain = parse_vpr_patient_data(vpr_json, "500", "1008684701V329302")
+    plain.raw_data = None
+    shared = parse_vpr_patient_data(vpr_json, "500", "1008684701V329302")
+    shared.raw_data = None
+
+    plain_dump = plain.model_dump(mode="json")
+    shared_dump = ValueTable().share_data(plain.model_dump(mode="json"))
+
+    rows = [
+        ("parsed", collection_size(plain), collection_size(shared)),
+        (
+            "rehydrated",
+            collection_size(rehydrate(plain_dump, share=False)),
+            collection_size(rehydrate(plain_dump, share=True)),
+        ),
+        ("cache entry", deep_size(plain_dump), deep_size(shared_dump)),
+    ]
+
+    print(f"{path.name}: {len(plain.all_items)} items\n")
+    print(f"{'collection':<14}{'plain KB':>10}{'shared KB':>11}{'saved':>8}")
+    for name, before, after in rows:
+        print(
+            f"{name:<14}{before / 1024:>10.0f}{after / 1024:>11.0f}"
+            f"{1 - after / before:>8.0%}"
+        )
+
+    print(f"\n{'pass':<28}{'ms':>8}")
+    print(f"{'share_values (parser)':<28}{timed(lambda: plain.share_values()):>8.1f}")
+    print(
+        f"{'share_values (rehydration)':<28}"
+        f"{timed(lambda: plain.share_values(share_strings=False)):>8.1f}"
+    )
+    print(
+        f"{'share_data (cache write)':<28}"
+        f"{timed(lambda: ValueTable().share_data(plain_dump)):>8.1f}"
+    )
+    print(
+        f"{'rehydrate':<28}"
+        f"{timed(lambda: rehydrate(plain_dump, share=False)):>8.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Benchmark loading a panel of patients one by one vs get_patient_data_many
+
+Loads every patient of the panel from the mock server with sequential
+get_patient_data calls, then with one get_patient_data_many call, clearing
+the patient cache before each run so both fetch every patient from VistA,
+and finally repeats the batched call against the warm cache.
+
+Start the mock server (see mock_server/README.md) with response delay enabled,
+e.g. in mock_server/.env:
+
+    ENABLE_RESPONSE_DELAY=true
+    MIN_RESPONSE_DELAY_MS=50
+    MAX_RESPONSE_DELAY_MS=200
+
+The mock server has 8 test patients; pass more ICNs to build a larger panel.
+
+Usage:
+    python scripts/benchmarks/bench_panel.py [max_concurrency] [icn ...]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.data import get_patient_data, get_patient_data_many  # noqa: E402
+from src.services.data.patient_data import _get_cache  # noqa: E402
+from src.vista.client import VistaAPIClient  # noqa: E402
+
+load_dotenv()
+
+STATION = os.getenv("DEFAULT_STATION", "500")
+DUZ = os.getenv("DEFAULT_DUZ", "10000000219")
+MOCK_ICNS = [
+    "1000220000V123456",
+    "1000000219V596118",
+    "1000240000V123456",
+    "1000250000V123456",
+    "1000260000V123456",
+    "1000270000V123456",
+    "1000280000V123456",
+    "1000290000V123456",
+]
+
+
+async def clear(icns: list[str]) -> None:
+    """Drop the panel from the patient cache"""
+    cache = await _get_cache()
+    for icn in icns:
+        await cache.invalidate_patient_data(STATION, icn, DUZ)
+
+
+async def main() -> None:
+    max_concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    icns = sys.argv[2:] or MOCK_ICNS
+
+    client = VistaAPIClient(
+        base_url=os.getenv("VISTA_API_BASE_URL", "http://localhost:8888"),
+        auth_url=os.getenv("VISTA_AUTH_URL", "http://localhost:8888"),
+        api_key=os.getenv("VISTA_API_KEY", "test-wildcard-key-456"),
+    )
+    try:
+        # Warm up the token
+        await client.invoke_rpc(STATION, DUZ, "ORWU DT", use_cache=False)
+
+        await clear(icns)
+        started = time.perf_counter()
+        for icn in icns:
+            await get_patient_data(client, STATION, icn, DUZ)
+        sequential_ms = (time.perf_counter() - started) * 1000
+
+        await clear(icns)
+        started = time.perf_counter()
+        results = await get_patient_data_many(
+            client, STATION, icns, DUZ, max_concurrency=max_concurrency
+        )
+        batched_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        await get_patient_data_many(
+            client, STATION, icns, DUZ, max_concurrency=max_concurrency
+        )
+        warm_ms = (time.perf_counter() - started) * 1000
+    finally:
+        await client.close()
+
+    failed = sum(isinstance(result, BaseException) for result in results.values())
+    print(
+        f"\n=== Panel of {len(icns)} patients, max_concurrency {max_concurrency} "
+        f"({failed} failed) ===\n"
+    )
+    print(f"{'sequential':<20}{sequential_ms:>10.1f} ms")
+    print(f"{'batched':<20}{batched_ms:>10.1f} ms")
+    print(f"{'batched (cached)':<20}{warm_ms:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Benchmark parsing very large VPR records in worker processes
+
+Builds a synthetic record of about 50,000 items by repeating the items of the
+mock server's VPR record (or another VPR JSON file) under new UIDs, then
+parses it in process and with 2, 4, ... worker processes, reporting the time
+and the speedup over the in-process parse. The speedup is bounded by the
+number of cores; on a single core the workers only add overhead.
+
+Usage:
+    python scripts/benchmarks/bench_parallel_parse.py [vpr_json_file] [items]
+"""
+
+import copy
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parsers.patient import parallel  # noqa: E402
+from src.services.parsers.patient.patient_parser import (  # noqa: E402
+    parse_vpr_patient_data,
+)
+
+DEFAULT_RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+DEFAULT_ITEMS = 50_000
+ROUNDS = 3
+
+
+def synthetic_record(vpr_data: dict, target: int) -> dict:
+    """Repeat the record's items under new UIDs until there are target items"""
+    payload = vpr_data.get("payload", vpr_data)
+    items = payload["data"]["items"]
+    patient = [item for item in items if ":patient:" in item.get("uid", "")]
+    others = [item for item in items if item not in patient]
+
+    synthetic = list(patient)
+    copy_number = 0
+    while len(synthetic) < target:
+        for item in others[: target - len(synthetic)]:
+            clone = copy.deepcopy(item)
+            clone["uid"] = f"{item['uid']}-{copy_number}"
+            synthetic.append(clone)
+        copy_number += 1
+
+    return {"data": {"items": synthetic}}
+
+
+def seconds(vpr_data: dict) -> float:
+    """Fastest of ROUNDS parses, after a warm-up"""
+    parse_vpr_patient_data(vpr_data, "500", "1008684701V329302")
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        parse_vpr_patient_data(vpr_data, "500", "1008684701V329302")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORD
+    target = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ITEMS
+    vpr_data = synthetic_record(json.loads(path.read_text()), target)
+    cores = os.cpu_count() or 1
+
+    print(
+        f"{target} items from {path.name}, {cores} core(s), "
+        f"chunks of {parallel.PARALLEL_PARSE_CHUNK_ITEMS}, best of {ROUNDS}\n"
+    )
+    print(f"{'workers':<10}{'ms':>9}{'speedup':>9}")
+
+    with patch.object(parallel, "PARALLEL_PARSE_WORKERS", 1):
+        baseline = seconds(vpr_data)
+    print(f"{'none':<10}{baseline * 1000:>9.0f}{1:>8.2f}x")
+
+    workers = 2
+    while workers <= max(2, cores):
+        with (
+            patch.object(parallel, "_pool", None),
+            patch.object(parallel, "PARALLEL_PARSE_MIN_ITEMS", 0),
+            patch.object(parallel, "PARALLEL_PARSE_WORKERS", workers),
+        ):
+            elapsed = seconds(vpr_data)
+            parallel.shutdown_parse_pool()
+        print(f"{workers:<10}{elapsed * 1000:>9.0f}{baseline / elapsed:>8.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
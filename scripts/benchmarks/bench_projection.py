@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmark field projection: full vs projected tool response serialization
+
+Serializes a page of documents, appointments and labs the way FastMCP does
+(pydantic_core.to_json on the ToolResponse), once with full items and once
+projected onto a few fields, and reports CPU time and response size.
+
+Usage:
+    python scripts/benchmarks/bench_projection.py [items_per_page]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pydantic_core
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+from src.models.responses.tool_responses import (  # noqa: E402
+    AppointmentsResponse,
+    AppointmentsResponseData,
+    DocumentsResponse,
+    DocumentsResponseData,
+    LabResultsResponse,
+    LabResultsResponseData,
+)
+
+REPEAT = 50
+
+
+def timed(response) -> tuple[float, int]:
+    """Mean milliseconds per serialization and the response size in bytes"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        body = pydantic_core.to_json(response)
+    return (time.perf_counter() - start) * 1000 / REPEAT, len(body)
+
+
+def main():
+    page = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    collection = build_collection(labs=page, documents=page, appointments=page)
+    cases = [
+        (
+            "documents",
+            lambda: DocumentsResponse(
+                success=True,
+                data=DocumentsResponseData(documents=collection.documents[:page]),
+            ),
+            ["localTitle", "referenceDateTime", "documentTypeName", "statusName"],
+        ),
+        (
+            "appointments",
+            lambda: AppointmentsResponse(
+                success=True,
+                data=AppointmentsResponseData(
+                    appointments=list(collection.appointments_dict.values())[:page]
+                ),
+            ),
+            ["dateTime", "appointmentStatus", "locationName"],
+        ),
+        (
+            "labs",
+            lambda: LabResultsResponse(
+                success=True,
+                data=LabResultsResponseData(labs=collection.lab_results[:page]),
+            ),
+            ["typeName", "result", "units", "observed", "interpretationCode"],
+        ),
+    ]
+
+    print(f"{page} items per response, {REPEAT} serializations each\n")
+    print(
+        f"{'tool':<14}{'full ms':>9}{'proj ms':>9}{'speedup':>9}"
+        f"{'full KB':>10}{'proj KB':>9}{'smaller':>9}"
+    )
+    for name, build, fields in cases:
+        full_ms, full_bytes = timed(build())
+        proj_ms, proj_bytes = timed(build().project(fields))
+        print(
+            f"{name:<14}{full_ms:>9.2f}{proj_ms:>9.2f}{full_ms / proj_ms:>8.1f}x"
+            f"{full_bytes / 1024:>10.1f}{proj_bytes / 1024:>9.1f}"
+            f"{full_bytes / proj_bytes:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
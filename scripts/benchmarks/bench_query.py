@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Benchmark domain queries: materialize-then-paginate vs the Query pipeline
+
+Times one page of appointments, documents and labs on a synthetic patient
+two ways: the previous tool code (filter the domain into a new list with a
+comprehension, then paginate_list the whole result) and the shared Query
+pipeline (index-aware date window, filters compiled into one generator
+expression and a single pass that fills the page and counts the rest).
+Both must return the same page and total.
+
+Usage:
+    python scripts/benchmarks/bench_query.py [items_per_domain]
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+from src.models.patient.query import Query, contains, equals, flag  # noqa: E402
+from src.utils import paginate_list  # noqa: E402
+
+REPEAT = 50
+OFFSET = 0
+LIMIT = 10
+
+
+def timed(fn) -> tuple[float, tuple[list, int]]:
+    """Mean milliseconds per call and the last result"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn()
+    return (time.perf_counter() - start) * 1000 / REPEAT, result
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    collection = build_collection(
+        labs=items, documents=items, appointments=items, years=10
+    )
+    now = datetime.now(UTC)
+    year_ago = now - timedelta(days=365)
+
+    def appointments_before():
+        matches = [
+            apt
+            for apt in collection.appointments
+            if apt.appointment_date >= year_ago
+            and str(apt.status).upper() == "KEPT"
+            and "MASTER" in apt.facility.name.upper()
+        ]
+        return paginate_list(matches, OFFSET, LIMIT)
+
+    def appointments_after():
+        query = Query(
+            equals("status", "kept", ignore_case=True),
+            contains("facility.name", "master"),
+            since=year_ago,
+        )
+        return query.page(collection.appointments_by_time, OFFSET, LIMIT)
+
+    def documents_before():
+        matches = [
+            d for d in collection.documents_by_time.since(year_ago) if d.is_completed
+        ]
+        return paginate_list(matches, OFFSET, LIMIT)
+
+    def documents_after():
+        query = Query(flag("is_completed"), since=year_ago)
+        return query.page(collection.documents_by_time, OFFSET, LIMIT)
+
+    def labs_before():
+        matches = [
+            lab
+            for lab in collection.lab_results_by_time.since(now - timedelta(days=3650))
+            if lab.is_abnormal and "GLU" in lab.type_name.upper()
+        ]
+        return paginate_list(matches, OFFSET, LIMIT)
+
+    def labs_after():
+        query = Query(
+            flag("is_abnormal"),
+            contains("type_name", "glu"),
+            since=now - timedelta(days=3650),
+        )
+        return query.page(collection.lab_results_by_time, OFFSET, LIMIT)
+
+    print(f"{items:,} items per domain, page of {LIMIT}, {REPEAT} calls each\n")
+    print(f"{'query':<14}{'matches':>9}{'before ms':>11}{'query ms':>10}{'speedup':>9}")
+    for label, before, after in (
+        ("appointments", appointments_before, appointments_after),
+        ("documents", documents_before, documents_after),
+        ("labs", labs_before, labs_after),
+    ):
+        before_ms, expected = timed(before)
+        after_ms, result = timed(after)
+        assert result == expected, label
+        print(
+            f"{label:<14}{expected[1]:>9,}{before_ms:>11.2f}{after_ms:>10.2f}"
+            f"{before_ms / after_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Benchmark the raw VPR payload retention modes
+
+Parses the mock server's VPR record (or another VPR JSON file) under each
+RAW_DATA_RETENTION mode and reports the memory each parsed collection keeps
+once the caller has dropped the decoded response, the parse time, and the
+size of the spilled file.
+
+Usage:
+    python scripts/benchmarks/bench_raw_data.py [vpr_json_file]
+"""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.patient import PatientDataCollection  # noqa: E402
+from src.services.parsers.patient import raw_data  # noqa: E402
+from src.services.parsers.patient.patient_parser import (  # noqa: E402
+    parse_vpr_patient_data,
+)
+from src.services.parsers.patient.raw_data import RawDataSpill  # noqa: E402
+
+DEFAULT_RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+REPEAT = 10
+STATION = "500"
+ICN = "1008684701V329302"
+
+
+def parse(text: str) -> PatientDataCollection:
+    """Decode and parse a response the way the patient data RPC does"""
+    return parse_vpr_patient_data(json.loads(text), STATION, ICN)
+
+
+def resident_bytes(text: str, spill: RawDataSpill) -> int:
+    """Bytes still allocated for one parsed collection after the response is dropped"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    collection = parse(text)
+    spill.flush()
+    gc.collect()
+    resident = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del collection
+    return resident
+
+
+def parse_ms(text: str, spill: RawDataSpill) -> float:
+    """Mean milliseconds per parse, including waiting for the spill write"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        parse(text)
+    spill.flush()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORD
+    text = path.read_text()
+    # Fill module-level caches (value table plans and the like) before measuring
+    parse(text)
+
+    print(f"{path.name}: {len(text) / 1024:.0f} KB of JSON, {REPEAT} parses\n")
+    print(f"{'mode':<8}{'resident KB':>13}{'parse ms':>10}{'spilled KB':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        spill = RawDataSpill(directory, max_files=REPEAT)
+        with patch.object(raw_data, "_spill_instance", spill):
+            for mode in ("off", "spill", "keep"):
+                with patch.object(raw_data, "RAW_DATA_RETENTION", mode):
+                    resident = resident_bytes(text, spill)
+                    elapsed = parse_ms(text, spill)
+                files = list(Path(directory).iterdir())
+                spilled = (
+                    f"{max(f.stat().st_size for f in files) / 1024:.0f}"
+                    if files
+                    else "-"
+                )
+                print(f"{mode:<8}{resident / 1024:>13.0f}{elapsed:>10.1f}{spilled:>12}")
+
+
+if __name__ == "__main__":
+    main()
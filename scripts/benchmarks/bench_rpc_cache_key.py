@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Micro-benchmark for RPC response cache key generation
+
+Compares the old key scheme (json.dumps with sort_keys + MD5) with
+build_rpc_cache_key for the hot parameter shapes: empty params, a named-array
+patientId and a single string. Prebuilt RpcParameters reuse their fragment,
+plain lists are encoded on every call.
+
+Usage:
+    python scripts/benchmarks/bench_rpc_cache_key.py [iterations]
+"""
+
+import hashlib
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.rpc.parameter_builder import (  # noqa: E402
+    build_empty_params,
+    build_icn_only_named_array_param,
+    build_rpc_cache_key,
+    build_single_string_param,
+)
+
+STATION = "500"
+DUZ = "10000000219"
+ICN = "1012853550V207686"
+
+
+def legacy_cache_key(
+    station: str, caller_duz: str, rpc_name: str, parameters: list[dict[str, Any]]
+) -> str:
+    """Key scheme used before RpcParameters (json.dumps + MD5 per call)"""
+    param_hash = hashlib.md5(
+        json.dumps(parameters, sort_keys=True).encode()
+    ).hexdigest()[:16]
+    return f"{station}:{caller_duz}:{rpc_name}:{param_hash}"
+
+
+def measure(fn: Callable[[], Any], iterations: int) -> float:
+    """Keys per second for a zero-argument key function"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    shapes = {
+        "empty": ("XWB IM HERE", build_empty_params()),
+        "patientId": (
+            "VPR GET PATIENT DATA JSON",
+            build_icn_only_named_array_param(ICN),
+        ),
+        "string": ("ORWU DT", build_single_string_param("NOW")),
+    }
+
+    print(f"Cache key generation, {iterations:,} keys per run (keys/sec)\n")
+    print(f"{'shape':<12}{'legacy md5':>14}{'plain list':>14}{'prebuilt':>14}")
+    for shape, (rpc_name, params) in shapes.items():
+        plain = list(params)
+        legacy = measure(
+            lambda r=rpc_name, p=plain: legacy_cache_key(STATION, DUZ, r, p),
+            iterations,
+        )
+        on_the_fly = measure(
+            lambda r=rpc_name, p=plain: build_rpc_cache_key(STATION, DUZ, r, p),
+            iterations,
+        )
+        prebuilt = measure(
+            lambda r=rpc_name, p=params: build_rpc_cache_key(STATION, DUZ, r, p),
+            iterations,
+        )
+        print(f"{shape:<12}{legacy:>14,.0f}{on_the_fly:>14,.0f}{prebuilt:>14,.0f}")
+
+    # Cost of building the parameters themselves, now that they hash once
+    build = measure(lambda: build_icn_only_named_array_param(ICN), iterations)
+    print(f"\nbuild_icn_only_named_array_param (incl. fragment): {build:,.0f}/sec")
+
+
+if __name__ == "__main__":
+    main()
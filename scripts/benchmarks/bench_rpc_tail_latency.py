@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Tail-latency benchmark for RPC retry and hedging policies
+
+Runs the same burst of idempotent RPCs against the mock server with retries
+disabled, retries enabled, and retries plus hedging, then prints latency
+percentiles and error rates for each configuration.
+
+Start the mock server (see mock_server/README.md) with delay and error
+injection enabled first, e.g. in mock_server/.env:
+
+    ENABLE_RESPONSE_DELAY=true
+    MIN_RESPONSE_DELAY_MS=20
+    MAX_RESPONSE_DELAY_MS=400
+    ERROR_INJECTION_RATE=0.2
+
+Usage:
+    python scripts/benchmarks/bench_rpc_tail_latency.py [requests] [concurrency]
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.vista.client import VistaAPIClient  # noqa: E402
+from src.vista.retry import RetryPolicy, RetryPolicyRegistry  # noqa: E402
+
+load_dotenv()
+
+STATION = os.getenv("DEFAULT_STATION", "500")
+DUZ = os.getenv("DEFAULT_DUZ", "10000000219")
+RPC_NAME = "ORWU DT"
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def build_registry(retry: bool, hedge: bool) -> RetryPolicyRegistry:
+    """Build a registry for a single benchmark configuration"""
+    registry = RetryPolicyRegistry()
+    if retry or hedge:
+        registry.register(
+            RPC_NAME,
+            RetryPolicy(
+                idempotent=True,
+                max_attempts=3 if retry else 1,
+                base_delay_seconds=0.05,
+                max_delay_seconds=0.5,
+                deadline_seconds=5.0,
+                hedge=hedge,
+            ),
+        )
+    return registry
+
+
+async def run_configuration(
+    label: str, retry: bool, hedge: bool, requests: int, concurrency: int
+) -> None:
+    """Run one configuration and print its latency profile"""
+    client = VistaAPIClient(
+        base_url=os.getenv("VISTA_API_BASE_URL", "http://localhost:8888"),
+        auth_url=os.getenv("VISTA_AUTH_URL", "http://localhost:8888"),
+        api_key=os.getenv("VISTA_API_KEY", "test-wildcard-key-456"),
+        retry_policies=build_registry(retry, hedge),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one_call() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await client.invoke_rpc(STATION, DUZ, RPC_NAME, use_cache=False)
+                latencies.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                errors += 1
+
+    try:
+        # Warm up the token and the latency tracker used for hedging
+        for _ in range(25):
+            with contextlib.suppress(Exception):
+                await client.invoke_rpc(STATION, DUZ, RPC_NAME, use_cache=False)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_call() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+
+    print(
+        f"{label:<16} ok={len(latencies):>5} errors={errors:>4} "
+        f"({errors / requests:6.1%})  "
+        f"p50={percentile(latencies, 0.50):7.1f}ms "
+        f"p95={percentile(latencies, 0.95):7.1f}ms "
+        f"p99={percentile(latencies, 0.99):7.1f}ms "
+        f"max={max(latencies, default=0):7.1f}ms  "
+        f"throughput={requests / elapsed:6.1f} req/s"
+    )
+
+
+async def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(
+        f"\n=== RPC tail latency: {RPC_NAME} x{requests}, concurrency {concurrency} ===\n"
+    )
+    await run_configuration("no retry", False, False, requests, concurrency)
+    await run_configuration("retry", True, False, requests, concurrency)
+    await run_configuration("retry + hedge", True, True, requests, concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""Benchmark one get_patient_snapshot call vs separate get_patient_* calls
+
+Times one agent turn two ways: running the tools server-side (argument
+parsing, data lookup, filtering and result serialization) and as full round
+trips through an in-memory FastMCP client, which adds MCP framing and the
+SDK's JSON-schema validation of inputs and outputs on both ends.
+get_patient_data is replaced with a cache hit (JSON rehydration of a synthetic
+patient), which is what every tool call pays when the patient is cached.
+
+Usage:
+    python scripts/benchmarks/bench_snapshot.py [items_per_domain]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+from fastmcp import Client, Context, FastMCP
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+import src.tools.patient as patient_tools  # noqa: E402
+from src.models.patient import PatientDataCollection  # noqa: E402
+from src.tools.patient import register_patient_tools  # noqa: E402
+
+ICN = "1008684701V329302"
+REPEAT = 10
+
+# The per-domain calls an agent turn typically makes
+CALLS = [
+    ("get_patient_vitals", "vitals"),
+    ("get_patient_labs", "labs"),
+    ("get_patient_medications", "medications"),
+    ("get_patient_problems", "problems"),
+    ("get_patient_allergies", "allergies"),
+    ("get_patient_documents", "documents"),
+    ("get_patient_appointments", "appointments"),
+]
+
+
+def install_cached_patient(collection: PatientDataCollection) -> None:
+    """Serve every tool's get_patient_data from a JSON cache entry"""
+    cached = json.loads(collection.model_dump_json())
+
+    async def get_patient_data(*args, **kwargs):
+        return PatientDataCollection.model_validate_json(json.dumps(cached))
+
+    for name in dir(patient_tools):
+        module = getattr(patient_tools, name)
+        if hasattr(module, "get_patient_data"):
+            module.get_patient_data = get_patient_data
+            module.validate_icn = lambda icn: True
+
+
+async def timed_server(mcp: FastMCP, calls: list[tuple[str, dict]]) -> float:
+    """Mean milliseconds to run one round of calls server-side"""
+    tools = [(await mcp.get_tool(name), arguments) for name, arguments in calls]
+    async with Context(fastmcp=mcp):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            for tool, arguments in tools:
+                await tool.run(arguments)
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+async def timed_client(client: Client, calls: list[tuple[str, dict]]) -> float:
+    """Mean milliseconds for one round of calls through the MCP client"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for tool, arguments in calls:
+            result = await client.call_tool(tool, arguments)
+            assert not result.is_error, result
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+async def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    install_cached_patient(
+        build_collection(vitals=items, labs=items, documents=items, appointments=items)
+    )
+    mcp = FastMCP("bench")
+    register_patient_tools(mcp, None)  # type: ignore[arg-type]
+
+    separate = [(tool, {"patient_icn": ICN, "station": "500"}) for tool, _ in CALLS]
+    snapshot = [
+        (
+            "get_patient_snapshot",
+            {
+                "patient_icn": ICN,
+                "station": "500",
+                "domains": [{"domain": domain} for _, domain in CALLS],
+            },
+        )
+    ]
+
+    async with Client(mcp) as client:
+        # Warm up schemas and lazily built indexes
+        await timed_client(client, separate + snapshot)
+        results = [
+            (
+                label,
+                len(calls),
+                await timed_server(mcp, calls),
+                await timed_client(client, calls),
+            )
+            for label, calls in (
+                ("separate tools", separate),
+                ("get_patient_snapshot", snapshot),
+            )
+        ]
+
+    print(f"{items} items per domain, {len(CALLS)} domains, {REPEAT} rounds\n")
+    print(f"{'path':<22}{'round trips':>12}{'server ms':>11}{'MCP ms':>9}")
+    for label, round_trips, server_ms, client_ms in results:
+        print(f"{label:<22}{round_trips:>12}{server_ms:>11.1f}{client_ms:>9.1f}")
+    (_, _, separate_server, separate_client), (_, _, snap_server, snap_client) = results
+    print(
+        f"\nspeedup: server {separate_server / snap_server:.1f}x, "
+        f"MCP round trip {separate_client / snap_client:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Benchmark date-window queries: linear scan vs TimeIndex bisect
+
+Builds synthetic patients with 10k-100k vitals and labs spread over ten
+years and times the days_back filters used by get_patient_vitals and
+get_patient_labs, before (scan every item) and after (bisect the index).
+
+Usage:
+    python scripts/benchmarks/bench_time_index.py [sizes...]
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+DAYS_BACK = (30, 365, 3650)
+REPEAT = 50
+
+
+def timed(fn, repeat: int = REPEAT) -> tuple[float, int]:
+    """Mean milliseconds per call and the result size"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) * 1000 / repeat, len(result)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000, 100_000]
+
+    for size in sizes:
+        build_start = time.perf_counter()
+        collection = build_collection(vitals=size // 2, labs=size // 2)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        index_start = time.perf_counter()
+        collection.rebuild_indexes()
+        index_ms = (time.perf_counter() - index_start) * 1000
+
+        print(
+            f"\n{size:,} items (build {build_ms:,.0f}ms, index rebuild {index_ms:,.1f}ms)"
+        )
+        print(
+            f"{'query':<22}{'matches':>9}{'scan ms':>10}{'index ms':>10}{'speedup':>9}"
+        )
+
+        for days_back in DAYS_BACK:
+            cutoff = datetime.now(UTC) - timedelta(days=days_back)
+            for label, items, index in (
+                ("vitals", collection.vital_signs, collection.vital_signs_by_time),
+                ("labs", collection.lab_results, collection.lab_results_by_time),
+            ):
+                scan_ms, matches = timed(
+                    lambda items=items, cutoff=cutoff: [
+                        x for x in items if x.observed >= cutoff
+                    ]
+                )
+                index_ms, _ = timed(
+                    lambda index=index, cutoff=cutoff: index.since(cutoff)
+                )
+                print(
+                    f"{f'{label} {days_back}d':<22}{matches:>9,}"
+                    f"{scan_ms:>10.3f}{index_ms:>10.3f}{scan_ms / index_ms:>8.0f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
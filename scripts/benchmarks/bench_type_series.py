@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Benchmark n_most_recent per type: regrouping vs pre-sorted type series
+
+Times the query behind get_patient_labs/get_patient_vitals with the default
+n_most_recent=3, comparing the old approach (filter the window, then build a
+type_code -> list dict on every call) with SeriesIndex.most_recent. Uses a
+lab-heavy synthetic patient plus a vitals-heavy one.
+
+Usage:
+    python scripts/benchmarks/bench_type_series.py [labs] [vitals]
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_patient import build_collection  # noqa: E402
+
+N_MOST_RECENT = 3
+REPEAT = 50
+
+
+def regroup(items, cutoff, n, abnormal_only=False):
+    """The per-call grouping the tools used before type series"""
+    window = [
+        item
+        for item in items
+        if item.observed >= cutoff and (not abnormal_only or item.is_abnormal)
+    ]
+    by_type: dict[str, list] = {}
+    for item in window:
+        group = by_type.setdefault(item.type_code, [])
+        if len(group) < n:
+            group.append(item)
+    return [item for group in by_type.values() for item in group]
+
+
+def timed(fn) -> tuple[float, int]:
+    """Mean milliseconds per call and the result size"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn()
+    return (time.perf_counter() - start) * 1000 / REPEAT, len(result)
+
+
+def main():
+    labs = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    vitals = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    collection = build_collection(vitals=vitals, labs=labs)
+    print(f"{labs:,} labs, {vitals:,} vitals, n_most_recent={N_MOST_RECENT}\n")
+    print(f"{'query':<28}{'rows':>6}{'regroup ms':>12}{'series ms':>11}{'speedup':>9}")
+
+    queries = []
+    for days_back in (90, 3650):
+        cutoff = datetime.now(UTC) - timedelta(days=days_back)
+        queries += [
+            (
+                f"labs {days_back}d",
+                lambda cutoff=cutoff: regroup(
+                    collection.lab_results, cutoff, N_MOST_RECENT
+                ),
+                lambda cutoff=cutoff: collection.lab_results_by_type.most_recent(
+                    N_MOST_RECENT, since=cutoff
+                ),
+            ),
+            (
+                f"labs {days_back}d abnormal",
+                lambda cutoff=cutoff: regroup(
+                    collection.lab_results, cutoff, N_MOST_RECENT, abnormal_only=True
+                ),
+                lambda cutoff=cutoff: collection.lab_results_by_type.most_recent(
+                    N_MOST_RECENT, since=cutoff, where=lambda lab: lab.is_abnormal
+                ),
+            ),
+            (
+                f"vitals {days_back}d",
+                lambda cutoff=cutoff: regroup(
+                    collection.vital_signs, cutoff, N_MOST_RECENT
+                ),
+                lambda cutoff=cutoff: collection.vital_signs_by_type.most_recent(
+                    N_MOST_RECENT, since=cutoff
+                ),
+            ),
+        ]
+
+    for label, before, after in queries:
+        before_ms, rows = timed(before)
+        after_ms, after_rows = timed(after)
+        assert rows == after_rows, label
+        print(
+            f"{label:<28}{rows:>6}{before_ms:>12.3f}{after_ms:>11.3f}"
+            f"{before_ms / after_ms:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
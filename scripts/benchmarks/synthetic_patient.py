@@ -0,0 +1,263 @@
+"""Synthetic patient collections for benchmarks
+
+Builds PatientDataCollection instances of arbitrary size without a VistA
+connection. Items are spread evenly over the last `years` years and inserted
+newest-first, like the VPR parser does.
+"""
+
+import random
+import sys
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.patient import (  # noqa: E402
+    Appointment,
+    Document,
+    LabResult,
+    PatientDataCollection,
+    PatientDemographics,
+    VitalSign,
+)
+
+STATION = "500"
+ICN = "1000000000V000000"
+
+# (type_code, type_name, units, low, high, value range)
+VITAL_TYPES = [
+    ("urn:va:vuid:4500634", "BLOOD PRESSURE", "mm[Hg]", None, None, None),
+    ("urn:va:vuid:4500635", "PULSE", "/min", 60, 100, (50, 120)),
+    ("urn:va:vuid:4688725", "TEMPERATURE", "F", 95, 100.4, (96, 102)),
+    ("urn:va:vuid:4500639", "WEIGHT", "lb", None, None, (150, 250)),
+    ("urn:va:vuid:4500637", "PULSE OXIMETRY", "%", 95, 100, (88, 100)),
+]
+
+LAB_TYPES = [
+    ("urn:lnc:4548-4", "HEMOGLOBIN A1C", "%", 4.0, 6.0, (5.0, 10.0)),
+    ("urn:lnc:2345-7", "GLUCOSE", "mg/dL", 70, 110, (60, 300)),
+    ("urn:lnc:2160-0", "CREATININE", "mg/dL", 0.6, 1.3, (0.5, 3.0)),
+    ("urn:lnc:2951-2", "SODIUM", "mmol/L", 135, 145, (125, 155)),
+    ("urn:lnc:2823-3", "POTASSIUM", "mmol/L", 3.5, 5.1, (2.8, 6.5)),
+    ("urn:lnc:718-7", "HEMOGLOBIN", "g/dL", 13.5, 17.5, (9, 19)),
+    ("urn:lnc:2093-3", "CHOLESTEROL", "mg/dL", 0, 200, (120, 320)),
+    ("urn:lnc:1742-6", "ALT", "U/L", 7, 56, (5, 200)),
+]
+
+# Vocabulary for synthetic note text
+WORDS = [
+    "patient",
+    "reports",
+    "chest",
+    "pain",
+    "shortness",
+    "breath",
+    "denies",
+    "fever",
+    "cough",
+    "warfarin",
+    "metformin",
+    "lisinopril",
+    "follow",
+    "up",
+    "clinic",
+    "labs",
+    "reviewed",
+    "stable",
+    "plan",
+    "continue",
+    "medication",
+    "hypertension",
+    "diabetes",
+    "counseling",
+    "smoking",
+    "cessation",
+    "exercise",
+]
+
+
+def _timestamps(count: int, years: int, rng: random.Random) -> list[datetime]:
+    """Random timestamps over the last `years` years, newest first"""
+    now = datetime.now(UTC)
+    span = years * 365 * 86400
+    return sorted(
+        (now - timedelta(seconds=rng.randrange(span)) for _ in range(count)),
+        reverse=True,
+    )
+
+
+def _interpretation(value: float, low: float | None, high: float | None) -> str | None:
+    if high is not None and value > high:
+        return "urn:hl7:observation-interpretation:H"
+    if low is not None and value < low:
+        return "urn:hl7:observation-interpretation:L"
+    return None
+
+
+def build_vitals(count: int, years: int = 10, seed: int = 1) -> dict[str, VitalSign]:
+    """Build `count` vital signs across all VITAL_TYPES"""
+    rng = random.Random(seed)
+    vitals: dict[str, VitalSign] = {}
+    for i, observed in enumerate(_timestamps(count, years, rng)):
+        type_code, type_name, units, low, high, value_range = VITAL_TYPES[
+            i % len(VITAL_TYPES)
+        ]
+        if value_range is None:
+            result = f"{rng.randint(100, 180)}/{rng.randint(60, 110)}"
+            interpretation = None
+        else:
+            value = round(rng.uniform(*value_range), 1)
+            result = str(value)
+            interpretation = _interpretation(value, low, high)
+        uid = f"urn:va:vital:{STATION}:{i}"
+        vitals[uid] = VitalSign(
+            uid=uid,
+            local_id=str(i),
+            type_code=type_code,
+            type_name=type_name,
+            display_name=type_name[:2],
+            result=result,
+            units=units,
+            low=low,
+            high=high,
+            observed=observed,
+            resulted=observed,
+            facility_code=STATION,
+            facility_name="CAMP MASTER",
+            interpretation_code=interpretation,
+        )
+    return vitals
+
+
+def build_labs(count: int, years: int = 10, seed: int = 2) -> dict[str, LabResult]:
+    """Build `count` lab results across all LAB_TYPES"""
+    rng = random.Random(seed)
+    labs: dict[str, LabResult] = {}
+    for i, observed in enumerate(_timestamps(count, years, rng)):
+        type_code, type_name, units, low, high, value_range = LAB_TYPES[
+            i % len(LAB_TYPES)
+        ]
+        value = round(rng.uniform(*value_range), 1)
+        interpretation = _interpretation(value, low, high)
+        uid = f"urn:va:lab:{STATION}:{i // 4}:{i}"
+        labs[uid] = LabResult(
+            uid=uid,
+            local_id=str(i),
+            type_code=type_code,
+            type_name=type_name,
+            display_name=type_name,
+            result=str(value),
+            units=units,
+            low=low,
+            high=high,
+            interpretation_code=interpretation,
+            interpretation_name="High" if interpretation else None,
+            observed=observed,
+            resulted=observed,
+            facility_code=STATION,
+            facility_name="CAMP MASTER",
+            status_code="urn:va:lab-status:completed",
+            status_name="completed",
+        )
+    return labs
+
+
+def build_documents(
+    count: int, years: int = 10, words: int = 200, seed: int = 3
+) -> dict[str, Document]:
+    """Build `count` progress notes of roughly `words` words each"""
+    rng = random.Random(seed)
+    documents: dict[str, Document] = {}
+    for i, reference in enumerate(_timestamps(count, years, rng)):
+        uid = f"urn:va:document:{STATION}:{i}"
+        documents[uid] = Document(
+            uid=uid,
+            local_id=str(i),
+            facility_code=STATION,
+            facility_name="CAMP MASTER",
+            document_class="PROGRESS NOTES",
+            document_type_code="PN",
+            document_type_name="Progress Note",
+            local_title=f"PRIMARY CARE NOTE {i}",
+            entered=reference,
+            reference_date_time=reference,
+            status_name="COMPLETED",
+            text=[
+                {
+                    "uid": uid,
+                    "content": " ".join(rng.choice(WORDS) for _ in range(words)),
+                    "dateTime": reference,
+                    "status": "COMPLETED",
+                    "clinicians": [],
+                }
+            ],
+        )
+    return documents
+
+
+def build_appointments(
+    count: int, years: int = 10, seed: int = 4
+) -> dict[str, Appointment]:
+    """Build `count` kept clinic appointments"""
+    rng = random.Random(seed)
+    appointments: dict[str, Appointment] = {}
+    for i, when in enumerate(_timestamps(count, years, rng)):
+        uid = f"urn:va:appointment:{STATION}:1:{i}"
+        appointments[uid] = Appointment(
+            uid=uid,
+            localId=str(i),
+            dateTime=when,
+            appointmentStatus="KEPT",
+            category={"categoryCode": "OV", "categoryName": "OUTPATIENT VISIT"},
+            facility={"code": STATION, "name": "CAMP MASTER"},
+            locationName="PRIMARY CARE",
+            locationUid=f"urn:va:location:{STATION}:23",
+            patient_class={"patientClassCode": "AMB", "patientClassName": "Ambulatory"},
+            providers=[
+                {"providerName": "PROVIDER,ONE", "providerUid": "urn:va:user:1"}
+            ],
+            service="MEDICINE",
+            stop_code={
+                "stopCodeName": "PRIMARY CARE",
+                "stopCodeUid": "urn:va:stop:323",
+            },
+            type={"typeCode": 9, "typeName": "REGULAR"},
+            summary=f"Primary care visit {i}",
+        )
+    return appointments
+
+
+def build_collection(
+    vitals: int = 0,
+    labs: int = 0,
+    documents: int = 0,
+    years: int = 10,
+    appointments: int = 0,
+) -> PatientDataCollection:
+    """Build a collection with the requested number of items per domain"""
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            uid=f"urn:va:patient:{STATION}:1",
+            dfn="1",
+            pid=f"{STATION};1",
+            icn=ICN,
+            fullName="SYNTHETIC,PATIENT",
+            familyName="SYNTHETIC",
+            givenNames="PATIENT",
+            displayName="SYNTHETIC,PATIENT",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=date(1950, 1, 1),
+            ssn="000000000",
+            sensitive=False,
+            deceased=False,
+        ),
+        vital_signs_dict=build_vitals(vitals, years),
+        lab_results_dict=build_labs(labs, years),
+        documents_dict=build_documents(documents, years),
+        appointments_dict=build_appointments(appointments, years),
+        source_station=STATION,
+        source_icn=ICN,
+        total_items=vitals + labs + documents + appointments,
+    )
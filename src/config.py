@@ -53,12 +53,106 @@ RESPONSE_CACHE_TTL_MINUTES = int(
     os.getenv("RESPONSE_CACHE_TTL_MINUTES", "10")
 )  # Increased from 5
 
+# Document search indexes kept in process, one per patient data snapshot
+DOCUMENT_SEARCH_CACHE_SIZE = int(os.getenv("DOCUMENT_SEARCH_CACHE_SIZE", "64"))
+
+# Document text bodies cached out of line - each body of at least
+# DOCUMENT_TEXT_MIN_CHARS characters is its own content-addressed cache entry,
+# loaded only when a tool returns full text
+DOCUMENT_TEXT_OUT_OF_LINE = (
+    os.getenv("DOCUMENT_TEXT_OUT_OF_LINE", "true").lower() == "true"
+)
+DOCUMENT_TEXT_MIN_CHARS = int(os.getenv("DOCUMENT_TEXT_MIN_CHARS", "256"))
+
+# Raw VPR payload kept after parsing, for debugging: "off" drops it, "keep"
+# holds it on the parsed collection, "spill" writes it compressed to a ring of
+# at most RAW_DATA_SPILL_MAX_FILES files in RAW_DATA_SPILL_DIR
+RAW_DATA_RETENTION = os.getenv("RAW_DATA_RETENTION", "off").lower()
+RAW_DATA_SPILL_DIR = os.getenv("RAW_DATA_SPILL_DIR", "logs/raw_vpr")
+RAW_DATA_SPILL_MAX_FILES = int(os.getenv("RAW_DATA_SPILL_MAX_FILES", "50"))
+
+# Parsing very large VPR records in worker processes - records of at least
+# PARALLEL_PARSE_MIN_ITEMS items have their big domains split into chunks of
+# PARALLEL_PARSE_CHUNK_ITEMS; fewer than 2 workers turns this off
+PARALLEL_PARSE_MIN_ITEMS = int(os.getenv("PARALLEL_PARSE_MIN_ITEMS", "20000"))
+PARALLEL_PARSE_CHUNK_ITEMS = int(os.getenv("PARALLEL_PARSE_CHUNK_ITEMS", "2500"))
+PARALLEL_PARSE_WORKERS = int(
+    os.getenv("PARALLEL_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Filtered result lists pinned for cursor paging, one per (data snapshot, query)
+CURSOR_CACHE_SIZE = int(os.getenv("CURSOR_CACHE_SIZE", "128"))
+
+# Patient data fetches in flight per station when loading a panel of patients
+PANEL_FETCH_MAX_CONCURRENCY = int(os.getenv("PANEL_FETCH_MAX_CONCURRENCY", "4"))
+
+# Federated patient fetch - how long a multi-station read waits for slow
+# stations before answering with the stations that did respond
+FEDERATED_FETCH_TIMEOUT_SECONDS = float(
+    os.getenv("FEDERATED_FETCH_TIMEOUT_SECONDS", "20")
+)
+
+# Cache prewarming from clinic schedules (SDES GET APPTS BY CLIN IEN 2).
+# PREWARM_CLINICS lists "station:clinic IEN" pairs, e.g. "500:195,500:196"
+PREWARM_ENABLED = os.getenv("PREWARM_ENABLED", "false").lower() == "true"
+PREWARM_CLINICS = os.getenv("PREWARM_CLINICS", "")
+PREWARM_DUZ = os.getenv("PREWARM_DUZ", DEFAULT_DUZ)
+PREWARM_LOOKAHEAD_HOURS = float(os.getenv("PREWARM_LOOKAHEAD_HOURS", "24"))
+PREWARM_LEAD_MINUTES = float(os.getenv("PREWARM_LEAD_MINUTES", "15"))
+PREWARM_INTERVAL_MINUTES = float(os.getenv("PREWARM_INTERVAL_MINUTES", "5"))
+PREWARM_RATE_PER_SECOND = float(os.getenv("PREWARM_RATE_PER_SECOND", "1"))
+PREWARM_MAX_PATIENTS = int(os.getenv("PREWARM_MAX_PATIENTS", "200"))
+
+# Serialized items memoized per (data snapshot, UID) for repeat tool responses
+FRAGMENT_CACHE_MAX_ITEMS = int(os.getenv("FRAGMENT_CACHE_MAX_ITEMS", "20000"))
+
 # Multi-tier Cache Configuration
 MULTI_TIER_WRITE_THROUGH = (
     os.getenv("MULTI_TIER_WRITE_THROUGH", "true").lower() == "true"
 )
 MULTI_TIER_READ_THROUGH = os.getenv("MULTI_TIER_READ_THROUGH", "true").lower() == "true"
 
+# Negative Cache Configuration (not-found / forbidden / RPC fault errors)
+NEGATIVE_CACHE_ENABLED = os.getenv("NEGATIVE_CACHE_ENABLED", "true").lower() == "true"
+NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS = int(
+    os.getenv("NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS", "60")
+)
+NEGATIVE_CACHE_FORBIDDEN_TTL_SECONDS = int(
+    os.getenv("NEGATIVE_CACHE_FORBIDDEN_TTL_SECONDS", "300")
+)
+NEGATIVE_CACHE_RPC_FAULT_TTL_SECONDS = int(
+    os.getenv("NEGATIVE_CACHE_RPC_FAULT_TTL_SECONDS", "30")
+)
+NEGATIVE_CACHE_MAX_SIZE = int(os.getenv("NEGATIVE_CACHE_MAX_SIZE", "1000"))
+
+# Tool Result Cache Configuration (serialized responses of repeated tool calls)
+TOOL_RESULT_CACHE_ENABLED = (
+    os.getenv("TOOL_RESULT_CACHE_ENABLED", "true").lower() == "true"
+)
+TOOL_RESULT_CACHE_MAX_BYTES = int(
+    os.getenv("TOOL_RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+# RPC Retry Configuration (applies to idempotent RPCs only)
+RPC_RETRY_ENABLED = os.getenv("RPC_RETRY_ENABLED", "true").lower() == "true"
+RPC_RETRY_MAX_ATTEMPTS = int(os.getenv("RPC_RETRY_MAX_ATTEMPTS", "3"))
+RPC_RETRY_BASE_DELAY_MS = int(os.getenv("RPC_RETRY_BASE_DELAY_MS", "100"))
+RPC_RETRY_MAX_DELAY_MS = int(os.getenv("RPC_RETRY_MAX_DELAY_MS", "2000"))
+RPC_RETRY_DEADLINE_SECONDS = float(os.getenv("RPC_RETRY_DEADLINE_SECONDS", "30"))
+
+# RPC Hedging - send a duplicate request once the first exceeds the observed p95
+RPC_HEDGING_ENABLED = os.getenv("RPC_HEDGING_ENABLED", "false").lower() == "true"
+RPC_HEDGE_MIN_DELAY_MS = int(os.getenv("RPC_HEDGE_MIN_DELAY_MS", "50"))
+
+# Bulk RPC - maximum calls in flight at once for invoke_many
+RPC_BULK_MAX_CONCURRENCY = int(os.getenv("RPC_BULK_MAX_CONCURRENCY", "8"))
+
+# Request Deadlines - total budget for a tool call (clients may shorten it with
+# the X-Vista-Deadline-Ms header, capped at REQUEST_DEADLINE_MAX_SECONDS)
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "55"))
+REQUEST_DEADLINE_MAX_SECONDS = float(os.getenv("REQUEST_DEADLINE_MAX_SECONDS", "300"))
+REQUEST_DEADLINE_RESERVE_MS = int(os.getenv("REQUEST_DEADLINE_RESERVE_MS", "250"))
+
 
 def get_vista_config():
     """Get Vista configuration from environment variables only"""
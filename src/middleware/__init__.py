@@ -1,7 +1,11 @@
 from fastmcp import FastMCP
 
 from .auth_middleware import AuthMiddleware
+from .deadline_middleware import DeadlineMiddleware
+from .result_cache_middleware import ToolResultCacheMiddleware
 
 
 def register_middleware(server: FastMCP):
+    server.add_middleware(DeadlineMiddleware())
     server.add_middleware(AuthMiddleware())
+    server.add_middleware(ToolResultCacheMiddleware())
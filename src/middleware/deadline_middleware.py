@@ -0,0 +1,40 @@
+import json
+
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from src.logging_config import get_logger
+from src.services.deadline import (
+    deadline_from_headers,
+    get_deadline,
+    reset_deadline,
+    start_deadline,
+)
+
+
+class DeadlineMiddleware(Middleware):
+    """Start a request deadline for every tool call.
+
+    The budget comes from the X-Vista-Deadline-Ms (or X-Request-Timeout-Ms)
+    header when present, otherwise from REQUEST_DEADLINE_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._logger = get_logger("mcp-deadline-middleware")
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        headers = get_http_headers() or {}
+        token = start_deadline(deadline_from_headers(headers))
+        try:
+            return await call_next(context)
+        finally:
+            deadline = get_deadline()
+            if deadline is not None:
+                report = deadline.report()
+                if report["exhausted_stages"] or report["skipped_stages"]:
+                    tool_name = getattr(context.message, "name", "unknown")
+                    self._logger.warning(
+                        f"DEADLINE_REPORT: {json.dumps({'tool': tool_name, **report})}"
+                    )
+            reset_deadline(token)
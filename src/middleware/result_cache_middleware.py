@@ -0,0 +1,122 @@
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pydantic_core
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+from src.logging_config import get_logger
+from src.models.responses.metadata import PerformanceMetrics
+from src.models.utils import format_datetime_for_mcp_response
+from src.services.cache.results import CachedToolResult, get_tool_result_cache
+from src.services.data import get_patient_data_version
+from src.utils import get_default_duz, get_default_station, resolve_vista_context
+
+
+class ToolResultCacheMiddleware(Middleware):
+    """Serve repeated patient tool calls from the tool result cache.
+
+    Applies to tools taking a patient_icn, except federated calls (a stations
+    argument), whose results span several stations' data. The content version of the cached
+    patient data is read without loading the data; a call repeating an earlier
+    one (same tool, arguments, station and DUZ) on the same version gets the
+    stored result with this call's own timing in metadata.performance and the
+    result's age in result_cache_age_ms. Only successful results are stored.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._logger = get_logger("mcp-result-cache-middleware")
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        cache = get_tool_result_cache()
+        arguments = dict(getattr(context.message, "arguments", None) or {})
+        patient_icn = arguments.get("patient_icn")
+        if (
+            not cache.enabled
+            or not isinstance(patient_icn, str)
+            or arguments.get("stations")
+        ):
+            return await call_next(context)
+
+        start_time = datetime.now(UTC)
+        tool_name = context.message.name
+        station, caller_duz = resolve_vista_context(
+            context.fastmcp_context,
+            station_arg=arguments.get("station"),
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+        arguments = await self._with_defaults(context, tool_name, arguments)
+
+        version = await get_patient_data_version(station, patient_icn, caller_duz)
+        if version is not None:
+            key = cache.make_key(tool_name, arguments, station, caller_duz, version)
+            cached = cache.get(tool_name, key)
+            if cached is not None:
+                return self._cached_result(cached, start_time)
+
+        result = await call_next(context)
+
+        structured = getattr(result, "structured_content", None)
+        if not isinstance(structured, dict) or structured.get("success") is not True:
+            return result
+        current = await get_patient_data_version(station, patient_icn, caller_duz)
+        if version is None:
+            # The call loaded the patient, so the version is known now
+            if current is None:
+                return result
+            key = cache.make_key(tool_name, arguments, station, caller_duz, current)
+        elif current != version:
+            # Refreshed while the tool ran; the result may hold the newer data
+            return result
+        cache.put(key, pydantic_core.to_json(structured).decode())
+        return result
+
+    async def _with_defaults(
+        self, context: MiddlewareContext, tool_name: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Arguments with the tool's defaults filled in, so omitted and explicit
+        defaults give the same key"""
+        fastmcp_context = getattr(context, "fastmcp_context", None)
+        if fastmcp_context is None:
+            return arguments
+        try:
+            tool = await fastmcp_context.fastmcp.get_tool(tool_name)
+        except Exception:
+            return arguments
+        properties = tool.parameters.get("properties", {})
+        defaults = {
+            name: schema["default"]
+            for name, schema in properties.items()
+            if "default" in schema
+        }
+        return {**defaults, **arguments}
+
+    def _cached_result(
+        self, cached: CachedToolResult, start_time: datetime
+    ) -> ToolResult:
+        """Stored result with this call's timing"""
+        payload = json.loads(cached.payload)
+        metadata = payload.get("metadata")
+        if isinstance(metadata, dict):
+            end_time = datetime.now(UTC)
+            performance = PerformanceMetrics(
+                duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                start_time=start_time,
+                end_time=end_time,
+                result_cache_age_ms=cached.age_ms,
+            )
+            payload["metadata"] = {
+                **metadata,
+                "timestamp": format_datetime_for_mcp_response(end_time),
+                "performance": pydantic_core.to_jsonable_python(performance),
+            }
+        return ToolResult(
+            content=[
+                TextContent(type="text", text=pydantic_core.to_json(payload).decode())
+            ],
+            structured_content=payload,
+        )
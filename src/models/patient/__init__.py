@@ -35,6 +35,7 @@ from .demographics import (
 from .diagnosis import Diagnosis
 from .document import Document
 from .health_factor import HealthFactor
+from .indexes import SeriesIndex, TimeIndex, UidIndex
 from .medication import Medication
 from .order import Order
 from .pov import POVSummary, POVType, PurposeOfVisit
@@ -45,7 +46,10 @@ from .problem import (
     ProblemStatus,
     ProblemSummary,
 )
+from .query import Filter, Query
+from .search import DocumentSearchIndex
 from .treatment import Treatment, TreatmentStatus
+from .trends import NumericSeries, TrendSummary
 from .visits import Visit, VisitSummary, VisitType
 
 __all__ = [
@@ -104,7 +108,18 @@ __all__ = [
     "AppointmentStatus",
     "AppointmentStopCode",
     "AppointmentType",
+    # Trends
+    "NumericSeries",
+    "TrendSummary",
+    # Search
+    "DocumentSearchIndex",
+    # Queries
+    "Filter",
+    "Query",
     # Collection
     "PatientDataCollection",
+    "SeriesIndex",
+    "TimeIndex",
+    "UidIndex",
     "CPTCode",
 ]
@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Optional
 
-from pydantic import ConfigDict, field_validator
+from pydantic import ConfigDict, PrivateAttr, field_validator
 
 from ..base.common import BaseVistaModel
 
@@ -22,6 +22,9 @@ class BasePatientModel(BaseVistaModel):
         json_schema_serialization_defaults_required=True,
     )
 
+    # (collection version, UID), set by PatientDataCollection.memoize_fragments
+    _fragment_key: tuple[str, str] | None = PrivateAttr(default=None)
+
 
 class Gender(str, Enum):
     """Gender codes used in patient records"""
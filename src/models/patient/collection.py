@@ -1,9 +1,12 @@
 """Patient data collection model"""
 
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
+from hashlib import blake2b
+from operator import attrgetter
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from .allergy import Allergy
 from .appointment import Appointment
@@ -14,13 +17,51 @@ from .demographics import PatientDemographics
 from .diagnosis import Diagnosis
 from .document import Document
 from .health_factor import HealthFactor
+from .indexes import SeriesIndex, TimeIndex, UidIndex
+from .interning import ValueTable
 from .medication import Medication
 from .order import Order
 from .pov import PurposeOfVisit
 from .problem import Problem
+from .search import DocumentSearchIndex
 from .treatment import Treatment
+from .trends import NumericSeries, build_numeric_series
 from .visits import Visit
 
+# Every UID-keyed domain dict
+DOMAIN_FIELDS: tuple[str, ...] = (
+    "vital_signs_dict",
+    "lab_results_dict",
+    "consults_dict",
+    "medications_dict",
+    "visits_dict",
+    "health_factors_dict",
+    "treatments_dict",
+    "diagnoses_dict",
+    "orders_dict",
+    "documents_dict",
+    "cpt_codes_dict",
+    "allergies_dict",
+    "povs_dict",
+    "problems_dict",
+    "appointments_dict",
+)
+
+# Domains served by per-type_code series
+TYPE_SERIES_DOMAINS: tuple[str, ...] = ("vital_signs_dict", "lab_results_dict")
+
+# Clinical timestamp used to order each date-filtered domain
+TIME_INDEXED_DOMAINS: dict[str, str] = {
+    "vital_signs_dict": "observed",
+    "lab_results_dict": "observed",
+    "documents_dict": "reference_date_time",
+    "visits_dict": "visit_date",
+    "problems_dict": "entered",
+    "povs_dict": "entered",
+    "treatments_dict": "date",
+    "appointments_dict": "appointment_date",
+}
+
 
 class PatientDataCollection(BasePatientModel):
     """
@@ -58,27 +99,231 @@ class PatientDataCollection(BasePatientModel):
     cache_version: str = Field(default="1.0")
     total_items: int = 0
 
-    # Store raw data for debugging (excluded from serialization)
+    # Station each item was read from, for collections merged across stations
+    item_stations: dict[str, str] = Field(default_factory=dict)
+
+    # Raw VPR payload for debugging, held or spilled to disk according to
+    # RAW_DATA_RETENTION (excluded from serialization)
     raw_data: dict[str, Any] | None = Field(default=None, exclude=True)
+    raw_data_path: str | None = Field(default=None, exclude=True)
+
+    # Secondary indexes, rebuilt after parsing or rehydration (never serialized)
+    _time_indexes: dict[str, TimeIndex[Any]] = PrivateAttr(default_factory=dict)
+    _type_series: dict[str, SeriesIndex[Any]] = PrivateAttr(default_factory=dict)
+    _uid_index: UidIndex[BasePatientModel] = PrivateAttr(default_factory=UidIndex)
+    # Built on first use (see document_search and *_numeric)
+    _document_search: DocumentSearchIndex | None = PrivateAttr(default=None)
+    _numeric_series: dict[str, list[NumericSeries]] = PrivateAttr(default_factory=dict)
+    _content_version: str | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build secondary indexes once the domain dicts are populated"""
+        super().model_post_init(__context)
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self, domains: Iterable[str] | None = None) -> None:
+        """
+        Rebuild secondary indexes (call after modifying a domain dict)
 
-    @property
-    def all_items(self) -> dict[str, BasePatientModel]:
-        """Get all items in the collection"""
-        return {
-            **self.vital_signs_dict,
-            **self.lab_results_dict,
-            **self.consults_dict,
-            **self.medications_dict,
-            **self.visits_dict,
-            **self.health_factors_dict,
-            **self.diagnoses_dict,
-            **self.orders_dict,
-            **self.documents_dict,
-            **self.cpt_codes_dict,
-            **self.allergies_dict,
-            **self.povs_dict,
-            **self.problems_dict,
+        Args:
+            domains: Domain dict names that changed (default: all of them)
+        """
+        self._content_version = None
+        for domain in DOMAIN_FIELDS if domains is None else domains:
+            items = getattr(self, domain)
+            self._uid_index.replace_domain(domain, items)
+            if domain == "documents_dict":
+                self._document_search = None
+            if domain in TIME_INDEXED_DOMAINS:
+                self._time_indexes[domain] = TimeIndex(
+                    items.values(), attrgetter(TIME_INDEXED_DOMAINS[domain])
+                )
+            if domain in TYPE_SERIES_DOMAINS:
+                self._numeric_series.pop(domain, None)
+                self._type_series[domain] = SeriesIndex(
+                    items.values(),
+                    attrgetter("type_code"),
+                    attrgetter("observed"),
+                )
+
+    @classmethod
+    def merge(
+        cls, collections: Mapping[str, "PatientDataCollection"]
+    ) -> "PatientDataCollection":
+        """
+        Merge one patient's collections read from several stations
+
+        Items are de-duplicated by UID, the first station listed keeping its
+        copy, and tagged with their station in item_stations. Demographics and
+        source metadata come from the first station; retrieved_at is the
+        oldest of the stations'.
+
+        Args:
+            collections: Collection per station, in order of precedence
+
+        Returns:
+            The merged collection
+        """
+        item_stations: dict[str, str] = {}
+        domains: dict[str, dict[str, BasePatientModel]] = {
+            domain: {} for domain in DOMAIN_FIELDS
         }
+        for station, collection in collections.items():
+            for domain in DOMAIN_FIELDS:
+                merged = domains[domain]
+                for uid, item in getattr(collection, domain).items():
+                    if uid not in item_stations:
+                        merged[uid] = item
+                        item_stations[uid] = station
+
+        first = next(iter(collections.values()))
+        return cls.model_validate(
+            {
+                "demographics": first.demographics,
+                **domains,
+                "source_station": first.source_station,
+                "source_icn": first.source_icn,
+                "retrieved_at": min(c.retrieved_at for c in collections.values()),
+                "total_items": len(item_stations),
+                "item_stations": item_stations,
+            }
+        )
+
+    @property
+    def content_version(self) -> str:
+        """
+        Version of this data snapshot
+
+        Combines when the data was retrieved with a hash of the patient, station
+        and every domain's UIDs, so a refresh or a changed domain gives a new
+        version even within the same second.
+        """
+        if self._content_version is None:
+            digest = blake2b(digest_size=10)
+            digest.update(f"{self.source_station}\0{self.source_icn}".encode())
+            for domain in DOMAIN_FIELDS:
+                digest.update(b"\1")
+                digest.update("\0".join(getattr(self, domain)).encode())
+            retrieved_ms = int(self.retrieved_at.timestamp() * 1000)
+            self._content_version = f"{retrieved_ms:x}-{digest.hexdigest()}"
+        return self._content_version
+
+    def memoize_fragments(self) -> None:
+        """
+        Reuse each item's serialized JSON across responses
+
+        Items of one content version never change, so once an item has been
+        serialized its output is kept (see fragments.py) and later responses
+        including it, from this or any rehydrated copy of the same snapshot,
+        skip its field serializers. Documents whose text is stored out of line
+        are left out: they are small, and a copy with the text loaded
+        (Document.with_text) serializes differently under the same UID.
+        """
+        version = self.content_version
+        for uid, item in self._uid_index.items.items():
+            if isinstance(item, Document) and item.text_offloaded:
+                continue
+            item._fragment_key = (version, uid)
+
+    def share_values(self, share_strings: bool = True) -> None:
+        """
+        Make the values repeated across items share one object
+
+        Equal short strings and equal pydantic fields sets of the demographics
+        and every item point at one object (see interning.py), which roughly
+        halves the memory a parsed collection holds.
+
+        Args:
+            share_strings: Also share strings (not needed after JSON validation,
+                which already reuses repeated short strings)
+        """
+        ValueTable(share_strings).share(
+            [self.demographics, *self._uid_index.items.values()]
+        )
+
+    @property
+    def vital_signs_by_time(self) -> TimeIndex[VitalSign]:
+        """Vital signs newest-first by observed time"""
+        return self._time_indexes["vital_signs_dict"]
+
+    @property
+    def lab_results_by_time(self) -> TimeIndex[LabResult]:
+        """Lab results newest-first by observed time"""
+        return self._time_indexes["lab_results_dict"]
+
+    @property
+    def vital_signs_by_type(self) -> SeriesIndex[VitalSign]:
+        """Vital signs grouped by type_code, each series newest-first"""
+        return self._type_series["vital_signs_dict"]
+
+    @property
+    def lab_results_by_type(self) -> SeriesIndex[LabResult]:
+        """Lab results grouped by type_code, each series newest-first"""
+        return self._type_series["lab_results_dict"]
+
+    @property
+    def documents_by_time(self) -> TimeIndex[Document]:
+        """Documents newest-first by reference date"""
+        return self._time_indexes["documents_dict"]
+
+    @property
+    def visits_by_time(self) -> TimeIndex[Visit]:
+        """Visits newest-first by visit date"""
+        return self._time_indexes["visits_dict"]
+
+    @property
+    def problems_by_time(self) -> TimeIndex[Problem]:
+        """Problems newest-first by entered date"""
+        return self._time_indexes["problems_dict"]
+
+    @property
+    def povs_by_time(self) -> TimeIndex[PurposeOfVisit]:
+        """Purposes of visit newest-first by entered date"""
+        return self._time_indexes["povs_dict"]
+
+    @property
+    def treatments_by_time(self) -> TimeIndex[Treatment]:
+        """Treatments newest-first by treatment date"""
+        return self._time_indexes["treatments_dict"]
+
+    @property
+    def appointments_by_time(self) -> TimeIndex[Appointment]:
+        """Appointments newest-first by appointment date"""
+        return self._time_indexes["appointments_dict"]
+
+    @property
+    def document_search(self) -> DocumentSearchIndex:
+        """Full-text index over documents, built on first use"""
+        if self._document_search is None:
+            self._document_search = DocumentSearchIndex(self.documents_dict.values())
+        return self._document_search
+
+    def _get_numeric_series(self, domain: str) -> list[NumericSeries]:
+        numeric = self._numeric_series.get(domain)
+        if numeric is None:
+            numeric = build_numeric_series(self._type_series[domain])
+            self._numeric_series[domain] = numeric
+        return numeric
+
+    @property
+    def vital_signs_numeric(self) -> list[NumericSeries]:
+        """Numeric vital sign series per type (blood pressure split in two)"""
+        return self._get_numeric_series("vital_signs_dict")
+
+    @property
+    def lab_results_numeric(self) -> list[NumericSeries]:
+        """Numeric lab result series per type"""
+        return self._get_numeric_series("lab_results_dict")
+
+    @property
+    def uid_index(self) -> UidIndex[BasePatientModel]:
+        """UID lookup across every domain, with prefix matching"""
+        return self._uid_index
+
+    @property
+    def all_items(self) -> Mapping[str, BasePatientModel]:
+        """Get all items in the collection (read-only view, no copy)"""
+        return self._uid_index.items
 
     @property
     def patient_name(self) -> str:
@@ -225,12 +470,7 @@ class PatientDataCollection(BasePatientModel):
         from datetime import datetime, timedelta
 
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
-        return [
-            doc
-            for doc in self.documents
-            if doc.reference_date_time is not None
-            and doc.reference_date_time >= cutoff_date
-        ]
+        return self.documents_by_time.since(cutoff_date)
 
     def get_progress_notes(self) -> list[Document]:
         """Get progress note documents"""
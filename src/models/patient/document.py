@@ -1,7 +1,10 @@
 """Document models for patient records"""
 
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from hashlib import blake2b
+from typing import Any
 
 from pydantic import Field, computed_field, field_validator
 
@@ -12,6 +15,49 @@ from .base import BasePatientModel
 
 logger = get_logger()
 
+# Characters of each text entry kept in a document's content_summary
+SUMMARY_CHARS = 200
+
+
+def summarize_content(content: str) -> str:
+    """Leading SUMMARY_CHARS characters of a text body"""
+    content = content.strip()
+    if len(content) > SUMMARY_CHARS:
+        return content[:SUMMARY_CHARS] + "..."
+    return content
+
+
+def text_ref(content: str) -> str:
+    """Content-addressed key of a text body (equal bodies share one key)"""
+    return blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def offload_text(document: dict[str, Any], min_chars: int) -> dict[str, str]:
+    """
+    Move the text bodies of a serialized document out of line
+
+    Each body of at least min_chars characters is replaced by its key and
+    summary (content_ref and content_summary), in place.
+
+    Args:
+        document: Document as dumped with model_dump(mode="json")
+        min_chars: Shorter bodies stay inline
+
+    Returns:
+        The moved bodies by key
+    """
+    bodies: dict[str, str] = {}
+    for text in document.get("text") or ():
+        content = text.get("content") or ""
+        if len(content) < min_chars:
+            continue
+        ref = text_ref(content)
+        bodies[ref] = content
+        text["content"] = ""
+        text["content_ref"] = ref
+        text["content_summary"] = summarize_content(content)
+    return bodies
+
 
 class DocumentTitle(BasePatientModel):
     """National document title information"""
@@ -50,11 +96,21 @@ class DocumentText(BasePatientModel):
     status: str
     clinicians: list[Clinician] = Field(default_factory=list)
 
+    # Set when the body is stored out of line (see offload_text): its key in
+    # the document text cache and its summary, with content left empty
+    content_ref: str | None = None
+    content_summary: str | None = None
+
     @field_validator("date_time", mode="before")
     @classmethod
     def parse_datetime(cls, v):
         return parse_datetime(v)
 
+    @property
+    def is_offloaded(self) -> bool:
+        """Check if the body is stored out of line and not loaded"""
+        return self.content_ref is not None and not self.content
+
 
 class Document(BasePatientModel):
     """Document - represents a clinical document in VistA"""
@@ -168,15 +224,84 @@ class Document(BasePatientModel):
         # Combine all content from text items
         content_parts = []
         for text_item in self.text:
-            if text_item.content:
-                # Take first 200 characters as summary
-                content = text_item.content.strip()
-                if len(content) > 200:
-                    content = content[:200] + "..."
-                content_parts.append(content)
+            if text_item.is_offloaded:
+                content_parts.append(text_item.content_summary or "")
+            elif text_item.content:
+                content_parts.append(summarize_content(text_item.content))
 
         return " | ".join(content_parts)
 
+    @property
+    def text_offloaded(self) -> bool:
+        """Check if any text body is stored out of line and not loaded"""
+        return any(text_item.is_offloaded for text_item in self.text)
+
+    def with_text(self, bodies: Mapping[str, str]) -> "Document":
+        """
+        Copy of the document with its out-of-line text bodies filled in
+
+        Args:
+            bodies: Text bodies by content_ref
+
+        Returns:
+            The copy, serializing as the document did before offloading
+            (entries whose body is missing keep their summary)
+        """
+        text = []
+        for text_item in self.text:
+            body = (
+                bodies.get(text_item.content_ref or "")
+                if text_item.is_offloaded
+                else None
+            )
+            if body is not None:
+                text_item = text_item.model_copy(
+                    update={
+                        "content": body,
+                        "content_ref": None,
+                        "content_summary": None,
+                    }
+                )
+            text.append(text_item)
+        document = self.model_copy(update={"text": text})
+        # Not the snapshot's memoized item (see memoize_fragments)
+        document._fragment_key = None
+        return document
+
+    def without_text(self, min_chars: int) -> "Document":
+        """
+        Copy of the document with its long text bodies replaced by summaries
+
+        Args:
+            min_chars: Shorter bodies stay inline
+
+        Returns:
+            The copy, serializing as the document does once its text is cached
+            out of line (see offload_text), or the document itself when no
+            body is that long
+        """
+        if not any(
+            text_item.content and len(text_item.content) >= min_chars
+            for text_item in self.text
+        ):
+            return self
+        text = []
+        for text_item in self.text:
+            content = text_item.content
+            if content and len(content) >= min_chars:
+                text_item = text_item.model_copy(
+                    update={
+                        "content": "",
+                        "content_ref": text_ref(content),
+                        "content_summary": summarize_content(content),
+                    }
+                )
+            text.append(text_item)
+        document = self.model_copy(update={"text": text})
+        # Not the snapshot's memoized item (see memoize_fragments)
+        document._fragment_key = None
+        return document
+
     @property
     def is_progress_note(self) -> bool:
         """Check if this is a progress note"""
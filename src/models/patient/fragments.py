@@ -0,0 +1,54 @@
+"""Memoized JSON fragments of serialized patient items"""
+
+from collections.abc import Hashable
+from typing import Any, TypedDict
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from ...config import FRAGMENT_CACHE_MAX_ITEMS, PATIENT_CACHE_TTL_MINUTES
+
+# JSON-mode output of items by (collection version, UID, serializer options).
+# Items of one collection version never change, so an item serialized for one
+# response is reused by every later response that includes it
+_fragments: TTLCache[tuple[Hashable, ...], Any] = TTLCache(
+    maxsize=FRAGMENT_CACHE_MAX_ITEMS, ttl=PATIENT_CACHE_TTL_MINUTES * 60
+)
+
+
+class SerializeOptions(TypedDict):
+    """Serializer options a fragment was produced with"""
+
+    by_alias: bool
+    exclude_none: bool
+    exclude_defaults: bool
+    exclude_unset: bool
+    round_trip: bool
+
+
+def fragment_key(item: BaseModel) -> tuple[str, str] | None:
+    """(collection version, UID) of an item, None if it is not memoized"""
+    private = item.__pydantic_private__
+    return private.get("_fragment_key") if private else None
+
+
+def serialize_item(item: BaseModel, options: SerializeOptions) -> Any:
+    """
+    Serialize an item in JSON mode, reusing its earlier output if memoized
+
+    Args:
+        item: Item model
+        options: Serializer options of the response
+
+    Returns:
+        The item's JSON-mode output (shared; do not modify)
+    """
+    key = fragment_key(item)
+    if key is None:
+        return item.__pydantic_serializer__.to_python(item, mode="json", **options)
+    memo_key = (*key, *options.items())
+    fragment = _fragments.get(memo_key)
+    if fragment is None:
+        fragment = item.__pydantic_serializer__.to_python(item, mode="json", **options)
+        _fragments[memo_key] = fragment
+    return fragment
@@ -0,0 +1,256 @@
+"""Secondary indexes over patient collection domains"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TimeIndex(Generic[T]):
+    """
+    Items of one domain sorted newest-first by their clinical timestamp.
+
+    A parallel array of negated epoch seconds is kept ascending, so a date
+    window is found with bisect instead of a scan, and slices of the item
+    list come back newest-first without re-sorting. Items without a
+    timestamp are left out, as they never match a date filter.
+    """
+
+    __slots__ = ("items", "_keys")
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        timestamp: Callable[[T], datetime | None],
+    ):
+        """
+        Build the index
+
+        Args:
+            items: Domain items, in any order (ties keep their original order)
+            timestamp: Function returning an item's clinical timestamp
+        """
+        keys: list[float] = []
+        dated: list[T] = []
+        for item in items:
+            ts = timestamp(item)
+            if ts is not None:
+                keys.append(-ts.timestamp())
+                dated.append(item)
+
+        # Ascending negated time is newest-first; sorted() is stable, so ties
+        # keep their original order
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.items: list[T] = [dated[i] for i in order]
+        self._keys = array("d", [keys[i] for i in order])
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def since(self, cutoff: datetime) -> list[T]:
+        """Items with a timestamp at or after cutoff, newest first"""
+        return self.items[: bisect_right(self._keys, -cutoff.timestamp())]
+
+    def between(self, start: datetime, end: datetime) -> list[T]:
+        """Items with start <= timestamp <= end, newest first"""
+        first = bisect_left(self._keys, -end.timestamp())
+        last = bisect_right(self._keys, -start.timestamp())
+        return self.items[first:last]
+
+    def latest(
+        self,
+        n: int,
+        since: datetime | None = None,
+        where: Callable[[T], bool] | None = None,
+        until: datetime | None = None,
+    ) -> list[T]:
+        """
+        Up to n newest items, optionally within a window and matching a filter
+
+        Args:
+            n: Maximum items to return
+            since: Only items at or after this time
+            where: Only items for which this returns True
+            until: Only items at or before this time
+
+        Returns:
+            Matching items, newest first
+        """
+        # Walk the window lazily instead of slicing it out first
+        start = 0 if until is None else bisect_left(self._keys, -until.timestamp())
+        end = (
+            len(self.items)
+            if since is None
+            else bisect_right(self._keys, -since.timestamp())
+        )
+        if where is None:
+            return self.items[start : min(start + n, end)]
+        return list(islice(filter(where, islice(self.items, start, end)), n))
+
+
+class SeriesIndex(Generic[T]):
+    """
+    Items grouped into per-key series (e.g. per type_code), each a TimeIndex.
+
+    Serves "n most recent per type" queries with one slice per series instead
+    of grouping the whole domain on every call.
+    """
+
+    __slots__ = ("series", "_timestamp")
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        key: Callable[[T], str],
+        timestamp: Callable[[T], datetime | None],
+    ):
+        """
+        Build the index
+
+        Args:
+            items: Domain items, in any order
+            key: Function returning the series an item belongs to
+            timestamp: Function returning an item's clinical timestamp
+        """
+        groups: dict[str, list[T]] = {}
+        for item in items:
+            groups.setdefault(key(item), []).append(item)
+        self.series: dict[str, TimeIndex[T]] = {
+            series_key: TimeIndex(group, timestamp)
+            for series_key, group in groups.items()
+        }
+        self._timestamp = timestamp
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def most_recent(
+        self,
+        n: int,
+        since: datetime | None = None,
+        where: Callable[[T], bool] | None = None,
+        series_filter: Callable[[T], bool] | None = None,
+        until: datetime | None = None,
+    ) -> list[T]:
+        """
+        Up to n newest items per series
+
+        Args:
+            n: Maximum items per series
+            since: Only items at or after this time
+            where: Only items for which this returns True
+            series_filter: Only series whose newest item passes this check
+                (for attributes shared by a whole series, e.g. type_name)
+            until: Only items at or before this time
+
+        Returns:
+            Selected items; series with the most recent match come first,
+            each series newest first
+        """
+        selections: list[tuple[float, list[T]]] = []
+        for series in self.series.values():
+            if not series.items or (
+                series_filter is not None and not series_filter(series.items[0])
+            ):
+                continue
+            selected = series.latest(n, since=since, where=where, until=until)
+            if selected:
+                newest = self._timestamp(selected[0])
+                selections.append((newest.timestamp() if newest else 0.0, selected))
+
+        selections.sort(key=itemgetter(0), reverse=True)
+        return [item for _, selected in selections for item in selected]
+
+
+class UidIndex(Generic[T]):
+    """
+    UID to item lookup across all domains of a collection.
+
+    Entries are tracked per domain, so a single domain can be replaced (delta
+    refresh, lazily loaded domains) without rebuilding the rest. The sorted
+    UID list used for prefix lookups is rebuilt on demand after a change.
+    """
+
+    __slots__ = ("_items", "_domains", "_sorted_uids")
+
+    # Suffix marking a UID pattern as a prefix match, e.g. urn:va:lab:500:*
+    WILDCARD = "*"
+
+    def __init__(self, domains: dict[str, dict[str, T]] | None = None):
+        """
+        Build the index
+
+        Args:
+            domains: Items per domain, each keyed by UID
+        """
+        self._items: dict[str, T] = {}
+        self._domains: dict[str, set[str]] = {}
+        self._sorted_uids: list[str] | None = None
+        for domain, items in (domains or {}).items():
+            self.replace_domain(domain, items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._items
+
+    @property
+    def items(self) -> Mapping[str, T]:
+        """Read-only view of every indexed item by UID"""
+        return MappingProxyType(self._items)
+
+    def replace_domain(self, domain: str, items: dict[str, T]) -> None:
+        """Replace all entries of one domain with its current items"""
+        for uid in self._domains.pop(domain, ()):
+            self._items.pop(uid, None)
+        self._items.update(items)
+        self._domains[domain] = set(items)
+        self._sorted_uids = None
+
+    def get(self, uid: str) -> T | None:
+        """Look up a single UID"""
+        return self._items.get(uid)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """All indexed UIDs starting with prefix, in sorted order"""
+        if self._sorted_uids is None:
+            self._sorted_uids = sorted(self._items)
+        start = bisect_left(self._sorted_uids, prefix)
+        end = start
+        while end < len(self._sorted_uids) and self._sorted_uids[end].startswith(
+            prefix
+        ):
+            end += 1
+        return self._sorted_uids[start:end]
+
+    def get_many(
+        self, patterns: Iterable[str], limit: int | None = None
+    ) -> dict[str, T]:
+        """
+        Look up several UIDs; patterns ending in WILDCARD match by prefix
+
+        Args:
+            patterns: Exact UIDs or prefix patterns
+            limit: Maximum items to return
+
+        Returns:
+            Found items by UID, in request order
+        """
+        found: dict[str, T] = {}
+        for pattern in patterns:
+            if pattern.endswith(self.WILDCARD):
+                uids = self.with_prefix(pattern[: -len(self.WILDCARD)])
+            else:
+                uids = [pattern] if pattern in self._items else []
+            for uid in uids:
+                if limit is not None and len(found) >= limit:
+                    return found
+                found[uid] = self._items[uid]
+        return found
@@ -0,0 +1,133 @@
+"""Shared objects for the values repeated across patient items"""
+
+from collections.abc import Iterable
+from typing import Any, get_args
+
+from pydantic import BaseModel
+
+# Longer strings (comments, note text) rarely repeat and are left alone
+INTERN_MAX_CHARS = 64
+
+
+def _annotation_types(annotation: Any) -> Iterable[type]:
+    """Classes named anywhere in a field annotation (list[X] | None -> X, None)"""
+    if isinstance(annotation, type):
+        yield annotation
+    for argument in get_args(annotation):
+        yield from _annotation_types(argument)
+
+
+def _field_plan(cls: type[BaseModel]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Fields of a model that can hold strings, and that can hold models or lists"""
+    strings: list[str] = []
+    nested: list[str] = []
+    for name, field in cls.model_fields.items():
+        types = list(_annotation_types(field.annotation))
+        if any(issubclass(kind, str) for kind in types):
+            strings.append(name)
+        if any(issubclass(kind, BaseModel | list) for kind in types):
+            nested.append(name)
+    return tuple(strings), tuple(nested)
+
+
+class ValueTable:
+    """
+    Dictionary-encodes the repeated values of a set of items
+
+    Facility names, status strings, units, type names and the like repeat on
+    thousands of items of one patient, and so does each model's set of
+    explicitly set fields, which pydantic keeps per instance (a set of twenty
+    names is over 2 KB). share() points every equal short string, and every
+    equal fields set, at one object.
+
+    Sharing fields sets relies on items not being modified once parsed, which
+    already holds for memoized fragments (see fragments.py).
+    """
+
+    __slots__ = ("strings", "fields_sets", "share_strings")
+
+    # Per model class, from _field_plan
+    _plans: dict[type[BaseModel], tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+    def __init__(self, share_strings: bool = True) -> None:
+        """
+        Args:
+            share_strings: Also share strings; JSON validation already reuses
+                the objects of repeated short strings, so cache rehydration
+                turns this off
+        """
+        self.strings: dict[str, str] = {}
+        self.fields_sets: dict[frozenset[str], set[str]] = {}
+        self.share_strings = share_strings
+
+    def share(self, items: Iterable[BaseModel]) -> None:
+        """
+        Replace repeated values of the items (and nested models) in place
+
+        Args:
+            items: Models to update
+        """
+        for item in items:
+            self._share_model(item)
+
+    def share_data(self, data: Any) -> Any:
+        """
+        Share the repeated strings of JSON-like data (dicts and lists) in place
+
+        Args:
+            data: Data such as a model_dump(mode="json") result
+
+        Returns:
+            The data, with the strings of its dict values and list elements
+            shared
+        """
+        strings = self.strings
+        if type(data) is dict:
+            for key, value in data.items():
+                if type(value) is str:
+                    if len(value) <= INTERN_MAX_CHARS:
+                        data[key] = strings.setdefault(value, value)
+                elif type(value) is dict or type(value) is list:
+                    self.share_data(value)
+        elif type(data) is list:
+            for index, value in enumerate(data):
+                if type(value) is str:
+                    if len(value) <= INTERN_MAX_CHARS:
+                        data[index] = strings.setdefault(value, value)
+                elif type(value) is dict or type(value) is list:
+                    self.share_data(value)
+        return data
+
+    def _share_model(self, model: BaseModel) -> None:
+        fields_set = model.__pydantic_fields_set__
+        shared = self.fields_sets.setdefault(frozenset(fields_set), fields_set)
+        if shared is not fields_set:
+            object.__setattr__(model, "__pydantic_fields_set__", shared)
+
+        cls = type(model)
+        plan = self._plans.get(cls)
+        if plan is None:
+            plan = self._plans[cls] = _field_plan(cls)
+        string_fields, nested_fields = plan
+
+        values = model.__dict__
+        if self.share_strings:
+            strings = self.strings
+            for name in string_fields:
+                value = values[name]
+                if type(value) is str and len(value) <= INTERN_MAX_CHARS:
+                    values[name] = strings.setdefault(value, value)
+        for name in nested_fields:
+            value = values[name]
+            if type(value) is list:
+                self._share_list(value)
+            elif isinstance(value, BaseModel):
+                self._share_model(value)
+
+    def _share_list(self, values: list[Any]) -> None:
+        for index, value in enumerate(values):
+            if type(value) is str:
+                if self.share_strings and len(value) <= INTERN_MAX_CHARS:
+                    values[index] = self.strings.setdefault(value, value)
+            elif isinstance(value, BaseModel):
+                self._share_model(value)
@@ -0,0 +1,375 @@
+"""Declarative filtering, sorting and paging of patient domains"""
+
+import heapq
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+from functools import cache, reduce
+from itertools import count, islice
+from operator import attrgetter
+from typing import Any, Protocol, TypeVar
+
+from .indexes import SeriesIndex, TimeIndex
+
+T = TypeVar("T")
+
+Predicate = Callable[[Any], Any]
+
+
+class Pinned(Protocol):
+    """
+    Stored results of an earlier run of the same query on the same data
+
+    Lets later pages of a query be sliced from a fixed result list instead of
+    filtering again (see services.data.cursors.ResultPin).
+    """
+
+    def page(self, offset: int, limit: int) -> tuple[list[Any], int] | None:
+        """One page of the stored results and their count, None if none are stored"""
+        ...
+
+    def load(self) -> list[Any] | None:
+        """Every stored result, None if none are stored"""
+        ...
+
+    def store(self, matches: Sequence[Any]) -> None:
+        """Keep the results of this run for later pages"""
+        ...
+
+
+def _text(value: Any) -> str | None:
+    """Upper-cased text of a value (an enum's value, not its name), None for None"""
+    if value is None:
+        return None
+    if value.__class__ is not str:
+        value = str(value.value if isinstance(value, Enum) else value)
+    return value.upper()
+
+
+@cache
+def _getter(path: str) -> Callable[[Any], Any]:
+    """Function reading a dotted attribute path from an item, None past a None link"""
+    parts = path.split(".")
+    if not all(part.isidentifier() for part in parts):
+        raise ValueError(f"Invalid attribute path: {path!r}")
+    if len(parts) == 1:
+        return attrgetter(path)
+
+    def get(item: Any) -> Any:
+        for part in parts:
+            if item is None:
+                return None
+            item = getattr(item, part)
+        return item
+
+    return get
+
+
+class Filter:
+    """
+    One condition of a query, as a predicate over an item.
+
+    Filters are built from tool arguments; a filter whose argument is unset
+    (False, None or "") has no predicate, so disabled options cost nothing
+    per item.
+    """
+
+    __slots__ = ("predicate",)
+
+    def __init__(self, predicate: Predicate | None = None):
+        self.predicate = predicate
+
+
+def flag(attr: str | None, enabled: bool = True) -> Filter:
+    """Items whose attribute is truthy (e.g. flag("is_active", active_only))"""
+    return Filter(_getter(attr) if attr and enabled else None)
+
+
+def unflagged(attr: str, enabled: bool = True) -> Filter:
+    """Items whose attribute is falsy (e.g. unflagged("removed", unremoved_only))"""
+    if not enabled:
+        return Filter()
+    get = _getter(attr)
+    return Filter(lambda item: not get(item))
+
+
+def equals(attr: str, value: Any, ignore_case: bool = False) -> Filter:
+    """Items whose attribute equals value; no-op when value is None or empty"""
+    if value is None or value == "":
+        return Filter()
+    get = _getter(attr)
+    if not ignore_case:
+        return Filter(lambda item: get(item) == value)
+    read = attrgetter(attr)
+    target = _text(value)
+
+    def predicate(item: Any) -> bool:
+        try:
+            value = read(item)
+        except AttributeError:
+            value = get(item)
+        if value.__class__ is str:
+            return value.upper() == target
+        return _text(value) == target
+
+    return Filter(predicate)
+
+
+def contains(attr: str, text: str | None) -> Filter:
+    """Items whose attribute contains text, ignoring case; no-op when text is empty"""
+    if not text:
+        return Filter()
+    get = _getter(attr)
+    read = attrgetter(attr)
+    needle = _text(text) or ""
+
+    def predicate(item: Any) -> bool:
+        # Read dotted paths in C, walking them only past a None link
+        try:
+            value = read(item)
+        except AttributeError:
+            value = get(item)
+        if value.__class__ is str:
+            return needle in value.upper()
+        return bool(value) and needle in str(_text(value))
+
+    return Filter(predicate)
+
+
+def within(
+    attr: str, since: datetime | None = None, until: datetime | None = None
+) -> Filter:
+    """Items whose timestamp is in [since, until]; undated items never match"""
+    if since is None and until is None:
+        return Filter()
+    get = _getter(attr)
+    if until is None:
+        return Filter(lambda item: (x := get(item)) is not None and x >= since)
+    if since is None:
+        return Filter(lambda item: (x := get(item)) is not None and x <= until)
+    return Filter(lambda item: (x := get(item)) is not None and since <= x <= until)
+
+
+def where(predicate: Predicate | None) -> Filter:
+    """Items for which predicate returns True (for conditions not covered above)"""
+    return Filter(predicate)
+
+
+def compile_filters(filters: Iterable[Filter]) -> Predicate | None:
+    """
+    Combine filters into one predicate
+
+    Returns:
+        None when no filter is active, otherwise one function checking every
+        active condition in the given order, stopping at the first miss
+    """
+    predicates = _predicates(filters)
+    return reduce(_both, predicates) if predicates else None
+
+
+def _predicates(filters: Iterable[Filter]) -> list[Predicate]:
+    """Predicates of the active filters, in order"""
+    return [f.predicate for f in filters if f.predicate is not None]
+
+
+def _both(first: Predicate, second: Predicate) -> Predicate:
+    return lambda item: first(item) and second(item)
+
+
+def paginate(
+    items: Iterable[T], offset: int = 0, limit: int = 10
+) -> tuple[list[T], int]:
+    """
+    Page items in one pass without materializing what lies past the page
+
+    Args:
+        items: Items in result order (a list is sliced directly)
+        offset: Starting index for pagination
+        limit: Maximum number of items to return
+
+    Returns:
+        Tuple of (page items, total number of items)
+    """
+    if offset < 0 or limit < 1:
+        raise ValueError("Offset must be non-negative and limit must be positive")
+    if isinstance(items, Sequence):
+        return list(items[offset : offset + limit]), len(items)
+    iterator = iter(items)
+    head = list(islice(iterator, offset + limit))
+    # Count the rest without a Python-level loop
+    rest = count()
+    deque(zip(iterator, rest, strict=False), maxlen=0)
+    return head[offset:], len(head) + next(rest)
+
+
+class Query:
+    """
+    A compiled domain query: filters, an optional date window and sort order.
+
+    Build one per tool call from its arguments, then run it against a domain
+    list or TimeIndex. A date window on a TimeIndex is resolved by bisection,
+    so items outside it are never visited; on a plain list it becomes the
+    first condition, on time_attr.
+    """
+
+    __slots__ = (
+        "predicate",
+        "since",
+        "until",
+        "_predicates",
+        "_time_attr",
+        "_scan",
+        "_sort_key",
+        "_reverse",
+    )
+
+    def __init__(
+        self,
+        *filters: Filter,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        time_attr: str | None = None,
+        order_by: Callable[[Any], Any] | None = None,
+        descending: bool = False,
+    ):
+        """
+        Compile the query
+
+        Args:
+            filters: Conditions every returned item must meet, cheapest first
+            since: Only items at or after this time
+            until: Only items at or before this time
+            time_attr: Timestamp attribute for a date window on a plain list
+                (a TimeIndex already knows its timestamps)
+            order_by: Sort key; ties keep source order. Without it, results
+                keep source order (newest first for a TimeIndex)
+            descending: Sort by order_by from largest to smallest
+        """
+        self._predicates = _predicates(filters)
+        self.predicate: Predicate | None = (
+            reduce(_both, self._predicates) if self._predicates else None
+        )
+        self.since = since
+        self.until = until
+        self._time_attr = time_attr
+        self._scan: list[Predicate] | None = None
+        self._sort_key = order_by
+        self._reverse = descending
+
+    def _list_predicates(self) -> list[Predicate]:
+        """Window and filters, for sources without a time index"""
+        if self.since is None and self.until is None:
+            return self._predicates
+        if self._scan is None:
+            if self._time_attr is None:
+                raise ValueError("A date window on a plain list requires time_attr")
+            window = within(self._time_attr, self.since, self.until).predicate
+            assert window is not None
+            self._scan = [window, *self._predicates]
+        return self._scan
+
+    def matches(self, source: TimeIndex[T] | Iterable[T]) -> Iterable[T]:
+        """Matching items in source order, filtered lazily"""
+        if isinstance(source, TimeIndex):
+            predicates = self._predicates
+            if self.until is not None:
+                items: Iterable[T] = source.between(
+                    self.since or datetime.min.replace(tzinfo=self.until.tzinfo),
+                    self.until,
+                )
+            elif self.since is not None:
+                items = source.since(self.since)
+            else:
+                items = source.items
+        else:
+            predicates = self._list_predicates()
+            items = source
+        # One C-level filter per condition; plain attribute flags then run
+        # without a Python call per item
+        for predicate in predicates:
+            items = filter(predicate, items)
+        return items
+
+    def all(
+        self, source: TimeIndex[T] | Iterable[T], pin: Pinned | None = None
+    ) -> list[T]:
+        """Every matching item, in result order (the pinned results if stored)"""
+        if pin is not None and (pinned := pin.load()) is not None:
+            return pinned
+        items = list(self.matches(source))
+        if self._sort_key is not None:
+            items.sort(key=self._sort_key, reverse=self._reverse)
+        if pin is not None:
+            pin.store(items)
+        return items
+
+    def page(
+        self,
+        source: TimeIndex[T] | Iterable[T],
+        offset: int = 0,
+        limit: int = 10,
+        pin: Pinned | None = None,
+    ) -> tuple[list[T], int]:
+        """
+        One page of matching items and the total match count, in one pass
+
+        Unsorted queries stop collecting once the page is full and only count
+        the rest; sorted queries keep just the offset + limit smallest keys.
+        With a pin, the page is sliced from the pinned results, or every match
+        is collected once and pinned for the following pages.
+        """
+        if pin is not None:
+            pinned = pin.page(offset, limit)
+            if pinned is not None:
+                return pinned
+            return paginate(self.all(source, pin), offset, limit)
+        if self._sort_key is None:
+            return paginate(self.matches(source), offset, limit)
+        if offset < 0 or limit < 1:
+            raise ValueError("Offset must be non-negative and limit must be positive")
+
+        total = 0
+
+        def counted(items: Iterable[T]) -> Iterator[T]:
+            nonlocal total
+            for total, item in enumerate(items, 1):  # noqa: B007
+                yield item
+
+        # nsmallest/nlargest match sorted(...)[:n], so ties keep source order
+        select = heapq.nlargest if self._reverse else heapq.nsmallest
+        head = select(offset + limit, counted(self.matches(source)), key=self._sort_key)
+        return head[offset:], total
+
+    def most_recent(
+        self,
+        index: SeriesIndex[T],
+        n: int,
+        series: Filter | None = None,
+        pin: Pinned | None = None,
+    ) -> list[T]:
+        """
+        Up to n newest matching items per series of a SeriesIndex
+
+        Args:
+            index: Per-type series of the domain
+            n: Maximum items per series
+            series: Condition on a series' shared attributes (e.g. type name),
+                checked once per series against its newest item
+            pin: Pinned results to return instead, or to store these in
+
+        Returns:
+            Selected items; series with the most recent match come first
+        """
+        if pin is not None and (pinned := pin.load()) is not None:
+            return pinned
+        items = index.most_recent(
+            n,
+            since=self.since,
+            until=self.until,
+            where=self.predicate,
+            series_filter=series.predicate if series is not None else None,
+        )
+        if pin is not None:
+            pin.store(items)
+        return items
@@ -0,0 +1,152 @@
+"""Full-text search over clinical documents"""
+
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+
+from .document import Document
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Characters of context kept on each side of the first match in a snippet
+SNIPPET_CONTEXT_CHARS = 80
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms of a text"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def document_title(document: Document) -> str:
+    """Best available title of a document"""
+    if document.local_title:
+        return document.local_title
+    if document.national_title:
+        return document.national_title.title
+    return document.document_type_name
+
+
+def document_authors(document: Document) -> list[str]:
+    """Names of the clinicians on a document's text entries, in order"""
+    return list(
+        dict.fromkeys(
+            clinician.name
+            for text in document.text
+            for clinician in text.clinicians
+            if clinician.name
+        )
+    )
+
+
+def document_content(document: Document) -> str:
+    """Body text of a document (all text entries joined)"""
+    return "\n".join(text.content for text in document.text if text.content)
+
+
+def make_snippet(content: str, terms: Iterable[str]) -> str:
+    """Text around the first occurrence of any term, whitespace collapsed"""
+    pattern = "|".join(re.escape(term) for term in terms)
+    match = re.search(rf"\b(?:{pattern})", content, re.IGNORECASE) if pattern else None
+    if match is None:
+        start, end = 0, 2 * SNIPPET_CONTEXT_CHARS
+    else:
+        start = max(0, match.start() - SNIPPET_CONTEXT_CHARS)
+        end = match.end() + SNIPPET_CONTEXT_CHARS
+    snippet = " ".join(content[start:end].split())
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(content) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+class DocumentSearchIndex:
+    """
+    Inverted index over document text, titles and authors, ranked by BM25.
+
+    Each term maps to the positions of the documents containing it and the
+    term's frequency in each, so a query only touches the postings of its own
+    terms rather than every document body.
+    """
+
+    __slots__ = ("documents", "_postings", "_lengths", "_average_length")
+
+    def __init__(self, documents: Iterable[Document]):
+        """
+        Build the index
+
+        Args:
+            documents: Documents to index
+        """
+        self.documents: list[Document] = list(documents)
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._lengths = array("I")
+
+        for position, document in enumerate(self.documents):
+            terms = tokenize(document_content(document))
+            terms += tokenize(document_title(document))
+            for author in document_authors(document):
+                terms += tokenize(author)
+            self._lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = (array("I"), array("I"))
+                    self._postings[term] = postings
+                postings[0].append(position)
+                postings[1].append(frequency)
+
+        self._average_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(
+        self, query: str, limit: int = 10, since: datetime | None = None
+    ) -> tuple[list[tuple[Document, float]], int]:
+        """
+        Rank documents matching any query term
+
+        Args:
+            query: Free-text query
+            limit: Maximum matches to return
+            since: Only documents with a reference date at or after this time
+
+        Returns:
+            Tuple of (best matches with their scores, total matching documents)
+        """
+        scores: dict[int, float] = {}
+        count = len(self.documents)
+        for term in dict.fromkeys(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            positions, frequencies = postings
+            idf = math.log(1 + (count - len(positions) + 0.5) / (len(positions) + 0.5))
+            for position, frequency in zip(positions, frequencies, strict=True):
+                norm = BM25_K1 * (
+                    1 - BM25_B + BM25_B * self._lengths[position] / self._average_length
+                )
+                scores[position] = scores.get(position, 0.0) + idf * (
+                    frequency * (BM25_K1 + 1) / (frequency + norm)
+                )
+
+        if since is not None:
+            scores = {
+                position: score
+                for position, score in scores.items()
+                if (when := self.documents[position].reference_date_time) is not None
+                and when >= since
+            }
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda entry: entry[1])
+        matches = [(self.documents[position], score) for position, score in best]
+        return matches, len(scores)
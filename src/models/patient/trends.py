@@ -0,0 +1,246 @@
+"""Columnar numeric series and trend summaries for vitals and labs"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from itertools import groupby
+from typing import TypeVar
+
+from pydantic import field_serializer
+
+from ...services.parsers.patient.value_parser import parse_blood_pressure
+from ..utils import format_datetime_for_mcp_response
+from .base import BasePatientModel, InterpretationCode
+from .clinical import LabResult, VitalSign
+from .indexes import SeriesIndex
+
+SECONDS_PER_YEAR = 365.25 * 86400
+
+# Decimal places kept in trend summaries
+TREND_PRECISION = 2
+
+Measurement = TypeVar("Measurement", VitalSign, LabResult)
+
+
+def _to_float(value: float | str | None) -> float | None:
+    """Numeric value of a result or reference bound, None if not numeric"""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _round(value: float) -> float:
+    return round(value, TREND_PRECISION)
+
+
+class TrendSummary(BasePatientModel):
+    """Windowed statistics for one numeric series"""
+
+    name: str
+    type_code: str
+    units: str | None = None
+    count: int
+    first_observed: datetime
+    last_observed: datetime
+    latest: float
+    min: float
+    max: float
+    mean: float
+    slope_per_year: float | None = None  # Least-squares slope, None for one point
+    baseline: float  # First value in the window
+    delta_from_baseline: float
+    low: float | None = None
+    high: float | None = None
+    out_of_range_count: int = 0
+    longest_out_of_range_streak: int = 0
+    current_out_of_range_streak: int = 0
+
+    @field_serializer("first_observed", "last_observed")
+    def serialize_datetime_fields(self, value: datetime | None) -> str | None:
+        """Serialize datetime fields to ISO format for JSON schema compliance"""
+        return format_datetime_for_mcp_response(value)
+
+
+class NumericSeries:
+    """
+    Numeric results of one type in parallel arrays, oldest first.
+
+    Timestamps (epoch seconds), values and out-of-range flags are stored as
+    compact arrays, so a window is found with bisect and summarized with
+    C-level reductions instead of walking pydantic models.
+    """
+
+    __slots__ = (
+        "name",
+        "type_code",
+        "units",
+        "low",
+        "high",
+        "times",
+        "values",
+        "flags",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        type_code: str,
+        units: str | None = None,
+        low: float | None = None,
+        high: float | None = None,
+    ):
+        self.name = name
+        self.type_code = type_code
+        self.units = units
+        self.low = low
+        self.high = high
+        self.times = array("d")
+        self.values = array("d")
+        self.flags = array("b")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, observed: datetime, value: float, out_of_range: bool) -> None:
+        """Add a point (points must be appended oldest first)"""
+        self.times.append(observed.timestamp())
+        self.values.append(value)
+        self.flags.append(out_of_range)
+
+    def is_out_of_range(self, value: float, interpretation_code: str | None) -> bool:
+        """Check a value against the reference range, else its interpretation"""
+        if self.low is not None or self.high is not None:
+            return (self.low is not None and value < self.low) or (
+                self.high is not None and value > self.high
+            )
+        interpretation = InterpretationCode.from_hl7(interpretation_code)
+        return (
+            interpretation is not None and interpretation != InterpretationCode.NORMAL
+        )
+
+    def summarize(self, since: datetime | None = None) -> TrendSummary | None:
+        """
+        Summarize the points at or after since
+
+        Args:
+            since: Start of the window (default: whole series)
+
+        Returns:
+            Trend summary, or None if the window is empty
+        """
+        start = 0 if since is None else bisect_left(self.times, since.timestamp())
+        count = len(self.values) - start
+        if count <= 0:
+            return None
+
+        values = self.values[start:]
+        times = self.times[start:]
+        mean = math.fsum(values) / count
+
+        # Least-squares slope on times relative to the window mean
+        slope = None
+        if count > 1:
+            mean_time = math.fsum(times) / count
+            dt = array("d", [t - mean_time for t in times])
+            variance = math.sumprod(dt, dt)
+            if variance > 0:
+                slope = math.sumprod(dt, values) / variance * SECONDS_PER_YEAR
+
+        # Runs of consecutive out-of-range points
+        flags = self.flags[start:]
+        streaks = [len(list(run)) for flagged, run in groupby(flags) if flagged]
+
+        return TrendSummary(
+            name=self.name,
+            type_code=self.type_code,
+            units=self.units,
+            count=count,
+            first_observed=datetime.fromtimestamp(times[0], UTC),
+            last_observed=datetime.fromtimestamp(times[-1], UTC),
+            latest=values[-1],
+            min=min(values),
+            max=max(values),
+            mean=_round(mean),
+            slope_per_year=None if slope is None else _round(slope),
+            baseline=values[0],
+            delta_from_baseline=_round(values[-1] - values[0]),
+            low=self.low,
+            high=self.high,
+            out_of_range_count=sum(flags),
+            longest_out_of_range_streak=max(streaks, default=0),
+            current_out_of_range_streak=streaks[-1] if flags[-1] else 0,
+        )
+
+
+def build_numeric_series(
+    index: SeriesIndex[Measurement],
+) -> list[NumericSeries]:
+    """
+    Build columnar numeric series from per-type series
+
+    Blood pressure readings ("135/100") are split into systolic and diastolic
+    series. Non-numeric results are skipped.
+
+    Args:
+        index: Per-type_code series of vitals or labs
+
+    Returns:
+        One series per type (two for blood pressure), skipping empty ones
+    """
+    numeric: list[NumericSeries] = []
+    for type_code, series in index.series.items():
+        if not series.items:
+            continue
+        newest = series.items[0]
+        plain = NumericSeries(
+            newest.type_name,
+            type_code,
+            newest.units,
+            _to_float(newest.low),
+            _to_float(newest.high),
+        )
+        systolic = NumericSeries(
+            f"{newest.type_name} SYSTOLIC", type_code, newest.units
+        )
+        diastolic = NumericSeries(
+            f"{newest.type_name} DIASTOLIC", type_code, newest.units
+        )
+
+        # Index items are newest first; columns are stored oldest first
+        for item in reversed(series.items):
+            result = item.result or ""
+            if "/" in result:
+                systolic_value, diastolic_value = parse_blood_pressure(result)
+                if systolic_value is None or diastolic_value is None:
+                    continue
+                # Interpretation codes flag the reading as a whole
+                flagged = plain.is_out_of_range(
+                    systolic_value, item.interpretation_code
+                )
+                systolic.append(item.observed, systolic_value, flagged)
+                diastolic.append(item.observed, diastolic_value, flagged)
+                continue
+            value = _to_float(result)
+            if value is not None:
+                plain.append(
+                    item.observed,
+                    value,
+                    plain.is_out_of_range(value, item.interpretation_code),
+                )
+
+        numeric.extend(s for s in (plain, systolic, diastolic) if s.values)
+    return numeric
+
+
+def summarize_series(
+    series: Iterable[NumericSeries], since: datetime | None = None
+) -> list[TrendSummary]:
+    """Summarize each series over the window, skipping empty windows"""
+    summaries = (s.summarize(since) for s in series)
+    return [summary for summary in summaries if summary is not None]
@@ -12,6 +12,7 @@ from pydantic import (
     model_validator,
 )
 
+from ...services.deadline import get_deadline
 from ...utils import get_logger
 from ..base import BaseVistaModel
 from ..patient.demographics import PatientDemographics
@@ -63,6 +64,15 @@ class LabsFiltersMetadata(FiltersMetadata):
     )
 
 
+class TrendsFiltersMetadata(FiltersMetadata):
+    """Filter metadata for trends tool"""
+
+    domain: str | None = Field(default=None, description="Restrict to vitals or labs")
+    type_name: str | None = Field(
+        default=None, description="Filter by vital or lab type name"
+    )
+
+
 class ConsultsFiltersMetadata(FiltersMetadata):
     """Filter metadata for consults tool"""
 
@@ -92,6 +102,12 @@ class DocumentsFiltersMetadata(FiltersMetadata):
     )
 
 
+class DocumentSearchFiltersMetadata(FiltersMetadata):
+    """Filter metadata for document search tool"""
+
+    query: str | None = Field(default=None, description="Search query")
+
+
 class DiagnosesFiltersMetadata(FiltersMetadata):
     """Filter metadata for diagnoses tool"""
 
@@ -180,6 +196,10 @@ class PaginationMetadata(BaseVistaModel):
     next_offset: int | None = Field(
         default=None, description="Offset for the next page"
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page of the same results",
+    )
     suggested_next_call: str | None = Field(
         default=None, description="Suggested next API call"
     )
@@ -202,12 +222,16 @@ class PaginationMetadata(BaseVistaModel):
 
         # Compute next_offset
         self.next_offset = self.offset + self.limit if self.has_more else None
+        if not self.has_more:
+            self.next_cursor = None
 
         # Build suggested next call if we have the required info
         if self.has_more and self.tool_name and self.patient_icn:
             params = [f'patient_icn="{self.patient_icn}"']
             params.append(f"limit={self.limit}")
-            if self.next_offset is not None:
+            if self.next_cursor is not None:
+                params.append(f'cursor="{self.next_cursor}"')
+            elif self.next_offset is not None:
                 params.append(f"offset={self.next_offset}")
             self.suggested_next_call = f"{self.tool_name}({', '.join(params)})"
 
@@ -257,6 +281,31 @@ class DemographicsMetadata(BaseVistaModel):
         )
 
 
+class DeadlineMetadata(BaseVistaModel):
+    """Request deadline outcome, reported only when a stage ran short of time"""
+
+    budget_ms: int = Field(description="Total budget for the request")
+    remaining_ms: int = Field(description="Budget left when metadata was built")
+    exhausted_stages: list[str] = Field(
+        default_factory=list, description="Stages that ran out of time"
+    )
+    skipped_stages: list[str] = Field(
+        default_factory=list,
+        description="Optional stages skipped to stay within the budget",
+    )
+
+
+def current_deadline_metadata() -> DeadlineMetadata | None:
+    """Deadline report for the current request, if any stage was affected"""
+    deadline = get_deadline()
+    if deadline is None:
+        return None
+    report = deadline.report()
+    if not report["exhausted_stages"] and not report["skipped_stages"]:
+        return None
+    return DeadlineMetadata(**report)
+
+
 class PerformanceMetrics(BaseVistaModel):
     """Performance metrics for the request"""
 
@@ -265,6 +314,15 @@ class PerformanceMetrics(BaseVistaModel):
     end_time: datetime = Field(
         default_factory=lambda: datetime.now(UTC), description="Request end time"
     )
+    deadline: DeadlineMetadata | None = Field(
+        default_factory=current_deadline_metadata,
+        description="Deadline exhaustion per stage (omitted when within budget)",
+    )
+    result_cache_age_ms: int | None = Field(
+        default=None,
+        description="Age of the cached tool result served for this call "
+        "(omitted when the result was built for this call)",
+    )
 
     @field_serializer("start_time", "end_time")
     def serialize_datetime_fields(self, value: datetime) -> str | None:
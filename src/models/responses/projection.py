@@ -0,0 +1,173 @@
+"""Field projection (sparse fieldsets) for tool responses"""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Annotated, Any, get_args, get_origin
+
+from pydantic import BaseModel, Field
+
+# Item fields kept in every projection so items stay addressable
+ALWAYS_INCLUDED = frozenset({"uid"})
+
+# Tool parameter selecting the item fields to return
+ItemFields = Annotated[
+    list[str] | None,
+    Field(
+        default=None,
+        description=(
+            "Only return these fields of each item, e.g. "
+            '["typeName", "result", "observed"] (uid is always included)'
+        ),
+    ),
+]
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strip Annotated[...] and Optional[...] wrappers from an annotation"""
+    while True:
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+            continue
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if get_origin(annotation) not in (list, dict) and len(args) == 1:
+            annotation = args[0]
+            continue
+        return annotation
+
+
+@cache
+def item_fields(data_model: type[BaseModel]) -> dict[str, type[BaseModel]]:
+    """
+    Fields of a response payload that hold domain items
+
+    Args:
+        data_model: ResponseData subclass
+
+    Returns:
+        Field name -> item model, for list[Model] and dict[str, Model] fields
+    """
+    fields: dict[str, type[BaseModel]] = {}
+    for name, field in data_model.model_fields.items():
+        annotation = _unwrap(field.annotation)
+        if get_origin(annotation) not in (list, dict):
+            continue
+        item = _unwrap(get_args(annotation)[-1])
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            fields[name] = item
+    return fields
+
+
+@cache
+def _output_names(model: type[BaseModel]) -> dict[str, str]:
+    """Serialized name (alias or attribute name) -> attribute name"""
+    names: dict[str, str] = {}
+    for name, field in model.model_fields.items():
+        names[name] = name
+        if field.serialization_alias or field.alias:
+            names[field.serialization_alias or field.alias or name] = name
+    for name, computed in model.model_computed_fields.items():
+        names[name] = name
+        if computed.alias:
+            names[computed.alias] = name
+    return names
+
+
+@cache
+def item_include(model: type[BaseModel], fields: frozenset[str]) -> frozenset[str]:
+    """
+    Attribute names to serialize for a projected item
+
+    Computed once per model and field set; requested names may be attribute
+    names or their serialized aliases, unknown names are ignored.
+
+    Args:
+        model: Item model
+        fields: Requested field names
+
+    Returns:
+        Attribute names to include
+    """
+    names = _output_names(model)
+    return frozenset(
+        names[field] for field in fields | ALWAYS_INCLUDED if field in names
+    )
+
+
+def payload_include(data: Any, requested: frozenset[str]) -> dict[str, Any]:
+    """
+    Build the include spec projecting one response payload's items onto fields
+
+    Args:
+        data: Response payload
+        requested: Requested item field names
+
+    Returns:
+        Include spec for the payload; non-item fields are kept as-is
+    """
+    data_model: type[BaseModel] = data.__class__
+    data_include: dict[str, Any] = dict.fromkeys(data_model.model_fields, True)
+    data_include.update(dict.fromkeys(data_model.model_computed_fields, True))
+    for name, model in item_fields(data_model).items():
+        items: Any = getattr(data, name)
+        if isinstance(items, dict):
+            # Values may be any subclass of the declared model
+            data_include[name] = {
+                key: item_include(item.__class__, requested)
+                for key, item in items.items()
+            }
+        else:
+            data_include[name] = {"__all__": item_include(model, requested)}
+    return data_include
+
+
+def build_include(
+    response_model: type[BaseModel], data: Any, fields: Iterable[str]
+) -> dict[str, Any]:
+    """
+    Build the include spec projecting a tool response's items onto fields
+
+    Everything outside the payload's item lists is kept as-is.
+
+    Args:
+        response_model: ToolResponse subclass
+        data: Response payload
+        fields: Requested item field names
+
+    Returns:
+        Include spec for pydantic serialization
+    """
+    include: dict[str, Any] = dict.fromkeys(response_model.model_fields, True)
+    include.update(dict.fromkeys(response_model.model_computed_fields, True))
+    if data is not None:
+        include["data"] = payload_include(data, frozenset(fields))
+    return include
+
+
+def relax_item_schemas(
+    json_schema: dict[str, Any],
+    data_model: type[BaseModel],
+    resolve: Any,
+) -> None:
+    """
+    Drop "required" from the item schemas of a response payload
+
+    Projected items may omit any field, so the serialization schema must not
+    require them.
+
+    Args:
+        json_schema: Schema of the payload (may be a $ref or nullable anyOf)
+        data_model: ResponseData subclass
+        resolve: Function resolving a {"$ref": ...} schema to its definition
+    """
+    candidates = json_schema.get("anyOf", [json_schema])
+    for candidate in candidates:
+        if "$ref" not in candidate:
+            continue
+        properties = resolve(candidate).get("properties", {})
+        for name in item_fields(data_model):
+            container = properties.get(name, {})
+            item_schema = container.get("items") or container.get(
+                "additionalProperties"
+            )
+            if isinstance(item_schema, dict) and "$ref" in item_schema:
+                resolve(item_schema).pop("required", None)
@@ -1,10 +1,24 @@
 """API response models (typed)"""
 
-from datetime import date
+from collections.abc import Iterable
+from contextvars import ContextVar
+from datetime import date, datetime
 from enum import Enum
-from typing import Generic, TypeVar
-
-from pydantic import Field, computed_field
+from functools import cache
+from typing import Any, Generic, Self, TypeVar, get_args
+
+from pydantic import (
+    Field,
+    GetJsonSchemaHandler,
+    PrivateAttr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    computed_field,
+    field_serializer,
+    model_serializer,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 
 from src.models.patient.appointment import Appointment
 from src.models.patient.treatment import Treatment
@@ -24,19 +38,64 @@ from ..patient import (
     Problem,
     ProblemSummary,
     PurposeOfVisit,
+    TrendSummary,
     Visit,
     VisitSummary,
     VitalSign,
 )
-from .metadata import ResponseMetadata
+from ..patient.fragments import SerializeOptions, fragment_key, serialize_item
+from ..utils import format_datetime_for_mcp_response
+from .metadata import DemographicsMetadata, ResponseMetadata
+from .projection import (
+    build_include,
+    item_fields,
+    payload_include,
+    relax_item_schemas,
+)
 
 T = TypeVar("T")
 
+# Set while a projected response re-enters its own serializer
+_projecting: ContextVar[bool] = ContextVar("projecting", default=False)
+
 
 class ResponseData(BaseVistaModel):
     """Base class for response data payloads"""
 
-    pass
+    def split_memoized(self) -> tuple[Self, dict[str, Any]]:
+        """
+        Take out the item lists that can be served from memoized fragments
+
+        Returns:
+            Tuple of (copy without those lists, their items by field name;
+            nested payloads map to their own items by field name)
+        """
+        memoized: dict[str, Any] = {}
+        update: dict[str, Any] = {}
+        for name, value in self:
+            if isinstance(value, ResponseData):
+                hollow, nested = value.split_memoized()
+                if nested:
+                    memoized[name], update[name] = nested, hollow
+            elif (
+                name in item_fields(type(self))
+                and isinstance(value, list)
+                and value
+                and fragment_key(value[0]) is not None
+            ):
+                memoized[name], update[name] = value, []
+        return (self.model_copy(update=update) if update else self), memoized
+
+
+def _splice_memoized(
+    payload: dict[str, Any], memoized: dict[str, Any], options: SerializeOptions
+) -> None:
+    """Put serialized items taken out by split_memoized back into the payload"""
+    for name, items in memoized.items():
+        if isinstance(items, dict):
+            _splice_memoized(payload[name], items, options)
+        else:
+            payload[name] = [serialize_item(item, options) for item in items]
 
 
 class ToolResponse(BaseVistaModel, Generic[T]):
@@ -49,11 +108,96 @@ class ToolResponse(BaseVistaModel, Generic[T]):
     total_item_count: int | None = None
     metadata: ResponseMetadata | None = None
 
+    # Include spec set by project() (never serialized)
+    _include: dict[str, Any] | None = PrivateAttr(default=None)
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def is_error(self) -> bool:
         return not self.success
 
+    def project(self, fields: Iterable[str] | None) -> Self:
+        """
+        Serialize only the given fields of each item in the payload
+
+        Args:
+            fields: Item field names or aliases ("uid" is always kept);
+                None or empty keeps full items
+
+        Returns:
+            This response
+        """
+        self._include = build_include(type(self), self.data, fields) if fields else None
+        return self
+
+    @model_serializer(mode="wrap")
+    def _serialize(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        """Apply the projection, so excluded item fields are never serialized.
+
+        Unprojected JSON output reuses the memoized serialization of items from
+        versioned collections (see PatientDataCollection.memoize_fragments).
+        """
+        if _projecting.get():
+            return handler(self)
+        if self._include is None:
+            return self._serialize_memoized(handler, info)
+        token = _projecting.set(True)
+        try:
+            return self.__pydantic_serializer__.to_python(
+                self,
+                mode=info.mode,
+                include=self._include,
+                by_alias=info.by_alias,
+                exclude_none=info.exclude_none,
+                exclude_defaults=info.exclude_defaults,
+                exclude_unset=info.exclude_unset,
+                round_trip=info.round_trip,
+            )
+        finally:
+            _projecting.reset(token)
+
+    def _serialize_memoized(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        if (
+            info.mode != "json"
+            or info.include is not None
+            or info.exclude is not None
+            or not isinstance(self.data, ResponseData)
+        ):
+            return handler(self)
+        hollow, memoized = self.data.split_memoized()
+        if not memoized:
+            return handler(self)
+        payload = handler(self.model_copy(update={"data": hollow}))
+        options = SerializeOptions(
+            by_alias=bool(info.by_alias),
+            exclude_none=info.exclude_none,
+            exclude_defaults=info.exclude_defaults,
+            exclude_unset=info.exclude_unset,
+            round_trip=info.round_trip,
+        )
+        _splice_memoized(payload["data"], memoized, options)
+        return payload
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """Allow projected items to omit fields in the serialization schema"""
+        json_schema = handler(core_schema)
+        data_args = get_args(cls.model_fields["data"].annotation)
+        data_model = next((arg for arg in data_args if isinstance(arg, type)), None)
+        if handler.mode == "serialization" and data_model is not None:
+            properties = handler.resolve_ref_schema(json_schema).get("properties", {})
+            if "data" in properties:
+                relax_item_schemas(
+                    properties["data"], data_model, handler.resolve_ref_schema
+                )
+        return json_schema
+
 
 class BodySystem(str, Enum):
     """Body system classifications for diagnoses"""
@@ -301,3 +445,163 @@ class TreatmentsResponse(ToolResponse[TreatmentsResponseData]):
     """Treatments response"""
 
     pass
+
+
+class TrendsResponseData(ResponseData):
+    """Vital sign and lab trends response data"""
+
+    trends: list[TrendSummary] = Field(default_factory=list)
+
+
+class TrendsResponse(ToolResponse[TrendsResponseData]):
+    """Vital sign and lab trends response"""
+
+    pass
+
+
+class DocumentSearchHit(BaseVistaModel):
+    """A document matching a search, with the text around the first match"""
+
+    uid: str
+    title: str
+    document_type_name: str
+    reference_date_time: datetime | None = None
+    authors: list[str] = Field(default_factory=list)
+    score: float
+    snippet: str
+
+    @field_serializer("reference_date_time")
+    def serialize_datetime_fields(self, value: datetime | None) -> str | None:
+        """Serialize datetime fields to ISO format for JSON schema compliance"""
+        return format_datetime_for_mcp_response(value)
+
+
+class DocumentSearchResponseData(ResponseData):
+    """Document search response data"""
+
+    total_matches: int = 0
+    matches: list[DocumentSearchHit] = Field(default_factory=list)
+
+
+class DocumentSearchResponse(ToolResponse[DocumentSearchResponseData]):
+    """Document search response"""
+
+    pass
+
+
+class SnapshotResponseData(ResponseData):
+    """Slices of several patient domains read from one collection"""
+
+    allergies: AllergiesResponseData | None = None
+    appointments: AppointmentsResponseData | None = None
+    consults: ConsultsResponseData | None = None
+    diagnoses: DiagnosesResponseData | None = None
+    documents: DocumentsResponseData | None = None
+    health_factors: HealthFactorsResponseData | None = None
+    labs: LabResultsResponseData | None = None
+    medications: MedicationsResponseData | None = None
+    orders: OrdersResponseData | None = None
+    povs: POVsResponseData | None = None
+    problems: ProblemsResponseData | None = None
+    procedures: ProceduresResponseData | None = None
+    treatments: TreatmentsResponseData | None = None
+    trends: TrendsResponseData | None = None
+    visits: VisitsResponseData | None = None
+    vitals: VitalSignsResponseData | None = None
+    total_available: dict[str, int] = Field(
+        default_factory=dict,
+        description="Matching items per domain before pagination",
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Domains that could not be served"
+    )
+    item_stations: dict[str, str] = Field(
+        default_factory=dict,
+        description="Station each returned item was read from (with stations)",
+    )
+    station_errors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Stations left out of the merge (with stations)",
+    )
+
+
+@cache
+def _slice_models() -> dict[str, type[ResponseData]]:
+    """Snapshot slice field name -> payload model"""
+    slices: dict[str, type[ResponseData]] = {}
+    for name, field in SnapshotResponseData.model_fields.items():
+        for arg in get_args(field.annotation):
+            if isinstance(arg, type) and issubclass(arg, ResponseData):
+                slices[name] = arg
+    return slices
+
+
+class SnapshotResponse(ToolResponse[SnapshotResponseData]):
+    """Multi-domain patient snapshot response"""
+
+    def project(self, fields: Iterable[str] | None) -> Self:
+        """Project the items of every slice onto fields"""
+        super().project(fields)
+        if self._include is not None and self.data is not None and fields:
+            requested = frozenset(fields)
+            data_include = self._include["data"]
+            for name in _slice_models():
+                slice_data = getattr(self.data, name)
+                if slice_data is not None:
+                    data_include[name] = payload_include(slice_data, requested)
+        return self
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """Allow projected slice items to omit fields in the serialization schema"""
+        json_schema = super().__get_pydantic_json_schema__(core_schema, handler)
+        if handler.mode != "serialization":
+            return json_schema
+        resolve = handler.resolve_ref_schema
+        data_schema = resolve(json_schema).get("properties", {}).get("data", {})
+        for candidate in data_schema.get("anyOf", [data_schema]):
+            if "$ref" not in candidate:
+                continue
+            properties = resolve(candidate).get("properties", {})
+            for name, model in _slice_models().items():
+                if name in properties:
+                    relax_item_schemas(properties[name], model, resolve)
+        return json_schema
+
+
+class PanelPatientSummary(BaseVistaModel):
+    """Compact summary of one patient in a panel"""
+
+    patient_icn: str
+    success: bool
+    demographics: DemographicsMetadata | None = None
+    domains: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description=(
+            "Per domain: matching items ('total') and the counts reported by "
+            "the matching get_patient_* tool, without the items"
+        ),
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Domains that could not be served"
+    )
+    error: str | None = Field(
+        default=None, description="Why the patient could not be loaded"
+    )
+
+
+class PanelSummaryResponseData(ResponseData):
+    """Summaries of several patients at one station"""
+
+    patients: list[PanelPatientSummary] = Field(default_factory=list)
+    failed_count: int = Field(
+        default=0, description="Patients that could not be loaded"
+    )
+
+
+class PanelSummaryResponse(ToolResponse[PanelSummaryResponseData]):
+    """Patient panel summary response"""
+
+    pass
@@ -8,7 +8,9 @@ from .local_dev import LocalDevCacheBackend
 from .local_dev_redis import LocalDevRedisBackend
 from .memory import MemoryCacheBackend
 from .multi_tier import MultiTierCacheBackend
+from .negative import NegativeCache
 from .redis import RedisCacheBackend
+from .results import ToolResultCache, get_tool_result_cache
 
 __all__ = [
     "CacheBackend",
@@ -20,5 +22,8 @@ __all__ = [
     "LocalDevRedisBackend",
     "MemoryCacheBackend",
     "MultiTierCacheBackend",
+    "NegativeCache",
     "RedisCacheBackend",
+    "ToolResultCache",
+    "get_tool_result_cache",
 ]
@@ -1,5 +1,6 @@
 """Base cache interface for patient data"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from typing import Any
@@ -21,6 +22,26 @@ class CacheBackend(ABC):
         """
         pass
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values from cache.
+
+        Backends that support a batched read (e.g. Redis MGET) override this;
+        the default issues the individual gets concurrently.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of key to value for the keys that were found
+        """
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return {
+            key: value
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
     @abstractmethod
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """
@@ -119,6 +140,14 @@ class PatientDataCache:
         """
         return f"patient:v1:{station}:{patient_id}:{user_duz}"
 
+    def _make_version_key(self, station: str, patient_id: str, user_duz: str) -> str:
+        """Cache key for the content version of cached patient data"""
+        return f"patient_version:v1:{station}:{patient_id}:{user_duz}"
+
+    def _make_text_key(self, ref: str) -> str:
+        """Cache key of an out-of-line document text body"""
+        return f"document_text:v1:{ref}"
+
     async def get_patient_data(
         self, station: str, icn: str, user_duz: str
     ) -> dict[str, Any] | None:
@@ -136,6 +165,24 @@ class PatientDataCache:
         key = self._make_key(station, icn, user_duz)
         return await self.backend.get(key)
 
+    async def get_patient_data_many(
+        self, station: str, icns: list[str], user_duz: str
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get several patients' data from cache in one batched read.
+
+        Args:
+            station: Station number
+            icns: Patient ICNs
+            user_duz: User DUZ
+
+        Returns:
+            Mapping of ICN to cached patient data for the ICNs that were found
+        """
+        keys = {self._make_key(station, icn, user_duz): icn for icn in icns}
+        found = await self.backend.get_many(list(keys))
+        return {keys[key]: data for key, data in found.items()}
+
     async def set_patient_data(
         self,
         station: str,
@@ -143,6 +190,7 @@ class PatientDataCache:
         user_duz: str,
         data: dict[str, Any],
         ttl: timedelta | None = None,
+        version: str | None = None,
     ) -> bool:
         """
         Cache patient data.
@@ -153,12 +201,77 @@ class PatientDataCache:
             user_duz: User DUZ
             data: Patient data to cache
             ttl: Override default TTL
+            version: Content version of the data, stored alongside so it can
+                be read without loading the data
 
         Returns:
             True if successful
         """
         key = self._make_key(station, icn, user_duz)
-        return await self.backend.set(key, data, ttl or self.default_ttl)
+        stored = await self.backend.set(key, data, ttl or self.default_ttl)
+        if stored and version is not None:
+            version_key = self._make_version_key(station, icn, user_duz)
+            await self.backend.set(version_key, version, ttl or self.default_ttl)
+        return stored
+
+    async def set_document_texts(
+        self, bodies: dict[str, str], ttl: timedelta | None = None
+    ) -> bool:
+        """
+        Cache document text bodies stored out of line.
+
+        Bodies are keyed by content (see text_ref), not by patient or user, so
+        a text shared by several documents or cached entries is stored once.
+        Write them before the patient data that refers to them.
+
+        Args:
+            bodies: Text bodies by content_ref
+            ttl: Override default TTL
+
+        Returns:
+            True if every body was stored
+        """
+        stored = await asyncio.gather(
+            *(
+                self.backend.set(
+                    self._make_text_key(ref), body, ttl or self.default_ttl
+                )
+                for ref, body in bodies.items()
+            )
+        )
+        return all(stored)
+
+    async def get_document_texts(self, refs: list[str]) -> dict[str, str]:
+        """
+        Get document text bodies in one batched read.
+
+        Args:
+            refs: content_ref of each body
+
+        Returns:
+            Mapping of content_ref to body for the bodies that were found
+        """
+        keys = {self._make_text_key(ref): ref for ref in refs}
+        found = await self.backend.get_many(list(keys))
+        return {keys[key]: body for key, body in found.items() if isinstance(body, str)}
+
+    async def get_patient_version(
+        self, station: str, icn: str, user_duz: str
+    ) -> str | None:
+        """
+        Get the content version of cached patient data.
+
+        Args:
+            station: Station number
+            icn: Patient ICN
+            user_duz: User DUZ
+
+        Returns:
+            Version stored with the data, or None if not cached
+        """
+        key = self._make_version_key(station, icn, user_duz)
+        version = await self.backend.get(key)
+        return version if isinstance(version, str) else None
 
     async def invalidate_patient_data(
         self, station: str, icn: str, user_duz: str
@@ -174,6 +287,7 @@ class PatientDataCache:
         Returns:
             True if data was cached and removed
         """
+        await self.backend.delete(self._make_version_key(station, icn, user_duz))
         key = self._make_key(station, icn, user_duz)
         return await self.backend.delete(key)
 
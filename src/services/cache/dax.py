@@ -14,6 +14,7 @@ try:
 except ImportError:
     HAS_DAX = False
 
+from ..deadline import should_skip_optional
 from .base import CacheBackend
 
 logger = logging.getLogger(__name__)
@@ -148,6 +149,10 @@ class DAXBackend(CacheBackend):
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
+        # boto3 calls block and can't be bounded, so don't start one near the deadline
+        if should_skip_optional("dax_get"):
+            return None
+
         try:
             client = self._get_client()
             prefixed_key = self._make_key(key)
@@ -181,6 +186,9 @@ class DAXBackend(CacheBackend):
 
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set value in cache."""
+        if should_skip_optional("dax_set"):
+            return False
+
         try:
             client = self._get_client()
             prefixed_key = self._make_key(key)
@@ -36,6 +36,22 @@ class MemoryCacheBackend(CacheBackend):
             logger.debug(f"Cache hit for key {key}")
             return value
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache under a single lock acquisition."""
+        found: dict[str, Any] = {}
+        async with self._lock:
+            now = datetime.now(UTC)
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                value, expiry = entry
+                if expiry and now > expiry:
+                    del self._cache[key]
+                    continue
+                found[key] = value
+        return found
+
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set value in cache."""
         async with self._lock:
@@ -5,6 +5,7 @@ import logging
 from datetime import timedelta
 from typing import Any
 
+from ..deadline import should_skip_optional
 from .base import CacheBackend
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,10 @@ class MultiTierCacheBackend(CacheBackend):
         """Get value from cache, checking tiers in order."""
         # Try each tier from fastest to slowest
         for i, backend in enumerate(self.backends):
+            # Slower tiers are optional when the request deadline is nearly spent
+            if i > 0 and should_skip_optional(f"cache_tier_{self.tier_names[i]}"):
+                break
+
             try:
                 value = await backend.get(key)
                 if value is not None:
@@ -62,7 +67,11 @@ class MultiTierCacheBackend(CacheBackend):
                     )
 
                     # Populate faster tiers on cache miss (read-through)
-                    if self.read_through and i > 0:
+                    if (
+                        self.read_through
+                        and i > 0
+                        and not should_skip_optional("cache_read_through")
+                    ):
                         asyncio.create_task(self._populate_faster_tiers(key, value, i))
 
                     return value
@@ -74,12 +83,48 @@ class MultiTierCacheBackend(CacheBackend):
         logger.debug(f"Cache miss for key {key} on all tiers")
         return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values, asking each slower tier only for remaining misses."""
+        found: dict[str, Any] = {}
+        remaining = list(keys)
+        for i, backend in enumerate(self.backends):
+            if not remaining:
+                break
+            if i > 0 and should_skip_optional(f"cache_tier_{self.tier_names[i]}"):
+                break
+
+            try:
+                tier_values = await backend.get_many(remaining)
+            except Exception as e:
+                logger.warning(f"Error reading from tier {self.tier_names[i]}: {e}")
+                continue
+
+            if tier_values:
+                logger.debug(
+                    f"Cache hit on tier {self.tier_names[i]} for {len(tier_values)} keys"
+                )
+                found.update(tier_values)
+                if (
+                    self.read_through
+                    and i > 0
+                    and not should_skip_optional("cache_read_through")
+                ):
+                    for key, value in tier_values.items():
+                        asyncio.create_task(self._populate_faster_tiers(key, value, i))
+                remaining = [key for key in remaining if key not in tier_values]
+
+        return found
+
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set value in cache across tiers."""
         if self.write_through:
-            # Write to all tiers concurrently
+            # Write to all tiers concurrently; only the fastest tier near the deadline
+            backends = self.backends
+            if len(backends) > 1 and should_skip_optional("cache_write_through"):
+                backends = backends[:1]
+
             tasks = []
-            for i, backend in enumerate(self.backends):
+            for i, backend in enumerate(backends):
                 task = asyncio.create_task(
                     self._set_with_logging(backend, key, value, ttl, i)
                 )
@@ -92,7 +137,7 @@ class MultiTierCacheBackend(CacheBackend):
             success_count = sum(1 for r in results if r is True)
             if success_count > 0:
                 logger.debug(
-                    f"Successfully cached key {key} on {success_count}/{len(self.backends)} tiers"
+                    f"Successfully cached key {key} on {success_count}/{len(backends)} tiers"
                 )
                 return True
             else:
@@ -0,0 +1,134 @@
+"""Short-TTL negative cache for errors that will not go away on retry"""
+
+import logging
+from typing import Any
+
+from cachetools import TTLCache
+
+from ...config import (
+    NEGATIVE_CACHE_ENABLED,
+    NEGATIVE_CACHE_FORBIDDEN_TTL_SECONDS,
+    NEGATIVE_CACHE_MAX_SIZE,
+    NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS,
+    NEGATIVE_CACHE_RPC_FAULT_TTL_SECONDS,
+)
+from ...vista.base import VistaAPIError
+
+logger = logging.getLogger(__name__)
+
+# Error classes worth caching. Transient failures (VistaLinkFault, 5xx, 429,
+# expired tokens) are never cached - retries may succeed.
+ERROR_CLASS_NOT_FOUND = "not_found"
+ERROR_CLASS_FORBIDDEN = "forbidden"
+ERROR_CLASS_RPC_FAULT = "rpc_fault"
+
+
+def classify_error(error: VistaAPIError) -> str | None:
+    """
+    Map a Vista API error to a negative cache class
+
+    Args:
+        error: Error raised by the Vista client
+
+    Returns:
+        Error class name, or None if the error must not be cached
+    """
+    if error.status_code == 401:
+        # Expired or invalid token (including 401 SecurityFaults); the key holds
+        # no token, so a cached entry would outlive the refresh
+        return None
+    if error.status_code == 404 or (
+        error.error_type == "RpcFault" and "not found" in error.message.lower()
+    ):
+        return ERROR_CLASS_NOT_FOUND
+    if error.status_code == 403:
+        return ERROR_CLASS_FORBIDDEN
+    if error.status_code == 400 or error.error_type == "RpcFault":
+        return ERROR_CLASS_RPC_FAULT
+    return None
+
+
+class NegativeCache:
+    """In-memory cache of recent permanent failures, one TTLCache per error class"""
+
+    def __init__(
+        self,
+        ttl_seconds: dict[str, float] | None = None,
+        max_size: int = NEGATIVE_CACHE_MAX_SIZE,
+        enabled: bool = NEGATIVE_CACHE_ENABLED,
+    ):
+        """
+        Initialize negative cache
+
+        Args:
+            ttl_seconds: TTL per error class (classes with TTL <= 0 are not cached)
+            max_size: Maximum entries per error class (least recently used evicted)
+            enabled: Whether failures are cached at all
+        """
+        if ttl_seconds is None:
+            ttl_seconds = {
+                ERROR_CLASS_NOT_FOUND: NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS,
+                ERROR_CLASS_FORBIDDEN: NEGATIVE_CACHE_FORBIDDEN_TTL_SECONDS,
+                ERROR_CLASS_RPC_FAULT: NEGATIVE_CACHE_RPC_FAULT_TTL_SECONDS,
+            }
+
+        self.enabled = enabled
+        self._caches: dict[str, TTLCache[str, dict[str, Any]]] = {
+            error_class: TTLCache(maxsize=max_size, ttl=ttl)
+            for error_class, ttl in ttl_seconds.items()
+            if ttl > 0
+        }
+        self._hits = dict.fromkeys(self._caches, 0)
+
+    def get(self, key: str) -> VistaAPIError | None:
+        """Get the cached error for a key, if a recent failure is recorded"""
+        if not self.enabled:
+            return None
+        for error_class, cache in self._caches.items():
+            error = cache.get(key)
+            if error is not None:
+                self._hits[error_class] += 1
+                logger.debug(f"Negative cache hit ({error_class}) for {key}")
+                return VistaAPIError(**error)
+        return None
+
+    def put(self, key: str, error: VistaAPIError) -> bool:
+        """
+        Record a failure if its error class is cacheable
+
+        Returns:
+            True if the error was cached
+        """
+        if not self.enabled:
+            return False
+        error_class = classify_error(error)
+        cache = self._caches.get(error_class) if error_class else None
+        if cache is None:
+            return False
+        cache[key] = error.to_dict()
+        logger.debug(f"Negative cached {error_class} for {key}")
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """Forget any recorded failure for a key (e.g. after a successful retry)"""
+        for cache in self._caches.values():
+            cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all recorded failures"""
+        for cache in self._caches.values():
+            cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Entry counts and hits per error class"""
+        return {
+            "enabled": self.enabled,
+            "classes": {
+                error_class: {
+                    "entries": len(cache),
+                    "ttl_seconds": cache.ttl,
+                    "hits": self._hits[error_class],
+                }
+                for error_class, cache in self._caches.items()
+            },
+        }
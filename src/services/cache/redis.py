@@ -14,6 +14,7 @@ except ImportError:
     HAS_REDIS = False
     Redis = None  # type: ignore[assignment, misc]
 
+from ..deadline import run_with_deadline
 from .base import CacheBackend
 from .json_encoder import DateTimeJSONEncoder
 
@@ -84,7 +85,7 @@ class RedisCacheBackend(CacheBackend):
             redis_client = await self._get_redis()
             prefixed_key = self._make_key(key)
 
-            value = await redis_client.get(prefixed_key)
+            value = await run_with_deadline("redis_get", redis_client.get(prefixed_key))
             if value is None:
                 return None
 
@@ -101,6 +102,30 @@ class RedisCacheBackend(CacheBackend):
             logger.error(f"Redis get error for key {key}: {e}")
             return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache with a single MGET."""
+        if not keys:
+            return {}
+        try:
+            redis_client = await self._get_redis()
+            values = await run_with_deadline(
+                "redis_get_many",
+                redis_client.mget([self._make_key(key) for key in keys]),
+            )
+        except Exception as e:
+            logger.error(f"Redis get_many error for {len(keys)} keys: {e}")
+            return {}
+
+        found: dict[str, Any] = {}
+        for key, value in zip(keys, values, strict=True):
+            if value is None:
+                continue
+            try:
+                found[key] = json.loads(value)
+            except json.JSONDecodeError:
+                logger.error(f"Failed to decode cached value for key {key}")
+        return found
+
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> bool:
         """Set value in cache."""
         try:
@@ -117,9 +142,14 @@ class RedisCacheBackend(CacheBackend):
             # Set with optional TTL
             if ttl:
                 ttl_seconds = int(ttl.total_seconds())
-                await redis_client.setex(prefixed_key, ttl_seconds, json_value)
+                await run_with_deadline(
+                    "redis_set",
+                    redis_client.setex(prefixed_key, ttl_seconds, json_value),
+                )
             else:
-                await redis_client.set(prefixed_key, json_value)
+                await run_with_deadline(
+                    "redis_set", redis_client.set(prefixed_key, json_value)
+                )
 
             logger.debug(f"Cached key {key} with TTL {ttl}")
             return True
@@ -0,0 +1,134 @@
+"""In-process cache of serialized tool results for repeated identical calls"""
+
+import json
+import logging
+import time
+from hashlib import blake2b
+from typing import Any, NamedTuple
+
+from cachetools import TTLCache
+
+from ...config import (
+    PATIENT_CACHE_TTL_MINUTES,
+    TOOL_RESULT_CACHE_ENABLED,
+    TOOL_RESULT_CACHE_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedToolResult(NamedTuple):
+    """A stored tool result"""
+
+    payload: str  # Structured content as JSON
+    stored_at: float  # time.monotonic() when stored
+
+    @property
+    def age_ms(self) -> int:
+        """Milliseconds since the result was stored"""
+        return int((time.monotonic() - self.stored_at) * 1000)
+
+
+def _payload_size(result: CachedToolResult) -> int:
+    return len(result.payload)
+
+
+class ToolResultCache:
+    """
+    Serialized tool results by tool call and patient data version.
+
+    Keys combine the tool, its arguments (with defaults filled in), station,
+    DUZ and the content version of the patient data the result was built
+    from, so a refreshed patient gets new keys and old results are never
+    served for it; they simply age out. Memory is bounded by the total size
+    of the stored payloads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = TOOL_RESULT_CACHE_MAX_BYTES,
+        ttl_seconds: float = PATIENT_CACHE_TTL_MINUTES * 60,
+        enabled: bool = TOOL_RESULT_CACHE_ENABLED,
+    ):
+        """
+        Initialize tool result cache
+
+        Args:
+            max_bytes: Maximum total payload size (least recently used evicted)
+            ttl_seconds: How long a result is kept
+            enabled: Whether results are cached at all
+        """
+        self.enabled = enabled and max_bytes > 0
+        self._results: TTLCache[str, CachedToolResult] = TTLCache(
+            maxsize=max(max_bytes, 1), ttl=ttl_seconds, getsizeof=_payload_size
+        )
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @staticmethod
+    def make_key(
+        tool_name: str,
+        arguments: dict[str, Any],
+        station: str,
+        duz: str,
+        version: str,
+    ) -> str:
+        """Key of one tool call against one patient data version"""
+        canonical = json.dumps(
+            [tool_name, station, duz, version, arguments], sort_keys=True, default=str
+        )
+        return blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def get(self, tool_name: str, key: str) -> CachedToolResult | None:
+        """Get a stored result, counting the hit or miss for the tool"""
+        result = self._results.get(key)
+        counts = self._hits if result is not None else self._misses
+        counts[tool_name] = counts.get(tool_name, 0) + 1
+        return result
+
+    def put(self, key: str, payload: str) -> bool:
+        """
+        Store a result
+
+        Returns:
+            True if stored (payloads larger than the whole cache are not)
+        """
+        if len(payload) > self._results.maxsize:
+            logger.debug(f"Tool result of {len(payload)} bytes too large to cache")
+            return False
+        self._results[key] = CachedToolResult(payload, time.monotonic())
+        return True
+
+    def clear(self) -> None:
+        """Forget all stored results"""
+        self._results.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Size and per-tool hit rates"""
+        tools = sorted(self._hits.keys() | self._misses.keys())
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._results),
+            "bytes": self._results.currsize,
+            "max_bytes": self._results.maxsize,
+            "tools": {
+                tool: {
+                    "hits": (hits := self._hits.get(tool, 0)),
+                    "misses": (misses := self._misses.get(tool, 0)),
+                    "hit_rate": round(hits / (hits + misses), 3),
+                }
+                for tool in tools
+            },
+        }
+
+
+_tool_result_cache: ToolResultCache | None = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get or create the singleton tool result cache"""
+    global _tool_result_cache
+
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
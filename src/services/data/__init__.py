@@ -1,7 +1,28 @@
 """Data access services that handle caching transparently."""
 
-from .patient_data import get_patient_data
+from .cursors import CursorError, ResultPin
+from .patient_data import (
+    FederatedPatientData,
+    get_document_search_index,
+    get_patient_data,
+    get_patient_data_federated,
+    get_patient_data_many,
+    get_patient_data_version,
+    load_document_text,
+    load_patient_data_by_dfn,
+    summarize_document_text,
+)
 
 __all__ = [
+    "CursorError",
+    "FederatedPatientData",
+    "ResultPin",
+    "get_document_search_index",
     "get_patient_data",
+    "get_patient_data_federated",
+    "get_patient_data_many",
+    "get_patient_data_version",
+    "load_document_text",
+    "load_patient_data_by_dfn",
+    "summarize_document_text",
 ]
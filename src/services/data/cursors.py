@@ -0,0 +1,143 @@
+"""Cursor tokens that pin a paged query to one patient data snapshot"""
+
+import base64
+import binascii
+import json
+from collections.abc import Mapping, Sequence
+from hashlib import blake2b
+from typing import Any
+
+from cachetools import TTLCache
+
+from ...config import CURSOR_CACHE_SIZE, PATIENT_CACHE_TTL_MINUTES
+from ...models.patient import PatientDataCollection
+
+# Bumped whenever the token layout changes, so old tokens are rejected cleanly
+CURSOR_FORMAT = "c1"
+
+# Filtered result UIDs by (collection version, query hash). Collections are
+# rehydrated from the cache on every call, so results are kept as UIDs and
+# resolved against the caller's collection
+_pinned_results: TTLCache[tuple[str, str], tuple[str, ...]] = TTLCache(
+    maxsize=CURSOR_CACHE_SIZE, ttl=PATIENT_CACHE_TTL_MINUTES * 60
+)
+
+
+class CursorError(ValueError):
+    """Raised for a cursor that is malformed, from another query or stale"""
+
+
+def query_hash(tool_name: str, arguments: Mapping[str, Any]) -> str:
+    """Hash of a tool and the filter arguments that select its results"""
+    canonical = json.dumps([tool_name, arguments], sort_keys=True, default=str)
+    return blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+
+def encode_cursor(version: str, query: str, position: int) -> str:
+    """Opaque token for the result at position of query on version"""
+    raw = f"{CURSOR_FORMAT}.{version}.{query}.{position}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str, int]:
+    """
+    Read a cursor token
+
+    Returns:
+        Tuple of (collection version, query hash, position)
+
+    Raises:
+        CursorError: If the token was not issued by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        layout, version, query, position = raw.split(".")
+        if layout != CURSOR_FORMAT or not position.isdigit():
+            raise ValueError(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise CursorError("Invalid cursor; repeat the call without a cursor") from e
+    return version, query, int(position)
+
+
+class ResultPin:
+    """
+    Filtered results of one query on one patient data snapshot
+
+    Open one per paged tool call. A call that has further pages pins its full
+    result list (as UIDs), and its next cursor names that list, so following
+    pages are sliced from it in O(page size) without filtering again and stay
+    consistent with the first page. A cursor for data that has since been
+    refreshed is rejected instead of silently skipping or repeating items.
+    """
+
+    __slots__ = ("offset", "limit", "version", "query", "_items")
+
+    def __init__(
+        self,
+        patient_data: PatientDataCollection,
+        tool_name: str,
+        arguments: Mapping[str, Any],
+        offset: int = 0,
+        limit: int = 10,
+        cursor: str | None = None,
+    ):
+        """
+        Open the pin
+
+        Args:
+            patient_data: Patient data the query runs on
+            tool_name: Tool running the query
+            arguments: The tool's filter arguments (not offset, limit or cursor)
+            offset: Requested offset, replaced by the cursor's position
+            limit: Page size
+            cursor: next_cursor of the previous page, if any
+
+        Raises:
+            CursorError: If the cursor is malformed, belongs to another query
+                or to an earlier version of the patient data
+        """
+        self.version = patient_data.content_version
+        self.query = query_hash(tool_name, arguments)
+        self.offset = offset
+        self.limit = limit
+        self._items = patient_data.uid_index
+        if cursor is not None:
+            version, query, self.offset = decode_cursor(cursor)
+            if query != self.query:
+                raise CursorError(
+                    "Cursor belongs to a different query; repeat the call "
+                    "with the original filters or without a cursor"
+                )
+            if version != self.version:
+                raise CursorError(
+                    "Patient data changed since this cursor was issued; "
+                    "restart paging without a cursor"
+                )
+
+    @property
+    def next_cursor(self) -> str:
+        """Cursor for the page after this one"""
+        return encode_cursor(self.version, self.query, self.offset + self.limit)
+
+    def _resolve(self, uids: Sequence[str]) -> list[Any]:
+        get = self._items.get
+        return [get(uid) for uid in uids]
+
+    def page(self, offset: int, limit: int) -> tuple[list[Any], int] | None:
+        """One page of the pinned results and their count, None if not pinned"""
+        uids = _pinned_results.get((self.version, self.query))
+        if uids is None:
+            return None
+        return self._resolve(uids[offset : offset + limit]), len(uids)
+
+    def load(self) -> list[Any] | None:
+        """Every pinned result, None if not pinned"""
+        uids = _pinned_results.get((self.version, self.query))
+        return None if uids is None else self._resolve(uids)
+
+    def store(self, matches: Sequence[Any]) -> None:
+        """Pin the results, if they run past this page"""
+        if len(matches) > self.offset + self.limit:
+            _pinned_results[(self.version, self.query)] = tuple(
+                item.uid for item in matches
+            )
@@ -1,13 +1,41 @@
 """Patient data access service with transparent caching."""
 
 import asyncio
+import contextlib
+import json
 import logging
+from collections.abc import Iterable
+from datetime import datetime
+from functools import partial
+from typing import Any, NamedTuple
 
+from cachetools import TTLCache
+
+from ...config import (
+    DOCUMENT_SEARCH_CACHE_SIZE,
+    DOCUMENT_TEXT_MIN_CHARS,
+    DOCUMENT_TEXT_OUT_OF_LINE,
+    FEDERATED_FETCH_TIMEOUT_SECONDS,
+    PANEL_FETCH_MAX_CONCURRENCY,
+    PATIENT_CACHE_TTL_MINUTES,
+)
+from ...models.patient.document import Document, offload_text
+from ...models.patient.interning import ValueTable
 from ...models.patient.patient import PatientDataCollection
+from ...models.patient.search import DocumentSearchIndex
 from ...services.cache.factory import CacheFactory
+from ...services.cache.negative import NegativeCache
 from ...services.parsers.patient.patient_parser import parse_vpr_patient_data
 from ...services.rpc import build_named_array_param, execute_rpc
 from ...vista.base import BaseVistaClient, VistaAPIError
+from ..deadline import (
+    DeadlineExceededError,
+    current_deadline,
+    get_deadline,
+    mark_exhausted,
+    run_with_deadline,
+    should_skip_optional,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +43,31 @@ logger = logging.getLogger(__name__)
 _cache_instance = None
 _cache_lock = asyncio.Lock()
 
+# Recent "patient not found" / "not authorized" failures, keyed per caller
+_negative_cache: NegativeCache | None = None
+
+# Document search indexes by data snapshot. Collections are rehydrated from the
+# cache on every call, so the index is kept here rather than only on the instance
+_document_search_indexes: TTLCache[tuple[str, str, datetime], DocumentSearchIndex] = (
+    TTLCache(maxsize=DOCUMENT_SEARCH_CACHE_SIZE, ttl=PATIENT_CACHE_TTL_MINUTES * 60)
+)
+
+
+# Station reads of federated fetches, by (station, ICN, DUZ). A read that
+# outlives its call keeps running here, so later calls join it instead of
+# sending another VPR request
+_federated_reads: dict[tuple[str, str, str], asyncio.Task[PatientDataCollection]] = {}
+
+# Panel fetches in flight per station, shared by concurrent panel loads
+_panel_fetch_slots: dict[str, asyncio.Semaphore] = {}
+
+
+class FederatedPatientData(NamedTuple):
+    """Result of reading one patient from several stations"""
+
+    data: PatientDataCollection | None  # Merged data, None if no station answered
+    errors: dict[str, str]  # Error (or timeout) per station that did not answer
+
 
 async def _get_cache():
     """Get or create singleton cache instance with thread safety."""
@@ -30,59 +83,350 @@ async def _get_cache():
     return _cache_instance
 
 
+def _get_negative_cache() -> NegativeCache:
+    """Get or create the singleton negative cache."""
+    global _negative_cache
+
+    if _negative_cache is None:
+        _negative_cache = NegativeCache()
+    return _negative_cache
+
+
+def _parse_patient_payload(
+    result: Any, station: str, patient_icn: str
+) -> PatientDataCollection:
+    """Parse VPR output, turning VPR's in-band error payloads into VistaAPIError."""
+    # VPR reports unknown patients as {"error": "..."} rather than an HTTP error
+    if isinstance(result, dict) and "error" in result and "data" not in result:
+        message = str(result["error"])
+        not_found = "not found" in message.lower()
+        raise VistaAPIError(
+            error_type="RpcFault",
+            error_code="PATIENT_NOT_FOUND" if not_found else "VPR_ERROR",
+            message=message,
+            status_code=404 if not_found else 400,
+        )
+    return parse_vpr_patient_data(result, station, patient_icn)
+
+
+def _negative_key(station: str, patient_icn: str, caller_duz: str) -> str:
+    return f"patient:{station}:{patient_icn}:{caller_duz}"
+
+
+def _rehydrate(cached_data: Any) -> PatientDataCollection:
+    """Rebuild a collection read from the patient cache"""
+    # The cache stores data with mode="json" which converts datetimes to strings
+    if isinstance(cached_data, dict):
+        # If it's a dict with datetime strings, we need to use model_validate_json
+        # to properly parse the datetime strings
+        json_str = json.dumps(cached_data)
+        patient_data = PatientDataCollection.model_validate_json(json_str)
+        patient_data.share_values(share_strings=False)
+    else:
+        # Fallback for other data types
+        patient_data = PatientDataCollection.model_validate(cached_data)
+        patient_data.share_values()
+    patient_data.memoize_fragments()
+    return patient_data
+
+
+def _vpr_patient_icn(result: Any) -> str | None:
+    """ICN of the patient record in a VPR payload, if it carries one"""
+    if not isinstance(result, dict):
+        return None
+    data = result.get("payload", result)
+    items = data.get("data", {}).get("items", []) if isinstance(data, dict) else []
+    for item in items:
+        if ":patient:" in str(item.get("uid", "")) and item.get("icn"):
+            return str(item["icn"])
+    return None
+
+
+def _rpc_error(rpc_result: dict[str, Any]) -> VistaAPIError:
+    """VistaAPIError for an execute_rpc error response"""
+    vista_error = rpc_result["metadata"].get("vista_error")
+    if vista_error:
+        return VistaAPIError(**vista_error)
+    return VistaAPIError(
+        error_type="RPC_ERROR",
+        error_code="RPC_FAILED",
+        message=rpc_result["error"],
+        status_code=500,
+    )
+
+
+async def _write_patient_data(
+    cache: Any,
+    station: str,
+    patient_icn: str,
+    caller_duz: str,
+    patient_data: PatientDataCollection,
+) -> bool:
+    """Cache patient data, document text bodies first and out of line"""
+    # Use mode='json' for proper datetime serialization
+    data = patient_data.model_dump(mode="json")
+    bodies: dict[str, str] = {}
+    if DOCUMENT_TEXT_OUT_OF_LINE:
+        for document in data["documents_dict"].values():
+            bodies.update(offload_text(document, DOCUMENT_TEXT_MIN_CHARS))
+    if bodies and not await cache.set_document_texts(bodies):
+        logger.warning("Caching document text failed; keeping the text inline")
+        data = patient_data.model_dump(mode="json")
+    # In-process backends keep the dict itself, so dump copies of repeated
+    # strings (statuses, facility names, timestamps) would each take memory
+    ValueTable().share_data(data)
+    return await cache.set_patient_data(
+        station,
+        patient_icn,
+        caller_duz,
+        data,
+        version=patient_data.content_version,
+    )
+
+
+async def _store_patient_data(
+    cache: Any,
+    station: str,
+    patient_icn: str,
+    caller_duz: str,
+    patient_data: PatientDataCollection,
+) -> None:
+    """Write freshly fetched patient data back to the patient cache"""
+    # The write-back is optional work, so skip it when the budget is nearly spent.
+    if not should_skip_optional("patient_cache_write"):
+        try:
+            await run_with_deadline(
+                "patient_cache_write",
+                _write_patient_data(
+                    cache, station, patient_icn, caller_duz, patient_data
+                ),
+            )
+        except DeadlineExceededError:
+            logger.warning("Skipped caching patient data: request deadline exhausted")
+
+    patient_data.memoize_fragments()
+
+
+async def _fetch_patient_data(
+    vista_client: BaseVistaClient,
+    cache: Any,
+    station: str,
+    patient_icn: str,
+    caller_duz: str,
+    bypass_negative_cache: bool = False,
+) -> PatientDataCollection:
+    """Fetch patient data from VistA, then cache it (or its error)"""
+    negative_cache = _get_negative_cache()
+    negative_key = _negative_key(station, patient_icn, caller_duz)
+
+    # Fetch from VistA using RPC executor. Failures are negative-cached here
+    # only, per patient, so the client's RPC-level negative cache is skipped
+    rpc_result = await execute_rpc(
+        vista_client=vista_client,
+        rpc_name="VPR GET PATIENT DATA JSON",
+        parameters=build_named_array_param({"patientId": f";{patient_icn}"}),
+        parser=lambda result: _parse_patient_payload(result, station, patient_icn),
+        station=station,
+        caller_duz=caller_duz,
+        context="LHS RPC CONTEXT",
+        json_result=True,
+        use_negative_cache=False,
+        error_response_builder=lambda error, metadata: {
+            "error": error,
+            "metadata": metadata,
+        },
+    )
+    # Check if this is an error response
+    if "error" in rpc_result:
+        error = _rpc_error(rpc_result)
+        negative_cache.put(negative_key, error)
+        raise error
+
+    if bypass_negative_cache:
+        negative_cache.invalidate(negative_key)
+
+    # Get parsed data
+    patient_data = rpc_result["parsed_data"]
+    await _store_patient_data(cache, station, patient_icn, caller_duz, patient_data)
+    return patient_data
+
+
 async def get_patient_data(
     vista_client: BaseVistaClient,
     station: str,
     patient_icn: str,
     caller_duz: str,
+    bypass_negative_cache: bool = False,
 ) -> PatientDataCollection:
     """Get patient data with transparent caching.
 
     This function handles all caching logic internally. It will:
-    1. Check the cache for existing data
-    2. If not found, fetch from VistA
-    3. Parse and cache the results
-    4. Return the patient data collection
+    1. Fail fast if the patient recently came back not found / not authorized
+    2. Check the cache for existing data
+    3. If not found, fetch from VistA
+    4. Parse and cache the results
+    5. Return the patient data collection
 
     Args:
         vista_client: The Vista API client
         station: Station ID
         patient_icn: Patient ICN
         caller_duz: Caller DUZ
+        bypass_negative_cache: Re-fetch even if the last attempt failed with a
+            cached error (for explicit retries)
 
     Returns:
         PatientDataCollection with all patient data
 
     Raises:
-        VistaAPIError: If the RPC call fails
+        VistaAPIError: If the RPC call fails or the request deadline is exhausted
     """
 
+    negative_cache = _get_negative_cache()
+    if not bypass_negative_cache:
+        cached_error = negative_cache.get(
+            _negative_key(station, patient_icn, caller_duz)
+        )
+        if cached_error is not None:
+            raise cached_error
+
     # Get cache instance
     cache = await _get_cache()
 
-    # Check cache first
-    cached_data = await cache.get_patient_data(station, patient_icn, caller_duz)
+    # Check cache first - a cache read that runs out of budget counts as a miss
+    try:
+        cached_data = await run_with_deadline(
+            "patient_cache_read",
+            cache.get_patient_data(station, patient_icn, caller_duz),
+        )
+    except DeadlineExceededError:
+        cached_data = None
 
     if cached_data:
-        # Return cached data - handle JSON serialized datetime strings
-        # The cache stores data with mode="json" which converts datetimes to strings
-        import json
-
-        if isinstance(cached_data, dict):
-            # If it's a dict with datetime strings, we need to use model_validate_json
-            # to properly parse the datetime strings
-            json_str = json.dumps(cached_data)
-            return PatientDataCollection.model_validate_json(json_str)
+        return _rehydrate(cached_data)
+
+    return await _fetch_patient_data(
+        vista_client, cache, station, patient_icn, caller_duz, bypass_negative_cache
+    )
+
+
+async def get_patient_data_many(
+    vista_client: BaseVistaClient,
+    station: str,
+    patient_icns: list[str],
+    caller_duz: str,
+    max_concurrency: int | None = None,
+) -> dict[str, PatientDataCollection | BaseException]:
+    """Get several patients' data from one station.
+
+    Cached patients are read in one batched cache read; the rest are fetched
+    from VistA concurrently and cached as get_patient_data would. Panel loads
+    of a station share PANEL_FETCH_MAX_CONCURRENCY fetch slots, so concurrent
+    calls never exceed it together. A failure for one patient does not affect
+    the others.
+
+    Args:
+        vista_client: Vista client for RPC calls
+        station: Station ID
+        patient_icns: Patient ICNs (duplicates are loaded once)
+        caller_duz: Caller DUZ
+        max_concurrency: Lower cap on this call's VistA fetches in flight
+
+    Returns:
+        Mapping of ICN to its PatientDataCollection, or to the exception
+        (usually VistaAPIError) that loading it raised, in request order
+    """
+    negative_cache = _get_negative_cache()
+    icns = list(dict.fromkeys(patient_icns))
+    results: dict[str, PatientDataCollection | BaseException] = {}
+    for icn in icns:
+        cached_error = negative_cache.get(_negative_key(station, icn, caller_duz))
+        if cached_error is not None:
+            results[icn] = cached_error
+
+    cache = await _get_cache()
+    pending = [icn for icn in icns if icn not in results]
+    try:
+        cached = await run_with_deadline(
+            "patient_cache_read",
+            cache.get_patient_data_many(station, pending, caller_duz),
+        )
+    except DeadlineExceededError:
+        cached = {}
+
+    missing = []
+    for icn in pending:
+        if cached.get(icn):
+            results[icn] = _rehydrate(cached[icn])
         else:
-            # Fallback for other data types
-            return PatientDataCollection.model_validate(cached_data)
+            missing.append(icn)
+
+    station_slots = _panel_fetch_semaphore(station)
+    call_slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def _fetch(icn: str) -> PatientDataCollection:
+        async with call_slots or contextlib.nullcontext(), station_slots:
+            return await _fetch_patient_data(
+                vista_client, cache, station, icn, caller_duz
+            )
+
+    fetched = await asyncio.gather(
+        *(_fetch(icn) for icn in missing), return_exceptions=True
+    )
+    results.update(zip(missing, fetched, strict=True))
+    return {icn: results[icn] for icn in icns}
+
+
+def _panel_fetch_semaphore(station: str) -> asyncio.Semaphore:
+    """Fetch slots of a station's panel loads"""
+    semaphore = _panel_fetch_slots.get(station)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PANEL_FETCH_MAX_CONCURRENCY)
+        _panel_fetch_slots[station] = semaphore
+    return semaphore
+
+
+async def load_patient_data_by_dfn(
+    vista_client: BaseVistaClient,
+    station: str,
+    patient_dfn: str,
+    caller_duz: str,
+) -> PatientDataCollection:
+    """Fetch a patient known only by DFN and cache the data under its ICN.
+
+    For callers that get patients from VistA lists (e.g. clinic schedules)
+    rather than by ICN. The ICN is read from the VPR payload, so this costs
+    the same single RPC as a get_patient_data miss; it never reads the cache.
+
+    Args:
+        vista_client: Vista client for RPC calls
+        station: Station ID
+        patient_dfn: Patient DFN at the station
+        caller_duz: Caller DUZ
+
+    Returns:
+        PatientDataCollection, cached for get_patient_data(patient_data.patient_icn)
+
+    Raises:
+        VistaAPIError: If the RPC call fails or the payload carries no ICN
+    """
+
+    def _parse(result: Any) -> PatientDataCollection:
+        patient_icn = _vpr_patient_icn(result)
+        if patient_icn is None and not (isinstance(result, dict) and "error" in result):
+            raise VistaAPIError(
+                error_type="RpcFault",
+                error_code="PATIENT_ICN_MISSING",
+                message=f"No ICN in VPR data for DFN {patient_dfn}",
+                status_code=422,
+            )
+        return _parse_patient_payload(result, station, patient_icn or patient_dfn)
 
-    # Fetch from VistA using RPC executor
     rpc_result = await execute_rpc(
         vista_client=vista_client,
         rpc_name="VPR GET PATIENT DATA JSON",
-        parameters=build_named_array_param({"patientId": f";{patient_icn}"}),
-        parser=lambda result: parse_vpr_patient_data(result, station, patient_icn),
+        parameters=build_named_array_param({"patientId": patient_dfn}),
+        parser=_parse,
         station=station,
         caller_duz=caller_duz,
         context="LHS RPC CONTEXT",
@@ -92,21 +436,211 @@ async def get_patient_data(
             "metadata": metadata,
         },
     )
-    # Check if this is an error response
     if "error" in rpc_result:
-        raise VistaAPIError(
-            error_type="RPC_ERROR",
-            error_code="RPC_FAILED",
-            message=rpc_result["error"],
-            status_code=500,
-        )
+        raise _rpc_error(rpc_result)
 
-    # Get parsed data
     patient_data = rpc_result["parsed_data"]
+    cache = await _get_cache()
+    await _store_patient_data(
+        cache, station, patient_data.patient_icn, caller_duz, patient_data
+    )
+    return patient_data
+
+
+def _forget_federated_read(
+    key: tuple[str, str, str], task: asyncio.Task[PatientDataCollection]
+) -> None:
+    """Drop a finished station read (its error is reported by the waiting call)"""
+    _federated_reads.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def get_patient_data_federated(
+    vista_client: BaseVistaClient,
+    stations: list[str],
+    patient_icn: str,
+    caller_duz: str,
+    timeout: float | None = None,
+) -> FederatedPatientData:
+    """Get one patient's data from several stations, merged into one collection.
+
+    Every station is read concurrently through get_patient_data, so each
+    station's data is cached (and refreshed) on its own. Stations that have
+    not answered when the timeout or the request deadline runs out are
+    reported in errors and left out; their reads finish in the background
+    and cache their data for the next call.
+
+    Args:
+        vista_client: Vista client for RPC calls
+        stations: Station IDs, in order of precedence for duplicate UIDs
+        patient_icn: Patient ICN
+        caller_duz: Caller DUZ
+        timeout: Seconds to wait for slow stations
+            (default FEDERATED_FETCH_TIMEOUT_SECONDS)
+
+    Returns:
+        FederatedPatientData with the merged collection (items tagged in
+        item_stations) and the error of each station left out
+    """
+    stations = list(dict.fromkeys(stations))
+
+    async def _read(station: str) -> PatientDataCollection:
+        # Free of the request deadline, which the wait below applies instead
+        current_deadline.set(None)
+        return await get_patient_data(vista_client, station, patient_icn, caller_duz)
+
+    reads: dict[str, asyncio.Task[PatientDataCollection]] = {}
+    for station in stations:
+        key = (station, patient_icn, caller_duz)
+        task = _federated_reads.get(key)
+        if task is None:
+            task = asyncio.create_task(_read(station))
+            _federated_reads[key] = task
+            task.add_done_callback(partial(_forget_federated_read, key))
+        reads[station] = task
+
+    wait = timeout if timeout is not None else FEDERATED_FETCH_TIMEOUT_SECONDS
+    deadline = get_deadline()
+    if deadline is not None:
+        wait = max(min(wait, deadline.remaining() - deadline.reserve_seconds), 0)
+    await asyncio.wait(reads.values(), timeout=wait)
 
-    # Cache for next time - use mode='json' for proper datetime serialization
-    await cache.set_patient_data(
-        station, patient_icn, caller_duz, patient_data.model_dump(mode="json")
+    collections: dict[str, PatientDataCollection] = {}
+    errors: dict[str, str] = {}
+    for station, task in reads.items():
+        if not task.done():
+            errors[station] = f"No response within {wait:.1f}s"
+            mark_exhausted(f"federated_read:{station}")
+        elif task.exception() is not None:
+            errors[station] = str(task.exception())
+        else:
+            collections[station] = task.result()
+
+    if not collections:
+        return FederatedPatientData(None, errors)
+    return FederatedPatientData(PatientDataCollection.merge(collections), errors)
+
+
+async def get_patient_data_version(
+    station: str, patient_icn: str, caller_duz: str
+) -> str | None:
+    """Get the content version of cached patient data without loading it.
+
+    The version changes whenever the patient data is refreshed, so it can key
+    anything derived from the data (see ToolResultCache).
+
+    Args:
+        station: Station ID
+        patient_icn: Patient ICN
+        caller_duz: Caller DUZ
+
+    Returns:
+        Version of the cached data, or None if the patient is not cached (or
+        the cache read ran out of budget)
+    """
+    cache = await _get_cache()
+    try:
+        return await run_with_deadline(
+            "patient_version_read",
+            cache.get_patient_version(station, patient_icn, caller_duz),
+        )
+    except DeadlineExceededError:
+        return None
+
+
+async def load_document_text(documents: Iterable[Document]) -> list[Document]:
+    """Get documents with their out-of-line text bodies loaded.
+
+    Cached patient data holds only a summary of each long text body (see
+    _write_patient_data); tools that return or search full text load the
+    bodies of just the documents they need, in one batched cache read.
+    Documents whose text is already inline are returned as they are.
+
+    Args:
+        documents: Documents of a patient data collection
+
+    Returns:
+        The documents in the same order, copies where text was loaded. A body
+        missing from the cache (or not read within the request deadline)
+        leaves its entry with the summary only.
+    """
+    documents = list(documents)
+    refs = list(
+        dict.fromkeys(
+            text.content_ref
+            for document in documents
+            for text in document.text
+            if text.is_offloaded and text.content_ref is not None
+        )
     )
+    if not refs:
+        return documents
 
-    return patient_data
+    cache = await _get_cache()
+    try:
+        bodies = await run_with_deadline(
+            "document_text_read", cache.get_document_texts(refs)
+        )
+    except DeadlineExceededError:
+        bodies = {}
+    if len(bodies) < len(refs):
+        logger.warning(
+            f"{len(refs) - len(bodies)} of {len(refs)} document text bodies "
+            "not in cache; returning their summaries"
+        )
+    return [
+        document.with_text(bodies) if document.text_offloaded else document
+        for document in documents
+    ]
+
+
+def summarize_document_text(documents: Iterable[Document]) -> list[Document]:
+    """Get documents with each long text body replaced by its summary.
+
+    For responses that promise summaries only. A collection fetched from
+    VistA still holds every body, while one read from the cache holds
+    summaries, so the bodies are replaced explicitly and the response is the
+    same either way.
+
+    Args:
+        documents: Documents of a patient data collection
+
+    Returns:
+        The documents in the same order, copies where text was replaced
+        (bodies under DOCUMENT_TEXT_MIN_CHARS characters stay inline)
+    """
+    return [document.without_text(DOCUMENT_TEXT_MIN_CHARS) for document in documents]
+
+
+async def get_document_search_index(
+    patient_data: PatientDataCollection,
+) -> DocumentSearchIndex:
+    """Get the document search index for a patient data snapshot.
+
+    The index is built lazily on first search, over the documents with their
+    text loaded, and shared by every copy of the same snapshot (same station,
+    ICN and retrieval time), so repeated searches against cached patient data
+    neither reload the text nor re-tokenize the documents.
+
+    Args:
+        patient_data: Patient data collection
+
+    Returns:
+        Full-text index over the collection's documents
+    """
+    key = (
+        patient_data.source_station,
+        patient_data.source_icn,
+        patient_data.retrieved_at,
+    )
+    index = _document_search_indexes.get(key)
+    if index is None:
+        if any(document.text_offloaded for document in patient_data.documents):
+            index = DocumentSearchIndex(
+                await load_document_text(patient_data.documents)
+            )
+        else:
+            index = patient_data.document_search
+        _document_search_indexes[key] = index
+    return index
@@ -0,0 +1,232 @@
+"""Request-scoped deadlines shared by tools, RPC execution and cache I/O"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Mapping
+from contextvars import ContextVar, Token
+from typing import Any, TypeVar
+
+from ..config import (
+    REQUEST_DEADLINE_MAX_SECONDS,
+    REQUEST_DEADLINE_RESERVE_MS,
+    REQUEST_DEADLINE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Headers a client may send to shorten the default budget (milliseconds)
+DEADLINE_HEADERS = ("x-vista-deadline-ms", "x-request-timeout-ms")
+
+STAGE_OK = "ok"
+STAGE_EXHAUSTED = "exhausted"
+STAGE_SKIPPED = "skipped"
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a stage cannot finish within the request deadline"""
+
+    def __init__(self, stage: str, budget_ms: int):
+        self.stage = stage
+        self.budget_ms = budget_ms
+        super().__init__(f"Request deadline of {budget_ms}ms exceeded during {stage}")
+
+
+class Deadline:
+    """Time budget for a single tool call"""
+
+    def __init__(
+        self,
+        budget_seconds: float,
+        reserve_seconds: float = REQUEST_DEADLINE_RESERVE_MS / 1000,
+    ):
+        """
+        Initialize deadline
+
+        Args:
+            budget_seconds: Total time the tool call may take
+            reserve_seconds: Budget kept back for building the response;
+                optional work is skipped once less than this remains
+        """
+        self.budget_seconds = budget_seconds
+        self.reserve_seconds = reserve_seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget_seconds
+        self.stages: dict[str, str] = {}
+
+    @property
+    def budget_ms(self) -> int:
+        return int(self.budget_seconds * 1000)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def nearly_spent(self) -> bool:
+        """Whether optional work should be skipped"""
+        return self.remaining() <= self.reserve_seconds
+
+    def clamp(self, timeout: float | None) -> float:
+        """Clamp a layer's own timeout to the remaining budget"""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def record(self, stage: str, status: str) -> None:
+        """Record the outcome of a stage; exhaustion is never overwritten"""
+        if self.stages.get(stage) != STAGE_EXHAUSTED:
+            self.stages[stage] = status
+
+    def report(self) -> dict[str, Any]:
+        """Summary of the budget and which stages ran out of time or were skipped"""
+        return {
+            "budget_ms": self.budget_ms,
+            "remaining_ms": int(self.remaining() * 1000),
+            "exhausted_stages": [
+                stage
+                for stage, status in self.stages.items()
+                if status == STAGE_EXHAUSTED
+            ],
+            "skipped_stages": [
+                stage
+                for stage, status in self.stages.items()
+                if status == STAGE_SKIPPED
+            ],
+        }
+
+
+# Context variable holding the deadline for the current tool call
+current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def start_deadline(budget_seconds: float | None = None) -> Token[Deadline | None]:
+    """
+    Start a deadline for the current async context
+
+    Args:
+        budget_seconds: Budget for the call (defaults to REQUEST_DEADLINE_SECONDS)
+
+    Returns:
+        Token for resetting the context variable when the call completes
+    """
+    budget = REQUEST_DEADLINE_SECONDS if budget_seconds is None else budget_seconds
+    budget = min(budget, REQUEST_DEADLINE_MAX_SECONDS)
+    return current_deadline.set(Deadline(budget))
+
+
+def reset_deadline(token: Token[Deadline | None]) -> None:
+    """Restore the deadline that was active before start_deadline"""
+    current_deadline.reset(token)
+
+
+def get_deadline() -> Deadline | None:
+    """Get the deadline for the current async context, if any"""
+    return current_deadline.get()
+
+
+def deadline_from_headers(headers: Mapping[str, str]) -> float | None:
+    """
+    Read a client-requested budget from HTTP headers
+
+    Returns:
+        Budget in seconds, or None if no valid header was sent
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    for header in DEADLINE_HEADERS:
+        value = lowered.get(header)
+        if not value:
+            continue
+        try:
+            budget_ms = float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {header} header: {value!r}")
+            continue
+        if budget_ms > 0:
+            return budget_ms / 1000
+    return None
+
+
+def clamp_timeout(timeout: float | None) -> float | None:
+    """Clamp a timeout to the current deadline (unchanged when none is set)"""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return timeout
+    return deadline.clamp(timeout)
+
+
+def should_skip_optional(stage: str) -> bool:
+    """
+    Check whether optional work (write-backs, lower cache tiers) should be skipped
+
+    Records the stage as skipped on the current deadline when it is.
+    """
+    deadline = current_deadline.get()
+    if deadline is None or not deadline.nearly_spent:
+        return False
+    deadline.record(stage, STAGE_SKIPPED)
+    logger.debug(
+        f"Skipping {stage}: {deadline.remaining() * 1000:.0f}ms left of {deadline.budget_ms}ms"
+    )
+    return True
+
+
+def check_deadline(stage: str) -> None:
+    """Raise DeadlineExceededError if the budget is already spent before a stage"""
+    deadline = current_deadline.get()
+    if deadline is not None and deadline.expired:
+        deadline.record(stage, STAGE_EXHAUSTED)
+        raise DeadlineExceededError(stage, deadline.budget_ms)
+
+
+def mark_exhausted(stage: str) -> None:
+    """Record that a stage ran out of time (no-op without a deadline)"""
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.record(stage, STAGE_EXHAUSTED)
+
+
+async def run_with_deadline(
+    stage: str, awaitable: Awaitable[T], timeout: float | None = None
+) -> T:
+    """
+    Await a stage bounded by the remaining budget and the stage's own timeout
+
+    Args:
+        stage: Stage name used in the deadline report
+        awaitable: Work to run
+        timeout: The stage's own timeout, clamped to the remaining budget
+
+    Raises:
+        DeadlineExceededError: If the stage does not finish in time
+    """
+    deadline = current_deadline.get()
+    if deadline is None:
+        if timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout)
+
+    try:
+        check_deadline(stage)
+    except DeadlineExceededError:
+        # Don't leave an un-awaited coroutine behind
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+
+    try:
+        result = await asyncio.wait_for(awaitable, deadline.clamp(timeout))
+    except TimeoutError as e:
+        if deadline.expired:
+            deadline.record(stage, STAGE_EXHAUSTED)
+            raise DeadlineExceededError(stage, deadline.budget_ms) from e
+        raise
+    deadline.record(stage, STAGE_OK)
+    return result
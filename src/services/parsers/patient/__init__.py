@@ -1,13 +1,14 @@
 """Patient data parsers"""
 
 # Import new parsers from submodules
-from .datetime_parser import parse_date, parse_datetime
+from .datetime_parser import parse_date, parse_datetime, parse_datetimes
 from .value_parser import (
     parse_blood_pressure,
 )
 
 __all__ = [
     "parse_datetime",
+    "parse_datetimes",
     "parse_date",
     "parse_blood_pressure",
 ]
@@ -0,0 +1,132 @@
+"""Validation of a whole domain's items at once"""
+
+from collections.abc import Callable, Iterable
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ....utils import get_logger
+from .datetime_parser import parse_datetime, parse_datetimes
+
+logger = get_logger()
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@cache
+def list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """TypeAdapter for a list of model, built once per model"""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def validate_items(
+    model: type[ModelT], items: list[dict[str, Any]], label: str
+) -> list[ModelT]:
+    """
+    Validate a domain's items in one call, skipping the ones that fail
+
+    The list is validated by one TypeAdapter call. When some items fail, the
+    rest are validated again as a batch and the failures one by one, so each
+    is logged with its own error as when items were validated separately.
+
+    Args:
+        model: Model of the domain
+        items: Preprocessed VPR items
+        label: Item kind for log messages (e.g. "vital sign")
+
+    Returns:
+        Models of the valid items, in the order of items
+    """
+    adapter = list_adapter(model)
+    try:
+        return adapter.validate_python(items)
+    except ValidationError as e:
+        failed: set[int] = set()
+        for error in e.errors():
+            index = error["loc"][0] if error["loc"] else None
+            if not isinstance(index, int):
+                return _validate_each(model, items, label)
+            failed.add(index)
+    except Exception:
+        # A validator raised something pydantic does not wrap
+        return _validate_each(model, items, label)
+
+    _validate_each(model, [items[index] for index in sorted(failed)], label)
+    valid = [item for index, item in enumerate(items) if index not in failed]
+    try:
+        return adapter.validate_python(valid)
+    except Exception:
+        return _validate_each(model, valid, label)
+
+
+def _validate_each(
+    model: type[ModelT], items: list[dict[str, Any]], label: str
+) -> list[ModelT]:
+    """Validate items one at a time, logging and skipping failures"""
+    models = []
+    for item in items:
+        try:
+            models.append(model(**item))
+        except Exception as e:
+            logger.warning(f"Failed to parse {label} {item.get('uid')}: {e}")
+            logger.debug(f"Item data: {item}")
+    return models
+
+
+def preprocess_items(
+    items: list[dict[str, Any]],
+    preprocess: Callable[[dict[str, Any]], dict[str, Any] | None],
+    label: str,
+) -> list[dict[str, Any]]:
+    """
+    Run a per-item preprocessor over a domain's items
+
+    Args:
+        items: VPR items
+        preprocess: Returns the prepared copy of an item, or None to skip it
+        label: Item kind for log messages
+
+    Returns:
+        Prepared items, without the skipped ones and the ones preprocess
+        failed on
+    """
+    processed_items = []
+    for item in items:
+        try:
+            processed = preprocess(item)
+        except Exception as e:
+            logger.warning(f"Failed to parse {label} {item.get('uid')}: {e}")
+            logger.debug(f"Item data: {item}")
+            continue
+        if processed is not None:
+            processed_items.append(processed)
+    return processed_items
+
+
+def parse_datetime_columns(items: list[dict[str, Any]], fields: Iterable[str]) -> None:
+    """
+    Parse datetime fields of preprocessed items a column at a time, in place
+
+    Empty values are left alone. A value that is not a real date (such as
+    Feb 30) is left as is, for model validation to reject its item.
+
+    Args:
+        items: Preprocessed items
+        fields: VPR field names holding datetimes
+    """
+    for field in fields:
+        rows = [item for item in items if item.get(field)]
+        try:
+            values = parse_datetimes(row[field] for row in rows)
+        except ValueError:
+            values = [_parse_or_keep(row[field]) for row in rows]
+        for row, value in zip(rows, values, strict=True):
+            row[field] = value
+
+
+def _parse_or_keep(value: Any) -> Any:
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return value
@@ -1,12 +1,18 @@
 """Datetime parsing utilities for healthcare data"""
 
 import re
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
+from functools import lru_cache
 
 DT_MATCHER = re.compile(
     r"^(?P<year>\d{4})(?P<month>0[1-9]|1[0-2])?(?P<day>0[1-9]|[12][0-9]|3[01])?(?P<hour>[01][0-9]|2[0-3])?(?P<minute>[0-5][0-9])?(?P<second>[0-5][0-9])?"
 )
 
+# Distinct values parsed and kept; the same timestamps repeat across the
+# orders, visits and appointments of a patient and again on cache rehydration
+DATETIME_MEMO_SIZE = 16384
+
 
 def parse_datetime(dt_value: int | str | datetime | None) -> datetime | None:
     """
@@ -36,10 +42,77 @@ def parse_datetime(dt_value: int | str | datetime | None) -> datetime | None:
     """
     if dt_value is None or isinstance(dt_value, datetime):
         return dt_value
+    if type(dt_value) is int or type(dt_value) is str:
+        return _parse_value(dt_value)
+    return _parse_text(str(dt_value).strip())
+
 
-    # Convert to string and clean
-    dt_str = str(dt_value).strip()
+def parse_datetimes(
+    values: Iterable[int | str | datetime | None],
+) -> list[datetime | None]:
+    """
+    Parse a column of datetime values, such as one field across many items.
 
+    Each distinct value in the column is parsed once. Values that compare
+    equal share a result, so a column should hold one kind of value.
+
+    Args:
+        values: Values accepted by parse_datetime
+
+    Returns:
+        Parsed datetimes, in the order of values
+    """
+    values = list(values)
+    try:
+        distinct = dict.fromkeys(values)
+    except TypeError:  # unhashable values, which parse to None
+        return [parse_datetime(value) for value in values]
+    parsed = {value: parse_datetime(value) for value in distinct}
+    return [parsed[value] for value in values]
+
+
+@lru_cache(maxsize=DATETIME_MEMO_SIZE)
+def _parse_value(value: int | str) -> datetime | None:
+    """parse_datetime for ints and strings, memoized"""
+    text = value.strip() if type(value) is str else str(value)
+    if text.isascii() and text.isdigit():
+        parsed = _parse_digits(int(text), len(text))
+        if parsed is not None:
+            return parsed
+    return _parse_text(text)
+
+
+def _parse_digits(number: int, digits: int) -> datetime | None:
+    """
+    YYYYMMDD, YYYYMMDDHHMM or YYYYMMDDHHMMSS split arithmetically.
+
+    Returns None for other lengths and out-of-range parts, which are left to
+    _parse_text.
+    """
+    hour = minute = second = 0
+    if digits == 14:
+        number, second = divmod(number, 100)
+        digits = 12
+    if digits == 12:
+        number, minute = divmod(number, 100)
+        number, hour = divmod(number, 100)
+    elif digits != 8:
+        return None
+    number, day = divmod(number, 100)
+    year, month = divmod(number, 100)
+    if (
+        1 <= month <= 12
+        and 1 <= day <= 31
+        and hour <= 23
+        and minute <= 59
+        and second <= 59
+    ):
+        return datetime(year, month, day, hour, minute, second, tzinfo=UTC)
+    return None
+
+
+def _parse_text(dt_str: str) -> datetime | None:
+    """ISO format, then YYYYMMDDHHMMSS or a prefix of it"""
     # see if it's iso format
     try:
         dt = datetime.fromisoformat(dt_str)
@@ -0,0 +1,68 @@
+"""Worker processes for parsing very large VPR records"""
+
+import atexit
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from ....config import (
+    PARALLEL_PARSE_CHUNK_ITEMS,
+    PARALLEL_PARSE_MIN_ITEMS,
+    PARALLEL_PARSE_WORKERS,
+)
+
+_pool: Executor | None = None
+
+
+def get_parse_pool(item_count: int) -> Executor | None:
+    """
+    Get the worker pool for parsing a record, if it is worth using
+
+    Workers are started on first use, with the spawn method (the server runs
+    threads, which fork does not carry over safely), and kept until
+    shutdown_parse_pool, which also runs at interpreter exit.
+
+    Args:
+        item_count: Number of items in the VPR record
+
+    Returns:
+        The pool, or None for records under PARALLEL_PARSE_MIN_ITEMS items or
+        when fewer than two workers are configured
+    """
+    global _pool
+    if item_count < PARALLEL_PARSE_MIN_ITEMS or PARALLEL_PARSE_WORKERS < 2:
+        return None
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=PARALLEL_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(shutdown_parse_pool)
+    return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse workers, if started"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def chunk_items(
+    items: list[dict[str, Any]], size: int = PARALLEL_PARSE_CHUNK_ITEMS
+) -> list[list[dict[str, Any]]]:
+    """
+    Split a domain's items into chunks for the workers
+
+    Args:
+        items: VPR items of one domain
+        size: Items per chunk
+
+    Returns:
+        Consecutive chunks, in order; none when the domain is smaller than one
+        chunk and is better parsed in process
+    """
+    if len(items) < size:
+        return []
+    return [items[start : start + size] for start in range(0, len(items), size)]
@@ -4,7 +4,10 @@ This module parses the raw Patient Record (VPR) JSON response
 into structured Pydantic models for easier consumption.
 """
 
+from collections.abc import Callable
+from concurrent.futures import Future
 from datetime import UTC, datetime
+from functools import cache
 from typing import Any
 
 from jsonpath_ng import parse as jsonpath_parse  # type: ignore
@@ -36,13 +39,82 @@ from ....models.patient import (
     Visit,
     VitalSign,
 )
+from ....models.patient.interning import ValueTable
 from ....models.patient.pov import POVType
 from ....utils import get_logger
-from ...parsers.patient.datetime_parser import parse_datetime
+from .batch import parse_datetime_columns, preprocess_items, validate_items
+from .parallel import chunk_items, get_parse_pool
+from .raw_data import retain_raw_data
 
 logger = get_logger()
 
 
+@cache
+def _jsonpath_expressions() -> dict[str, Any]:
+    """
+    JSONPath expressions used by the parser, compiled once per process.
+
+    Compiling one builds a parser table (over 10 ms), and a parser is created
+    for every VPR response.
+    """
+    return {
+        # Core data extraction
+        "items": jsonpath_parse("$.data.items[*]"),
+        "payload_items": jsonpath_parse("$.payload.data.items[*]"),
+        # Patient demographics
+        "patient_addresses": jsonpath_parse("$.addresses[*]"),
+        "patient_telecoms": jsonpath_parse("$.telecoms[*]"),
+        "patient_supports": jsonpath_parse("$.supports[*]"),
+        "patient_veteran": jsonpath_parse("$.veteran"),
+        "patient_flags": jsonpath_parse("$.flags[*]"),
+        # Medication specific
+        "med_orders": jsonpath_parse("$.orders[*]"),
+        "med_prescriber": jsonpath_parse("$.orders[0].providerName"),
+        "med_prescriber_uid": jsonpath_parse("$.orders[0].providerUid"),
+        "med_name": jsonpath_parse("$.name"),
+        "med_medicationName": jsonpath_parse("$.medicationName"),
+        "med_drugName": jsonpath_parse("$.drugName"),
+    }
+
+
+# Newest-first sort key of each domain's models; orders and documents keep
+# VPR order
+_SORT_KEYS: dict[str, Callable[[Any], Any]] = {
+    "vital": lambda v: v.observed,
+    "lab": lambda lab: lab.observed,
+    "consult": lambda c: c.date_time,
+    "med": lambda m: m.start_date or datetime.min,
+    "visit": lambda v: v.visit_date or datetime.min,
+    "factor": lambda f: f.recorded_date,
+    "treatment": lambda t: t.date,
+    "diagnosis": lambda d: d.diagnosis_date or datetime.min,
+    "cpt": lambda c: c.entered or datetime.min.replace(tzinfo=UTC),
+    "allergy": lambda a: a.entered or datetime.min.replace(tzinfo=UTC),
+    "pov": lambda p: p.entered or datetime.min.replace(tzinfo=UTC),
+    "problem": lambda p: p.entered or datetime.min.replace(tzinfo=UTC),
+    "appointment": lambda p: p.appointment_date or datetime.min.replace(tzinfo=UTC),
+}
+
+# Parser method of each domain whose items parse independently of each other,
+# so that a large domain can be parsed in chunks (visits need parsed orders)
+_CHUNKABLE_DOMAINS = {
+    "vital": "_parse_vital_signs",
+    "lab": "_parse_lab_results",
+    "consult": "_parse_consults",
+    "med": "_parse_medications",
+    "order": "_parse_orders",
+    "factor": "_parse_health_factors",
+    "treatment": "_parse_treatments",
+    "document": "_parse_documents",
+    "cpt": "_parse_cpt_codes",
+    "allergy": "_parse_allergies",
+    "pov": "_parse_povs",
+    "problem": "_parse_problems",
+    "appointment": "_parse_appointments",
+    "diagnosis": "_parse_diagnoses",
+}
+
+
 class PatientDataParser:
     """Parser for VPR GET PATIENT DATA JSON response using JSONPath"""
 
@@ -57,22 +129,8 @@ class PatientDataParser:
         self.station = station
         self.icn = icn
 
-        # Pre-compile JSONPath expressions for better performance
-        self._jsonpath_expressions = {
-            # Core data extraction
-            "items": jsonpath_parse("$.data.items[*]"),
-            "payload_items": jsonpath_parse("$.payload.data.items[*]"),
-            # Patient demographics
-            "patient_addresses": jsonpath_parse("$.addresses[*]"),
-            "patient_telecoms": jsonpath_parse("$.telecoms[*]"),
-            "patient_supports": jsonpath_parse("$.supports[*]"),
-            "patient_veteran": jsonpath_parse("$.veteran"),
-            "patient_flags": jsonpath_parse("$.flags[*]"),
-            # Medication specific
-            "med_orders": jsonpath_parse("$.orders[*]"),
-            "med_prescriber": jsonpath_parse("$.orders[0].providerName"),
-            "med_prescriber_uid": jsonpath_parse("$.orders[0].providerUid"),
-        }
+        # Pre-compiled JSONPath expressions, shared by all parsers
+        self._jsonpath_expressions = _jsonpath_expressions()
 
     def parse(self, vpr_data: dict[str, Any]) -> PatientDataCollection:
         """
@@ -101,6 +159,15 @@ class PatientDataParser:
 
         # Group items by type using UID pattern matching
         grouped_items = self._group_items_by_uid_type(items)
+        # Diagnoses are read from problems and POVs
+        grouped_items["diagnosis"] = [
+            *grouped_items.get("problem", []),
+            *grouped_items.get("pov", []),
+        ]
+
+        # Very large records: big domains are parsed in worker processes while
+        # the rest are parsed here
+        chunked = self._submit_chunks(grouped_items, len(items))
 
         # Parse demographics (required)
         demographics = self._parse_demographics(grouped_items.get("patient", []))
@@ -108,25 +175,23 @@ class PatientDataParser:
             raise ValueError("Patient demographics not found in VPR data")
 
         # Parse clinical data
-        vital_signs = self._parse_vital_signs(grouped_items.get("vital", []))
-        lab_results = self._parse_lab_results(grouped_items.get("lab", []))
-        consults = self._parse_consults(grouped_items.get("consult", []))
-        medications = self._parse_medications(grouped_items.get("med", []))
-        orders = self._parse_orders(grouped_items.get("order", []))
+        vital_signs = self._parse_domain("vital", grouped_items, chunked)
+        lab_results = self._parse_domain("lab", grouped_items, chunked)
+        consults = self._parse_domain("consult", grouped_items, chunked)
+        medications = self._parse_domain("med", grouped_items, chunked)
+        orders = self._parse_domain("order", grouped_items, chunked)
         visits = self._parse_visits(grouped_items.get("visit", []), orders)
-        health_factors = self._parse_health_factors(grouped_items.get("factor", []))
-        treatments = self._parse_treatments(grouped_items.get("treatment", []))
-        documents = self._parse_documents(grouped_items.get("document", []))
-        cpt_codes = self._parse_cpt_codes(grouped_items.get("cpt", []))
-        allergies = self._parse_allergies(grouped_items.get("allergy", []))
-        povs = self._parse_povs(grouped_items.get("pov", []))
-        problems = self._parse_problems(grouped_items.get("problem", []))
-        appointments = self._parse_appointments(grouped_items.get("appointment", []))
-
-        problem_items = grouped_items.get("problem", [])
-        pov_items = grouped_items.get("pov", [])
-        all_diagnosis_items = problem_items + pov_items
-        diagnoses = self._parse_diagnoses(all_diagnosis_items)
+        health_factors = self._parse_domain("factor", grouped_items, chunked)
+        treatments = self._parse_domain("treatment", grouped_items, chunked)
+        documents = self._parse_domain("document", grouped_items, chunked)
+        cpt_codes = self._parse_domain("cpt", grouped_items, chunked)
+        allergies = self._parse_domain("allergy", grouped_items, chunked)
+        povs = self._parse_domain("pov", grouped_items, chunked)
+        problems = self._parse_domain("problem", grouped_items, chunked)
+        appointments = self._parse_domain("appointment", grouped_items, chunked)
+        diagnoses = self._parse_domain("diagnosis", grouped_items, chunked)
+
+        raw_data, raw_data_path = retain_raw_data(self.station, self.icn, vpr_data)
 
         # Create collection
         collection = PatientDataCollection(
@@ -149,8 +214,10 @@ class PatientDataParser:
             source_station=self.station,
             source_icn=self.icn,
             total_items=len(items),
-            raw_data=vpr_data,  # Store for debugging
+            raw_data=raw_data,
+            raw_data_path=str(raw_data_path) if raw_data_path else None,
         )
+        collection.share_values()
 
         logger.info(
             f"""Parsed patient data for {collection.patient_name}: 
@@ -200,6 +267,49 @@ class PatientDataParser:
 
         return grouped
 
+    def _submit_chunks(
+        self, grouped_items: dict[str, list[dict[str, Any]]], item_count: int
+    ) -> dict[str, list[Future[list[Any]]]]:
+        """Hand the chunks of large domains to the parse workers, if worthwhile"""
+        pool = get_parse_pool(item_count)
+        if pool is None:
+            return {}
+
+        chunked: dict[str, list[Future[list[Any]]]] = {}
+        try:
+            for domain in _CHUNKABLE_DOMAINS:
+                chunks = chunk_items(grouped_items.get(domain, []))
+                if chunks:
+                    chunked[domain] = [
+                        pool.submit(_parse_chunk, self.station, self.icn, domain, chunk)
+                        for chunk in chunks
+                    ]
+        except Exception as e:
+            # Broken or shut down pool; unsubmitted domains are parsed here
+            logger.warning(f"Failed to start parallel parse: {e}")
+        return chunked
+
+    def _parse_domain(
+        self,
+        domain: str,
+        grouped_items: dict[str, list[dict[str, Any]]],
+        chunked: dict[str, list[Future[list[Any]]]],
+    ) -> dict[str, Any]:
+        """Parse one domain here, or reassemble the chunks parsed by workers"""
+        futures = chunked.get(domain)
+        if futures:
+            try:
+                models = [model for future in futures for model in future.result()]
+            except Exception as e:
+                logger.warning(f"Parallel parse of {domain} failed, retrying: {e}")
+            else:
+                if domain in _SORT_KEYS:
+                    models.sort(key=_SORT_KEYS[domain], reverse=True)
+                return {model.uid: model for model in models}
+
+        parse = getattr(self, _CHUNKABLE_DOMAINS[domain])
+        return parse(grouped_items.get(domain, []))
+
     def _parse_demographics(
         self, patient_items: list[dict[str, Any]]
     ) -> PatientDemographics | None:
@@ -293,17 +403,10 @@ class PatientDataParser:
         self, vital_items: list[dict[str, Any]]
     ) -> dict[str, VitalSign]:
         """Parse vital signs from vital items"""
-        vitals = []
-
-        for item in vital_items:
-            try:
-                vital = VitalSign(**item)
-                vitals.append(vital)
-            except Exception as e:
-                logger.warning(f"Failed to parse vital sign {item.get('uid')}: {e}")
+        vitals = validate_items(VitalSign, vital_items, "vital sign")
 
         # Sort by observed date (newest first)
-        vitals.sort(key=lambda v: v.observed, reverse=True)
+        vitals.sort(key=_SORT_KEYS["vital"], reverse=True)
 
         return {vital.uid: vital for vital in vitals}
 
@@ -311,17 +414,10 @@ class PatientDataParser:
         self, lab_items: list[dict[str, Any]]
     ) -> dict[str, LabResult]:
         """Parse lab results from lab items"""
-        labs = []
-
-        for item in lab_items:
-            try:
-                lab = LabResult(**item)
-                labs.append(lab)
-            except Exception as e:
-                logger.warning(f"Failed to parse lab result {item.get('uid')}: {e}")
+        labs = validate_items(LabResult, lab_items, "lab result")
 
         # Sort by observed date (newest first)
-        labs.sort(key=lambda lab: lab.observed, reverse=True)
+        labs.sort(key=_SORT_KEYS["lab"], reverse=True)
 
         return {lab.uid: lab for lab in labs}
 
@@ -329,17 +425,10 @@ class PatientDataParser:
         self, consult_items: list[dict[str, Any]]
     ) -> dict[str, Consult]:
         """Parse consultations from consult items"""
-        consults = []
-
-        for item in consult_items:
-            try:
-                consult = Consult(**item)
-                consults.append(consult)
-            except Exception as e:
-                logger.warning(f"Failed to parse consult {item.get('uid')}: {e}")
+        consults = validate_items(Consult, consult_items, "consult")
 
         # Sort by date (newest first)
-        consults.sort(key=lambda c: c.date_time, reverse=True)
+        consults.sort(key=_SORT_KEYS["consult"], reverse=True)
 
         return {consult.uid: consult for consult in consults}
 
@@ -347,20 +436,13 @@ class PatientDataParser:
         self, med_items: list[dict[str, Any]]
     ) -> dict[str, Medication]:
         """Parse medications from med items"""
-        medications = []
-
-        for item in med_items:
-            try:
-                # Preprocess the medication data
-                processed_item = self._preprocess_medication_item(item)
-                medication = Medication(**processed_item)
-                medications.append(medication)
-            except Exception as e:
-                logger.warning(f"Failed to parse medication {item.get('uid')}: {e}")
-                logger.debug(f"Medication item data: {item}")
+        processed_items = preprocess_items(
+            med_items, self._preprocess_medication_item, "medication"
+        )
+        medications = validate_items(Medication, processed_items, "medication")
 
         # Sort by start date (newest first), handling None dates
-        medications.sort(key=lambda m: m.start_date or datetime.min, reverse=True)
+        medications.sort(key=_SORT_KEYS["med"], reverse=True)
 
         return {medication.uid: medication for medication in medications}
 
@@ -370,7 +452,6 @@ class PatientDataParser:
         orders: dict[str, Order] | None = None,
     ) -> dict[str, Visit]:
         """Parse visits from visit items and populate order/treatment UIDs"""
-        visits: list[Visit] = []
         orders = orders or {}
 
         # Create a mapping of visit UIDs to order UIDs for efficient lookup
@@ -395,30 +476,25 @@ class PatientDataParser:
                 ]:
                     visit_to_treatments[encounter_uid].append(order.uid)
 
-        for item in visit_items:
-            try:
-                # Pre-process visit data
-                processed_item = self._preprocess_visit_item(item)
-
-                # Get the visit UID to look up related orders
-                visit_uid = processed_item.get("uid")
-
-                # Populate orderUids and treatmentUids from the mappings
-                processed_item["orderUids"] = (
-                    visit_to_orders.get(visit_uid, []) if visit_uid else []
-                )
-                processed_item["treatmentUids"] = (
-                    visit_to_treatments.get(visit_uid, []) if visit_uid else []
-                )
-
-                visit = Visit(**processed_item)
-                visits.append(visit)
-            except Exception as e:
-                logger.warning(f"Failed to parse visit {item.get('uid')}: {e}")
-                logger.debug(f"Visit item data: {item}")
+        processed_items = preprocess_items(
+            visit_items, self._preprocess_visit_item, "visit"
+        )
+        for processed_item in processed_items:
+            # Get the visit UID to look up related orders
+            visit_uid = processed_item.get("uid")
+
+            # Populate orderUids and treatmentUids from the mappings
+            processed_item["orderUids"] = (
+                visit_to_orders.get(visit_uid, []) if visit_uid else []
+            )
+            processed_item["treatmentUids"] = (
+                visit_to_treatments.get(visit_uid, []) if visit_uid else []
+            )
+
+        visits = validate_items(Visit, processed_items, "visit")
 
         # Sort by visit date (newest first)
-        visits.sort(key=lambda v: v.visit_date or datetime.min, reverse=True)
+        visits.sort(key=_SORT_KEYS["visit"], reverse=True)
 
         return {visit.uid: visit for visit in visits}
 
@@ -457,7 +533,7 @@ class PatientDataParser:
             # Try alternative field names using JSONPath
             alternative_fields = ["name", "medicationName", "drugName"]
             for alt_field in alternative_fields:
-                alt_expr = jsonpath_parse(f"$.{alt_field}")
+                alt_expr = self._jsonpath_expressions[f"med_{alt_field}"]
                 matches = alt_expr.find(processed)
                 if matches:
                     processed["productFormName"] = matches[0].value
@@ -485,25 +561,13 @@ class PatientDataParser:
         self, factor_items: list[dict[str, Any]]
     ) -> dict[str, HealthFactor]:
         """Parse health factors from factor items"""
-        health_factors = []
-
-        for item in factor_items:
-            try:
-                # Preprocess the health factor data
-                processed_item = self._preprocess_health_factor_item(item)
-
-                # Skip malformed items that return None
-                if processed_item is None:
-                    continue
-
-                health_factor = HealthFactor(**processed_item)
-                health_factors.append(health_factor)
-            except Exception as e:
-                logger.warning(f"Failed to parse health factor {item.get('uid')}: {e}")
-                logger.debug(f"Health factor item data: {item}")
+        processed_items = preprocess_items(
+            factor_items, self._preprocess_health_factor_item, "health factor"
+        )
+        health_factors = validate_items(HealthFactor, processed_items, "health factor")
 
         # Sort by recorded date (newest first)
-        health_factors.sort(key=lambda f: f.recorded_date, reverse=True)
+        health_factors.sort(key=_SORT_KEYS["factor"], reverse=True)
 
         return {health_factor.uid: health_factor for health_factor in health_factors}
 
@@ -557,20 +621,13 @@ class PatientDataParser:
         self, treatment_items: list[dict[str, Any]]
     ) -> dict[str, Treatment]:
         """Parse treatments from treatment items"""
-        treatments = []
-
-        for item in treatment_items:
-            try:
-                # Preprocess the treatment data for field normalization
-                processed_item = self._preprocess_treatment_item(item)
-                treatment = Treatment(**processed_item)
-                treatments.append(treatment)
-            except Exception as e:
-                logger.warning(f"Failed to parse treatment {item.get('uid')}: {e}")
-                logger.debug(f"Treatment item data: {item}")
+        processed_items = preprocess_items(
+            treatment_items, self._preprocess_treatment_item, "treatment"
+        )
+        treatments = validate_items(Treatment, processed_items, "treatment")
 
         # Sort by treatment date (newest first)
-        treatments.sort(key=lambda t: t.date, reverse=True)
+        treatments.sort(key=_SORT_KEYS["treatment"], reverse=True)
 
         return {treatment.uid: treatment for treatment in treatments}
 
@@ -607,20 +664,13 @@ class PatientDataParser:
         self, problem_items: list[dict[str, Any]]
     ) -> dict[str, Diagnosis]:
         """Parse diagnoses from problem items"""
-        diagnoses: list[Diagnosis] = []
-
-        for item in problem_items:
-            try:
-                # Preprocess the diagnosis data
-                processed_item = self._preprocess_diagnosis_item(item)
-                diagnosis = Diagnosis(**processed_item)
-                diagnoses.append(diagnosis)
-            except Exception as e:
-                logger.warning(f"Failed to parse diagnosis {item.get('uid')}: {e}")
-                logger.debug(f"Diagnosis item data: {item}")
+        processed_items = preprocess_items(
+            problem_items, self._preprocess_diagnosis_item, "diagnosis"
+        )
+        diagnoses = validate_items(Diagnosis, processed_items, "diagnosis")
 
         # Sort by diagnosis date (newest first)
-        diagnoses.sort(key=lambda d: d.diagnosis_date or datetime.min, reverse=True)
+        diagnoses.sort(key=_SORT_KEYS["diagnosis"], reverse=True)
 
         return {diagnosis.uid: diagnosis for diagnosis in diagnoses}
 
@@ -704,29 +754,18 @@ class PatientDataParser:
 
     def _parse_orders(self, order_items: list[dict[str, Any]]) -> dict[str, Order]:
         """Parse orders from order items"""
-        try:
-            parsed = {order["uid"]: Order(**order) for order in order_items}
-            return parsed
-        except Exception as e:
-            logger.warning(f"Failed to parse orders: {e}")
-            return {}
+        orders = validate_items(Order, order_items, "order")
+        return {order.uid: order for order in orders}
 
     def _parse_documents(
         self, document_items: list[dict[str, Any]]
     ) -> dict[str, Document]:
         """Parse documents from document items"""
-        try:
-            # Preprocess each document item
-            processed_items = []
-            for item in document_items:
-                processed = self._preprocess_document_item(item)
-                processed_items.append(processed)
-
-            parsed = {doc["uid"]: Document(**doc) for doc in processed_items}
-            return parsed
-        except Exception as e:
-            logger.warning(f"Failed to parse documents: {e}")
-            return {}
+        processed_items = preprocess_items(
+            document_items, self._preprocess_document_item, "document"
+        )
+        documents = validate_items(Document, processed_items, "document")
+        return {document.uid: document for document in documents}
 
     def _preprocess_document_item(self, doc_data: dict[str, Any]) -> dict[str, Any]:
         """Preprocess document item before creating Document model"""
@@ -787,27 +826,13 @@ class PatientDataParser:
 
     def _parse_cpt_codes(self, cpt_items: list[dict[str, Any]]) -> dict[str, CPTCode]:
         """Parse CPT codes from cpt items"""
-        cpt_codes = []
-
-        for item in cpt_items:
-            try:
-                # Preprocess the CPT code data
-                processed_item = self._preprocess_cpt_code_item(item)
-
-                # Skip malformed items that return None
-                if processed_item is None:
-                    continue
-
-                cpt_code = CPTCode(**processed_item)
-                cpt_codes.append(cpt_code)
-            except Exception as e:
-                logger.warning(f"Failed to parse CPT code {item.get('uid')}: {e}")
-                logger.debug(f"CPT code item data: {item}")
+        processed_items = preprocess_items(
+            cpt_items, self._preprocess_cpt_code_item, "CPT code"
+        )
+        cpt_codes = validate_items(CPTCode, processed_items, "CPT code")
 
         # Sort by procedure date (newest first)
-        cpt_codes.sort(
-            key=lambda c: c.entered or datetime.min.replace(tzinfo=UTC), reverse=True
-        )
+        cpt_codes.sort(key=_SORT_KEYS["cpt"], reverse=True)
         return {cpt_code.uid: cpt_code for cpt_code in cpt_codes}
 
     def _preprocess_cpt_code_item(self, item: dict[str, Any]) -> dict[str, Any] | None:
@@ -841,24 +866,14 @@ class PatientDataParser:
         self, allergy_items: list[dict[str, Any]]
     ) -> dict[str, Allergy]:
         """Parse allergy items from VPR JSON"""
-        allergies = []
-
-        for item in allergy_items:
-            try:
-                processed_item = self._preprocess_allergy_item(item)
-                if not processed_item:
-                    continue
-
-                allergy = Allergy(**processed_item)
-                allergies.append(allergy)
-            except Exception as e:
-                logger.warning(f"Failed to parse allergy {item.get('uid')}: {e}")
-                logger.debug(f"Allergy item data: {item}")
+        processed_items = preprocess_items(
+            allergy_items, self._preprocess_allergy_item, "allergy"
+        )
+        parse_datetime_columns(processed_items, ["entered", "verified"])
+        allergies = validate_items(Allergy, processed_items, "allergy")
 
         # Sort by entered date (newest first)
-        allergies.sort(
-            key=lambda a: a.entered or datetime.min.replace(tzinfo=UTC), reverse=True
-        )
+        allergies.sort(key=_SORT_KEYS["allergy"], reverse=True)
 
         return {allergy.uid: allergy for allergy in allergies}
 
@@ -901,13 +916,6 @@ class PatientDataParser:
         else:
             processed["reactions"] = []
 
-        # Parse datetime fields
-        from .datetime_parser import parse_datetime
-
-        for field in ["entered", "verified"]:
-            if field in processed and processed[field]:
-                processed[field] = parse_datetime(processed[field])
-
         # Ensure facility code and name are present
         if "facilityCode" not in processed:
             processed["facilityCode"] = self.station
@@ -919,24 +927,12 @@ class PatientDataParser:
 
     def _parse_povs(self, pov_items: list[dict[str, Any]]) -> dict[str, PurposeOfVisit]:
         """Parse POV (Purpose of Visit) items from VPR data"""
-        povs = []
-
-        for item in pov_items:
-            try:
-                processed_item = self._preprocess_pov_item(item)
-                if processed_item is None:
-                    continue
-
-                pov = PurposeOfVisit(**processed_item)
-                povs.append(pov)
-            except Exception as e:
-                logger.warning(f"Failed to parse POV {item.get('uid')}: {e}")
-                logger.debug(f"POV item data: {item}")
+        processed_items = preprocess_items(pov_items, self._preprocess_pov_item, "POV")
+        parse_datetime_columns(processed_items, ["entered"])
+        povs = validate_items(PurposeOfVisit, processed_items, "POV")
 
         # Sort by entered date (newest first)
-        povs.sort(
-            key=lambda p: p.entered or datetime.min.replace(tzinfo=UTC), reverse=True
-        )
+        povs.sort(key=_SORT_KEYS["pov"], reverse=True)
 
         return {pov.uid: pov for pov in povs}
 
@@ -952,13 +948,6 @@ class PatientDataParser:
             logger.warning("POV item missing UID")
             return None
 
-        # Parse datetime fields
-        from .datetime_parser import parse_datetime
-
-        for field in ["entered"]:
-            if field in processed and processed[field]:
-                processed[field] = parse_datetime(processed[field])
-
         # Ensure facility code and name are present
         if "facilityCode" not in processed:
             processed["facilityCode"] = self.station
@@ -987,24 +976,14 @@ class PatientDataParser:
         self, problem_items: list[dict[str, Any]]
     ) -> dict[str, Problem]:
         """Parse Problem items from VPR data"""
-        problems = []
-
-        for item in problem_items:
-            try:
-                processed_item = self._preprocess_problem_item(item)
-                if processed_item is None:
-                    continue
-
-                problem = Problem(**processed_item)
-                problems.append(problem)
-            except Exception as e:
-                logger.warning(f"Failed to parse problem {item.get('uid')}: {e}")
-                logger.debug(f"Problem item data: {item}")
+        processed_items = preprocess_items(
+            problem_items, self._preprocess_problem_item, "problem"
+        )
+        parse_datetime_columns(processed_items, ["entered", "onset", "updated"])
+        problems = validate_items(Problem, processed_items, "problem")
 
         # Sort by onset date (newest first)
-        problems.sort(
-            key=lambda p: p.entered or datetime.min.replace(tzinfo=UTC), reverse=True
-        )
+        problems.sort(key=_SORT_KEYS["problem"], reverse=True)
 
         return {problem.uid: problem for problem in problems}
 
@@ -1020,13 +999,6 @@ class PatientDataParser:
             logger.warning("Problem item missing UID")
             return None
 
-        # Parse datetime fields
-        from .datetime_parser import parse_datetime
-
-        for field in ["entered", "onset", "updated"]:
-            if field in processed and processed[field]:
-                processed[field] = parse_datetime(processed[field])
-
         # Parse comments if present
         if "comments" in processed and isinstance(processed["comments"], list):
             from ....models.patient.problem import ProblemComment
@@ -1080,24 +1052,14 @@ class PatientDataParser:
         self, appointment_items: list[dict[str, Any]]
     ) -> dict[str, Appointment]:
         """Parse appointment items from VPR data"""
-        appointments = []
-
-        for item in appointment_items:
-            try:
-                processed_item = self._preprocess_appointment_item(item)
-                if processed_item is None:
-                    continue
-
-                appointments.append(Appointment(**processed_item))
-            except Exception as e:
-                logger.warning(f"Failed to parse appointment: {e}")
-                logger.debug(f"Appointment item data: {item}")
+        processed_items = preprocess_items(
+            appointment_items, self._preprocess_appointment_item, "appointment"
+        )
+        parse_datetime_columns(processed_items, ["dateTime", "checkOut"])
+        appointments = validate_items(Appointment, processed_items, "appointment")
 
         # Sort by appointment date (newest first)
-        appointments.sort(
-            key=lambda p: p.appointment_date or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
-        )
+        appointments.sort(key=_SORT_KEYS["appointment"], reverse=True)
 
         return {appointment.uid: appointment for appointment in appointments}
 
@@ -1115,11 +1077,6 @@ class PatientDataParser:
             logger.warning("Appointment item missing UID")
             return None
 
-        # Parse datetime fields
-        for field in ["dateTime", "checkOut"]:
-            if field in processed and processed[field]:
-                processed[field] = parse_datetime(processed[field])
-
         # Convert categoryName to AppointmentType enum if present
         if "categoryName" in processed and processed["categoryName"]:
             category_name = processed["categoryName"]
@@ -1182,6 +1139,21 @@ class PatientDataParser:
         return processed
 
 
+def _parse_chunk(
+    station: str, icn: str, domain: str, items: list[dict[str, Any]]
+) -> list[Any]:
+    """
+    Parse a chunk of one domain's items in a parse worker process.
+
+    Repeated values are shared before the models are pickled back to the
+    parent, which makes them smaller and quicker to unpickle.
+    """
+    parser = PatientDataParser(station, icn)
+    models = list(getattr(parser, _CHUNKABLE_DOMAINS[domain])(items).values())
+    ValueTable().share(models)
+    return models
+
+
 def parse_vpr_patient_data(
     vpr_json: dict[str, Any], station: str, icn: str
 ) -> PatientDataCollection:
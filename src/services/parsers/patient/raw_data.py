@@ -0,0 +1,130 @@
+"""Retention of the raw VPR payload behind a parsed patient collection"""
+
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ....config import (
+    RAW_DATA_RETENTION,
+    RAW_DATA_SPILL_DIR,
+    RAW_DATA_SPILL_MAX_FILES,
+)
+from ....utils import get_logger
+
+logger = get_logger()
+
+# Payloads are written once and read rarely, so favour speed over ratio
+SPILL_COMPRESSLEVEL = 1
+
+
+class RawDataSpill:
+    """
+    Compressed on-disk ring buffer of raw VPR payloads
+
+    Each payload is written as gzipped JSON by a single background thread (the
+    parser runs on the event loop), and the oldest files are removed once the
+    directory holds more than max_files. File names start with a nanosecond
+    timestamp, so name order is write order.
+
+    The files hold patient data; point the directory somewhere only the
+    server's operators can read.
+    """
+
+    def __init__(self, directory: str | Path, max_files: int):
+        """
+        Args:
+            directory: Directory for the spill files, created on first write
+            max_files: Number of most recent payloads kept
+        """
+        self.directory = Path(directory)
+        self.max_files = max(1, max_files)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="raw-vpr-spill"
+        )
+        self._lock = threading.Lock()
+        self._last: Future[None] | None = None
+
+    def spill(self, station: str, icn: str, raw_data: dict[str, Any]) -> Path:
+        """
+        Queue a payload for writing
+
+        Args:
+            station: Station the payload was read from
+            icn: Patient ICN
+            raw_data: VPR payload, not modified afterwards
+
+        Returns:
+            Path the payload is written to
+        """
+        path = self.directory / f"{time.time_ns()}-{station}-{icn}.json.gz"
+        with self._lock:
+            self._last = self._executor.submit(self._write, path, raw_data)
+        return path
+
+    def flush(self) -> None:
+        """Wait for queued payloads to be written"""
+        with self._lock:
+            last = self._last
+        if last is not None:
+            last.result()
+
+    @staticmethod
+    def load(path: str | Path) -> dict[str, Any]:
+        """Read back a spilled payload"""
+        with gzip.open(path, "rt", encoding="utf-8") as spilled:
+            return json.load(spilled)
+
+    def _write(self, path: Path, raw_data: dict[str, Any]) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            body = json.dumps(raw_data, separators=(",", ":")).encode("utf-8")
+            path.write_bytes(gzip.compress(body, compresslevel=SPILL_COMPRESSLEVEL))
+            self._trim()
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to spill raw VPR payload to {path}: {e}")
+
+    def _trim(self) -> None:
+        spilled = sorted(self.directory.glob("*.json.gz"))
+        for path in spilled[: -self.max_files]:
+            path.unlink(missing_ok=True)
+
+
+_spill_instance: RawDataSpill | None = None
+
+
+def get_raw_data_spill() -> RawDataSpill:
+    """Get the process-wide spill ring for raw VPR payloads"""
+    global _spill_instance
+    if _spill_instance is None:
+        _spill_instance = RawDataSpill(RAW_DATA_SPILL_DIR, RAW_DATA_SPILL_MAX_FILES)
+    return _spill_instance
+
+
+def retain_raw_data(
+    station: str, icn: str, raw_data: dict[str, Any]
+) -> tuple[dict[str, Any] | None, Path | None]:
+    """
+    Apply RAW_DATA_RETENTION to a parsed payload
+
+    Args:
+        station: Station the payload was read from
+        icn: Patient ICN
+        raw_data: VPR payload
+
+    Returns:
+        Tuple of the payload to hold on the collection (only for "keep") and
+        the spill file path (only for "spill")
+    """
+    if RAW_DATA_RETENTION == "keep":
+        return raw_data, None
+    if RAW_DATA_RETENTION == "spill":
+        return None, get_raw_data_spill().spill(station, icn, raw_data)
+    if RAW_DATA_RETENTION != "off":
+        logger.warning(
+            f"Unknown RAW_DATA_RETENTION {RAW_DATA_RETENTION!r}, dropping raw data"
+        )
+    return None, None
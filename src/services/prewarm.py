@@ -0,0 +1,408 @@
+"""Patient cache prewarming from clinic appointment schedules"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any, NamedTuple
+
+from cachetools import LRUCache, TTLCache
+
+from ..config import (
+    PATIENT_CACHE_TTL_MINUTES,
+    PREWARM_CLINICS,
+    PREWARM_DUZ,
+    PREWARM_ENABLED,
+    PREWARM_INTERVAL_MINUTES,
+    PREWARM_LEAD_MINUTES,
+    PREWARM_LOOKAHEAD_HOURS,
+    PREWARM_MAX_PATIENTS,
+    PREWARM_RATE_PER_SECOND,
+    get_vista_config,
+)
+from ..vista.base import BaseVistaClient, VistaAPIError
+from ..vista.client import VistaAPIClient
+from .data import get_patient_data, get_patient_data_version, load_patient_data_by_dfn
+from .parsers.patient.datetime_parser import parse_datetimes
+from .rpc import build_multi_param, execute_rpc
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_RPC = "SDES GET APPTS BY CLIN IEN 2"
+
+# Appointments that will not bring the patient in
+SKIPPED_STATUSES = frozenset({"CANCELLED", "CANCELED", "NO-SHOW", "NO SHOW"})
+
+OUTCOME_WARMED = "warmed"
+OUTCOME_CACHED = "cached"
+OUTCOME_FAILED = "failed"
+OUTCOME_OVER_BUDGET = "over_budget"
+
+
+class ClinicAppointment(NamedTuple):
+    """An upcoming appointment of a patient in a clinic"""
+
+    station: str
+    clinic_ien: str
+    patient_dfn: str
+    patient_icn: str | None
+    starts_at: datetime
+
+
+def parse_clinic_list(value: str) -> list[tuple[str, str]]:
+    """(station, clinic IEN) pairs from a "500:195,500:196" list"""
+    clinics = []
+    for entry in (part.strip() for part in value.split(",")):
+        station, _, clinic_ien = entry.partition(":")
+        if station and clinic_ien:
+            clinics.append((station, clinic_ien))
+        elif entry:
+            logger.warning(f"Ignoring prewarm clinic {entry!r}: expected station:ien")
+    return clinics
+
+
+def parse_clinic_appointments(
+    result: Any, station: str, clinic_ien: str
+) -> list[ClinicAppointment]:
+    """Appointments in an SDES GET APPTS BY CLIN IEN 2 result"""
+    if not isinstance(result, dict):
+        return []
+    items = [
+        item
+        for item in result.get("appointments") or []
+        if isinstance(item, dict)
+        and str(item.get("status", "")).upper() not in SKIPPED_STATUSES
+    ]
+    start_times = parse_datetimes(item.get("date") for item in items)
+    appointments = []
+    for item, starts_at in zip(items, start_times, strict=True):
+        patient_dfn = str(item.get("patientIEN") or "")
+        if not patient_dfn or starts_at is None:
+            continue
+        appointments.append(
+            ClinicAppointment(
+                station=station,
+                clinic_ien=clinic_ien,
+                patient_dfn=patient_dfn,
+                patient_icn=item.get("patientICN") or None,
+                starts_at=starts_at,
+            )
+        )
+    return appointments
+
+
+class StationRateLimiter:
+    """Spaces calls to each station at least 1 / rate_per_second apart"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, station: str) -> None:
+        """Wait for the station's next free slot"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(station, now))
+        self._next_slot[station] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class PrewarmScheduler:
+    """
+    Loads patients with upcoming clinic appointments into the patient cache.
+
+    Each cycle reads the configured clinics' schedules and warms every patient
+    appointed within the lookahead window lead minutes before their first
+    appointment (at once if that time has passed), so the first question about
+    the patient finds the data cached. The lead is capped at the patient cache
+    TTL so warmed data is still cached when the appointment starts. Loads are
+    spaced per station by the rate limit, and at most max_patients warmed
+    patients are kept in the cache at a time (one patient cache TTL); the
+    rest wait for a later cycle.
+    """
+
+    def __init__(
+        self,
+        vista_client: BaseVistaClient,
+        clinics: list[tuple[str, str]],
+        caller_duz: str = PREWARM_DUZ,
+        lookahead_hours: float = PREWARM_LOOKAHEAD_HOURS,
+        lead_minutes: float = PREWARM_LEAD_MINUTES,
+        interval_minutes: float = PREWARM_INTERVAL_MINUTES,
+        rate_per_second: float = PREWARM_RATE_PER_SECOND,
+        max_patients: int = PREWARM_MAX_PATIENTS,
+    ):
+        """
+        Initialize prewarm scheduler
+
+        Args:
+            vista_client: Vista client for schedule and patient data RPCs
+            clinics: (station, clinic IEN) pairs to read schedules of
+            caller_duz: DUZ the data is fetched and cached for
+            lookahead_hours: How far ahead appointments are considered
+            lead_minutes: How long before an appointment its patient is loaded
+            interval_minutes: How often schedules are re-read
+            rate_per_second: Patient loads per second per station
+            max_patients: Warmed patients kept in the cache at a time
+        """
+        self.vista_client = vista_client
+        self.clinics = clinics
+        self.caller_duz = caller_duz
+        self.lookahead = timedelta(hours=lookahead_hours)
+        self.lead = timedelta(minutes=min(lead_minutes, PATIENT_CACHE_TTL_MINUTES))
+        self.interval_seconds = interval_minutes * 60
+        self.max_patients = max_patients
+        self._limiter = StationRateLimiter(rate_per_second)
+        # Patients warmed within the patient cache TTL, i.e. still cached
+        self._warmed: TTLCache[tuple[str, str], bool] = TTLCache(
+            maxsize=max(max_patients, 1), ttl=PATIENT_CACHE_TTL_MINUTES * 60
+        )
+        # ICNs learned from loading patients by DFN, so later cycles can
+        # check the cache before fetching
+        self._icns: LRUCache[tuple[str, str], str] = LRUCache(
+            maxsize=max(max_patients * 10, 1000)
+        )
+        self._task: asyncio.Task[None] | None = None
+        self._counts = {
+            OUTCOME_WARMED: 0,
+            OUTCOME_CACHED: 0,
+            OUTCOME_FAILED: 0,
+            OUTCOME_OVER_BUDGET: 0,
+            "schedule_errors": 0,
+        }
+        self._cycles = 0
+        self._pending = 0
+        self._last_cycle: dict[str, Any] = {}
+
+    async def read_schedules(self, now: datetime) -> list[ClinicAppointment]:
+        """Appointments of all configured clinics within the lookahead window"""
+        start = now.strftime("%Y-%m-%dT%H:%M:%S")
+        end = (now + self.lookahead).strftime("%Y-%m-%dT%H:%M:%S")
+
+        async def _read(station: str, clinic_ien: str) -> list[ClinicAppointment]:
+            rpc_result = await execute_rpc(
+                vista_client=self.vista_client,
+                rpc_name=SCHEDULE_RPC,
+                parameters=build_multi_param(clinic_ien, start, end),
+                parser=lambda result: parse_clinic_appointments(
+                    result, station, clinic_ien
+                ),
+                station=station,
+                caller_duz=self.caller_duz,
+                json_result=True,
+                error_response_builder=lambda error, metadata: {
+                    "error": error,
+                    "metadata": metadata,
+                },
+            )
+            if "error" in rpc_result:
+                logger.warning(
+                    f"Prewarm schedule read failed for clinic {clinic_ien} "
+                    f"at station {station}: {rpc_result['error']}"
+                )
+                self._counts["schedule_errors"] += 1
+                return []
+            return rpc_result["parsed_data"]
+
+        schedules = await asyncio.gather(
+            *(_read(station, clinic_ien) for station, clinic_ien in self.clinics)
+        )
+        return [appointment for schedule in schedules for appointment in schedule]
+
+    def plan(
+        self, appointments: list[ClinicAppointment], now: datetime
+    ) -> list[ClinicAppointment]:
+        """Each patient's first appointment in the window, soonest first"""
+        first: dict[tuple[str, str], ClinicAppointment] = {}
+        for appointment in appointments:
+            if not now <= appointment.starts_at <= now + self.lookahead:
+                continue
+            key = (appointment.station, appointment.patient_dfn)
+            if key not in first or appointment.starts_at < first[key].starts_at:
+                first[key] = appointment
+        return sorted(first.values(), key=lambda appointment: appointment.starts_at)
+
+    async def warm(self, appointment: ClinicAppointment) -> str:
+        """Load one patient into the cache unless it is already there"""
+        key = (appointment.station, appointment.patient_dfn)
+        patient_icn = appointment.patient_icn or self._icns.get(key)
+        if patient_icn and (
+            await get_patient_data_version(
+                appointment.station, patient_icn, self.caller_duz
+            )
+            is not None
+        ):
+            return OUTCOME_CACHED
+
+        self._warmed.expire()
+        if len(self._warmed) >= self.max_patients:
+            return OUTCOME_OVER_BUDGET
+        # Reserve the budget slot before waiting on the rate limit
+        self._warmed[key] = True
+
+        await self._limiter.acquire(appointment.station)
+        try:
+            if patient_icn:
+                await get_patient_data(
+                    self.vista_client, appointment.station, patient_icn, self.caller_duz
+                )
+            else:
+                patient_data = await load_patient_data_by_dfn(
+                    self.vista_client,
+                    appointment.station,
+                    appointment.patient_dfn,
+                    self.caller_duz,
+                )
+                self._icns[key] = patient_data.patient_icn
+        except VistaAPIError as e:
+            self._warmed.pop(key, None)
+            logger.warning(
+                f"Prewarm failed for DFN {appointment.patient_dfn} "
+                f"at station {appointment.station}: {e}"
+            )
+            return OUTCOME_FAILED
+        return OUTCOME_WARMED
+
+    async def _warm_station(
+        self, appointments: list[ClinicAppointment], cycle_started: datetime
+    ) -> None:
+        """Warm one station's patients in appointment order, each at its lead"""
+        started = time.monotonic()
+        for appointment in appointments:
+            due_at = appointment.starts_at - self.lead - cycle_started
+            wait = due_at.total_seconds() - (time.monotonic() - started)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            outcome = await self.warm(appointment)
+            self._counts[outcome] += 1
+            self._pending -= 1
+
+    async def run_cycle(self) -> dict[str, Any]:
+        """
+        Read the schedules once and warm every patient due within the cycle
+
+        Returns:
+            Summary of the cycle (also reported by get_stats)
+        """
+        started = time.monotonic()
+        now = datetime.now(UTC)
+        counts_before = dict(self._counts)
+
+        planned = self.plan(await self.read_schedules(now), now)
+        cycle_end = now + timedelta(seconds=self.interval_seconds)
+        by_station: dict[str, list[ClinicAppointment]] = {}
+        for appointment in planned:
+            if appointment.starts_at - self.lead <= cycle_end:
+                by_station.setdefault(appointment.station, []).append(appointment)
+        self._pending = sum(len(due) for due in by_station.values())
+
+        await asyncio.gather(
+            *(self._warm_station(due, now) for due in by_station.values())
+        )
+
+        self._cycles += 1
+        self._last_cycle = {
+            "started_at": now.isoformat(),
+            "duration_ms": int((time.monotonic() - started) * 1000),
+            "appointments": len(planned),
+            **{
+                outcome: count - counts_before[outcome]
+                for outcome, count in self._counts.items()
+            },
+        }
+        return self._last_cycle
+
+    async def run(self) -> None:
+        """Run cycles every interval until cancelled"""
+        while True:
+            started = time.monotonic()
+            try:
+                await self.run_cycle()
+            except Exception:
+                logger.exception("Prewarm cycle failed")
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(self.interval_seconds - elapsed, 0.0))
+
+    def start(self) -> None:
+        """Start running cycles in the background of the current event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background cycles"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def lifespan(
+        self, inner: Callable[[Any], AbstractAsyncContextManager[Any]]
+    ) -> Callable[[Any], AbstractAsyncContextManager[Any]]:
+        """Wrap an ASGI app lifespan to run the scheduler while the app runs"""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any) -> AsyncIterator[Any]:
+            async with inner(app) as state:
+                self.start()
+                try:
+                    yield state
+                finally:
+                    await self.stop()
+
+        return _lifespan
+
+    def get_stats(self) -> dict[str, Any]:
+        """Progress of the scheduler"""
+        self._warmed.expire()
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "clinics": len(self.clinics),
+            "cycles": self._cycles,
+            "pending": self._pending,
+            "budget_used": len(self._warmed),
+            "budget_max": self.max_patients,
+            **self._counts,
+            "last_cycle": self._last_cycle,
+        }
+
+
+# Scheduler of this process, if prewarming is configured
+_scheduler: PrewarmScheduler | None = None
+
+
+def create_prewarm_scheduler(
+    vista_client: BaseVistaClient | None = None,
+) -> PrewarmScheduler | None:
+    """
+    Set up this process's scheduler from the PREWARM_* settings
+
+    Args:
+        vista_client: Client to use (default: an API key client built from
+            the Vista configuration, as prewarming runs outside any request)
+
+    Returns:
+        The scheduler, or None if prewarming is disabled or no clinics are set
+    """
+    global _scheduler
+
+    clinics = parse_clinic_list(PREWARM_CLINICS)
+    if not PREWARM_ENABLED or not clinics:
+        return None
+    if vista_client is None:
+        config = get_vista_config()
+        vista_client = VistaAPIClient(
+            base_url=config["base_url"],
+            api_key=config["api_key"],
+            auth_url=config["auth_url"],
+        )
+    _scheduler = PrewarmScheduler(vista_client, clinics)
+    return _scheduler
+
+
+def get_prewarm_scheduler() -> PrewarmScheduler | None:
+    """This process's scheduler, if one was created"""
+    return _scheduler
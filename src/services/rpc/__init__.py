@@ -1,6 +1,6 @@
 """RPC execution services for VistA API calls."""
 
-from .executor import execute_rpc
+from .executor import execute_rpc, execute_rpcs
 from .parameter_builder import (
     build_empty_params,
     build_icn_only_named_array_param,
@@ -12,6 +12,7 @@ from .response_builder import build_error_response, build_success_response
 
 __all__ = [
     "execute_rpc",
+    "execute_rpcs",
     "build_single_string_param",
     "build_multi_param",
     "build_named_array_param",
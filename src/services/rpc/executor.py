@@ -8,6 +8,7 @@ from typing import Any, TypeVar
 
 from ...utils import build_metadata, log_rpc_call, translate_vista_error
 from ...vista.base import BaseVistaClient, VistaAPIError
+from ..deadline import DeadlineExceededError, run_with_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,8 @@ async def execute_rpc(
     error_response_builder: Callable[[str, dict[str, Any]], dict[str, Any]],
     context: str | None = None,
     json_result: bool = False,
+    bypass_negative_cache: bool = False,
+    use_negative_cache: bool = True,
 ) -> dict[str, Any]:
     """Execute an RPC call with standardized error handling and logging.
 
@@ -37,32 +40,173 @@ async def execute_rpc(
         error_response_builder: Function to build error response
         context: Optional RPC context
         json_result: Whether to expect JSON result
+        bypass_negative_cache: Re-send the RPC even if it recently failed
+        use_negative_cache: Let the client negative-cache failures (off when
+            the caller keeps its own negative cache)
 
     Returns:
         Parsed and formatted response
     """
     start_time = time.time()
 
+    rpc_kwargs = _build_rpc_kwargs(
+        station=station,
+        caller_duz=caller_duz,
+        rpc_name=rpc_name,
+        parameters=parameters,
+        context=context,
+        json_result=json_result,
+        bypass_negative_cache=bypass_negative_cache,
+        use_negative_cache=use_negative_cache,
+    )
+
+    logger.debug(
+        f"RPC Request - Name: {rpc_name}, Station: {station}, DUZ: {caller_duz}"
+    )
+    logger.debug(f"RPC kwargs: {json.dumps(rpc_kwargs, default=str, indent=2)}")
+
+    result: Any
     try:
-        # Build RPC kwargs
-        rpc_kwargs: dict[str, Any] = {
-            "station": station,
-            "caller_duz": caller_duz,
-            "rpc_name": rpc_name,
-            "parameters": parameters,
-        }
+        result = await run_with_deadline(
+            f"rpc:{rpc_name}", vista_client.invoke_rpc(**rpc_kwargs)
+        )
+    except Exception as e:
+        result = e
 
-        if context:
-            rpc_kwargs["context"] = context
-        if json_result:
-            rpc_kwargs["json_result"] = json_result
+    return _build_rpc_response(
+        result=result,
+        rpc_name=rpc_name,
+        parameters=parameters,
+        parser=parser,
+        station=station,
+        caller_duz=caller_duz,
+        error_response_builder=error_response_builder,
+        context=context,
+        json_result=json_result,
+        start_time=start_time,
+    )
+
+
+async def execute_rpcs(
+    vista_client: BaseVistaClient,
+    requests: list[dict[str, Any]],
+    station: str,
+    caller_duz: str,
+    error_response_builder: Callable[[str, dict[str, Any]], dict[str, Any]],
+    max_concurrency: int | None = None,
+) -> list[dict[str, Any]]:
+    """Execute several independent RPC calls concurrently.
+
+    The calls are sent through the client's invoke_many, so they share one
+    token fetch and one batched cache lookup. A failing call does not affect
+    the others - each gets its own error response.
+
+    Args:
+        vista_client: The Vista API client instance
+        requests: One dict per call with rpc_name, parameters and parser, and
+            optionally context, json_result, bypass_negative_cache and
+            use_negative_cache
+        station: Station ID
+        caller_duz: Caller DUZ
+        error_response_builder: Function to build error response
+        max_concurrency: Maximum calls in flight (default: RPC_BULK_MAX_CONCURRENCY)
 
-        logger.debug(
-            f"RPC Request - Name: {rpc_name}, Station: {station}, DUZ: {caller_duz}"
+    Returns:
+        Parsed and formatted response for each request, in order
+    """
+    start_time = time.time()
+
+    calls = [
+        _build_rpc_kwargs(
+            station=station,
+            caller_duz=caller_duz,
+            rpc_name=request["rpc_name"],
+            parameters=request["parameters"],
+            context=request.get("context"),
+            json_result=request.get("json_result", False),
+            bypass_negative_cache=request.get("bypass_negative_cache", False),
+            use_negative_cache=request.get("use_negative_cache", True),
         )
-        logger.debug(f"RPC kwargs: {json.dumps(rpc_kwargs, default=str, indent=2)}")
+        for request in requests
+    ]
 
-        result = await vista_client.invoke_rpc(**rpc_kwargs)
+    rpc_names = ",".join(request["rpc_name"] for request in requests)
+    logger.debug(
+        f"RPC Batch Request - Names: {rpc_names}, Station: {station}, DUZ: {caller_duz}"
+    )
+
+    results: list[Any]
+    try:
+        results = await run_with_deadline(
+            f"rpc_batch:{rpc_names}",
+            vista_client.invoke_many(calls, max_concurrency=max_concurrency),
+        )
+    except Exception as e:
+        results = [e] * len(requests)
+
+    return [
+        _build_rpc_response(
+            result=result,
+            rpc_name=request["rpc_name"],
+            parameters=request["parameters"],
+            parser=request["parser"],
+            station=station,
+            caller_duz=caller_duz,
+            error_response_builder=error_response_builder,
+            context=request.get("context"),
+            json_result=request.get("json_result", False),
+            start_time=start_time,
+        )
+        for request, result in zip(requests, results, strict=True)
+    ]
+
+
+def _build_rpc_kwargs(
+    station: str,
+    caller_duz: str,
+    rpc_name: str,
+    parameters: list[dict[str, Any]],
+    context: str | None,
+    json_result: bool,
+    bypass_negative_cache: bool,
+    use_negative_cache: bool = True,
+) -> dict[str, Any]:
+    """Build invoke_rpc keyword arguments, omitting defaults"""
+    rpc_kwargs: dict[str, Any] = {
+        "station": station,
+        "caller_duz": caller_duz,
+        "rpc_name": rpc_name,
+        "parameters": parameters,
+    }
+
+    if context:
+        rpc_kwargs["context"] = context
+    if json_result:
+        rpc_kwargs["json_result"] = json_result
+    if bypass_negative_cache:
+        rpc_kwargs["bypass_negative_cache"] = True
+    if not use_negative_cache:
+        rpc_kwargs["use_negative_cache"] = False
+
+    return rpc_kwargs
+
+
+def _build_rpc_response(
+    result: Any,
+    rpc_name: str,
+    parameters: list[dict[str, Any]],
+    parser: Callable[[Any], Any],
+    station: str,
+    caller_duz: str,
+    error_response_builder: Callable[[str, dict[str, Any]], dict[str, Any]],
+    context: str | None,
+    json_result: bool,
+    start_time: float,
+) -> dict[str, Any]:
+    """Parse an RPC result, or build the error response for a raised exception"""
+    try:
+        if isinstance(result, BaseException):
+            raise result
 
         try:
             result_json = json.dumps(result, default=str, indent=2)
@@ -144,6 +288,7 @@ async def execute_rpc(
         error_metadata = build_metadata(station=station, rpc_name=rpc_name)
         error_metadata["rpc"] = rpc_details
         error_metadata["duz"] = caller_duz
+        error_metadata["vista_error"] = e.to_dict()
 
         # Build error response
         return error_response_builder(
@@ -151,6 +296,27 @@ async def execute_rpc(
             error_metadata,
         )
 
+    except DeadlineExceededError as e:
+        logger.warning(
+            f"DEADLINE_EXCEEDED: {json.dumps({'stage': e.stage, 'budget_ms': e.budget_ms, 'rpc_name': rpc_name, 'station': station})}"
+        )
+
+        log_rpc_call(
+            rpc_name=rpc_name,
+            station=station,
+            duz=caller_duz,
+            success=False,
+            error=str(e),
+        )
+
+        error_metadata = build_metadata(station=station, rpc_name=rpc_name)
+        error_metadata["duz"] = caller_duz
+
+        return error_response_builder(
+            f"Request timed out: {str(e)}",
+            error_metadata,
+        )
+
     except Exception as e:
         logger.error(
             f"UNEXPECTED_ERROR: {json.dumps({
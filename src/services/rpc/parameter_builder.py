@@ -1,9 +1,111 @@
 """Helper functions for building RPC parameters."""
 
+import hashlib
+import json
 from typing import Any
 
+# Bump when the canonical parameter encoding changes so old cache entries
+# are never read back under a different meaning
+RPC_CACHE_KEY_VERSION = "v2"
 
-def build_single_string_param(value: str) -> list[dict[str, Any]]:
+# Fixed hash key, so fragments are stable across processes sharing a cache
+_FRAGMENT_HASH_KEY = f"vista-rpc-cache:{RPC_CACHE_KEY_VERSION}".encode()
+
+# Separators for the canonical encoding; values containing them fall back to JSON
+_PARAM_SEPARATOR = "\x1e"
+_FIELD_SEPARATOR = "\x1f"
+
+
+class RpcParameters(list[dict[str, Any]]):
+    """RPC parameter list carrying a precomputed cache key fragment.
+
+    Behaves exactly like the plain parameter list it wraps, so it can be sent
+    as the request payload and compared against lists in tests. The fragment
+    is computed once at construction, so the list must not be mutated after.
+    """
+
+    def __init__(self, params: list[dict[str, Any]]):
+        super().__init__(params)
+        self.cache_fragment = compute_cache_fragment(params)
+
+
+def _canonical_value(value: Any) -> str | None:
+    """Encode a string value, or None if it would make the encoding ambiguous"""
+    if not isinstance(value, str):
+        return None
+    if _PARAM_SEPARATOR in value or _FIELD_SEPARATOR in value or "=" in value:
+        return None
+    return value
+
+
+def _canonical_param(param: dict[str, Any]) -> str:
+    """Encode one parameter; common shapes avoid JSON serialization"""
+    if len(param) == 1:
+        if "string" in param:
+            value = _canonical_value(param["string"])
+            if value is not None:
+                return f"s{value}"
+        elif "namedArray" in param and isinstance(param["namedArray"], dict):
+            fields = []
+            for name in sorted(param["namedArray"]):
+                field_name = _canonical_value(name)
+                field_value = _canonical_value(param["namedArray"][name])
+                if field_name is None or field_value is None:
+                    break
+                fields.append(f"{field_name}={field_value}")
+            else:
+                return "n" + _FIELD_SEPARATOR.join(fields)
+    return "j" + json.dumps(param, sort_keys=True, separators=(",", ":"))
+
+
+def compute_cache_fragment(parameters: list[dict[str, Any]] | None) -> str:
+    """Compute the cache key fragment for a parameter list.
+
+    Args:
+        parameters: RPC parameters
+
+    Returns:
+        16 hex character keyed BLAKE2b digest of the canonical encoding
+    """
+    canonical = _PARAM_SEPARATOR.join(_canonical_param(p) for p in parameters or [])
+    return hashlib.blake2b(
+        canonical.encode(), digest_size=8, key=_FRAGMENT_HASH_KEY
+    ).hexdigest()
+
+
+_EMPTY_FRAGMENT = compute_cache_fragment([])
+
+
+def build_rpc_cache_key(
+    station: str,
+    caller_duz: str,
+    rpc_name: str,
+    parameters: list[dict[str, Any]] | None,
+) -> str:
+    """Build the response cache key for an RPC call.
+
+    Parameters built by this module reuse their precomputed fragment; plain
+    lists are encoded on the fly and produce the same key.
+
+    Args:
+        station: Station ID
+        caller_duz: Caller DUZ
+        rpc_name: Name of the RPC
+        parameters: RPC parameters
+
+    Returns:
+        Versioned cache key
+    """
+    if isinstance(parameters, RpcParameters):
+        fragment = parameters.cache_fragment
+    elif not parameters:
+        fragment = _EMPTY_FRAGMENT
+    else:
+        fragment = compute_cache_fragment(parameters)
+    return f"rpc:{RPC_CACHE_KEY_VERSION}:{station}:{caller_duz}:{rpc_name}:{fragment}"
+
+
+def build_single_string_param(value: str) -> RpcParameters:
     """Build parameters for a single string value.
 
     Args:
@@ -12,10 +114,10 @@ def build_single_string_param(value: str) -> list[dict[str, Any]]:
     Returns:
         List with single string parameter
     """
-    return [{"string": value}]
+    return RpcParameters([{"string": value}])
 
 
-def build_named_array_param(params: dict[str, Any]) -> list[dict[str, Any]]:
+def build_named_array_param(params: dict[str, Any]) -> RpcParameters:
     """Build parameters for a named array.
 
     Args:
@@ -24,10 +126,10 @@ def build_named_array_param(params: dict[str, Any]) -> list[dict[str, Any]]:
     Returns:
         List with named array parameter
     """
-    return [{"namedArray": params}]
+    return RpcParameters([{"namedArray": params}])
 
 
-def build_icn_only_named_array_param(icn: str) -> list[dict[str, Any]]:
+def build_icn_only_named_array_param(icn: str) -> RpcParameters:
     """Build parameters for a named array.
 
     Args:
@@ -36,19 +138,19 @@ def build_icn_only_named_array_param(icn: str) -> list[dict[str, Any]]:
     Returns:
         List with named array parameter
     """
-    return [{"namedArray": {"patientId": f";{icn}"}}]
+    return RpcParameters([{"namedArray": {"patientId": f";{icn}"}}])
 
 
-def build_empty_params() -> list[dict[str, Any]]:
+def build_empty_params() -> RpcParameters:
     """Build empty parameters list.
 
     Returns:
         Empty parameters list
     """
-    return []
+    return RpcParameters([])
 
 
-def build_multi_param(*values: str) -> list[dict[str, Any]]:
+def build_multi_param(*values: str) -> RpcParameters:
     """Build parameters for multiple string values.
 
     Args:
@@ -57,4 +159,4 @@ def build_multi_param(*values: str) -> list[dict[str, Any]]:
     Returns:
         List of string parameters
     """
-    return [{"string": value} for value in values]
+    return RpcParameters([{"string": value} for value in values])
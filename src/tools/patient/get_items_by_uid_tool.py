@@ -6,7 +6,7 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field, SerializeAsAny
 
-from ...models.patient import BasePatientModel, PatientDataCollection
+from ...models.patient import BasePatientModel, Document, PatientDataCollection
 from ...models.responses.metadata import (
     DemographicsMetadata,
     PerformanceMetrics,
@@ -14,8 +14,9 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import ResponseData, ToolResponse
-from ...services.data import get_patient_data
+from ...services.data import get_patient_data, load_document_text
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
@@ -28,6 +29,9 @@ from ...vista.base import BaseVistaClient
 
 logger = get_logger(__name__)
 
+# Maximum UIDs per request, and items returned once prefixes are expanded
+MAX_ITEMS = 100
+
 
 class ItemsByUidResponseData(ResponseData):
     """Payload for get_items_by_uid"""
@@ -51,12 +55,16 @@ def register_get_items_by_uid_tool(mcp: FastMCP, vista_client: BaseVistaClient):
         patient_icn: str,
         uids: Annotated[
             list[str],
-            Field(description="List of UIDs/URNs to fetch", max_length=100),
+            Field(
+                description="List of UIDs/URNs to fetch; end one with * to match a prefix",
+                max_length=MAX_ITEMS,
+            ),
         ],
         station: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> GetItemsByUidResponse:
-        """Return one or more patient items by UID/URN for the requested patient ICN. Maximum of 100 items at a time"""
+        """Return one or more patient items by UID/URN for the requested patient ICN. A UID ending in * returns every item with that prefix (e.g. urn:va:lab:500:*). Maximum of 100 items at a time"""
         start_time = datetime.now(UTC)
         station, caller_duz = resolve_vista_context(
             ctx,
@@ -89,14 +97,13 @@ def register_get_items_by_uid_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Build lookup from the aggregated dictionary
-            all_items = patient_data.all_items
-
-            result: dict[str, BasePatientModel] = {}
-            for uid in uids:
-                item = all_items.get(uid)
-                if item is not None:
-                    result[uid] = item
+            # Look up exact UIDs and prefix patterns in the collection's index
+            result: dict[str, BasePatientModel] = patient_data.uid_index.get_many(
+                uids, limit=MAX_ITEMS
+            )
+            documents = [item for item in result.values() if isinstance(item, Document)]
+            for document in await load_document_text(documents):
+                result[document.uid] = document
 
             # Build typed metadata inline
             end_time = datetime.now(UTC)
@@ -132,7 +139,7 @@ def register_get_items_by_uid_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 data=data,
                 metadata=md,
                 total_item_count=len(result),
-            )
+            ).project(fields)
 
         except Exception as e:
             logger.exception("Unexpected error in get_items_by_uid")
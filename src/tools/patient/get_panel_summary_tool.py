@@ -0,0 +1,162 @@
+"""Get panel summary tool for MCP server"""
+
+from datetime import UTC, datetime
+from typing import Annotated
+
+from fastmcp import Context, FastMCP
+from pydantic import Field
+
+from ...models.patient import PatientDataCollection
+from ...models.responses.metadata import (
+    DemographicsMetadata,
+    PerformanceMetrics,
+    ResponseMetadata,
+    StationMetadata,
+)
+from ...models.responses.projection import item_fields
+from ...models.responses.tool_responses import (
+    PanelPatientSummary,
+    PanelSummaryResponse,
+    PanelSummaryResponseData,
+)
+from ...services.data import get_patient_data_many
+from ...services.validators import validate_icn
+from ...utils import (
+    get_default_duz,
+    get_default_station,
+    get_logger,
+    resolve_vista_context,
+)
+from ...vista.base import BaseVistaClient
+from .get_patient_snapshot_tool import MAX_DOMAINS, SnapshotQuery, build_domain_slices
+
+logger = get_logger(__name__)
+
+# Maximum patients per panel request
+MAX_PANEL_PATIENTS = 50
+
+
+def summarize_patient(
+    patient_icn: str, patient_data: PatientDataCollection, domains: list[SnapshotQuery]
+) -> PanelPatientSummary:
+    """
+    Summarize the requested domains of one patient
+
+    Args:
+        patient_icn: ICN the patient was requested by
+        patient_data: Patient data collection
+        domains: Requested domains with their filters, offset and limit
+
+    Returns:
+        Demographics plus, per domain, the matching item count and the
+        payload's own counts with the item lists left out
+    """
+    slices, total_available, errors = build_domain_slices(patient_data, domains)
+    summaries = {
+        domain: {
+            "total": total_available[domain],
+            **data.model_dump(mode="json", exclude=set(item_fields(type(data)))),
+        }
+        for domain, data in slices.items()
+    }
+    return PanelPatientSummary(
+        patient_icn=patient_icn,
+        success=True,
+        demographics=DemographicsMetadata.from_patient_demographics(
+            patient_data.demographics
+        ),
+        domains=summaries,
+        errors=errors,
+    )
+
+
+def register_get_panel_summary_tool(mcp: FastMCP, vista_client: BaseVistaClient):
+    """Register the get_panel_summary tool with the MCP server"""
+
+    @mcp.tool()
+    async def get_panel_summary(
+        patient_icns: Annotated[
+            list[str], Field(min_length=1, max_length=MAX_PANEL_PATIENTS)
+        ],
+        domains: Annotated[
+            list[SnapshotQuery], Field(min_length=1, max_length=MAX_DOMAINS)
+        ],
+        station: str | None = None,
+        ctx: Context | None = None,
+    ) -> PanelSummaryResponse:
+        """Summarize several patients (e.g. a clinic list) in one call.
+
+        For each patient, returns demographics and per requested domain the
+        number of matching items and the tool's counts (abnormal, active,
+        upcoming, ...) without the items. domains takes the same entries as
+        get_patient_snapshot. Patients that fail are reported individually.
+        """
+        start_time = datetime.now(UTC)
+        station, caller_duz = resolve_vista_context(
+            ctx,
+            station_arg=station,
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+
+        try:
+            valid_icns = [icn for icn in patient_icns if validate_icn(icn)]
+            loaded = await get_patient_data_many(
+                vista_client, station, valid_icns, caller_duz
+            )
+
+            patients: list[PanelPatientSummary] = []
+            for icn in dict.fromkeys(patient_icns):
+                result = loaded.get(icn)
+                if result is None:
+                    error = f"Invalid patient ICN: {icn}"
+                elif isinstance(result, BaseException):
+                    error = str(result)
+                else:
+                    patients.append(summarize_patient(icn, result, domains))
+                    continue
+                patients.append(
+                    PanelPatientSummary(patient_icn=icn, success=False, error=error)
+                )
+
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            failed_count = sum(1 for patient in patients if not patient.success)
+            return PanelSummaryResponse(
+                success=failed_count < len(patients),
+                error=(
+                    "No patient in the panel could be loaded"
+                    if failed_count == len(patients)
+                    else None
+                ),
+                data=PanelSummaryResponseData(
+                    patients=patients, failed_count=failed_count
+                ),
+                metadata=md,
+            )
+
+        except Exception as e:
+            logger.exception("Unexpected error in get_panel_summary")
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return PanelSummaryResponse(
+                success=False,
+                error=f"Unexpected error: {str(e)}",
+                metadata=md,
+            )
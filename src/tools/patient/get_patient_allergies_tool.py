@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, flag, unflagged
 from ...models.responses.metadata import (
     AllergiesFiltersMetadata,
     DemographicsMetadata,
@@ -15,18 +17,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     AllergiesResponse,
     AllergiesResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -34,6 +36,42 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_allergies_data(
+    patient_data: PatientDataCollection,
+    verified_only: bool = False,
+    omit_historical: bool = True,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[AllergiesResponseData, int]:
+    """
+    Filter and page a patient's allergies
+
+    Args:
+        patient_data: Patient data collection
+        verified_only: Only verified allergies
+        omit_historical: Leave out historical allergies
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching allergies
+    """
+    query = Query(
+        flag("is_verified", verified_only),
+        unflagged("historical", omit_historical),
+    )
+    allergies_page, total_allergies_after_filtering = query.page(
+        patient_data.allergies_dict.values(), offset, limit, pin
+    )
+
+    response_data = AllergiesResponseData(
+        allergies=allergies_page,  # Use paginated list
+    )
+    return response_data, total_allergies_after_filtering
+
+
 def register_get_patient_allergies_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_allergies tool with the MCP server"""
 
@@ -45,6 +83,8 @@ def register_get_patient_allergies_tool(mcp: FastMCP, vista_client: BaseVistaCli
         omit_historical: bool = True,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> AllergiesResponse:
         """Get patient allergies and adverse reactions."""
@@ -90,24 +130,25 @@ def register_get_patient_allergies_tool(mcp: FastMCP, vista_client: BaseVistaCli
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter allergies based on parameters
-            all_allergies = patient_data.allergies
-
-            filtered_allergies = [
-                allergy
-                for allergy in all_allergies
-                if (not verified_only or allergy.is_verified)
-                and (not omit_historical or not allergy.historical)
-            ]
-
-            # Apply pagination to filtered allergies
-            allergies_page, total_allergies_after_filtering = paginate_list(
-                filtered_allergies, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_allergies",
+                {
+                    "verified_only": verified_only,
+                    "omit_historical": omit_historical,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            # Build response data
-            response_data = AllergiesResponseData(
-                allergies=allergies_page,  # Use paginated list
+            response_data, total_allergies_after_filtering = build_allergies_data(
+                patient_data,
+                verified_only=verified_only,
+                omit_historical=omit_historical,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             end_time = datetime.now(timezone.utc)
@@ -139,15 +180,45 @@ def register_get_patient_allergies_tool(mcp: FastMCP, vista_client: BaseVistaCli
                     ),
                     pagination=PaginationMetadata(
                         total_available_items=total_allergies_after_filtering,
-                        returned=len(allergies_page),
-                        offset=offset,
+                        returned=len(response_data.allergies),
+                        offset=pin.offset,
                         limit=limit,
+                        next_cursor=pin.next_cursor,
                         tool_name="get_patient_allergies",
                         patient_icn=patient_icn,
                     ),
                 ),
-            )
+            ).project(fields)
+
+        except CursorError as e:
+            end_time = datetime.now(timezone.utc)
+            duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
+            return AllergiesResponse(
+                success=False,
+                error=str(e),
+                error_code="INVALID_CURSOR",
+                metadata=ResponseMetadata(
+                    request_id=f"req_{int(start_time.timestamp())}",
+                    performance=PerformanceMetrics(
+                        start_time=start_time,
+                        end_time=end_time,
+                        duration_ms=duration_ms,
+                    ),
+                    rpc=RpcCallMetadata(
+                        rpc="VPR GET PATIENT DATA JSON",
+                        context="LHS RPC CONTEXT",
+                        parameters=build_icn_only_named_array_param(patient_icn),
+                        duz=caller_duz,
+                    ),
+                    station=StationMetadata(station_number=station),
+                    demographics=DemographicsMetadata(
+                        patient_icn=patient_icn,
+                        patient_name=None,
+                        patient_age=None,
+                    ),
+                ),
+            )
         except Exception as e:
             logger.error(f"Error retrieving allergies for patient {patient_icn}: {e}")
             end_time = datetime.now(timezone.utc)
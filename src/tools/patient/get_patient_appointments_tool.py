@@ -7,6 +7,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import Appointment, PatientDataCollection
+from ...models.patient.query import Query, contains, equals, where
 from ...models.responses.metadata import (
     AppointmentsFiltersMetadata,
     DemographicsMetadata,
@@ -16,18 +18,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     AppointmentsResponse,
     AppointmentsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -35,6 +37,91 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_appointments_data(
+    patient_data: PatientDataCollection,
+    days_back: Annotated[int, Field(ge=0, le=3650)] = 30,
+    status_filter: str | None = None,
+    clinic_filter: str | None = None,
+    category: str | None = None,
+    provider_filter: str | None = None,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[AppointmentsResponseData, int]:
+    """
+    Filter, page and summarize a patient's appointments
+
+    Args:
+        patient_data: Patient data collection
+        days_back: Only appointments after now minus days_back days
+        status_filter: Exact appointment status
+        clinic_filter: Substring of the clinic name
+        category: Substring of the appointment category type
+        provider_filter: Substring of a provider name
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching appointments
+    """
+    # Filter appointments by all criteria in a single pass
+    now = datetime.now(UTC)
+    past_cutoff = now - timedelta(days=days_back)
+    provider_upper = provider_filter.upper() if provider_filter else ""
+
+    def has_provider(apt: Appointment) -> bool:
+        return any(
+            provider_upper in provider.provider_name.upper()
+            for provider in apt.providers
+        )
+
+    query = Query(
+        equals("status", status_filter, ignore_case=True),
+        contains("facility.name", clinic_filter),
+        contains("category.type", category),
+        where(has_provider if provider_upper else None),
+        since=past_cutoff,
+    )
+    appointments_page, total_appointments_after_filtering = query.page(
+        patient_data.appointments_by_time, offset, limit, pin
+    )
+
+    # Split appointments into upcoming (next 7 days) and past
+    future_appointments: list[str] = []
+    past_appointments: list[str] = []
+    future_appointments, past_appointments = reduce(
+        lambda acc, apt: (
+            (acc[0].append(apt.uid) or acc)  # type: ignore[func-returns-value]
+            if apt.appointment_date > now
+            else (acc[1].append(apt.uid) or acc)  # type: ignore[func-returns-value]
+        ),
+        appointments_page,
+        (future_appointments, past_appointments),
+    )
+
+    # Count by status
+    by_status: dict[str, int] = {}
+    for apt in appointments_page:
+        status = str(apt.status)
+        by_status[status] = by_status.get(status, 0) + 1
+
+    # Count by clinic
+    by_clinic: dict[str, int] = {}
+    for apt in appointments_page:
+        clinic = apt.facility.name
+        by_clinic[clinic] = by_clinic.get(clinic, 0) + 1
+
+    data = AppointmentsResponseData(
+        future_count=len(future_appointments),
+        past_count=len(past_appointments),
+        by_status=by_status,
+        by_clinic=by_clinic,
+        appointments=appointments_page,
+    )
+    return data, total_appointments_after_filtering
+
+
 def register_get_patient_appointments_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_appointments tool with the MCP server"""
 
@@ -49,6 +136,8 @@ def register_get_patient_appointments_tool(mcp: FastMCP, vista_client: BaseVista
         provider_filter: str | None = None,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> AppointmentsResponse:
         """Get patient appointments and schedules."""
@@ -84,69 +173,35 @@ def register_get_patient_appointments_tool(mcp: FastMCP, vista_client: BaseVista
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter appointments by all criteria in a single pass
-            now = datetime.now(UTC)
-            past_cutoff = now - timedelta(days=days_back)
-            status_upper = status_filter.upper() if status_filter else None
-            clinic_upper = clinic_filter.upper() if clinic_filter else None
-            category_upper = str(category).upper() if category else None
-            provider_upper = provider_filter.upper() if provider_filter else None
-
-            appointments = [
-                apt
-                for apt in patient_data.appointments
-                if apt.appointment_date >= past_cutoff
-                and (not status_upper or str(apt.status).upper() == status_upper)
-                and (not clinic_upper or clinic_upper in apt.facility.name.upper())
-                and (
-                    not category_upper
-                    or (
-                        apt.category
-                        and apt.category.type
-                        and category_upper in str(apt.category.type).upper()
-                    )
-                )
-                and (
-                    not provider_upper
-                    or any(
-                        provider_upper in provider.provider_name.upper()
-                        for provider in apt.providers
-                    )
-                )
-            ]
-
-            # Apply pagination
-            appointments_page, total_appointments_after_filtering = paginate_list(
-                appointments, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_appointments",
+                {
+                    "days_back": days_back,
+                    "status_filter": status_filter,
+                    "clinic_filter": clinic_filter,
+                    "category": category,
+                    "provider_filter": provider_filter,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            # Split appointments into upcoming (next 7 days) and past
-            future_appointments: list[str] = []
-            past_appointments: list[str] = []
-            future_appointments, past_appointments = reduce(
-                lambda acc, apt: (
-                    (acc[0].append(apt.uid) or acc)  # type: ignore[func-returns-value]
-                    if apt.appointment_date > now
-                    else (acc[1].append(apt.uid) or acc)  # type: ignore[func-returns-value]
-                ),
-                appointments_page,
-                (future_appointments, past_appointments),
+            data, total_appointments_after_filtering = build_appointments_data(
+                patient_data,
+                days_back=days_back,
+                status_filter=status_filter,
+                clinic_filter=clinic_filter,
+                category=category,
+                provider_filter=provider_filter,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
-            # Count by status
-            by_status: dict[str, int] = {}
-            for apt in appointments_page:
-                status = str(apt.status)
-                by_status[status] = by_status.get(status, 0) + 1
-
-            # Count by clinic
-            by_clinic: dict[str, int] = {}
-            for apt in appointments_page:
-                clinic = apt.facility.name
-                by_clinic[clinic] = by_clinic.get(clinic, 0) + 1
-
             # Build metadata
-            end_time = now
+            end_time = datetime.now(UTC)
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
             rpc_details = RpcCallMetadata(
@@ -179,29 +234,39 @@ def register_get_patient_appointments_tool(mcp: FastMCP, vista_client: BaseVista
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_appointments_after_filtering,
-                    returned=len(appointments_page),
-                    offset=offset,
+                    returned=len(data.appointments),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_appointments",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = AppointmentsResponseData(
-                future_count=len(future_appointments),
-                past_count=len(past_appointments),
-                by_status=by_status,
-                by_clinic=by_clinic,
-                appointments=appointments_page,
-            )
-
             return AppointmentsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
+
+        except CursorError as e:
+            import traceback
 
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return AppointmentsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.exception("Unexpected error in get_patient_appointments")
             logger.error(f"Detailed error: {type(e).__name__}: {str(e)}")
@@ -8,6 +8,8 @@ from pydantic import Field
 
 from src.services.validators.vista_validators import validate_icn
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, flag
 from ...models.responses.metadata import (
     ConsultsFiltersMetadata,
     DemographicsMetadata,
@@ -17,17 +19,17 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     ConsultsResponse,
     ConsultsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -35,6 +37,41 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_consults_data(
+    patient_data: PatientDataCollection,
+    active_only: bool = True,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[ConsultsResponseData, int]:
+    """
+    Filter and page a patient's consults
+
+    Args:
+        patient_data: Patient data collection
+        active_only: Only active consults
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching consults
+    """
+    query = Query(flag("is_active", active_only))
+    consults_page, total_consults_after_filtering = query.page(
+        patient_data.consults_dict.values(), offset, limit, pin
+    )
+
+    # Get overdue consults
+    overdue_consults = [c for c in consults_page if c.is_overdue]
+
+    data = ConsultsResponseData(
+        overdue_list=[c.uid for c in overdue_consults],
+        consults=consults_page,
+    )
+    return data, total_consults_after_filtering
+
+
 def register_get_patient_consults_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_consults tool with the MCP server"""
 
@@ -45,6 +82,8 @@ def register_get_patient_consults_tool(mcp: FastMCP, vista_client: BaseVistaClie
         active_only: bool = True,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> ConsultsResponse:
         """Get patient consultation requests and referrals."""
@@ -80,18 +119,24 @@ def register_get_patient_consults_tool(mcp: FastMCP, vista_client: BaseVistaClie
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter consults
-            consults = patient_data.consults
-            if active_only:
-                consults = [c for c in consults if c.is_active]
-
-            # Apply pagination
-            consults_page, total_consults_after_filtering = paginate_list(
-                consults, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_consults",
+                {
+                    "active_only": active_only,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            # Get overdue consults
-            overdue_consults = [c for c in consults_page if c.is_overdue]
+            data, total_consults_after_filtering = build_consults_data(
+                patient_data,
+                active_only=active_only,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
+            )
 
             # Build typed metadata inline
             end_time = datetime.now(UTC)
@@ -119,26 +164,37 @@ def register_get_patient_consults_tool(mcp: FastMCP, vista_client: BaseVistaClie
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_consults_after_filtering,
-                    returned=len(consults_page),
-                    offset=offset,
+                    returned=len(data.consults),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_consults",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = ConsultsResponseData(
-                overdue_list=[c.uid for c in overdue_consults],
-                consults=consults_page,
-            )
-
             return ConsultsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return ConsultsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.exception("Unexpected error in get_patient_consults")
             end_time = datetime.now(UTC)
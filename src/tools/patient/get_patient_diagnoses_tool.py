@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query
 from ...models.responses.metadata import (
     DemographicsMetadata,
     DiagnosesFiltersMetadata,
@@ -15,18 +17,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     DiagnosesResponse,
     DiagnosesResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -34,6 +36,40 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_diagnoses_data(
+    patient_data: PatientDataCollection,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[DiagnosesResponseData, int]:
+    """
+    Page a patient's diagnoses
+
+    Args:
+        patient_data: Patient data collection
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of diagnoses
+    """
+    filtered_diagnoses_page, total_filtered_diagnoses = Query().page(
+        patient_data.diagnoses_dict.values(), offset, limit, pin
+    )
+
+    # Get active diagnoses
+    active_diagnoses = [
+        d.uid for d in filtered_diagnoses_page if d.status.lower() == "active"
+    ]
+
+    data = DiagnosesResponseData(
+        active_count=len(active_diagnoses),
+        diagnoses=filtered_diagnoses_page,
+    )
+    return data, total_filtered_diagnoses
+
+
 def register_get_patient_diagnoses_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_diagnoses tool with the MCP server"""
 
@@ -45,6 +81,8 @@ def register_get_patient_diagnoses_tool(mcp: FastMCP, vista_client: BaseVistaCli
         icd_version: str | None = None,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> DiagnosesResponse:
         """Get patient diagnoses with ICD codes."""
@@ -98,15 +136,21 @@ def register_get_patient_diagnoses_tool(mcp: FastMCP, vista_client: BaseVistaCli
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Apply pagination
-            filtered_diagnoses_page, total_filtered_diagnoses = paginate_list(
-                patient_data.diagnoses, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_diagnoses",
+                {},
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            # Get active diagnoses
-            active_diagnoses = [
-                d.uid for d in filtered_diagnoses_page if d.status.lower() == "active"
-            ]
+            data, total_filtered_diagnoses = build_diagnoses_data(
+                patient_data,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
+            )
 
             # Build typed metadata inline
             end_time = datetime.now(UTC)
@@ -136,26 +180,37 @@ def register_get_patient_diagnoses_tool(mcp: FastMCP, vista_client: BaseVistaCli
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_filtered_diagnoses,
-                    offset=offset,
+                    offset=pin.offset,
                     limit=limit,
-                    returned=len(filtered_diagnoses_page),
+                    next_cursor=pin.next_cursor,
+                    returned=len(data.diagnoses),
                     tool_name="get_patient_diagnoses",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = DiagnosesResponseData(
-                active_count=len(active_diagnoses),
-                diagnoses=filtered_diagnoses_page,
-            )
-
             return DiagnosesResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return DiagnosesResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(
                 f"[DEBUG] Exception in get_patient_diagnoses: {type(e).__name__}: {str(e)}"
@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, equals, flag
 from ...models.responses.metadata import (
     DemographicsMetadata,
     DocumentsFiltersMetadata,
@@ -15,15 +17,21 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import DocumentsResponse, DocumentsResponseData
-from ...services.data import get_patient_data
+from ...services.data import (
+    CursorError,
+    ResultPin,
+    get_patient_data,
+    load_document_text,
+    summarize_document_text,
+)
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -31,6 +39,47 @@ from ...vista.base import BaseVistaClient
 logger = get_logger()
 
 
+def build_documents_data(
+    patient_data: PatientDataCollection,
+    completed_only: bool = True,
+    days_back: Annotated[int, Field(ge=1)] = 365,
+    document_type: str = "",
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[DocumentsResponseData, int]:
+    """
+    Filter and page a patient's documents
+
+    Args:
+        patient_data: Patient data collection
+        completed_only: Only completed documents
+        days_back: Only documents referenced in the last days_back days
+        document_type: Exact document type
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching documents
+    """
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    query = Query(
+        flag("is_completed", completed_only),
+        equals("document_type", document_type),
+        since=cutoff_date,
+    )
+    documents_page, total_documents_after_filtering = query.page(
+        patient_data.documents_by_time, offset, limit, pin
+    )
+
+    data = DocumentsResponseData(
+        completed=[d.uid for d in documents_page if d.is_completed],
+        documents=documents_page,
+    )
+    return data, total_documents_after_filtering
+
+
 def register_get_patient_documents_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_documents tool with the MCP server"""
 
@@ -43,9 +92,16 @@ def register_get_patient_documents_tool(mcp: FastMCP, vista_client: BaseVistaCli
         document_type: str = "",
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
+        include_text: bool = True,
         ctx: Context | None = None,
     ) -> DocumentsResponse:
-        """Get patient clinical documents and notes."""
+        """Get patient clinical documents and notes.
+
+        Set include_text=false to list documents with only a content_summary of
+        long note text, which is faster for browsing titles, dates and authors.
+        """
         start_time = datetime.now(UTC)
         station, caller_duz = resolve_vista_context(
             ctx,
@@ -77,22 +133,33 @@ def register_get_patient_documents_tool(mcp: FastMCP, vista_client: BaseVistaCli
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter documents with combined conditions
-            cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
-            documents = [
-                d
-                for d in patient_data.documents
-                if d.reference_date_time
-                and d.reference_date_time >= cutoff_date
-                and (not completed_only or d.is_completed)
-                and (not document_type or d.document_type == document_type)
-            ]
-
-            # Apply pagination
-            documents_page, total_documents_after_filtering = paginate_list(
-                documents, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_documents",
+                {
+                    "completed_only": completed_only,
+                    "days_back": days_back,
+                    "document_type": document_type,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
+            data, total_documents_after_filtering = build_documents_data(
+                patient_data,
+                completed_only=completed_only,
+                days_back=days_back,
+                document_type=document_type,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
+            )
+            if include_text:
+                data.documents = await load_document_text(data.documents)
+            else:
+                data.documents = summarize_document_text(data.documents)
+
             # Build typed metadata inline
             end_time = datetime.now(UTC)
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -121,26 +188,37 @@ def register_get_patient_documents_tool(mcp: FastMCP, vista_client: BaseVistaCli
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_documents_after_filtering,
-                    returned=len(documents_page),
-                    offset=offset,
+                    returned=len(data.documents),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_documents",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = DocumentsResponseData(
-                completed=[d.uid for d in documents_page if d.is_completed],
-                documents=documents_page,
-            )
-
             return DocumentsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return DocumentsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(f"Error getting patient documents: {e}")
             end_time = datetime.now(UTC)
@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, contains
 from ...models.responses.metadata import (
     DemographicsMetadata,
     HealthFactorsFiltersMetadata,
@@ -15,18 +17,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     HealthFactorsResponse,
     HealthFactorsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -34,6 +36,37 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_health_factors_data(
+    patient_data: PatientDataCollection,
+    category_filter: str | None = None,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[HealthFactorsResponseData, int]:
+    """
+    Filter and page a patient's health factors
+
+    Args:
+        patient_data: Patient data collection
+        category_filter: Substring of the health factor category
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching factors
+    """
+    query = Query(contains("category", category_filter))
+    health_factors_page, total_health_factors_after_filtering = query.page(
+        patient_data.health_factors_dict.values(), offset, limit, pin
+    )
+
+    data = HealthFactorsResponseData(
+        health_factors=health_factors_page,
+    )
+    return data, total_health_factors_after_filtering
+
+
 def register_get_patient_health_factors_tool(
     mcp: FastMCP, vista_client: BaseVistaClient
 ):
@@ -46,6 +79,8 @@ def register_get_patient_health_factors_tool(
         category_filter: str | None = None,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> HealthFactorsResponse:
         """Get patient health factors."""
@@ -81,16 +116,23 @@ def register_get_patient_health_factors_tool(
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter health factors by category if specified
-            health_factors = [
-                f
-                for f in patient_data.health_factors
-                if not category_filter or category_filter.upper() in f.category.upper()
-            ]
+            pin = ResultPin(
+                patient_data,
+                "get_patient_health_factors",
+                {
+                    "category_filter": category_filter,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+            )
 
-            # Apply pagination
-            health_factors_page, total_health_factors_after_filtering = paginate_list(
-                health_factors, offset, limit
+            data, total_health_factors_after_filtering = build_health_factors_data(
+                patient_data,
+                category_filter=category_filter,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             # Build typed metadata inline
@@ -119,25 +161,37 @@ def register_get_patient_health_factors_tool(
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_health_factors_after_filtering,
-                    returned=len(health_factors_page),
-                    offset=offset,
+                    returned=len(data.health_factors),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_health_factors",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = HealthFactorsResponseData(
-                health_factors=health_factors_page,
-            )
-
             return HealthFactorsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return HealthFactorsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(
                 f"[DEBUG] Exception in get_patient_health_factors: {type(e).__name__}: {str(e)}"
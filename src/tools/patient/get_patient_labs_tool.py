@@ -1,12 +1,13 @@
 """Get patient labs tool for MCP server"""
 
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from ...models.patient import LabResult
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, contains, flag, paginate
 from ...models.responses.metadata import (
     DemographicsMetadata,
     LabsFiltersMetadata,
@@ -16,18 +17,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     LabResultsResponse,
     LabResultsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -35,6 +36,57 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_labs_data(
+    patient_data: PatientDataCollection,
+    abnormal_only: bool = False,
+    lab_type: str | None = None,
+    n_most_recent: Annotated[int | None, Field(ge=0)] = 3,
+    days_back: Annotated[int, Field(ge=0)] = 90,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 200,
+    pin: ResultPin | None = None,
+) -> tuple[LabResultsResponseData, int]:
+    """
+    Filter and page a patient's lab results
+
+    Args:
+        patient_data: Patient data collection
+        abnormal_only: Only abnormal results
+        lab_type: Substring of the lab type name
+        n_most_recent: At most this many results per lab type (0/None for all)
+        days_back: Only results observed in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching results
+    """
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+
+    abnormal = flag("is_abnormal", abnormal_only)
+    of_type = contains("type_name", lab_type)
+
+    if n_most_recent:
+        # At most n per type, read from the pre-sorted per-type series
+        labs = Query(abnormal, since=cutoff_date).most_recent(
+            patient_data.lab_results_by_type, n_most_recent, series=of_type, pin=pin
+        )
+        labs_page, total_filtered_labs = paginate(labs, offset, limit)
+    else:
+        query = Query(abnormal, of_type, since=cutoff_date)
+        labs_page, total_filtered_labs = query.page(
+            patient_data.lab_results_by_time, offset, limit, pin
+        )
+
+    data = LabResultsResponseData(
+        abnormal_count=len([lab for lab in labs_page if lab.is_abnormal]),
+        critical_count=len([lab for lab in labs_page if lab.is_critical]),
+        labs=labs_page,
+    )
+    return data, total_filtered_labs
+
+
 def register_get_patient_labs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_labs tool with the MCP server"""
 
@@ -48,6 +100,8 @@ def register_get_patient_labs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
         days_back: Annotated[int, Field(default=90, ge=0)] = 90,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=200, ge=1, le=200)] = 200,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> LabResultsResponse:
         """Get patient laboratory test results with values and reference ranges."""
@@ -83,36 +137,30 @@ def register_get_patient_labs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter labs with combined conditions
-            cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
-            labs = [
-                lab
-                for lab in patient_data.lab_results
-                if lab.observed >= cutoff_date
-                and (not abnormal_only or lab.is_abnormal)
-                and (not lab_type or lab_type.upper() in lab.type_name.upper())
-            ]
-
-            # group by type and have at most n per type, then flatten out.
-            # TODO: there are smarter ways to do this
-            if n_most_recent:
-                labs_by_type: dict[str, list[LabResult]] = {}
-                for lab in labs:
-                    lab_list = labs_by_type.setdefault(lab.type_code, [])
-                    if len(lab_list) < n_most_recent:
-                        lab_list.append(lab)
-
-            labs = [lab for lab_list in labs_by_type.values() for lab in lab_list]
-
-            # Apply pagination
-            labs_page, total_filtered_labs = paginate_list(labs, offset, limit)
-
-            # Group by test type (for paginated results)
-            lab_groups: dict[str, list[Any]] = {}
-            for lab in labs_page:
-                if lab.type_code not in lab_groups:
-                    lab_groups[lab.type_code] = []
-                lab_groups[lab.type_code].append(lab.uid)
+            pin = ResultPin(
+                patient_data,
+                "get_patient_labs",
+                {
+                    "abnormal_only": abnormal_only,
+                    "lab_type": lab_type,
+                    "n_most_recent": n_most_recent,
+                    "days_back": days_back,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+            )
+
+            data, total_filtered_labs = build_labs_data(
+                patient_data,
+                abnormal_only=abnormal_only,
+                lab_type=lab_type,
+                n_most_recent=n_most_recent,
+                days_back=days_back,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
+            )
 
             # Build typed metadata inline
             end_time = datetime.now(UTC)
@@ -142,27 +190,37 @@ def register_get_patient_labs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_filtered_labs,
-                    offset=offset,
+                    offset=pin.offset,
                     limit=limit,
-                    returned=len(labs_page),
+                    next_cursor=pin.next_cursor,
+                    returned=len(data.labs),
                     tool_name="get_patient_labs",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = LabResultsResponseData(
-                abnormal_count=len([lab for lab in labs_page if lab.is_abnormal]),
-                critical_count=len([lab for lab in labs_page if lab.is_critical]),
-                labs=labs_page,
-            )
-
             return LabResultsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return LabResultsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.exception("Unexpected error in get_patient_labs")
             end_time = datetime.now(UTC)
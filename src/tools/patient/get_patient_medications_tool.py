@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import Medication, PatientDataCollection
+from ...models.patient.query import Query, where
 from ...models.responses.metadata import (
     DemographicsMetadata,
     MedicationsFiltersMetadata,
@@ -15,18 +17,18 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     MedicationsResponse,
     MedicationsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -34,6 +36,56 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_medications_data(
+    patient_data: PatientDataCollection,
+    active_only: bool = False,
+    return_all_active_and_pending: bool = True,
+    days_back: Annotated[int, Field(ge=1, le=36500)] = 183,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=1000)] = 100,
+    pin: ResultPin | None = None,
+) -> tuple[MedicationsResponseData, int]:
+    """
+    Filter and page a patient's medications
+
+    Args:
+        patient_data: Patient data collection
+        active_only: Only active medications
+        return_all_active_and_pending: Keep active/pending medications regardless
+            of the days_back window
+        days_back: Only medications last filled in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching medications
+    """
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back) if days_back else None
+
+    def matches(m: Medication) -> bool:
+        return bool(
+            (return_all_active_and_pending and (m.is_pending or m.is_active))
+            or (
+                (not active_only or m.is_active)
+                and (
+                    cutoff_date is None
+                    or (m.last_filled and m.last_filled >= cutoff_date)
+                )
+            )
+        )
+
+    query = Query(where(matches))
+    medications_page, total_medications_after_filtering = query.page(
+        patient_data.medications_dict.values(), offset, limit, pin
+    )
+
+    data = MedicationsResponseData(
+        medications=medications_page,
+    )
+    return data, total_medications_after_filtering
+
+
 def register_get_patient_medications_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_medications tool with the MCP server"""
 
@@ -46,6 +98,8 @@ def register_get_patient_medications_tool(mcp: FastMCP, vista_client: BaseVistaC
         days_back: Annotated[int, Field(default=183, ge=1, le=36500)] = 183,  # 6 months
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=100, ge=1, le=1000)] = 100,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> MedicationsResponse:
         """Get patient medications with dosing and refill information."""
@@ -81,26 +135,27 @@ def register_get_patient_medications_tool(mcp: FastMCP, vista_client: BaseVistaC
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter medications based on active status and days back
-            cutoff_date = (
-                datetime.now(UTC) - timedelta(days=days_back) if days_back else None
+            pin = ResultPin(
+                patient_data,
+                "get_patient_medications",
+                {
+                    "active_only": active_only,
+                    "return_all_active_and_pending": return_all_active_and_pending,
+                    "days_back": days_back,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
-            medications = [
-                m
-                for m in patient_data.medications
-                if (return_all_active_and_pending and (m.is_pending or m.is_active))
-                or (
-                    (not active_only or m.is_active)
-                    and (
-                        cutoff_date is None
-                        or (m.last_filled and m.last_filled >= cutoff_date)
-                    )
-                )
-            ]
 
-            # Apply pagination
-            medications_page, total_medications_after_filtering = paginate_list(
-                medications, offset, limit
+            data, total_medications_after_filtering = build_medications_data(
+                patient_data,
+                active_only=active_only,
+                return_all_active_and_pending=return_all_active_and_pending,
+                days_back=days_back,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             # Build typed metadata inline
@@ -129,25 +184,37 @@ def register_get_patient_medications_tool(mcp: FastMCP, vista_client: BaseVistaC
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_medications_after_filtering,
-                    returned=len(medications_page),
-                    offset=offset,
+                    returned=len(data.medications),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_medications",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = MedicationsResponseData(
-                medications=medications_page,
-            )
-
             return MedicationsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return MedicationsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(
                 f"[DEBUG] Exception in get_patient_medications: {type(e).__name__}: {str(e)}"
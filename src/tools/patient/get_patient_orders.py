@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, flag
 from ...models.responses.metadata import (
     DemographicsMetadata,
     OrdersFiltersMetadata,
@@ -15,15 +17,15 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import OrdersResponse, OrdersResponseData
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -31,6 +33,38 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_orders_data(
+    patient_data: PatientDataCollection,
+    active_only: bool = True,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[OrdersResponseData, int]:
+    """
+    Filter and page a patient's orders
+
+    Args:
+        patient_data: Patient data collection
+        active_only: Only active orders
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching orders
+    """
+    query = Query(flag("is_active", active_only))
+    orders_page, total_orders_after_filtering = query.page(
+        patient_data.orders_dict.values(), offset, limit, pin
+    )
+
+    data = OrdersResponseData(
+        active_count=sum(1 for o in orders_page if o.is_active),
+        orders=orders_page,
+    )
+    return data, total_orders_after_filtering
+
+
 def register_get_patient_orders_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_orders tool with the MCP server"""
 
@@ -41,6 +75,8 @@ def register_get_patient_orders_tool(mcp: FastMCP, vista_client: BaseVistaClient
         active_only: bool = True,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> OrdersResponse:
         """Get patient orders including medications, labs, and procedures."""
@@ -79,14 +115,23 @@ def register_get_patient_orders_tool(mcp: FastMCP, vista_client: BaseVistaClient
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter orders
-            orders = patient_data.orders
-            if active_only:
-                orders = [o for o in orders if o.is_active]
+            pin = ResultPin(
+                patient_data,
+                "get_patient_orders",
+                {
+                    "active_only": active_only,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+            )
 
-            # Apply pagination
-            orders_page, total_orders_after_filtering = paginate_list(
-                orders, offset, limit
+            data, total_orders_after_filtering = build_orders_data(
+                patient_data,
+                active_only=active_only,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             # Build typed metadata inline
@@ -115,26 +160,37 @@ def register_get_patient_orders_tool(mcp: FastMCP, vista_client: BaseVistaClient
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_orders_after_filtering,
-                    returned=len(orders_page),
-                    offset=offset,
+                    returned=len(data.orders),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_orders",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = OrdersResponseData(
-                active_count=sum(1 for o in orders_page if o.is_active),
-                orders=orders_page,
-            )
-
             return OrdersResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return OrdersResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.exception("Unexpected error in get_patient_orders")
             end_time = datetime.now(UTC)
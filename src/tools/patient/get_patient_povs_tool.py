@@ -6,7 +6,9 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
 from ...models.patient.pov import POVSummary
+from ...models.patient.query import Query, flag, paginate
 from ...models.responses.metadata import (
     DemographicsMetadata,
     PaginationMetadata,
@@ -16,15 +18,15 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import POVsResponse, POVsResponseData
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -32,6 +34,84 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_povs_data(
+    patient_data: PatientDataCollection,
+    primary_only: bool = False,
+    days_back: Annotated[int, Field(ge=1, le=1095)] = 365,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[POVsResponseData, int]:
+    """
+    Filter, page and summarize a patient's purposes of visit
+
+    Args:
+        patient_data: Patient data collection
+        primary_only: Only primary POVs
+        days_back: Only POVs entered in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching POVs
+    """
+    # Extract POVs in the date range from patient data
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    query = Query(flag("is_primary", primary_only), since=cutoff_date)
+    povs = query.all(patient_data.povs_by_time, pin)
+
+    # Apply pagination
+    povs_page, total_filtered_povs = paginate(povs, offset, limit)
+
+    # Group POVs by encounter
+    by_encounter: dict[str, list[str]] = {}
+    for pov in povs_page:
+        encounter_uid = pov.encounter_uid
+        if encounter_uid not in by_encounter:
+            by_encounter[encounter_uid] = []
+        by_encounter[encounter_uid].append(pov.uid)
+
+    # Group by type
+    by_type = {"Primary": 0, "Secondary": 0}
+    primary_povs = []
+    secondary_povs = []
+
+    for pov in povs_page:
+        if pov.is_primary:
+            by_type["Primary"] += 1
+            primary_povs.append(pov.uid)
+        else:
+            by_type["Secondary"] += 1
+            secondary_povs.append(pov.uid)
+
+    # Calculate summary statistics
+    unique_encounters = len({pov.encounter_uid for pov in povs})
+    facilities = list({pov.facility_name for pov in povs if pov.facility_name})
+    encounter_types = list({pov.encounter_name for pov in povs if pov.encounter_name})
+
+    summary = POVSummary(
+        total_povs=total_filtered_povs,
+        primary_count=by_type["Primary"],
+        secondary_count=by_type["Secondary"],
+        unique_encounters=unique_encounters,
+        date_range_days=days_back,
+        most_recent_pov=povs[0].entered if povs else None,
+        facilities=facilities,
+        encounter_types=encounter_types,
+    )
+
+    data = POVsResponseData(
+        povs=povs_page,
+        summary=summary,
+        by_encounter=by_encounter,
+        by_type=by_type,
+        primary_povs=primary_povs,
+        secondary_povs=secondary_povs,
+    )
+    return data, total_filtered_povs
+
+
 def register_get_patient_povs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_povs tool with the MCP server"""
 
@@ -43,6 +123,8 @@ def register_get_patient_povs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
         days_back: Annotated[int, Field(default=365, ge=1, le=1095)] = 365,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> POVsResponse:
         """Get patient Purpose of Visit (POV) records with filtering and pagination."""
@@ -78,69 +160,25 @@ def register_get_patient_povs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Extract POVs from patient data
-            povs = patient_data.povs
-
-            # Filter POVs by date range
-            cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
-
-            # Filter POVs by date and primary status
-            povs = [
-                pov
-                for pov in povs
-                if pov.entered >= cutoff_date and (not primary_only or pov.is_primary)
-            ]
-
-            # Apply pagination
-            povs_page, total_filtered_povs = paginate_list(povs, offset, limit)
-
-            # Group POVs by encounter
-            by_encounter: dict[str, list[str]] = {}
-            for pov in povs_page:
-                encounter_uid = pov.encounter_uid
-                if encounter_uid not in by_encounter:
-                    by_encounter[encounter_uid] = []
-                by_encounter[encounter_uid].append(pov.uid)
-
-            # Group by type
-            by_type = {"Primary": 0, "Secondary": 0}
-            primary_povs = []
-            secondary_povs = []
-
-            for pov in povs_page:
-                if pov.is_primary:
-                    by_type["Primary"] += 1
-                    primary_povs.append(pov.uid)
-                else:
-                    by_type["Secondary"] += 1
-                    secondary_povs.append(pov.uid)
-
-            # Calculate summary statistics
-            unique_encounters = len({pov.encounter_uid for pov in povs})
-            facilities = list({pov.facility_name for pov in povs if pov.facility_name})
-            encounter_types = list(
-                {pov.encounter_name for pov in povs if pov.encounter_name}
+            pin = ResultPin(
+                patient_data,
+                "get_patient_povs",
+                {
+                    "primary_only": primary_only,
+                    "days_back": days_back,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            summary = POVSummary(
-                total_povs=total_filtered_povs,
-                primary_count=by_type["Primary"],
-                secondary_count=by_type["Secondary"],
-                unique_encounters=unique_encounters,
-                date_range_days=days_back,
-                most_recent_pov=povs[0].entered if povs else None,
-                facilities=facilities,
-                encounter_types=encounter_types,
-            )
-
-            # Build response data
-            data = POVsResponseData(
-                povs=povs_page,
-                summary=summary,
-                by_encounter=by_encounter,
-                by_type=by_type,
-                primary_povs=primary_povs,
-                secondary_povs=secondary_povs,
+            data, total_filtered_povs = build_povs_data(
+                patient_data,
+                primary_only=primary_only,
+                days_back=days_back,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             # Build metadata
@@ -166,9 +204,10 @@ def register_get_patient_povs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_filtered_povs,
-                    offset=offset,
+                    offset=pin.offset,
                     limit=limit,
-                    returned=len(povs_page),
+                    next_cursor=pin.next_cursor,
+                    returned=len(data.povs),
                     tool_name="get_patient_povs",
                     patient_icn=patient_icn,
                 ),
@@ -182,8 +221,24 @@ def register_get_patient_povs_tool(mcp: FastMCP, vista_client: BaseVistaClient):
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return POVsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(
                 f"[DEBUG] Exception in get_patient_povs: {type(e).__name__}: {str(e)}"
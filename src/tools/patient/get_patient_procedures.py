@@ -6,7 +6,9 @@ from typing import Annotated, Any
 from fastmcp import Context
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
 from ...models.patient.cpt_code import CPTCode
+from ...models.patient.query import Query, paginate, where
 from ...models.responses.metadata import (
     DemographicsMetadata,
     PaginationMetadata,
@@ -16,10 +18,12 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     ProceduresResponse,
     ProceduresResponseData,
 )
+from ...services.data.cursors import CursorError, ResultPin
 from ...services.data.patient_data import get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
@@ -27,7 +31,6 @@ from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient, VistaAPIError
@@ -44,6 +47,7 @@ async def get_patient_procedures_impl(
     date_to: date | None = None,
     offset: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
 ) -> ProceduresResponse:
     """
     Implementation for getting patient procedures/CPT codes
@@ -80,24 +84,27 @@ async def get_patient_procedures_impl(
             caller_duz=str(caller_duz),
         )
 
-        # Get CPT codes
-        all_cpt_codes = patient_data.cpt_codes
+        pin = ResultPin(
+            patient_data,
+            "get_patient_procedures",
+            {
+                "date_from": date_from,
+                "date_to": date_to,
+            },
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
 
-        # Apply filters
-        filtered_codes = _apply_procedure_filters(
-            all_cpt_codes,
+        data, total_after_filtering = build_procedures_data(
+            patient_data,
             date_from=date_from,
             date_to=date_to,
+            offset=pin.offset,
+            limit=limit,
+            pin=pin,
         )
 
-        # Apply pagination
-        paginated_codes, total_after_filtering = paginate_list(
-            filtered_codes, offset, limit
-        )
-
-        # Build summary statistics (based on all filtered codes, not just the page)
-        summary_stats = _build_procedure_summary(all_cpt_codes, filtered_codes)
-
         # Build RPC metadata
         end_time = datetime.now(UTC)
         rpc_details = RpcCallMetadata(
@@ -126,28 +133,15 @@ async def get_patient_procedures_impl(
             ),
             pagination=PaginationMetadata(
                 total_available_items=total_after_filtering,
-                returned=len(paginated_codes),
-                offset=offset,
+                returned=len(data.procedures),
+                offset=pin.offset,
                 limit=limit,
+                next_cursor=pin.next_cursor,
                 tool_name="get_patient_procedures",
                 patient_icn=patient_icn,
             ),
         )
 
-        # Build response data
-        data = ProceduresResponseData(
-            total_procedures=summary_stats["total_procedures"],
-            filtered_procedures=summary_stats["filtered_procedures"],
-            date_range=summary_stats["date_range"],
-            unique_encounters=summary_stats["unique_encounters"],
-            procedures=paginated_codes,
-            filters_applied={
-                "date_from": date_from,
-                "date_to": date_to,
-                "limit": limit,
-            },
-        )
-
         return ProceduresResponse(
             success=True,
             data=data,
@@ -174,6 +168,22 @@ async def get_patient_procedures_impl(
             error_code=e.error_type,
             metadata=md,
         )
+    except CursorError as e:
+        end_time = datetime.now(UTC)
+        md = ResponseMetadata(
+            request_id=f"req_{int(end_time.timestamp())}",
+            performance=PerformanceMetrics(
+                duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                start_time=start_time,
+                end_time=end_time,
+            ),
+            station=StationMetadata(station_number=station),
+        )
+        return ProceduresResponse(
+            success=False,
+            error=str(e),
+            metadata=md,
+        )
     except Exception as e:
         logger.exception(
             f"Unexpected error getting procedures for patient {patient_icn}"
@@ -199,24 +209,19 @@ def _apply_procedure_filters(
     cpt_codes: list[CPTCode],
     date_from: date | None = None,
     date_to: date | None = None,
+    pin: ResultPin | None = None,
 ) -> list[CPTCode]:
     """Apply filters to CPT codes list"""
-    filtered = cpt_codes
 
-    # Filter by date range
-    if date_from or date_to:
-        try:
-            filtered = [
-                code
-                for code in filtered
-                if code.entered is None
-                or (not date_from or date_from <= code.entered.date())
-                and (not date_to or code.entered.date() <= date_to)
-            ]
-        except ValueError as e:
-            logger.warning(f"Invalid date format in filters: {e}")
+    def in_date_range(code: CPTCode) -> bool:
+        # Codes without an entered date are kept
+        return code.entered is None or (
+            (not date_from or date_from <= code.entered.date())
+            and (not date_to or code.entered.date() <= date_to)
+        )
 
-    return filtered
+    query = Query(where(in_date_range if date_from or date_to else None))
+    return query.all(cpt_codes, pin)
 
 
 def _build_procedure_summary(
@@ -250,6 +255,59 @@ def _build_procedure_summary(
     }
 
 
+def build_procedures_data(
+    patient_data: PatientDataCollection,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[ProceduresResponseData, int]:
+    """
+    Filter, page and summarize a patient's procedures
+
+    Args:
+        patient_data: Patient data collection
+        date_from: Start date filter
+        date_to: End date filter
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching procedures
+    """
+    all_cpt_codes = patient_data.cpt_codes
+
+    # Apply filters
+    filtered_codes = _apply_procedure_filters(
+        all_cpt_codes,
+        date_from=date_from,
+        date_to=date_to,
+        pin=pin,
+    )
+
+    # Apply pagination
+    paginated_codes, total_after_filtering = paginate(filtered_codes, offset, limit)
+
+    # Build summary statistics (based on all filtered codes, not just the page)
+    summary_stats = _build_procedure_summary(all_cpt_codes, filtered_codes)
+
+    data = ProceduresResponseData(
+        total_procedures=summary_stats["total_procedures"],
+        filtered_procedures=summary_stats["filtered_procedures"],
+        date_range=summary_stats["date_range"],
+        unique_encounters=summary_stats["unique_encounters"],
+        procedures=paginated_codes,
+        filters_applied={
+            "date_from": date_from,
+            "date_to": date_to,
+            "limit": limit,
+        },
+    )
+    return data, total_after_filtering
+
+
 def register_get_patient_procedures_tool(mcp, vista_client: BaseVistaClient):
     """Register the get_patient_procedures tool with the MCP server"""
 
@@ -261,6 +319,8 @@ def register_get_patient_procedures_tool(mcp, vista_client: BaseVistaClient):
         date_to: Annotated[date | None, Field(default=None)] = None,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> ProceduresResponse:
         """Get patient CPT procedure codes and billing information."""
@@ -290,7 +350,7 @@ def register_get_patient_procedures_tool(mcp, vista_client: BaseVistaClient):
                 metadata=md,
             )
 
-        return await get_patient_procedures_impl(
+        response = await get_patient_procedures_impl(
             vista_client=vista_client,
             patient_icn=patient_icn,
             station=str(station),
@@ -299,4 +359,6 @@ def register_get_patient_procedures_tool(mcp, vista_client: BaseVistaClient):
             date_to=date_to,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
+        return response.project(fields)
@@ -0,0 +1,323 @@
+"""Get patient snapshot tool for MCP server"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Annotated, Any, Literal
+
+from fastmcp import Context, FastMCP
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, validate_call
+
+from ...models.patient import PatientDataCollection
+from ...models.responses.metadata import (
+    DemographicsMetadata,
+    PerformanceMetrics,
+    ResponseMetadata,
+    RpcCallMetadata,
+    StationMetadata,
+)
+from ...models.responses.projection import ItemFields, item_fields
+from ...models.responses.tool_responses import (
+    DocumentsResponseData,
+    ResponseData,
+    SnapshotResponse,
+    SnapshotResponseData,
+)
+from ...services.data import (
+    get_patient_data,
+    get_patient_data_federated,
+    summarize_document_text,
+)
+from ...services.rpc import build_icn_only_named_array_param
+from ...services.validators import validate_icn
+from ...utils import (
+    get_default_duz,
+    get_default_station,
+    get_logger,
+    resolve_vista_context,
+)
+from ...vista.base import BaseVistaClient, VistaAPIError
+from .get_patient_allergies_tool import build_allergies_data
+from .get_patient_appointments_tool import build_appointments_data
+from .get_patient_consults_tool import build_consults_data
+from .get_patient_diagnoses_tool import build_diagnoses_data
+from .get_patient_documents import build_documents_data
+from .get_patient_health_factors_tool import build_health_factors_data
+from .get_patient_labs_tool import build_labs_data
+from .get_patient_medications_tool import build_medications_data
+from .get_patient_orders import build_orders_data
+from .get_patient_povs_tool import build_povs_data
+from .get_patient_problems_tool import build_problems_data
+from .get_patient_procedures import build_procedures_data
+from .get_patient_treatments_tool import build_treatments_data
+from .get_patient_trends_tool import build_trends_data
+from .get_patient_visits_tool import build_visits_data
+from .get_patient_vitals_tool import build_vitals_data
+
+logger = get_logger(__name__)
+
+# Maximum domains per snapshot request
+MAX_DOMAINS = 16
+
+# Maximum additional stations per federated snapshot request
+MAX_STATIONS = 10
+
+SnapshotDomain = Literal[
+    "allergies",
+    "appointments",
+    "consults",
+    "diagnoses",
+    "documents",
+    "health_factors",
+    "labs",
+    "medications",
+    "orders",
+    "povs",
+    "problems",
+    "procedures",
+    "treatments",
+    "trends",
+    "visits",
+    "vitals",
+]
+
+# Domain -> data builder shared with the single-domain tool
+_BUILDERS: dict[str, Callable[..., tuple[ResponseData, int]]] = {
+    "allergies": build_allergies_data,
+    "appointments": build_appointments_data,
+    "consults": build_consults_data,
+    "diagnoses": build_diagnoses_data,
+    "documents": build_documents_data,
+    "health_factors": build_health_factors_data,
+    "labs": build_labs_data,
+    "medications": build_medications_data,
+    "orders": build_orders_data,
+    "povs": build_povs_data,
+    "problems": build_problems_data,
+    "procedures": build_procedures_data,
+    "treatments": build_treatments_data,
+    "trends": build_trends_data,
+    "visits": build_visits_data,
+    "vitals": build_vitals_data,
+}
+
+# validate_call applies the tool's own parameter types and bounds to the
+# snapshot filters (arbitrary types for the builders' ResultPin, which a JSON
+# filter can never supply)
+DOMAIN_BUILDERS = {
+    domain: validate_call(config=ConfigDict(arbitrary_types_allowed=True))(builder)
+    for domain, builder in _BUILDERS.items()
+}
+
+
+class SnapshotQuery(BaseModel):
+    """One domain requested from get_patient_snapshot"""
+
+    domain: SnapshotDomain
+    filters: dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Filter arguments of the matching get_patient_* tool, e.g. "
+            '{"abnormal_only": true, "days_back": 30} for labs'
+        ),
+    )
+    offset: int | None = Field(default=None, ge=0)
+    limit: int | None = Field(default=None, ge=1)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Condense a filter validation error to one line"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def build_domain_slices(
+    patient_data: PatientDataCollection, domains: list[SnapshotQuery]
+) -> tuple[dict[str, ResponseData], dict[str, int], dict[str, str]]:
+    """
+    Build the requested domain slices from one collection
+
+    Args:
+        patient_data: Patient data collection
+        domains: Requested domains with their filters, offset and limit
+
+    Returns:
+        Tuple of (payload per domain, matching items per domain before
+        pagination, error per domain that could not be served)
+    """
+    slices: dict[str, ResponseData] = {}
+    total_available: dict[str, int] = {}
+    errors: dict[str, str] = {}
+    for query in domains:
+        if query.domain in slices or query.domain in errors:
+            errors.setdefault(query.domain, "Domain requested more than once")
+            continue
+        arguments = dict(query.filters)
+        if query.offset is not None:
+            arguments["offset"] = query.offset
+        if query.limit is not None:
+            arguments["limit"] = query.limit
+        try:
+            data, total = DOMAIN_BUILDERS[query.domain](patient_data, **arguments)
+        except ValidationError as e:
+            errors[query.domain] = f"Invalid filters: {_format_validation_error(e)}"
+            continue
+        except Exception as e:
+            logger.exception(f"Error building snapshot domain {query.domain}")
+            errors[query.domain] = f"Unexpected error: {str(e)}"
+            continue
+        if isinstance(data, DocumentsResponseData):
+            # Summaries only, whether or not the collection came from the cache
+            data.documents = summarize_document_text(data.documents)
+        slices[query.domain] = data
+        total_available[query.domain] = total
+    return slices, total_available, errors
+
+
+def slice_item_stations(
+    slices: dict[str, ResponseData], item_stations: dict[str, str]
+) -> dict[str, str]:
+    """Station of every item in the slices, for a merged collection"""
+    stations: dict[str, str] = {}
+    for data in slices.values():
+        for field in item_fields(type(data)):
+            items = getattr(data, field)
+            for item in items.values() if isinstance(items, dict) else items:
+                uid = getattr(item, "uid", None)
+                if uid in item_stations:
+                    stations[uid] = item_stations[uid]
+    return stations
+
+
+def register_get_patient_snapshot_tool(mcp: FastMCP, vista_client: BaseVistaClient):
+    """Register the get_patient_snapshot tool with the MCP server"""
+
+    @mcp.tool()
+    async def get_patient_snapshot(
+        patient_icn: str,
+        domains: Annotated[
+            list[SnapshotQuery], Field(min_length=1, max_length=MAX_DOMAINS)
+        ],
+        station: str | None = None,
+        stations: Annotated[list[str] | None, Field(max_length=MAX_STATIONS)] = None,
+        fields: ItemFields = None,
+        ctx: Context | None = None,
+    ) -> SnapshotResponse:
+        """Get several patient domains (labs, vitals, medications, ...) in one call.
+
+        Each entry in domains takes the same filters, offset and limit as the
+        matching get_patient_* tool and defaults to that tool's defaults. Prefer
+        this over calling several get_patient_* tools for the same patient.
+
+        stations: other VistA sites to read the patient from as well. Their data
+        is merged with the station's, duplicates removed, and item_stations
+        tells which site each item came from. Sites that do not answer in time
+        are listed in station_errors and left out.
+        """
+        start_time = datetime.now(UTC)
+        station, caller_duz = resolve_vista_context(
+            ctx,
+            station_arg=station,
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+
+        # Validate ICN
+        if not validate_icn(patient_icn):
+            md = ResponseMetadata(
+                request_id=f"req_{int(start_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=0,
+                    start_time=start_time,
+                    end_time=start_time,
+                ),
+                station=StationMetadata(station_number=station),
+                demographics=DemographicsMetadata(patient_icn=patient_icn),
+            )
+            return SnapshotResponse(
+                success=False,
+                error=f"Invalid patient ICN: {patient_icn}",
+                metadata=md,
+            )
+
+        try:
+            # Get patient data once for every domain
+            station_errors: dict[str, str] = {}
+            if stations:
+                federated = await get_patient_data_federated(
+                    vista_client, [station, *stations], patient_icn, caller_duz
+                )
+                station_errors = federated.errors
+                if federated.data is None:
+                    raise VistaAPIError(
+                        error_type="FederatedFetchError",
+                        error_code="NO_STATION_DATA",
+                        message="No station returned patient data: "
+                        + "; ".join(f"{s}: {e}" for s, e in station_errors.items()),
+                        status_code=502,
+                    )
+                patient_data = federated.data
+            else:
+                patient_data = await get_patient_data(
+                    vista_client, station, patient_icn, caller_duz
+                )
+
+            slices, total_available, errors = build_domain_slices(patient_data, domains)
+
+            # Build typed metadata inline
+            end_time = datetime.now(UTC)
+            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            rpc_details = RpcCallMetadata(
+                rpc="VPR GET PATIENT DATA JSON",
+                context="LHS RPC CONTEXT",
+                parameters=build_icn_only_named_array_param(patient_icn),
+                duz=caller_duz,
+            )
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=duration_ms,
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+                rpc=rpc_details,
+                demographics=DemographicsMetadata.from_patient_demographics(
+                    patient_data.demographics,
+                ),
+            )
+
+            return SnapshotResponse(
+                success=True,
+                data=SnapshotResponseData.model_validate(
+                    {
+                        **slices,
+                        "total_available": total_available,
+                        "errors": errors,
+                        "item_stations": slice_item_stations(
+                            slices, patient_data.item_stations
+                        ),
+                        "station_errors": station_errors,
+                    }
+                ),
+                metadata=md,
+            ).project(fields)
+
+        except Exception as e:
+            logger.exception("Unexpected error in get_patient_snapshot")
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return SnapshotResponse(
+                success=False,
+                error=f"Unexpected error: {str(e)}",
+                metadata=md,
+            )
@@ -6,6 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, flag, paginate
 from ...models.patient.treatment import TreatmentStatusFilter
 from ...models.responses.metadata import (
     DemographicsMetadata,
@@ -15,24 +17,90 @@ from ...models.responses.metadata import (
     RpcCallMetadata,
     StationMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     TreatmentsResponse,
     TreatmentsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
 
 logger = get_logger(__name__)
 
+# Treatment flag each status filter selects on
+TREATMENT_STATUS_FLAGS = {
+    TreatmentStatusFilter.ACTIVE: "is_active",
+    TreatmentStatusFilter.COMPLETED: "is_completed",
+    TreatmentStatusFilter.PLANNED: "is_scheduled",
+}
+
+
+def build_treatments_data(
+    patient_data: PatientDataCollection,
+    status_filter: TreatmentStatusFilter | None = None,
+    days_back: Annotated[int, Field(ge=1, le=3650)] = 30,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[TreatmentsResponseData, int]:
+    """
+    Filter, page and summarize a patient's treatments
+
+    Args:
+        patient_data: Patient data collection
+        status_filter: Only active, completed or planned treatments
+        days_back: Only treatments in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching treatments
+    """
+    # Get treatments in the days_back window from patient data
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    query = Query(
+        flag(TREATMENT_STATUS_FLAGS[status_filter] if status_filter else None),
+        since=cutoff_date,
+    )
+    treatments = query.all(patient_data.treatments_by_time, pin)
+
+    # Apply pagination
+    treatments_page, total_treatments_after_filtering = paginate(
+        treatments, offset, limit
+    )
+
+    # Build summary data using the full filtered treatments list (not just the page)
+    # This gives users complete statistics across all matching results
+
+    # Get UIDs directly with single comprehensions over full filtered results
+    active_treatments_uids = [t.uid for t in treatments if t.is_active]
+    completed_treatments_uids = [t.uid for t in treatments if t.is_completed]
+    scheduled_treatments_uids = [t.uid for t in treatments if t.is_scheduled]
+
+    # Group by status
+    by_status: dict[str, int] = {}
+    for treatment in treatments:
+        status = str(treatment.status) if treatment.status else "unknown"
+        by_status[status] = by_status.get(status, 0) + 1
+
+    data = TreatmentsResponseData(
+        treatments=treatments_page,
+        active_treatments=sorted(active_treatments_uids),
+        completed_treatments=sorted(completed_treatments_uids),
+        scheduled_treatments=sorted(scheduled_treatments_uids),
+        by_status=by_status,
+    )
+    return data, total_treatments_after_filtering
+
 
 def register_get_patient_treatments_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_treatments tool with the MCP server"""
@@ -45,6 +113,8 @@ def register_get_patient_treatments_tool(mcp: FastMCP, vista_client: BaseVistaCl
         days_back: Annotated[int, Field(default=30, ge=1, le=3650)] = 30,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> TreatmentsResponse:
         """Get patient treatments with status, complexity, and outcome information."""
@@ -80,40 +150,26 @@ def register_get_patient_treatments_tool(mcp: FastMCP, vista_client: BaseVistaCl
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Get treatments from patient data
-            treatments = patient_data.treatments
-
-            # Apply days_back filter to scope treatments by date
-            cutoff_date = start_time - timedelta(days=days_back)
-            treatments = [t for t in treatments if t.date >= cutoff_date]
-
-            # Apply filters
-            if status_filter:
-                if status_filter == TreatmentStatusFilter.ACTIVE:
-                    treatments = [t for t in treatments if t.is_active]
-                elif status_filter == TreatmentStatusFilter.COMPLETED:
-                    treatments = [t for t in treatments if t.is_completed]
-                elif status_filter == TreatmentStatusFilter.PLANNED:
-                    treatments = [t for t in treatments if t.is_scheduled]
-
-            # Apply pagination
-            treatments_page, total_treatments_after_filtering = paginate_list(
-                treatments, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_treatments",
+                {
+                    "status_filter": status_filter,
+                    "days_back": days_back,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
             )
 
-            # Build summary data using the full filtered treatments list (not just the page)
-            # This gives users complete statistics across all matching results
-
-            # Get UIDs directly with single comprehensions over full filtered results
-            active_treatments_uids = [t.uid for t in treatments if t.is_active]
-            completed_treatments_uids = [t.uid for t in treatments if t.is_completed]
-            scheduled_treatments_uids = [t.uid for t in treatments if t.is_scheduled]
-
-            # Group by status
-            by_status: dict[str, int] = {}
-            for treatment in treatments:
-                status = str(treatment.status) if treatment.status else "unknown"
-                by_status[status] = by_status.get(status, 0) + 1
+            data, total_treatments_after_filtering = build_treatments_data(
+                patient_data,
+                status_filter=status_filter,
+                days_back=days_back,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
+            )
 
             # Build typed metadata inline
             end_time = datetime.now(UTC)
@@ -138,29 +194,37 @@ def register_get_patient_treatments_tool(mcp: FastMCP, vista_client: BaseVistaCl
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_treatments_after_filtering,
-                    returned=len(treatments_page),
-                    offset=offset,
+                    returned=len(data.treatments),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_treatments",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = TreatmentsResponseData(
-                treatments=treatments_page,
-                active_treatments=sorted(active_treatments_uids),
-                completed_treatments=sorted(completed_treatments_uids),
-                scheduled_treatments=sorted(scheduled_treatments_uids),
-                by_status=by_status,
-            )
-
             return TreatmentsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return TreatmentsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.error(
                 f"[DEBUG] Exception in get_patient_treatments: {type(e).__name__}: {str(e)}"
@@ -0,0 +1,175 @@
+"""Get patient vital sign and lab trends tool for MCP server"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Literal
+
+from fastmcp import Context, FastMCP
+from pydantic import Field
+
+from ...models.patient import NumericSeries, PatientDataCollection
+from ...models.patient.trends import summarize_series
+from ...models.responses.metadata import (
+    DemographicsMetadata,
+    PerformanceMetrics,
+    ResponseMetadata,
+    RpcCallMetadata,
+    StationMetadata,
+    TrendsFiltersMetadata,
+)
+from ...models.responses.projection import ItemFields
+from ...models.responses.tool_responses import (
+    TrendsResponse,
+    TrendsResponseData,
+)
+from ...services.data import get_patient_data
+from ...services.rpc import build_icn_only_named_array_param
+from ...services.validators import validate_icn
+from ...utils import (
+    get_default_duz,
+    get_default_station,
+    get_logger,
+    resolve_vista_context,
+)
+from ...vista.base import BaseVistaClient
+
+logger = get_logger(__name__)
+
+
+def build_trends_data(
+    patient_data: PatientDataCollection,
+    domain: Literal["vitals", "labs"] | None = None,
+    type_name: str | None = None,
+    days_back: Annotated[int, Field(ge=0)] = 365,
+) -> tuple[TrendsResponseData, int]:
+    """
+    Summarize a patient's numeric vital and lab series
+
+    Args:
+        patient_data: Patient data collection
+        domain: Only vitals or only labs
+        type_name: Substring of the type name
+        days_back: Only values observed in the last days_back days
+
+    Returns:
+        Response data and the number of summarized series
+    """
+    series: list[NumericSeries] = []
+    if domain in (None, "vitals"):
+        series.extend(patient_data.vital_signs_numeric)
+    if domain in (None, "labs"):
+        series.extend(patient_data.lab_results_numeric)
+    if type_name:
+        series = [s for s in series if type_name.upper() in s.name.upper()]
+
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    trends = summarize_series(series, since=cutoff_date)
+    return TrendsResponseData(trends=trends), len(trends)
+
+
+def register_get_patient_trends_tool(mcp: FastMCP, vista_client: BaseVistaClient):
+    """Register the get_patient_trends tool with the MCP server"""
+
+    @mcp.tool()
+    async def get_patient_trends(
+        patient_icn: str,
+        station: str | None = None,
+        domain: Literal["vitals", "labs"] | None = None,
+        type_name: str | None = None,
+        days_back: Annotated[int, Field(default=365, ge=0)] = 365,
+        fields: ItemFields = None,
+        ctx: Context | None = None,
+    ) -> TrendsResponse:
+        """Summarize how patient vital signs and lab values have trended over a window.
+
+        Returns per-type min/max/mean, slope per year, change from the first value
+        in the window and out-of-range streaks instead of raw results. Blood
+        pressure is reported as separate systolic and diastolic series. type_name
+        matches any part of the type name (e.g. "A1C", "BLOOD PRESSURE").
+        """
+        start_time = datetime.now(UTC)
+        station, caller_duz = resolve_vista_context(
+            ctx,
+            station_arg=station,
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+
+        # Validate ICN
+        if not validate_icn(patient_icn):
+            md = ResponseMetadata(
+                request_id=f"req_{int(start_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=0,
+                    start_time=start_time,
+                    end_time=start_time,
+                ),
+                station=StationMetadata(station_number=station),
+                demographics=DemographicsMetadata(patient_icn=patient_icn),
+            )
+            return TrendsResponse(
+                success=False,
+                error=f"Invalid patient ICN: {patient_icn}",
+                metadata=md,
+            )
+
+        try:
+            # Get patient data (handles caching internally)
+            patient_data = await get_patient_data(
+                vista_client, station, patient_icn, caller_duz
+            )
+
+            data, _ = build_trends_data(
+                patient_data, domain=domain, type_name=type_name, days_back=days_back
+            )
+
+            # Build typed metadata inline
+            end_time = datetime.now(UTC)
+            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            rpc_details = RpcCallMetadata(
+                rpc="VPR GET PATIENT DATA JSON",
+                context="LHS RPC CONTEXT",
+                parameters=build_icn_only_named_array_param(patient_icn),
+                duz=caller_duz,
+            )
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=duration_ms,
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+                rpc=rpc_details,
+                demographics=DemographicsMetadata.from_patient_demographics(
+                    patient_data.demographics,
+                ),
+                filters=TrendsFiltersMetadata(
+                    domain=domain,
+                    type_name=type_name,
+                    days_back=days_back,
+                ),
+            )
+
+            return TrendsResponse(
+                success=True,
+                data=data,
+                metadata=md,
+            ).project(fields)
+
+        except Exception as e:
+            logger.exception("Unexpected error in get_patient_trends")
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return TrendsResponse(
+                success=False,
+                error=f"Unexpected error: {str(e)}",
+                metadata=md,
+            )
@@ -6,7 +6,9 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from ...models.patient import PatientDataCollection
 from ...models.patient.base import FacilityInfo
+from ...models.patient.query import Query, equals, paginate
 from ...models.patient.visits import VisitSummary
 from ...models.responses.metadata import (
     DemographicsMetadata,
@@ -17,15 +19,15 @@ from ...models.responses.metadata import (
     StationMetadata,
     VisitsFiltersMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import VisitsResponse, VisitsResponseData
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -33,6 +35,78 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_visits_data(
+    patient_data: PatientDataCollection,
+    visit_type: str = "",
+    active_only: bool = False,
+    days_back: Annotated[int, Field(ge=1, le=1095)] = 365,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[VisitsResponseData, int]:
+    """
+    Filter, page and summarize a patient's visits
+
+    Args:
+        patient_data: Patient data collection
+        visit_type: Visit type (case-insensitive)
+        active_only: Only visits with an active status
+        days_back: Only visits in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching visits
+    """
+    # Visits in the date range, newest first
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+    query = Query(
+        equals("visit_type", visit_type, ignore_case=True),
+        equals("status_code", "active" if active_only else None, ignore_case=True),
+        since=cutoff_date,
+    )
+    visits = query.all(patient_data.visits_by_time, pin)
+
+    # Apply pagination
+    visits_page, total_visits_after_filtering = paginate(visits, offset, limit)
+
+    # Build visits summary with actual data from visits
+    # Extract unique visit types from visits
+    unique_visit_types = list(
+        {visit.visit_type for visit in visits if visit.visit_type}
+    )
+
+    # Extract unique facilities from visits
+    unique_facilities = {}
+    for visit in visits:
+        if visit.facility_code and visit.facility_name:
+            unique_facilities[visit.facility_code] = visit.facility_name
+
+    facility_infos = [
+        FacilityInfo(code=str(code), name=name)
+        for code, name in unique_facilities.items()
+    ]
+
+    visits_summary = VisitSummary(
+        total_visits=total_visits_after_filtering,
+        last_visit=visits[0].visit_date if visits else None,
+        visit_types=unique_visit_types,
+        facilities=facility_infos,
+    )
+
+    response_data = VisitsResponseData(
+        summary=visits_summary,
+        all_visits=visits_page,
+        filters={
+            "visit_type": visit_type,
+            "active_only": active_only,
+            "days_back": days_back,
+        },
+    )
+    return response_data, total_visits_after_filtering
+
+
 async def get_patient_visits_impl(
     patient_icn: str,
     vista_client: BaseVistaClient,
@@ -42,6 +116,7 @@ async def get_patient_visits_impl(
     days_back: int = 365,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
     ctx: Context | None = None,
 ) -> VisitsResponse:
     """Get patient visit history with location and duration data."""
@@ -100,79 +175,33 @@ async def get_patient_visits_impl(
             caller_duz,
         )
 
-        # Filter visits
-        visits = patient_data.visits
-
-        # Filter by visit type
-        if visit_type:
-            visits = [
-                v
-                for v in visits
-                if (
-                    hasattr(v.visit_type, "value")
-                    and v.visit_type.value.lower() == visit_type.lower()
-                )
-                or (
-                    isinstance(v.visit_type, str)
-                    and v.visit_type.lower() == visit_type.lower()
-                )
-            ]
-
-        # Filter by active status
-        if active_only:
-            visits = [
-                v for v in visits if v.status_code and v.status_code.lower() == "active"
-            ]
-
-        # Filter by date range
-        cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
-        visits = [v for v in visits if v.visit_date and v.visit_date >= cutoff_date]
-
-        # Apply pagination
-        visits_page, total_visits_after_filtering = paginate_list(visits, offset, limit)
-
-        # Use the paginated visits for the response
-        visit_summaries = visits_page
-
-        # Calculate end time and duration
-        end_time = datetime.now(UTC)
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
-
-        # Build visits summary with actual data from visits
-        # Extract unique visit types from visits
-        unique_visit_types = list(
-            {visit.visit_type for visit in visits if visit.visit_type}
-        )
-
-        # Extract unique facilities from visits
-        unique_facilities = {}
-        for visit in visits:
-            if visit.facility_code and visit.facility_name:
-                unique_facilities[visit.facility_code] = visit.facility_name
-
-        facility_infos = [
-            FacilityInfo(code=str(code), name=name)
-            for code, name in unique_facilities.items()
-        ]
-
-        visits_summary = VisitSummary(
-            total_visits=total_visits_after_filtering,
-            last_visit=visits[0].visit_date if visits else None,
-            visit_types=unique_visit_types,
-            facilities=facility_infos,
-        )
-
-        # Build response data
-        response_data = VisitsResponseData(
-            summary=visits_summary,
-            all_visits=visit_summaries,
-            filters={
+        pin = ResultPin(
+            patient_data,
+            "get_patient_visits",
+            {
                 "visit_type": visit_type,
                 "active_only": active_only,
                 "days_back": days_back,
             },
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
+
+        response_data, total_visits_after_filtering = build_visits_data(
+            patient_data,
+            visit_type=visit_type,
+            active_only=active_only,
+            days_back=days_back,
+            offset=pin.offset,
+            limit=limit,
+            pin=pin,
         )
 
+        # Calculate end time and duration
+        end_time = datetime.now(UTC)
+        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
         # Build metadata
         metadata = ResponseMetadata(
             request_id=f"visits_{patient_icn}_{int(start_time.timestamp())}",
@@ -196,9 +225,10 @@ async def get_patient_visits_impl(
             ),
             pagination=PaginationMetadata(
                 total_available_items=total_visits_after_filtering,
-                returned=len(visits_page),
-                offset=offset,
+                returned=len(response_data.all_visits),
+                offset=pin.offset,
                 limit=limit,
+                next_cursor=pin.next_cursor,
                 tool_name="get_patient_visits",
                 patient_icn=patient_icn,
             ),
@@ -207,6 +237,22 @@ async def get_patient_visits_impl(
         # Build final response
         return VisitsResponse(success=True, data=response_data, metadata=metadata)
 
+    except CursorError as e:
+        end_time = datetime.now(UTC)
+        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
+        return VisitsResponse(
+            success=False,
+            error=str(e),
+            data=VisitsResponseData(summary=VisitSummary(total_visits=0)),
+            metadata=ResponseMetadata(
+                request_id=f"visits_{patient_icn}_{int(start_time.timestamp())}",
+                station=StationMetadata(station_number=station),
+                performance=PerformanceMetrics(
+                    duration_ms=duration_ms, start_time=start_time, end_time=end_time
+                ),
+            ),
+        )
     except Exception as e:
         logger.exception("Unexpected error in get_patient_visits")
         end_time = datetime.now(UTC)
@@ -238,10 +284,12 @@ def register_get_patient_visits_tool(mcp: FastMCP, vista_client: BaseVistaClient
         days_back: Annotated[int, Field(default=365, ge=1)] = 365,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=200, ge=1, le=200)] = 200,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> VisitsResponse:
         """Get patient visit history with location and duration data."""
-        return await get_patient_visits_impl(
+        response = await get_patient_visits_impl(
             patient_icn=patient_icn,
             station=station,
             visit_type=visit_type,
@@ -249,6 +297,8 @@ def register_get_patient_visits_tool(mcp: FastMCP, vista_client: BaseVistaClient
             days_back=days_back,
             offset=offset,
             limit=limit,
+            cursor=cursor,
             vista_client=vista_client,
             ctx=ctx,
         )
+        return response.project(fields)
@@ -6,7 +6,8 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from ...models.patient import VitalSign
+from ...models.patient import PatientDataCollection
+from ...models.patient.query import Query, equals, paginate
 from ...models.responses.metadata import (
     DemographicsMetadata,
     PaginationMetadata,
@@ -16,18 +17,18 @@ from ...models.responses.metadata import (
     StationMetadata,
     VitalsFiltersMetadata,
 )
+from ...models.responses.projection import ItemFields
 from ...models.responses.tool_responses import (
     VitalSignsResponse,
     VitalSignsResponseData,
 )
-from ...services.data import get_patient_data
+from ...services.data import CursorError, ResultPin, get_patient_data
 from ...services.rpc import build_icn_only_named_array_param
 from ...services.validators import validate_icn
 from ...utils import (
     get_default_duz,
     get_default_station,
     get_logger,
-    paginate_list,
     resolve_vista_context,
 )
 from ...vista.base import BaseVistaClient
@@ -35,6 +36,52 @@ from ...vista.base import BaseVistaClient
 logger = get_logger(__name__)
 
 
+def build_vitals_data(
+    patient_data: PatientDataCollection,
+    vital_type: str | None = None,
+    n_most_recent: Annotated[int | None, Field(ge=0)] = 3,
+    days_back: Annotated[int, Field(ge=0)] = 30,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1, le=200)] = 10,
+    pin: ResultPin | None = None,
+) -> tuple[VitalSignsResponseData, int]:
+    """
+    Filter and page a patient's vital signs
+
+    Args:
+        patient_data: Patient data collection
+        vital_type: Exact vital type name (case-insensitive)
+        n_most_recent: At most this many measurements per type (0/None for all)
+        days_back: Only measurements observed in the last days_back days
+        offset: Pagination offset
+        limit: Page size
+        pin: Pinned results for cursor paging (see ResultPin)
+
+    Returns:
+        Response data for the page and the total number of matching vitals
+    """
+    cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
+
+    of_type = equals("type_name", vital_type, ignore_case=True)
+
+    if n_most_recent:
+        # At most n per type, read from the pre-sorted per-type series
+        vitals = Query(since=cutoff_date).most_recent(
+            patient_data.vital_signs_by_type, n_most_recent, series=of_type, pin=pin
+        )
+        vitals_page, total_vitals_after_filtering = paginate(vitals, offset, limit)
+    else:
+        query = Query(of_type, since=cutoff_date)
+        vitals_page, total_vitals_after_filtering = query.page(
+            patient_data.vital_signs_by_time, offset, limit, pin
+        )
+
+    data = VitalSignsResponseData(
+        vital_signs=vitals_page,
+    )
+    return data, total_vitals_after_filtering
+
+
 def register_get_patient_vitals_tool(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register the get_patient_vitals tool with the MCP server"""
 
@@ -47,6 +94,8 @@ def register_get_patient_vitals_tool(mcp: FastMCP, vista_client: BaseVistaClient
         days_back: Annotated[int, Field(default=30, ge=0)] = 30,
         offset: Annotated[int, Field(default=0, ge=0)] = 0,
         limit: Annotated[int, Field(default=10, ge=1, le=200)] = 10,
+        cursor: str | None = None,
+        fields: ItemFields = None,
         ctx: Context | None = None,
     ) -> VitalSignsResponse:
         """Get patient vital signs with latest values and history."""
@@ -82,34 +131,27 @@ def register_get_patient_vitals_tool(mcp: FastMCP, vista_client: BaseVistaClient
                 vista_client, station, patient_icn, caller_duz
             )
 
-            # Filter vitals
-            cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
-            vitals = [v for v in patient_data.vital_signs if v.observed >= cutoff_date]
-
-            # Filter by type if specified
-            if vital_type:
-                vitals = [
-                    v for v in vitals if v.type_name.upper() == vital_type.upper()
-                ]
-
-            # group by type and have at most n per type, then flatten out.
-            # TODO: there are smarter ways to do this
-            if n_most_recent:
-                vitals_by_type: dict[str, list[VitalSign]] = {}
-                for vital_sign in vitals:
-                    vitals_list = vitals_by_type.setdefault(vital_sign.type_code, [])
-                    if len(vitals_list) < n_most_recent:
-                        vitals_list.append(vital_sign)
-
-            vitals = [
-                vital_sign
-                for vitals_list in vitals_by_type.values()
-                for vital_sign in vitals_list
-            ]
-
-            # Apply pagination
-            vitals_page, total_vitals_after_filtering = paginate_list(
-                vitals, offset, limit
+            pin = ResultPin(
+                patient_data,
+                "get_patient_vitals",
+                {
+                    "vital_type": vital_type,
+                    "n_most_recent": n_most_recent,
+                    "days_back": days_back,
+                },
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+            )
+
+            data, total_vitals_after_filtering = build_vitals_data(
+                patient_data,
+                vital_type=vital_type,
+                n_most_recent=n_most_recent,
+                days_back=days_back,
+                offset=pin.offset,
+                limit=limit,
+                pin=pin,
             )
 
             # Build typed metadata inline
@@ -139,25 +181,37 @@ def register_get_patient_vitals_tool(mcp: FastMCP, vista_client: BaseVistaClient
                 ),
                 pagination=PaginationMetadata(
                     total_available_items=total_vitals_after_filtering,
-                    returned=len(vitals_page),
-                    offset=offset,
+                    returned=len(data.vital_signs),
+                    offset=pin.offset,
                     limit=limit,
+                    next_cursor=pin.next_cursor,
                     tool_name="get_patient_vitals",
                     patient_icn=patient_icn,
                 ),
             )
 
-            # Build response data
-            data = VitalSignsResponseData(
-                vital_signs=vitals_page,
-            )
-
             return VitalSignsResponse(
                 success=True,
                 data=data,
                 metadata=md,
-            )
+            ).project(fields)
 
+        except CursorError as e:
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return VitalSignsResponse(
+                success=False,
+                error=str(e),
+                metadata=md,
+            )
         except Exception as e:
             logger.exception("Unexpected error in get_patient_vitals")
             end_time = datetime.now(UTC)
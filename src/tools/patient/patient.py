@@ -4,6 +4,7 @@ from fastmcp import FastMCP
 
 from ...vista.base import BaseVistaClient
 from .get_items_by_uid_tool import register_get_items_by_uid_tool
+from .get_panel_summary_tool import register_get_panel_summary_tool
 from .get_patient_allergies_tool import register_get_patient_allergies_tool
 from .get_patient_appointments_tool import register_get_patient_appointments_tool
 from .get_patient_consults_tool import register_get_patient_consults_tool
@@ -16,9 +17,12 @@ from .get_patient_orders import register_get_patient_orders_tool
 from .get_patient_povs_tool import register_get_patient_povs_tool
 from .get_patient_problems_tool import register_get_patient_problems_tool
 from .get_patient_procedures import register_get_patient_procedures_tool
+from .get_patient_snapshot_tool import register_get_patient_snapshot_tool
 from .get_patient_treatments_tool import register_get_patient_treatments_tool
+from .get_patient_trends_tool import register_get_patient_trends_tool
 from .get_patient_visits_tool import register_get_patient_visits_tool
 from .get_patient_vitals_tool import register_get_patient_vitals_tool
+from .search_patient_documents_tool import register_search_patient_documents_tool
 
 
 def register_patient_tools(mcp: FastMCP, vista_client: BaseVistaClient):
@@ -37,7 +41,11 @@ def register_patient_tools(mcp: FastMCP, vista_client: BaseVistaClient):
     register_get_patient_povs_tool(mcp, vista_client)
     register_get_patient_problems_tool(mcp, vista_client)
     register_get_patient_procedures_tool(mcp, vista_client)
+    register_get_patient_snapshot_tool(mcp, vista_client)
     register_get_patient_treatments_tool(mcp, vista_client)
+    register_get_patient_trends_tool(mcp, vista_client)
     register_get_patient_visits_tool(mcp, vista_client)
     register_get_items_by_uid_tool(mcp, vista_client)
+    register_get_panel_summary_tool(mcp, vista_client)
     register_get_patient_vitals_tool(mcp, vista_client)
+    register_search_patient_documents_tool(mcp, vista_client)
@@ -0,0 +1,164 @@
+"""Search patient documents tool for MCP server"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+from fastmcp import Context, FastMCP
+from pydantic import Field
+
+from ...models.patient.search import (
+    document_authors,
+    document_content,
+    document_title,
+    make_snippet,
+    tokenize,
+)
+from ...models.responses.metadata import (
+    DemographicsMetadata,
+    DocumentSearchFiltersMetadata,
+    PerformanceMetrics,
+    ResponseMetadata,
+    RpcCallMetadata,
+    StationMetadata,
+)
+from ...models.responses.projection import ItemFields
+from ...models.responses.tool_responses import (
+    DocumentSearchHit,
+    DocumentSearchResponse,
+    DocumentSearchResponseData,
+)
+from ...services.data import get_document_search_index, get_patient_data
+from ...services.rpc import build_icn_only_named_array_param
+from ...services.validators import validate_icn
+from ...utils import (
+    get_default_duz,
+    get_default_station,
+    get_logger,
+    resolve_vista_context,
+)
+from ...vista.base import BaseVistaClient
+
+logger = get_logger()
+
+
+def register_search_patient_documents_tool(mcp: FastMCP, vista_client: BaseVistaClient):
+    """Register the search_patient_documents tool with the MCP server"""
+
+    @mcp.tool()
+    async def search_patient_documents(
+        patient_icn: str,
+        query: Annotated[str, Field(min_length=1)],
+        station: str = "",
+        days_back: Annotated[int | None, Field(default=None, ge=1)] = None,
+        limit: Annotated[int, Field(default=10, ge=1, le=50)] = 10,
+        fields: ItemFields = None,
+        ctx: Context | None = None,
+    ) -> DocumentSearchResponse:
+        """Search patient notes and documents by text, title or author.
+
+        Returns ranked matches with a short snippet and the document UID; fetch the
+        full document with get_items_by_uid only if the snippet is not enough.
+        """
+        start_time = datetime.now(UTC)
+        station, caller_duz = resolve_vista_context(
+            ctx,
+            station_arg=station,
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+
+        # Validate ICN
+        if not validate_icn(patient_icn):
+            md = ResponseMetadata(
+                request_id=f"req_{int(start_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=0,
+                    start_time=start_time,
+                    end_time=start_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return DocumentSearchResponse(
+                success=False,
+                error=f"Invalid patient ICN: {patient_icn}",
+                metadata=md,
+            )
+
+        try:
+            # Get patient data (handles caching internally)
+            patient_data = await get_patient_data(
+                vista_client, station, patient_icn, caller_duz
+            )
+
+            index = await get_document_search_index(patient_data)
+            since = datetime.now(UTC) - timedelta(days=days_back) if days_back else None
+            ranked, total_matches = index.search(query, limit=limit, since=since)
+
+            # Snippets are only cut for the returned matches
+            terms = tokenize(query)
+            matches = [
+                DocumentSearchHit(
+                    uid=document.uid,
+                    title=document_title(document),
+                    document_type_name=document.document_type_name,
+                    reference_date_time=document.reference_date_time,
+                    authors=document_authors(document),
+                    score=round(score, 3),
+                    snippet=make_snippet(document_content(document), terms),
+                )
+                for document, score in ranked
+            ]
+
+            # Build typed metadata inline
+            end_time = datetime.now(UTC)
+            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            rpc_details = RpcCallMetadata(
+                rpc="VPR GET PATIENT DATA JSON",
+                context="LHS RPC CONTEXT",
+                parameters=build_icn_only_named_array_param(patient_icn),
+                duz=caller_duz,
+            )
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=duration_ms,
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+                rpc=rpc_details,
+                demographics=DemographicsMetadata.from_patient_demographics(
+                    patient_data.demographics,
+                ),
+                filters=DocumentSearchFiltersMetadata(
+                    query=query,
+                    days_back=days_back,
+                ),
+            )
+
+            return DocumentSearchResponse(
+                success=True,
+                data=DocumentSearchResponseData(
+                    total_matches=total_matches,
+                    matches=matches,
+                ),
+                metadata=md,
+            ).project(fields)
+
+        except Exception as e:
+            logger.exception("Unexpected error in search_patient_documents")
+            end_time = datetime.now(UTC)
+            md = ResponseMetadata(
+                request_id=f"req_{int(end_time.timestamp())}",
+                performance=PerformanceMetrics(
+                    duration_ms=int((end_time - start_time).total_seconds() * 1000),
+                    start_time=start_time,
+                    end_time=end_time,
+                ),
+                station=StationMetadata(station_number=station),
+            )
+            return DocumentSearchResponse(
+                success=False,
+                error=f"Unexpected error: {str(e)}",
+                metadata=md,
+            )
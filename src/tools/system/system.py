@@ -5,13 +5,16 @@ from typing import Any
 
 from fastmcp import Context, FastMCP
 
+from ...services.cache import get_tool_result_cache
 from ...services.parsers.vista import (
     parse_fileman_date,
 )
+from ...services.prewarm import get_prewarm_scheduler
 from ...services.rpc import (
     build_empty_params,
     build_single_string_param,
     execute_rpc,
+    execute_rpcs,
 )
 from ...utils import (
     get_default_duz,
@@ -23,6 +26,24 @@ from ...vista.base import BaseVistaClient
 logger = logging.getLogger(__name__)
 
 
+def _parse_heartbeat(result: str) -> bool:
+    """XWB IM HERE returns "1" when the connection is alive"""
+    return result == "1"
+
+
+def _parse_server_time(result: str) -> dict[str, Any]:
+    """Parse ORWU DT into ISO and FileMan forms"""
+    iso_datetime = parse_fileman_date(result.strip())
+    return {
+        "iso_datetime": iso_datetime,
+        "fileman_time": result.strip(),
+    }
+
+
+def _parse_server_version(result: str) -> str:
+    return result.strip()
+
+
 def register_system_tools(mcp: FastMCP, vista_client: BaseVistaClient):
     """Register system tools with the MCP server"""
 
@@ -44,7 +65,7 @@ def register_system_tools(mcp: FastMCP, vista_client: BaseVistaClient):
             vista_client=vista_client,
             rpc_name="XWB IM HERE",
             parameters=build_empty_params(),
-            parser=lambda result: result == "1",
+            parser=_parse_heartbeat,
             station=station,
             caller_duz=caller_duz,
             error_response_builder=lambda error, metadata: {
@@ -89,20 +110,12 @@ def register_system_tools(mcp: FastMCP, vista_client: BaseVistaClient):
             default_duz=get_default_duz,
         )
 
-        # Parser function that returns both parsed and raw values
-        def parse_server_time(result: str) -> dict[str, Any]:
-            iso_datetime = parse_fileman_date(result.strip())
-            return {
-                "iso_datetime": iso_datetime,
-                "fileman_time": result.strip(),
-            }
-
         # Execute RPC with standardized error handling
         rpc_result = await execute_rpc(
             vista_client=vista_client,
             rpc_name="ORWU DT",
             parameters=build_single_string_param(format),
-            parser=parse_server_time,
+            parser=_parse_server_time,
             station=station,
             caller_duz=caller_duz,
             error_response_builder=lambda error, metadata: {
@@ -147,7 +160,7 @@ def register_system_tools(mcp: FastMCP, vista_client: BaseVistaClient):
             vista_client=vista_client,
             rpc_name="ORWU VERSRV",
             parameters=build_empty_params(),
-            parser=lambda result: result.strip(),
+            parser=_parse_server_version,
             station=station,
             caller_duz=caller_duz,
             error_response_builder=lambda error, metadata: {
@@ -171,3 +184,82 @@ def register_system_tools(mcp: FastMCP, vista_client: BaseVistaClient):
             "version": version,
             "metadata": metadata,
         }
+
+    @mcp.tool()
+    async def get_system_status(
+        station: str | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Check Vista connection, server time and version in one call.
+
+        Also reports the tool result cache: its size and per-tool hit rates,
+        and cache prewarming progress when it runs in this process.
+        """
+        station, caller_duz = resolve_vista_context(
+            ctx,
+            station_arg=station,
+            default_station=get_default_station,
+            default_duz=get_default_duz,
+        )
+
+        # The three RPCs are independent, so send them concurrently
+        heartbeat_result, time_result, version_result = await execute_rpcs(
+            vista_client=vista_client,
+            requests=[
+                {
+                    "rpc_name": "XWB IM HERE",
+                    "parameters": build_empty_params(),
+                    "parser": _parse_heartbeat,
+                },
+                {
+                    "rpc_name": "ORWU DT",
+                    "parameters": build_single_string_param("NOW"),
+                    "parser": _parse_server_time,
+                },
+                {
+                    "rpc_name": "ORWU VERSRV",
+                    "parameters": build_empty_params(),
+                    "parser": _parse_server_version,
+                },
+            ],
+            station=station,
+            caller_duz=caller_duz,
+            error_response_builder=lambda error, metadata: {
+                "error": error,
+                "metadata": metadata,
+            },
+        )
+
+        errors = {
+            name: rpc_result["error"]
+            for name, rpc_result in (
+                ("heartbeat", heartbeat_result),
+                ("server_time", time_result),
+                ("server_version", version_result),
+            )
+            if "error" in rpc_result
+        }
+
+        is_alive = "error" not in heartbeat_result and heartbeat_result["parsed_data"]
+        response: dict[str, Any] = {
+            "success": not errors,
+            "alive": is_alive,
+            "station": station,
+            "metadata": heartbeat_result["metadata"],
+        }
+        if "error" not in time_result:
+            time_data = time_result["parsed_data"]
+            response["server_time"] = (
+                time_data["iso_datetime"] or time_data["fileman_time"]
+            )
+            response["fileman_time"] = time_data["fileman_time"]
+        if "error" not in version_result:
+            response["version"] = version_result["parsed_data"]
+        if errors:
+            response["errors"] = errors
+        response["tool_result_cache"] = get_tool_result_cache().get_stats()
+        prewarm = get_prewarm_scheduler()
+        if prewarm is not None:
+            response["prewarm"] = prewarm.get_stats()
+
+        return response
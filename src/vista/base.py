@@ -1,8 +1,11 @@
 """Base abstract class for Vista API clients"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..config import RPC_BULK_MAX_CONCURRENCY
+
 
 class BaseVistaClient(ABC):
     """Abstract base class for Vista API clients"""
@@ -44,6 +47,34 @@ class BaseVistaClient(ABC):
         """
         pass
 
+    async def invoke_many(
+        self,
+        calls: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """
+        Invoke several Vista RPCs concurrently
+
+        Args:
+            calls: invoke_rpc keyword arguments, one dict per call
+            max_concurrency: Maximum calls in flight (default: RPC_BULK_MAX_CONCURRENCY)
+
+        Returns:
+            One entry per call, in order - the RPC response, or the exception
+            the call raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or RPC_BULK_MAX_CONCURRENCY)
+
+        async def _invoke(call: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.invoke_rpc(**call)
+
+        return list(
+            await asyncio.gather(
+                *(_invoke(call) for call in calls), return_exceptions=True
+            )
+        )
+
     @abstractmethod
     async def close(self) -> None:
         """Close any open connections"""
@@ -1,19 +1,40 @@
 """Vista API X client wrapper with authentication and caching"""
 
-import hashlib
+import asyncio
+import contextlib
 import json
 import logging
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
 from cachetools import TTLCache
 
+from ..config import RPC_BULK_MAX_CONCURRENCY
 from ..services.cache.base import CacheBackend
 from ..services.cache.factory import CacheFactory
+from ..services.cache.negative import NegativeCache
+from ..services.deadline import (
+    DeadlineExceededError,
+    check_deadline,
+    clamp_timeout,
+    get_deadline,
+    mark_exhausted,
+    run_with_deadline,
+    should_skip_optional,
+)
+from ..services.rpc.parameter_builder import build_rpc_cache_key
 from .auth.jwt import get_token_ttl_seconds, has_token_expired
 from .base import BaseVistaClient, VistaAPIError
+from .retry import (
+    LatencyTracker,
+    RetryPolicy,
+    RetryPolicyRegistry,
+    build_default_retry_registry,
+    is_retryable_error,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +51,8 @@ class VistaAPIClient(BaseVistaClient):
         token_cache_ttl: int = 3300,  # 55 minutes
         response_cache_ttl: int = 300,  # 5 minutes
         response_cache_backend: CacheBackend | None = None,
+        retry_policies: RetryPolicyRegistry | None = None,
+        negative_cache: NegativeCache | None = None,
     ):
         """
         Initialize Vista API client
@@ -42,6 +65,8 @@ class VistaAPIClient(BaseVistaClient):
             token_cache_ttl: JWT token cache TTL in seconds
             response_cache_ttl: Response cache TTL in seconds
             response_cache_backend: Optional cache backend for responses (uses Redis if available)
+            retry_policies: Per-RPC retry/hedging policies (defaults from config)
+            negative_cache: Cache of recent permanent RPC failures (defaults from config)
         """
         super().__init__(timeout)
         self.base_url = base_url.rstrip("/")
@@ -67,6 +92,13 @@ class VistaAPIClient(BaseVistaClient):
                 f"Using {type(self.response_cache_backend).__name__} for response caching"
             )
 
+        # Recent not-found/forbidden/RPC fault errors, so retry loops fail fast
+        self.negative_cache = negative_cache or NegativeCache()
+
+        # Retry and hedging policies keyed by RPC name
+        self.retry_policies = retry_policies or build_default_retry_registry()
+        self._latency_tracker = LatencyTracker()
+
         self._token: str | None = None
         self._token_expiry: datetime | None = None
 
@@ -103,6 +135,7 @@ class VistaAPIClient(BaseVistaClient):
                 f"{self.auth_url}/vista-api-x/auth/token",
                 json={"key": self.api_key},
                 headers={"Content-Type": "application/json"},
+                timeout=clamp_timeout(self.timeout),
             )
             response.raise_for_status()
 
@@ -173,6 +206,8 @@ class VistaAPIClient(BaseVistaClient):
         json_result: bool = False,
         use_cache: bool = True,
         client_jwt: str | None = None,
+        bypass_negative_cache: bool = False,
+        use_negative_cache: bool = True,
     ) -> Any:
         """
         Invoke a Vista RPC
@@ -186,6 +221,10 @@ class VistaAPIClient(BaseVistaClient):
             json_result: Whether to request JSON response
             use_cache: Whether to use response cache
             client_jwt: JWT token from client (when USE_CLIENT_JWT=true)
+            bypass_negative_cache: Re-send the RPC even if it recently failed
+                with a cached error (e.g. an explicit retry)
+            use_negative_cache: Check and record failures in the negative cache
+                (off for callers that negative-cache the result themselves)
 
         Returns:
             RPC response (string or dict depending on RPC and json_result)
@@ -194,22 +233,146 @@ class VistaAPIClient(BaseVistaClient):
         if not self._cache_initialized:
             await self._ensure_cache_initialized()
 
-        # Create cache key using deterministic hash
-        # Use MD5 for speed (not for security, just for cache key generation)
-        param_hash = hashlib.md5(
-            json.dumps(parameters, sort_keys=True).encode()
-        ).hexdigest()[
-            :16
-        ]  # Use first 16 chars of hash for brevity
-        cache_key = f"{station}:{caller_duz}:{rpc_name}:{param_hash}"
+        # Keys are only needed for caching; use_cache=False skips both the
+        # response cache and the negative cache
+        cache_key = (
+            self._make_cache_key(station, caller_duz, rpc_name, parameters)
+            if use_cache
+            else None
+        )
 
         # Check cache if enabled
-        if use_cache:
+        if cache_key is not None:
             cached_response = await self._get_cached_response(cache_key)
             if cached_response is not None:
                 logger.debug(f"Using cached response for {rpc_name}")
                 return cached_response
 
+        return await self._fetch_rpc(
+            cache_key,
+            station=station,
+            caller_duz=caller_duz,
+            rpc_name=rpc_name,
+            context=context,
+            parameters=parameters,
+            json_result=json_result,
+            use_cache=use_cache,
+            client_jwt=client_jwt,
+            bypass_negative_cache=bypass_negative_cache,
+            use_negative_cache=use_negative_cache,
+        )
+
+    async def invoke_many(
+        self,
+        calls: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """
+        Invoke several RPCs concurrently
+
+        Cache lookups for all calls are batched into one get_many, and the
+        service JWT is obtained once before the uncached calls fan out.
+
+        Args:
+            calls: invoke_rpc keyword arguments for each call
+            max_concurrency: Maximum calls in flight (default RPC_BULK_MAX_CONCURRENCY)
+
+        Returns:
+            Result or raised exception for each call, in the same order as calls
+        """
+        if not self._cache_initialized:
+            await self._ensure_cache_initialized()
+
+        results: list[Any] = [None] * len(calls)
+        cache_keys: list[str | None] = [
+            (
+                self._make_cache_key(
+                    call.get("station", ""),
+                    call.get("caller_duz", ""),
+                    call.get("rpc_name", ""),
+                    call.get("parameters"),
+                )
+                if call.get("use_cache", True)
+                else None
+            )
+            for call in calls
+        ]
+
+        # One batched cache read for every call that allows caching
+        cached = await self._get_cached_responses(
+            [key for key in cache_keys if key is not None]
+        )
+        pending: list[int] = []
+        for i, cache_key in enumerate(cache_keys):
+            if cache_key is not None and cache_key in cached:
+                results[i] = cached[cache_key]
+            else:
+                pending.append(i)
+
+        # Share one token fetch instead of every call racing to refresh it
+        if any(not calls[i].get("client_jwt") for i in pending):
+            try:
+                await self._ensure_valid_token()
+            except Exception as e:
+                for i in [i for i in pending if not calls[i].get("client_jwt")]:
+                    results[i] = e
+                pending = [i for i in pending if calls[i].get("client_jwt")]
+
+        semaphore = asyncio.Semaphore(max_concurrency or RPC_BULK_MAX_CONCURRENCY)
+
+        async def fetch(index: int) -> None:
+            async with semaphore:
+                try:
+                    results[index] = await self._fetch_rpc(
+                        cache_keys[index], **calls[index]
+                    )
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(*(fetch(i) for i in pending))
+        return results
+
+    def _make_cache_key(
+        self,
+        station: str,
+        caller_duz: str,
+        rpc_name: str,
+        parameters: list[dict[str, Any]] | None,
+    ) -> str:
+        """Create cache key (reuses the fragment precomputed by parameter builders)"""
+        return build_rpc_cache_key(station, caller_duz, rpc_name, parameters)
+
+    async def _fetch_rpc(
+        self,
+        cache_key: str | None,
+        station: str,
+        caller_duz: str,
+        rpc_name: str,
+        context: str = "OR CPRS GUI CHART",
+        parameters: list[dict[str, Any]] | None = None,
+        json_result: bool = False,
+        use_cache: bool = True,
+        client_jwt: str | None = None,
+        bypass_negative_cache: bool = False,
+        use_negative_cache: bool = True,
+    ) -> Any:
+        """
+        Send an RPC that missed the response cache and cache its result
+
+        A cache_key of None (use_cache=False) skips all caching, including
+        the negative cache.
+        """
+        negative_key = cache_key if use_negative_cache else None
+
+        # Fail fast if this exact call recently failed with a permanent error
+        if negative_key is not None and not bypass_negative_cache:
+            cached_error = self.negative_cache.get(negative_key)
+            if cached_error is not None:
+                logger.info(
+                    f"Negative cache hit for {rpc_name}: {cached_error.error_type}"
+                )
+                raise cached_error
+
         # Determine which JWT to use based on configuration
         if client_jwt:
             # USE_CLIENT_JWT mode: use client-provided JWT
@@ -257,31 +420,45 @@ class VistaAPIClient(BaseVistaClient):
         logger.debug(f"Invoking RPC: {rpc_name} at station {station}")
 
         try:
-            response = await self.client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-
-            # Extract result
-            data = response.json()
-            logger.debug(
-                f"RPC_RESPONSE_DATA: {json.dumps({'has_payload': 'payload' in data, 'data_keys': list(data.keys()) if isinstance(data, dict) else 'not_dict'})}"
+            result = await self._post_with_retry(
+                url, payload, headers, rpc_name, self.retry_policies.get(rpc_name)
             )
 
-            # Vista API X returns the result in different formats
-            if "payload" in data:
-                result = data["payload"]
-                # Some RPCs return result wrapped in another layer
-                if isinstance(result, dict) and "result" in result:
-                    result = result["result"]
-            else:
-                result = data
-
-            # Cache successful response
-            if use_cache:
+            # Cache successful response (optional work, skipped near the deadline)
+            if cache_key is not None and not should_skip_optional(
+                "response_cache_write"
+            ):
                 await self._set_cached_response(cache_key, result)
+            if negative_key is not None and bypass_negative_cache:
+                self.negative_cache.invalidate(negative_key)
 
             logger.debug(f"RPC {rpc_name} completed successfully")
             return result
 
+        except VistaAPIError as e:
+            logger.error(f"Error invoking RPC {rpc_name}: {str(e)}")
+            if negative_key is not None:
+                self.negative_cache.put(negative_key, e)
+            raise
+        except Exception as e:
+            logger.error(f"Error invoking RPC {rpc_name}: {str(e)}")
+            raise
+
+    async def _post_rpc(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        rpc_name: str,
+        timeout: float,
+    ) -> Any:
+        """Send a single RPC request and extract its result"""
+        started = time.monotonic()
+        try:
+            response = await self.client.post(
+                url, json=payload, headers=headers, timeout=timeout
+            )
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"RPC invocation failed: {e.response.status_code} - {e.response.text}"
@@ -289,12 +466,6 @@ class VistaAPIClient(BaseVistaClient):
             # Parse error response
             try:
                 error_data = e.response.json()
-                raise VistaAPIError(
-                    error_type=error_data.get("errorType", "Unknown"),
-                    error_code=error_data.get("errorCode", ""),
-                    message=error_data.get("message", str(e)),
-                    status_code=e.response.status_code,
-                )
             except Exception:
                 raise VistaAPIError(
                     error_type="HTTPError",
@@ -302,9 +473,159 @@ class VistaAPIClient(BaseVistaClient):
                     message=str(e),
                     status_code=e.response.status_code,
                 ) from e
-        except Exception as e:
-            logger.error(f"Error invoking RPC {rpc_name}: {str(e)}")
-            raise
+            raise VistaAPIError(
+                error_type=error_data.get("errorType", "Unknown"),
+                error_code=error_data.get("errorCode", ""),
+                message=error_data.get("message", str(e)),
+                status_code=e.response.status_code,
+            ) from e
+
+        self._latency_tracker.record(rpc_name, time.monotonic() - started)
+
+        # Extract result
+        data = response.json()
+        logger.debug(
+            f"RPC_RESPONSE_DATA: {json.dumps({'has_payload': 'payload' in data, 'data_keys': list(data.keys()) if isinstance(data, dict) else 'not_dict'})}"
+        )
+
+        # Vista API X returns the result in different formats
+        if "payload" in data:
+            result = data["payload"]
+            # Some RPCs return result wrapped in another layer
+            if isinstance(result, dict) and "result" in result:
+                result = result["result"]
+        else:
+            result = data
+
+        return result
+
+    async def _post_with_retry(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        rpc_name: str,
+        policy: RetryPolicy,
+    ) -> Any:
+        """
+        Send an RPC request, retrying transient failures per the RPC's policy
+
+        Non-idempotent RPCs are sent exactly once. Idempotent RPCs are retried
+        with jittered exponential backoff until they succeed, fail with a
+        non-retryable error, run out of attempts or exhaust the policy deadline.
+        """
+        deadline = (
+            time.monotonic() + policy.deadline_seconds
+            if policy.deadline_seconds
+            else None
+        )
+        stage = f"http:{rpc_name}"
+        attempt = 0
+        while True:
+            attempt += 1
+            check_deadline(stage)
+            timeout = self.timeout
+            if deadline is not None:
+                timeout = max(min(timeout, deadline - time.monotonic()), 0.001)
+            # Never wait longer than the caller's request deadline allows
+            timeout = max(clamp_timeout(timeout) or 0.0, 0.001)
+
+            try:
+                if policy.idempotent and policy.hedge:
+                    return await self._post_hedged(
+                        url, payload, headers, rpc_name, policy, timeout
+                    )
+                return await self._post_rpc(url, payload, headers, rpc_name, timeout)
+            except Exception as e:
+                request_deadline = get_deadline()
+                if (
+                    isinstance(e, httpx.TimeoutException)
+                    and request_deadline is not None
+                    and request_deadline.expired
+                ):
+                    mark_exhausted(stage)
+                    raise DeadlineExceededError(
+                        stage, request_deadline.budget_ms
+                    ) from e
+
+                if (
+                    not policy.idempotent
+                    or attempt >= policy.max_attempts
+                    or not is_retryable_error(e)
+                ):
+                    raise
+
+                delay = policy.backoff_delay(attempt)
+                if (deadline is not None and time.monotonic() + delay >= deadline) or (
+                    request_deadline is not None
+                    and delay >= request_deadline.remaining()
+                ):
+                    logger.warning(
+                        f"RPC {rpc_name} retry deadline exhausted after {attempt} attempts"
+                    )
+                    raise
+
+                logger.warning(
+                    f"RPC {rpc_name} attempt {attempt} failed ({e}), retrying in {delay * 1000:.0f}ms"
+                )
+                await asyncio.sleep(delay)
+
+    async def _post_hedged(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        rpc_name: str,
+        policy: RetryPolicy,
+        timeout: float,
+    ) -> Any:
+        """
+        Send an RPC request and a duplicate once the first exceeds the observed
+        latency quantile; the first successful answer wins
+        """
+        hedge_delay = self._latency_tracker.quantile(rpc_name, policy.hedge_quantile)
+        if hedge_delay is None:
+            # Not enough history yet to know what "slow" means
+            return await self._post_rpc(url, payload, headers, rpc_name, timeout)
+        hedge_delay = max(hedge_delay, policy.hedge_min_delay_seconds)
+        if hedge_delay >= timeout:
+            return await self._post_rpc(url, payload, headers, rpc_name, timeout)
+
+        primary = asyncio.create_task(
+            self._post_rpc(url, payload, headers, rpc_name, timeout)
+        )
+        pending: set[asyncio.Task[Any]] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            logger.debug(
+                f"Hedging RPC {rpc_name} after {hedge_delay * 1000:.0f}ms without a response"
+            )
+            pending.add(
+                asyncio.create_task(
+                    self._post_rpc(
+                        url, payload, headers, rpc_name, timeout - hedge_delay
+                    )
+                )
+            )
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task_error = task.exception()
+                    if task_error is None:
+                        return task.result()
+                    error = task_error
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _ensure_cache_initialized(self):
         """Initialize cache backend if needed (lazy initialization for async)"""
@@ -338,7 +659,9 @@ class VistaAPIClient(BaseVistaClient):
         if self.response_cache_backend:
             # Using CacheBackend (Redis/etc)
             try:
-                cached_value = await self.response_cache_backend.get(cache_key)
+                cached_value = await run_with_deadline(
+                    "response_cache_read", self.response_cache_backend.get(cache_key)
+                )
                 if cached_value:
                     # Deserialize if it's a string (Redis stores as string)
                     if isinstance(cached_value, str):
@@ -350,11 +673,42 @@ class VistaAPIClient(BaseVistaClient):
             except Exception as e:
                 logger.warning(f"Error getting cached response: {e}")
                 return None
-        elif self._ttl_response_cache:
+        elif self._ttl_response_cache is not None:
             # Using in-memory TTLCache
             return self._ttl_response_cache.get(cache_key)
         return None
 
+    async def _get_cached_responses(self, cache_keys: list[str]) -> dict[str, Any]:
+        """Get several responses from cache in one round trip where supported"""
+        if not cache_keys:
+            return {}
+        if self.response_cache_backend:
+            try:
+                cached_values = await run_with_deadline(
+                    "response_cache_read",
+                    self.response_cache_backend.get_many(cache_keys),
+                )
+            except Exception as e:
+                logger.warning(f"Error getting cached responses: {e}")
+                return {}
+            responses: dict[str, Any] = {}
+            for key, cached_value in cached_values.items():
+                if not cached_value:
+                    continue
+                # Deserialize if it's a string (Redis stores as string)
+                if isinstance(cached_value, str):
+                    with contextlib.suppress(json.JSONDecodeError):
+                        cached_value = json.loads(cached_value)
+                responses[key] = cached_value
+            return responses
+        elif self._ttl_response_cache is not None:
+            return {
+                key: self._ttl_response_cache[key]
+                for key in cache_keys
+                if key in self._ttl_response_cache
+            }
+        return {}
+
     async def _set_cached_response(self, cache_key: str, value: Any):
         """Set response in cache (handles both TTLCache and CacheBackend)"""
         if self.response_cache_backend:
@@ -370,7 +724,7 @@ class VistaAPIClient(BaseVistaClient):
                 )
             except Exception as e:
                 logger.warning(f"Error caching response: {e}")
-        elif self._ttl_response_cache:
+        elif self._ttl_response_cache is not None:
             # Using in-memory TTLCache
             self._ttl_response_cache[cache_key] = value
             logger.debug("Cached response in TTLCache")
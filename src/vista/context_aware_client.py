@@ -37,8 +37,6 @@ class ContextAwareVistaClient(BaseVistaClient):
     ) -> Any:
         """Invoke RPC with automatic client JWT handling"""
 
-        client_jwt = None
-
         logger.info(
             f"CONTEXT_AWARE_CLIENT_DEBUG: {json.dumps({
             'USE_CLIENT_JWT': USE_CLIENT_JWT,
@@ -48,39 +46,9 @@ class ContextAwareVistaClient(BaseVistaClient):
         })}"
         )
 
-        if USE_CLIENT_JWT:
-            # Get JWT from context variable
-            client_jwt = current_jwt.get()
-
-            logger.info(
-                f"CLIENT_JWT_CHECK: {json.dumps({
-                'client_jwt_present': bool(client_jwt),
-                'client_jwt_length': len(client_jwt) if client_jwt else 0
-            })}"
-            )
-
-            if not client_jwt:
-                raise ToolError(
-                    "Authentication required: No JWT token provided in authorization header. "
-                    "Please include 'Authorization: Bearer <token>' in your request."
-                )
-
-            # Validate JWT is not expired (30 second buffer for clock skew)
-            if has_token_expired(client_jwt, buffer_seconds=30):
-                raise ToolError(
-                    "Authentication failed: JWT token has expired. "
-                    "Please refresh your token and retry."
-                )
-
-            # Pass JWT to the wrapped client
+        client_jwt = self._resolve_client_jwt()
+        if client_jwt:
             kwargs["client_jwt"] = client_jwt
-            logger.info(
-                f"CLIENT_JWT_PASSED: {json.dumps({'client_jwt_passed_to_wrapped': True})}"
-            )
-        else:
-            logger.info(
-                f"CLIENT_JWT_MODE: {json.dumps({'USE_CLIENT_JWT': False, 'mode': 'service_to_service'})}"
-            )
 
         # Delegate to wrapped client
         logger.info(
@@ -97,6 +65,68 @@ class ContextAwareVistaClient(BaseVistaClient):
             **kwargs,
         )
 
+    async def invoke_many(
+        self,
+        calls: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """Invoke several RPCs concurrently, all using the caller's JWT"""
+        client_jwt = self._resolve_client_jwt()
+        if client_jwt:
+            calls = [{**call, "client_jwt": client_jwt} for call in calls]
+
+        logger.info(
+            f"INVOKING_MANY_WITH: {json.dumps({'calls': len(calls), 'has_client_jwt': bool(client_jwt)})}"
+        )
+        return await self.wrapped_client.invoke_many(
+            calls, max_concurrency=max_concurrency
+        )
+
+    def _resolve_client_jwt(self) -> str | None:
+        """
+        Get the caller's JWT from context when USE_CLIENT_JWT is enabled
+
+        Returns:
+            The client JWT, or None in service-to-service mode
+
+        Raises:
+            ToolError: If the JWT is missing or expired
+        """
+        if not USE_CLIENT_JWT:
+            logger.info(
+                f"CLIENT_JWT_MODE: {json.dumps({'USE_CLIENT_JWT': False, 'mode': 'service_to_service'})}"
+            )
+            return None
+
+        # Get JWT from context variable
+        client_jwt = current_jwt.get()
+
+        logger.info(
+            f"CLIENT_JWT_CHECK: {json.dumps({
+            'client_jwt_present': bool(client_jwt),
+            'client_jwt_length': len(client_jwt) if client_jwt else 0
+        })}"
+        )
+
+        if not client_jwt:
+            raise ToolError(
+                "Authentication required: No JWT token provided in authorization header. "
+                "Please include 'Authorization: Bearer <token>' in your request."
+            )
+
+        # Validate JWT is not expired (30 second buffer for clock skew)
+        if has_token_expired(client_jwt, buffer_seconds=30):
+            raise ToolError(
+                "Authentication failed: JWT token has expired. "
+                "Please refresh your token and retry."
+            )
+
+        # Pass JWT to the wrapped client
+        logger.info(
+            f"CLIENT_JWT_PASSED: {json.dumps({'client_jwt_passed_to_wrapped': True})}"
+        )
+        return client_jwt
+
     async def close(self) -> None:
         """Close the wrapped client"""
         await self.wrapped_client.close()
@@ -0,0 +1,178 @@
+"""Retry and hedging policies for Vista RPC invocations"""
+
+import random
+from collections import deque
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..config import (
+    RPC_HEDGE_MIN_DELAY_MS,
+    RPC_HEDGING_ENABLED,
+    RPC_RETRY_BASE_DELAY_MS,
+    RPC_RETRY_DEADLINE_SECONDS,
+    RPC_RETRY_ENABLED,
+    RPC_RETRY_MAX_ATTEMPTS,
+    RPC_RETRY_MAX_DELAY_MS,
+)
+from .base import VistaAPIError
+
+# RPCs that only read data and can safely be sent more than once
+IDEMPOTENT_RPCS = frozenset(
+    {
+        "VPR GET PATIENT DATA JSON",
+        "XWB IM HERE",
+        "ORWU DT",
+    }
+)
+
+# Vista API X error types that indicate a transient VistaLink problem
+RETRYABLE_ERROR_TYPES = frozenset({"VistaLinkFault"})
+
+# HTTP status codes worth retrying (throttling and upstream failures)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy(BaseModel):
+    """Retry and hedging behavior for a single RPC"""
+
+    model_config = ConfigDict(frozen=True)
+
+    idempotent: bool = Field(
+        default=False, description="Whether the RPC may be sent more than once"
+    )
+    max_attempts: int = Field(default=1, ge=1, description="Total attempts allowed")
+    base_delay_seconds: float = Field(
+        default=0.1, ge=0, description="Backoff delay before the first retry"
+    )
+    max_delay_seconds: float = Field(
+        default=2.0, ge=0, description="Upper bound for a single backoff delay"
+    )
+    deadline_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        description="Total time budget for all attempts (None = unbounded)",
+    )
+    hedge: bool = Field(
+        default=False, description="Send a duplicate request when the first is slow"
+    )
+    hedge_quantile: float = Field(
+        default=0.95, gt=0, lt=1, description="Latency quantile that triggers a hedge"
+    )
+    hedge_min_delay_seconds: float = Field(
+        default=0.05, ge=0, description="Floor for the hedge trigger delay"
+    )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter
+
+        Args:
+            attempt: Number of attempts already made (1 for the first retry)
+
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        ceiling = min(
+            self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempt - 1))
+        )
+        return random.uniform(0, ceiling)
+
+
+class RetryPolicyRegistry:
+    """Retry policies keyed by RPC name, with a default for unknown RPCs"""
+
+    def __init__(
+        self,
+        default: RetryPolicy | None = None,
+        policies: dict[str, RetryPolicy] | None = None,
+    ):
+        """
+        Initialize registry
+
+        Args:
+            default: Policy for RPCs without an explicit entry (no retries)
+            policies: Initial RPC name to policy mapping
+        """
+        self.default = default or RetryPolicy()
+        self._policies: dict[str, RetryPolicy] = dict(policies or {})
+
+    def register(self, rpc_name: str, policy: RetryPolicy) -> None:
+        """Register (or replace) the policy for an RPC"""
+        self._policies[rpc_name] = policy
+
+    def get(self, rpc_name: str) -> RetryPolicy:
+        """Get the policy for an RPC, falling back to the default"""
+        return self._policies.get(rpc_name, self.default)
+
+    def __contains__(self, rpc_name: str) -> bool:
+        return rpc_name in self._policies
+
+
+class LatencyTracker:
+    """Sliding window of successful RPC latencies used to time hedged requests"""
+
+    def __init__(self, window: int = 256, min_samples: int = 20):
+        """
+        Initialize tracker
+
+        Args:
+            window: Number of recent samples kept per RPC
+            min_samples: Samples required before a quantile is reported
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, rpc_name: str, seconds: float) -> None:
+        """Record a successful call duration"""
+        samples = self._samples.get(rpc_name)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._samples[rpc_name] = samples
+        samples.append(seconds)
+
+    def quantile(self, rpc_name: str, q: float) -> float | None:
+        """
+        Get a latency quantile for an RPC
+
+        Returns:
+            Latency in seconds, or None if not enough samples were recorded
+        """
+        samples = self._samples.get(rpc_name)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check whether an RPC failure is transient and worth retrying"""
+    if isinstance(error, VistaAPIError):
+        return (
+            error.error_type in RETRYABLE_ERROR_TYPES
+            or error.status_code in RETRYABLE_STATUS_CODES
+        )
+    # Connection resets, DNS failures and timeouts
+    return isinstance(error, httpx.TransportError)
+
+
+def build_default_retry_registry() -> RetryPolicyRegistry:
+    """Build the registry from configuration, covering the idempotent RPCs"""
+    registry = RetryPolicyRegistry()
+    if not RPC_RETRY_ENABLED:
+        return registry
+
+    idempotent_policy = RetryPolicy(
+        idempotent=True,
+        max_attempts=RPC_RETRY_MAX_ATTEMPTS,
+        base_delay_seconds=RPC_RETRY_BASE_DELAY_MS / 1000,
+        max_delay_seconds=RPC_RETRY_MAX_DELAY_MS / 1000,
+        deadline_seconds=RPC_RETRY_DEADLINE_SECONDS,
+        hedge=RPC_HEDGING_ENABLED,
+        hedge_min_delay_seconds=RPC_HEDGE_MIN_DELAY_MS / 1000,
+    )
+    for rpc_name in IDEMPOTENT_RPCS:
+        registry.register(rpc_name, idempotent_policy)
+    return registry
@@ -0,0 +1,147 @@
+"""Integration tests for get_panel_summary tool."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.patient.clinical import LabResult
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.models.responses.tool_responses import PanelSummaryResponse
+from src.vista.base import BaseVistaClient, VistaAPIError
+
+MODULE = "src.tools.patient.get_panel_summary_tool"
+
+LOADED_ICN = "1008684701V329302"
+FAILED_ICN = "1000000219V596118"
+INVALID_ICN = "not-an-icn"
+
+
+def make_patient_data(icn: str) -> PatientDataCollection:
+    """Create patient data with two of three glucose results abnormal."""
+    now = datetime.now(UTC)
+    labs = [
+        LabResult(
+            uid=f"urn:va:lab:84F0:237:{index}",
+            localId=str(index),
+            typeCode="urn:va:ien:60:175:72",
+            typeName="GLUCOSE",
+            displayName="GLU",
+            result=str(result),
+            units="mg/dL",
+            low="70",
+            high="110",
+            interpretationCode=(
+                "urn:hl7:observation-interpretation:H" if result > 110 else None
+            ),
+            observed=now - timedelta(days=index),
+            resulted=now - timedelta(days=index),
+            facilityCode="500",
+            facilityName="CAMP MASTER",
+            statusCode="urn:va:lab-status:completed",
+            statusName="completed",
+        )
+        for index, result in enumerate([95, 140, 180])
+    ]
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=icn,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        lab_results_dict={lab.uid: lab for lab in labs},
+        source_station="84F0",
+        source_icn=icn,
+    )
+
+
+@pytest.fixture
+def panel_tool(monkeypatch):
+    """Register the tool against mocked data and return its function."""
+    calls = []
+
+    async def _mock_get_patient_data_many(vista_client, station, icns, duz):
+        calls.append(list(icns))
+        return {
+            icn: (
+                make_patient_data(icn)
+                if icn == LOADED_ICN
+                else VistaAPIError("NotFound", "PATIENT_NOT_FOUND", "gone", 404)
+            )
+            for icn in icns
+        }
+
+    monkeypatch.setattr(f"{MODULE}.get_patient_data_many", _mock_get_patient_data_many)
+    monkeypatch.setattr(f"{MODULE}.validate_icn", lambda icn: icn != INVALID_ICN)
+    monkeypatch.setattr(f"{MODULE}.get_default_station", lambda: "84F0")
+    monkeypatch.setattr(f"{MODULE}.get_default_duz", lambda: "123")
+
+    from src.tools.patient.get_panel_summary_tool import (
+        register_get_panel_summary_tool,
+    )
+    from src.tools.patient.get_patient_snapshot_tool import SnapshotQuery
+
+    registered_func = None
+
+    class MockMCP:
+        def tool(self, name=None, description=None):
+            def decorator(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return decorator
+
+    register_get_panel_summary_tool(MockMCP(), MagicMock(spec=BaseVistaClient))
+
+    async def call(patient_icns, domains, **kwargs):
+        return await registered_func(
+            patient_icns=patient_icns,
+            domains=[SnapshotQuery(**domain) for domain in domains],
+            **kwargs,
+        )
+
+    call.data_calls = calls
+    return call
+
+
+class TestGetPanelSummaryToolIntegration:
+    """Integration tests for get_panel_summary tool."""
+
+    @pytest.mark.asyncio
+    async def test_mixed_panel(self, panel_tool):
+        """Test that each patient succeeds or fails on its own."""
+        result = await panel_tool(
+            [LOADED_ICN, FAILED_ICN, INVALID_ICN],
+            [{"domain": "labs", "filters": {"abnormal_only": True}}],
+        )
+
+        assert isinstance(result, PanelSummaryResponse)
+        assert result.success is True
+        assert panel_tool.data_calls == [[LOADED_ICN, FAILED_ICN]]
+        loaded, failed, invalid = result.data.patients
+        assert loaded.success is True
+        assert loaded.demographics.patient_icn == LOADED_ICN
+        assert loaded.domains["labs"]["total"] == 2
+        assert loaded.domains["labs"]["abnormal_count"] == 2
+        assert "labs" not in loaded.domains["labs"]
+        assert failed.success is False
+        assert "gone" in failed.error
+        assert invalid.error == f"Invalid patient ICN: {INVALID_ICN}"
+        assert result.data.failed_count == 2
+
+    @pytest.mark.asyncio
+    async def test_all_patients_failed(self, panel_tool):
+        """Test that the call fails only when no patient loads."""
+        result = await panel_tool([FAILED_ICN, INVALID_ICN], [{"domain": "vitals"}])
+
+        assert result.success is False
+        assert result.error == "No patient in the panel could be loaded"
+        assert result.data.failed_count == 2
@@ -0,0 +1,218 @@
+"""Integration tests for get_patient_snapshot tool."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.patient.clinical import LabResult, VitalSign
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.models.responses.tool_responses import SnapshotResponse
+from src.services.data import FederatedPatientData
+from src.vista.base import BaseVistaClient
+
+MODULE = "src.tools.patient.get_patient_snapshot_tool"
+
+
+@pytest.fixture
+def mock_patient_data():
+    """Create patient data with recent labs and vitals."""
+    now = datetime.now(UTC)
+    demographics = PatientDemographics(
+        uid="urn:va:patient:84F0:237",
+        dfn="237",
+        pid="84F0;237",
+        icn="1008684701V329302",
+        fullName="PATIENT,TEST",
+        familyName="PATIENT",
+        givenNames="TEST",
+        displayName="PATIENT,TEST",
+        genderCode="M",
+        genderName="Male",
+        dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+        ssn="666001001",
+        sensitive=False,
+        deceased=False,
+    )
+    labs = [
+        LabResult(
+            uid=f"urn:va:lab:84F0:237:{index}",
+            localId=str(index),
+            typeCode="urn:va:ien:60:175:72",
+            typeName="GLUCOSE",
+            displayName="GLU",
+            result=str(result),
+            units="mg/dL",
+            low="70",
+            high="110",
+            interpretationCode=(
+                "urn:hl7:observation-interpretation:H" if result > 110 else None
+            ),
+            observed=now - timedelta(days=index),
+            resulted=now - timedelta(days=index),
+            facilityCode="500",
+            facilityName="CAMP MASTER",
+            statusCode="urn:va:lab-status:completed",
+            statusName="completed",
+        )
+        for index, result in enumerate([95, 140, 180])
+    ]
+    vitals = [
+        VitalSign(
+            uid=f"urn:va:vital:84F0:237:{index}",
+            localId=str(index),
+            typeCode="urn:va:vuid:4500639",
+            typeName="PULSE",
+            displayName="P",
+            result="72",
+            observed=now - timedelta(days=index),
+            resulted=now - timedelta(days=index),
+            facilityCode="500",
+            facilityName="CAMP MASTER",
+        )
+        for index in range(2)
+    ]
+    return PatientDataCollection(
+        demographics=demographics,
+        lab_results_dict={lab.uid: lab for lab in labs},
+        vital_signs_dict={vital.uid: vital for vital in vitals},
+        source_station="84F0",
+        source_icn="1008684701V329302",
+    )
+
+
+@pytest.fixture
+def snapshot_tool(mock_patient_data, monkeypatch):
+    """Register the tool against mocked data and return its function."""
+    calls = []
+
+    async def _mock_get_patient_data(vista_client, station, icn, duz):
+        calls.append(icn)
+        return mock_patient_data
+
+    monkeypatch.setattr(f"{MODULE}.get_patient_data", _mock_get_patient_data)
+    monkeypatch.setattr(f"{MODULE}.validate_icn", lambda icn: True)
+    monkeypatch.setattr(f"{MODULE}.get_default_station", lambda: "84F0")
+    monkeypatch.setattr(f"{MODULE}.get_default_duz", lambda: "123")
+
+    from src.tools.patient.get_patient_snapshot_tool import (
+        SnapshotQuery,
+        register_get_patient_snapshot_tool,
+    )
+
+    registered_func = None
+
+    class MockMCP:
+        def tool(self, name=None, description=None):
+            def decorator(func):
+                nonlocal registered_func
+                registered_func = func
+                return func
+
+            return decorator
+
+    register_get_patient_snapshot_tool(MockMCP(), MagicMock(spec=BaseVistaClient))
+
+    async def call(domains, **kwargs):
+        return await registered_func(
+            patient_icn="1008684701V329302",
+            domains=[SnapshotQuery(**domain) for domain in domains],
+            **kwargs,
+        )
+
+    call.data_calls = calls
+    return call
+
+
+class TestGetPatientSnapshotToolIntegration:
+    """Integration tests for get_patient_snapshot tool."""
+
+    @pytest.mark.asyncio
+    async def test_multiple_domains_one_lookup(self, snapshot_tool):
+        """Test that all domains are served from a single data lookup."""
+        result = await snapshot_tool(
+            [
+                {"domain": "labs", "filters": {"abnormal_only": True}},
+                {"domain": "vitals", "filters": {"n_most_recent": 0}},
+                {"domain": "allergies"},
+            ]
+        )
+
+        assert isinstance(result, SnapshotResponse)
+        assert result.success is True
+        assert snapshot_tool.data_calls == ["1008684701V329302"]
+        assert [lab.result for lab in result.data.labs.labs] == ["140", "180"]
+        assert result.data.labs.abnormal_count == 2
+        assert len(result.data.vitals.vital_signs) == 2
+        assert result.data.allergies.allergies == []
+        assert result.data.total_available == {"labs": 2, "vitals": 2, "allergies": 0}
+        assert result.data.medications is None
+        assert result.metadata.demographics.patient_icn == "1008684701V329302"
+
+    @pytest.mark.asyncio
+    async def test_limit_and_offset(self, snapshot_tool):
+        """Test per-domain pagination."""
+        result = await snapshot_tool(
+            [
+                {
+                    "domain": "labs",
+                    "filters": {"n_most_recent": 0},
+                    "offset": 1,
+                    "limit": 1,
+                }
+            ]
+        )
+
+        assert [lab.result for lab in result.data.labs.labs] == ["140"]
+        assert result.data.total_available == {"labs": 3}
+
+    @pytest.mark.asyncio
+    async def test_invalid_filters_reported_per_domain(self, snapshot_tool):
+        """Test that bad filters fail only their own domain."""
+        result = await snapshot_tool(
+            [
+                {"domain": "labs", "filters": {"bogus": True}},
+                {"domain": "vitals", "limit": 500},
+                {"domain": "vitals"},
+                {"domain": "orders"},
+            ]
+        )
+
+        assert result.success is True
+        assert set(result.data.errors) == {"labs", "vitals"}
+        assert "bogus" in result.data.errors["labs"]
+        assert "limit" in result.data.errors["vitals"]
+        assert result.data.orders is not None
+
+    @pytest.mark.asyncio
+    async def test_federated_stations(
+        self, snapshot_tool, mock_patient_data, monkeypatch
+    ):
+        """Test that stations merges sites and reports the ones left out."""
+        mock_patient_data.item_stations = {
+            uid: "500" if uid.endswith(":0") else "501"
+            for uid in mock_patient_data.all_items
+        }
+        requested = []
+
+        async def _mock_federated(vista_client, stations, icn, duz):
+            requested.append(stations)
+            return FederatedPatientData(mock_patient_data, {"502": "timed out"})
+
+        monkeypatch.setattr(f"{MODULE}.get_patient_data_federated", _mock_federated)
+
+        result = await snapshot_tool(
+            [{"domain": "labs", "filters": {"n_most_recent": 0}}],
+            stations=["501", "502"],
+        )
+
+        assert result.success is True
+        assert requested == [["84F0", "501", "502"]]
+        assert snapshot_tool.data_calls == []
+        assert result.data.item_stations == {
+            "urn:va:lab:84F0:237:0": "500",
+            "urn:va:lab:84F0:237:1": "501",
+            "urn:va:lab:84F0:237:2": "501",
+        }
+        assert result.data.station_errors == {"502": "timed out"}
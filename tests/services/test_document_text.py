@@ -0,0 +1,157 @@
+"""Tests for document text bodies cached out of line"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pydantic_core
+import pytest
+from fastmcp import Client, FastMCP
+
+from src.models.patient import Document, PatientDataCollection, PatientDemographics
+from src.models.patient.document import text_ref
+from src.services.cache.base import PatientDataCache
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.cache.negative import NegativeCache
+from src.services.data import patient_data
+from src.tools.patient.get_patient_documents import (
+    register_get_patient_documents_tool,
+)
+
+ICN = "1008684701V329302"
+LONG_NOTE = "Patient seen for follow-up. " * 20 + "Warfarin dose adjusted."
+
+
+def make_document(index: int, content: str) -> Document:
+    uid = f"urn:va:document:500:{index}"
+    return Document(
+        uid=uid,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+        documentClass="PROGRESS NOTES",
+        documentTypeCode="PN",
+        documentTypeName="Progress Note",
+        localTitle="PRIMARY CARE NOTE",
+        referenceDateTime=datetime(2025, 6, 1, tzinfo=UTC),
+        statusName="COMPLETED",
+        text=[{"uid": uid, "content": content, "status": "COMPLETED"}],
+    )
+
+
+def make_collection() -> PatientDataCollection:
+    documents = [
+        make_document(1, LONG_NOTE),
+        make_document(2, LONG_NOTE),
+        make_document(3, "Short note."),
+    ]
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=ICN,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        documents_dict={document.uid: document for document in documents},
+        source_station="500",
+        source_icn=ICN,
+    )
+
+
+@pytest.mark.asyncio
+class TestDocumentTextOutOfLine:
+    """Test offloading text bodies on cache write and loading them on demand"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self):
+        """Use a fresh in-memory patient cache for each test"""
+        self.backend = MemoryCacheBackend()
+        self.cache = PatientDataCache(self.backend)
+        with patch.object(patient_data, "_cache_instance", self.cache):
+            yield
+
+    async def test_cached_entry_holds_summary_and_shared_body(self):
+        """Test that long bodies are stored once by hash, short ones inline"""
+        collection = make_collection()
+        await patient_data._store_patient_data(
+            self.cache, "500", ICN, "123", collection
+        )
+
+        cached = await self.cache.get_patient_data("500", ICN, "123")
+        texts = [d["text"][0] for d in cached["documents_dict"].values()]
+        assert [text["content"] for text in texts] == ["", "", "Short note."]
+        assert texts[0]["content_ref"] == texts[1]["content_ref"] == text_ref(LONG_NOTE)
+        assert "content_ref" not in texts[2]
+        body_keys = [key for key in self.backend._cache if "document_text" in key]
+        assert len(body_keys) == 1
+
+        restored = patient_data._rehydrate(cached)
+        note = restored.documents_dict["urn:va:document:500:1"]
+        assert note.text_offloaded
+        assert note.content_summary == collection.documents[0].content_summary
+
+    async def test_loaded_documents_serialize_as_before(self):
+        """Test that on-demand loading restores the original documents"""
+        collection = make_collection()
+        await patient_data._store_patient_data(
+            self.cache, "500", ICN, "123", collection
+        )
+        restored = patient_data._rehydrate(
+            await self.cache.get_patient_data("500", ICN, "123")
+        )
+
+        loaded = await patient_data.load_document_text(restored.documents)
+
+        assert [d.text[0].content for d in loaded] == [
+            LONG_NOTE,
+            LONG_NOTE,
+            "Short note.",
+        ]
+        assert loaded[2] is restored.documents[2]
+        assert pydantic_core.to_json(loaded) == pydantic_core.to_json(
+            make_collection().documents
+        )
+        index = await patient_data.get_document_search_index(restored)
+        assert index.search("warfarin")[1] == 2
+
+    async def test_missing_body_keeps_summary(self):
+        """Test that an evicted body leaves the summary in place"""
+        await patient_data._store_patient_data(
+            self.cache, "500", ICN, "123", make_collection()
+        )
+        restored = patient_data._rehydrate(
+            await self.cache.get_patient_data("500", ICN, "123")
+        )
+        await self.backend.delete(f"document_text:v1:{text_ref(LONG_NOTE)}")
+
+        loaded = await patient_data.load_document_text(restored.documents[:1])
+
+        assert loaded[0].text_offloaded
+        assert loaded[0].content_summary.startswith("Patient seen for follow-up.")
+
+    async def test_summaries_do_not_depend_on_cache_state(self, mock_vista_client):
+        """Test that include_text=false returns the same documents cold and warm"""
+        mcp = FastMCP("test")
+        register_get_patient_documents_tool(mcp, mock_vista_client)
+        fetch = AsyncMock(side_effect=lambda **_: {"parsed_data": make_collection()})
+        arguments = {"patient_icn": ICN, "days_back": 36500, "include_text": False}
+
+        with (
+            patch.object(patient_data, "execute_rpc", fetch),
+            patch.object(patient_data, "_negative_cache", NegativeCache()),
+        ):
+            async with Client(mcp) as client:
+                cold = await client.call_tool("get_patient_documents", arguments)
+                warm = await client.call_tool("get_patient_documents", arguments)
+
+        assert fetch.await_count == 1
+        cold_documents = cold.structured_content["data"]["documents"]
+        assert cold_documents == warm.structured_content["data"]["documents"]
+        assert [d["text"][0]["content"] for d in cold_documents] == [
+            "",
+            "",
+            "Short note.",
+        ]
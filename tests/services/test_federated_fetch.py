@@ -0,0 +1,136 @@
+"""Tests for reading one patient from several stations"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.models.patient.clinical import LabResult
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.services.data import patient_data
+from src.vista.base import VistaAPIError
+
+ICN = "1008684701V329302"
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_collection(station: str, lab_ids: list[str]) -> PatientDataCollection:
+    """Collection with one glucose result per lab ID"""
+    labs = [
+        LabResult(
+            uid=f"urn:va:lab:84F0:237:{lab_id}",
+            localId=lab_id,
+            typeCode="urn:va:ien:60:175:72",
+            typeName="GLUCOSE",
+            displayName="GLU",
+            result=station,
+            units="mg/dL",
+            observed=NOW - timedelta(days=int(lab_id)),
+            resulted=NOW - timedelta(days=int(lab_id)),
+            facilityCode=station,
+            facilityName=f"STATION {station}",
+            statusCode="urn:va:lab-status:completed",
+            statusName="completed",
+        )
+        for lab_id in lab_ids
+    ]
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=ICN,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        lab_results_dict={lab.uid: lab for lab in labs},
+        source_station=station,
+        source_icn=ICN,
+        retrieved_at=NOW,
+    )
+
+
+class TestMerge:
+    """Test merging per-station collections"""
+
+    def test_dedupe_by_uid_and_tag_station(self):
+        """Test that the first station keeps shared UIDs and items are tagged"""
+        first = make_collection("500", ["1", "2"])
+        first.memoize_fragments()
+        second = make_collection("501", ["2", "3"])
+
+        merged = PatientDataCollection.merge({"500": first, "501": second})
+
+        assert [lab.result for lab in merged.lab_results] == ["500", "500", "501"]
+        assert merged.item_stations == {
+            "urn:va:lab:84F0:237:1": "500",
+            "urn:va:lab:84F0:237:2": "500",
+            "urn:va:lab:84F0:237:3": "501",
+        }
+        assert merged.total_items == 3
+        assert len(merged.lab_results_by_time) == 3
+        # Items keep their station's memoized fragments
+        assert merged.lab_results_dict["urn:va:lab:84F0:237:1"] is (
+            first.lab_results_dict["urn:va:lab:84F0:237:1"]
+        )
+
+
+@pytest.mark.asyncio
+class TestGetPatientDataFederated:
+    """Test concurrent station reads with partial results"""
+
+    async def test_partial_results_and_background_reads(self, mock_vista_client):
+        """Test that failed and slow stations are left out, slow reads finish"""
+        calls: list[str] = []
+        release = asyncio.Event()
+
+        async def _get_patient_data(vista_client, station, icn, duz):
+            calls.append(station)
+            if station == "501":
+                raise VistaAPIError("RpcFault", "PATIENT_NOT_FOUND", "gone", 404)
+            if station == "502":
+                await release.wait()
+            return make_collection(station, ["1"] if station == "500" else ["2"])
+
+        with patch.object(patient_data, "get_patient_data", _get_patient_data):
+            result = await patient_data.get_patient_data_federated(
+                mock_vista_client, ["500", "501", "502", "500"], ICN, "123", 0.05
+            )
+            assert result.data is not None
+            assert result.data.item_stations == {"urn:va:lab:84F0:237:1": "500"}
+            assert set(result.errors) == {"501", "502"}
+            assert "gone" in result.errors["501"]
+
+            # A repeat call joins the read still in flight
+            retry = asyncio.create_task(
+                patient_data.get_patient_data_federated(
+                    mock_vista_client, ["502"], ICN, "123", 1.0
+                )
+            )
+            await asyncio.sleep(0)
+            release.set()
+            result = await retry
+
+        assert calls == ["500", "501", "502"]
+        assert result.data is not None
+        assert result.errors == {}
+        assert patient_data._federated_reads == {}
+
+    async def test_no_station_answers(self, mock_vista_client):
+        """Test that data is None when every station fails"""
+
+        async def _get_patient_data(vista_client, station, icn, duz):
+            raise VistaAPIError("RpcFault", "PATIENT_NOT_FOUND", "gone", 404)
+
+        with patch.object(patient_data, "get_patient_data", _get_patient_data):
+            result = await patient_data.get_patient_data_federated(
+                mock_vista_client, ["500", "501"], ICN, "123"
+            )
+
+        assert result.data is None
+        assert set(result.errors) == {"500", "501"}
@@ -0,0 +1,203 @@
+"""Tests for negative caching of permanent Vista errors"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.services.cache.base import PatientDataCache
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.cache.negative import (
+    ERROR_CLASS_FORBIDDEN,
+    ERROR_CLASS_NOT_FOUND,
+    ERROR_CLASS_RPC_FAULT,
+    NegativeCache,
+    classify_error,
+)
+from src.services.data import patient_data
+from src.vista.base import VistaAPIError
+from src.vista.client import VistaAPIClient
+
+
+class TestNegativeCache:
+    """Test error classification and per-class TTLs"""
+
+    def test_classify_error(self):
+        """Test that only permanent errors are cacheable"""
+        assert (
+            classify_error(VistaAPIError("RpcFault", "X", "Patient not found", 400))
+            == ERROR_CLASS_NOT_FOUND
+        )
+        assert (
+            classify_error(VistaAPIError("SecurityFault", "X", "denied", 403))
+            == ERROR_CLASS_FORBIDDEN
+        )
+        assert (
+            classify_error(VistaAPIError("RpcFault", "X", "bad param", 400))
+            == ERROR_CLASS_RPC_FAULT
+        )
+        assert classify_error(VistaAPIError("VistaLinkFault", "X", "down", 500)) is None
+        assert (
+            classify_error(VistaAPIError("JwtException", "X", "expired", 401)) is None
+        )
+        assert (
+            classify_error(
+                VistaAPIError("SecurityFault", "JWT_EXPIRED", "Token expired", 401)
+            )
+            is None
+        )
+
+    def test_per_class_ttl(self):
+        """Test that each error class expires on its own TTL"""
+        cache = NegativeCache(
+            ttl_seconds={ERROR_CLASS_NOT_FOUND: 0.05, ERROR_CLASS_FORBIDDEN: 60}
+        )
+        assert cache.put("a", VistaAPIError("RpcFault", "X", "not found", 404))
+        assert cache.put("b", VistaAPIError("SecurityFault", "X", "denied", 403))
+        # No TTL configured for RPC faults, so they are not cached
+        assert not cache.put("c", VistaAPIError("RpcFault", "X", "bad", 400))
+
+        time.sleep(0.06)
+
+        assert cache.get("a") is None
+        cached = cache.get("b")
+        assert cached is not None
+        assert cached.error_type == "SecurityFault"
+        assert cache.get_stats()["classes"][ERROR_CLASS_FORBIDDEN]["hits"] == 1
+
+    def test_unauthorized_security_fault_not_cached(self):
+        """Test that a 401 SecurityFault does not block the patient after refresh"""
+        cache = NegativeCache()
+
+        assert not cache.put(
+            "a", VistaAPIError("SecurityFault", "INVALID_JWT", "Invalid token", 401)
+        )
+        assert cache.get("a") is None
+
+    def test_disabled(self):
+        """Test that nothing is cached when disabled"""
+        cache = NegativeCache(enabled=False)
+        assert not cache.put("a", VistaAPIError("SecurityFault", "X", "denied", 403))
+        assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+class TestClientNegativeCache:
+    """Test negative caching in VistaAPIClient.invoke_rpc"""
+
+    @pytest.fixture
+    def mock_httpx_client(self):
+        """Mock httpx client returning a security fault"""
+        client = AsyncMock()
+        response = Mock()
+        response.status_code = 403
+        response.text = "denied"
+        response.json = Mock(
+            return_value={
+                "errorType": "SecurityFault",
+                "errorCode": "ACCESS-DENIED",
+                "message": "Access denied",
+            }
+        )
+        response.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError(
+                "denied", request=Mock(), response=response
+            )
+        )
+        client.post.return_value = response
+        return client
+
+    @pytest.fixture
+    def vista_client(self, mock_httpx_client):
+        """Create Vista client with mocked httpx and a fixed token"""
+        with patch("src.vista.client.httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = mock_httpx_client
+            client = VistaAPIClient(
+                base_url="http://localhost:8888",
+                api_key="test-key",
+                auth_url="http://localhost:8888",
+                negative_cache=NegativeCache(),
+            )
+            client.client = mock_httpx_client
+            client._ensure_valid_token = AsyncMock(return_value="token")  # type: ignore[method-assign]
+            return client
+
+    async def test_forbidden_error_cached(self, vista_client, mock_httpx_client):
+        """Test that a repeated forbidden call does not reach Vista again"""
+        for _ in range(3):
+            with pytest.raises(VistaAPIError) as exc_info:
+                await vista_client.invoke_rpc("500", "123", "ORWPT SELECT")
+            assert exc_info.value.error_type == "SecurityFault"
+
+        assert mock_httpx_client.post.call_count == 1
+
+    async def test_bypass_flag_resends(self, vista_client, mock_httpx_client):
+        """Test that the bypass flag re-sends a call that recently failed"""
+        with pytest.raises(VistaAPIError):
+            await vista_client.invoke_rpc("500", "123", "ORWPT SELECT")
+        with pytest.raises(VistaAPIError):
+            await vista_client.invoke_rpc(
+                "500", "123", "ORWPT SELECT", bypass_negative_cache=True
+            )
+
+        assert mock_httpx_client.post.call_count == 2
+
+    async def test_caller_cached_rpc_skips_client_cache(
+        self, vista_client, mock_httpx_client
+    ):
+        """Test that use_negative_cache=False leaves failures to the caller"""
+        for _ in range(2):
+            with pytest.raises(VistaAPIError):
+                await vista_client.invoke_rpc(
+                    "500", "123", "ORWPT SELECT", use_negative_cache=False
+                )
+
+        stats = vista_client.negative_cache.get_stats()
+        assert mock_httpx_client.post.call_count == 2
+        assert stats["classes"][ERROR_CLASS_FORBIDDEN]["entries"] == 0
+
+
+@pytest.mark.asyncio
+class TestPatientDataNegativeCache:
+    """Test negative caching in get_patient_data"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_caches(self):
+        """Use fresh in-memory caches for each test"""
+        with (
+            patch.object(
+                patient_data,
+                "_cache_instance",
+                PatientDataCache(MemoryCacheBackend()),
+            ),
+            patch.object(patient_data, "_negative_cache", NegativeCache()),
+        ):
+            yield
+
+    async def test_patient_not_found_cached(self, mock_vista_client):
+        """Test that an unknown ICN is only looked up once"""
+        mock_vista_client.invoke_rpc.return_value = {"error": "Patient not found"}
+
+        for _ in range(3):
+            with pytest.raises(VistaAPIError) as exc_info:
+                await patient_data.get_patient_data(
+                    mock_vista_client, "500", "0000000000V000000", "123"
+                )
+            assert exc_info.value.status_code == 404
+
+        assert mock_vista_client.invoke_rpc.call_count == 1
+        # Cached per patient only, not again per RPC in the client
+        assert (
+            mock_vista_client.invoke_rpc.call_args.kwargs["use_negative_cache"] is False
+        )
+
+        with pytest.raises(VistaAPIError):
+            await patient_data.get_patient_data(
+                mock_vista_client,
+                "500",
+                "0000000000V000000",
+                "123",
+                bypass_negative_cache=True,
+            )
+        assert mock_vista_client.invoke_rpc.call_count == 2
@@ -0,0 +1,129 @@
+"""Tests for loading several patients with get_patient_data_many"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.services.cache.base import PatientDataCache
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.cache.negative import NegativeCache
+from src.services.data import patient_data
+from src.vista.base import VistaAPIError
+
+ICNS = [f"10000{index}0000V123456" for index in range(6)]
+
+
+def make_collection(icn: str) -> PatientDataCollection:
+    """Collection with demographics only"""
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=icn,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        source_station="500",
+        source_icn=icn,
+        retrieved_at=datetime(2025, 6, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+class TestGetPatientDataMany:
+    """Test batched cache reads and bounded concurrent fetches"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_caches(self):
+        """Use fresh in-memory caches for each test"""
+        self.cache = PatientDataCache(MemoryCacheBackend())
+        with (
+            patch.object(patient_data, "_cache_instance", self.cache),
+            patch.object(patient_data, "_negative_cache", NegativeCache()),
+            patch.object(patient_data, "_panel_fetch_slots", {}),
+        ):
+            yield
+
+    async def test_cached_and_fetched_patients(self, mock_vista_client):
+        """Test that cached patients skip VistA and the rest are fetched"""
+        await self.cache.set_patient_data(
+            "500", ICNS[0], "123", make_collection(ICNS[0]).model_dump(mode="json")
+        )
+        fetched = []
+
+        async def _fetch(vista_client, cache, station, icn, duz):
+            fetched.append(icn)
+            return make_collection(icn)
+
+        with patch.object(patient_data, "_fetch_patient_data", _fetch):
+            results = await patient_data.get_patient_data_many(
+                mock_vista_client, "500", [ICNS[1], ICNS[0], ICNS[1]], "123"
+            )
+
+        assert list(results) == [ICNS[1], ICNS[0]]
+        assert fetched == [ICNS[1]]
+        assert all(isinstance(data, PatientDataCollection) for data in results.values())
+        assert results[ICNS[0]].patient_icn == ICNS[0]
+
+    async def test_concurrency_bounded_and_failures_isolated(self, mock_vista_client):
+        """Test the in-flight cap and that one failure spares the others"""
+        in_flight = 0
+        peak = 0
+
+        async def _fetch(vista_client, cache, station, icn, duz):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if icn == ICNS[2]:
+                raise VistaAPIError("RPC_ERROR", "RPC_FAILED", "boom", 500)
+            return make_collection(icn)
+
+        with patch.object(patient_data, "_fetch_patient_data", _fetch):
+            results = await patient_data.get_patient_data_many(
+                mock_vista_client, "500", ICNS, "123", max_concurrency=2
+            )
+
+        assert peak == 2
+        assert isinstance(results[ICNS[2]], VistaAPIError)
+        assert (
+            sum(isinstance(data, PatientDataCollection) for data in results.values())
+            == 5
+        )
+
+    async def test_concurrent_panels_share_station_cap(self, mock_vista_client):
+        """Test that two panel loads of a station share its fetch slots"""
+        in_flight = 0
+        peak = 0
+
+        async def _fetch(vista_client, cache, station, icn, duz):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_collection(icn)
+
+        with (
+            patch.object(patient_data, "_fetch_patient_data", _fetch),
+            patch.object(patient_data, "PANEL_FETCH_MAX_CONCURRENCY", 2),
+        ):
+            await asyncio.gather(
+                patient_data.get_patient_data_many(
+                    mock_vista_client, "500", ICNS[:3], "123"
+                ),
+                patient_data.get_patient_data_many(
+                    mock_vista_client, "500", ICNS[3:], "123"
+                ),
+            )
+
+        assert peak == 2
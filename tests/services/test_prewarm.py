@@ -0,0 +1,157 @@
+"""Tests for clinic-schedule cache prewarming"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services import prewarm
+from src.services.cache.base import PatientDataCache
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.data import patient_data
+from src.services.prewarm import (
+    ClinicAppointment,
+    PrewarmScheduler,
+    StationRateLimiter,
+    parse_clinic_appointments,
+    parse_clinic_list,
+)
+from src.vista.base import VistaAPIError
+
+VPR_PAYLOAD = {
+    "data": {
+        "items": [
+            {
+                "uid": "urn:va:patient:500:100022:100022",
+                "localId": 100022,
+                "dfn": "100022",
+                "icn": "1000220000V123456",
+                "fullName": "PATIENT,TEST",
+                "familyName": "PATIENT",
+                "givenNames": "TEST",
+                "genderCode": "urn:va:pat-gender:M",
+                "genderName": "Male",
+                "dateOfBirth": 19350407,
+                "ssn": 666001001,
+            }
+        ]
+    }
+}
+
+
+def appointment(dfn: str, starts_in: timedelta, icn: str | None = None):
+    return ClinicAppointment("500", "195", dfn, icn, datetime.now(UTC) + starts_in)
+
+
+class TestScheduleParsing:
+    """Test reading clinic lists and schedules"""
+
+    def test_parse_clinic_list(self):
+        """Test station:clinic pairs, skipping malformed entries"""
+        assert parse_clinic_list("500:195, 500:196,bogus,") == [
+            ("500", "195"),
+            ("500", "196"),
+        ]
+
+    def test_parse_clinic_appointments(self):
+        """Test that cancelled and undated appointments are skipped"""
+        result = {
+            "appointments": [
+                {"patientIEN": "100022", "date": "2025-06-02T09:00:00"},
+                {"patientIEN": "100023", "date": "2025-06-02T10:00:00"},
+                {
+                    "patientIEN": "100024",
+                    "date": "2025-06-02T11:00:00",
+                    "status": "CANCELLED",
+                },
+                {"patientIEN": "100025"},
+            ]
+        }
+
+        appointments = parse_clinic_appointments(result, "500", "195")
+
+        assert [a.patient_dfn for a in appointments] == ["100022", "100023"]
+        assert appointments[0].starts_at == datetime(2025, 6, 2, 9, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+class TestPrewarmScheduler:
+    """Test warming patients from schedules"""
+
+    async def test_rate_limit_per_station(self):
+        """Test that loads to one station are spaced, other stations are not"""
+        limiter = StationRateLimiter(20)
+        started = time.monotonic()
+        for station in ("500", "500", "500", "501"):
+            await limiter.acquire(station)
+
+        assert 0.1 <= time.monotonic() - started < 0.5
+
+    async def test_cycle_warms_due_patients_within_budget(self, mock_vista_client):
+        """Test staggering, cache checks, failures and the budget cap"""
+        scheduler = PrewarmScheduler(
+            mock_vista_client,
+            [("500", "195")],
+            caller_duz="123",
+            lead_minutes=20,
+            interval_minutes=5,
+            rate_per_second=1000,
+            max_patients=2,
+        )
+        appointments = [
+            appointment("1", timedelta(minutes=10)),
+            appointment("2", timedelta(minutes=12), icn="2000000000V000000"),
+            appointment("3", timedelta(minutes=14)),
+            appointment("4", timedelta(minutes=16)),
+            appointment("5", timedelta(minutes=18)),
+            appointment("1", timedelta(hours=2)),
+            appointment("6", timedelta(hours=3)),
+        ]
+
+        async def _load(vista_client, station, dfn, duz):
+            if dfn == "3":
+                raise VistaAPIError("RpcFault", "PATIENT_NOT_FOUND", "gone", 404)
+            return Mock(patient_icn=f"{dfn}000000000V000000")
+
+        load = AsyncMock(side_effect=_load)
+        with (
+            patch.object(
+                scheduler, "read_schedules", AsyncMock(return_value=appointments)
+            ),
+            patch.object(
+                prewarm,
+                "get_patient_data_version",
+                AsyncMock(side_effect=lambda station, icn, duz: "v1"),
+            ),
+            patch.object(prewarm, "load_patient_data_by_dfn", load),
+        ):
+            summary = await scheduler.run_cycle()
+
+        assert [call.args[2] for call in load.call_args_list] == ["1", "3", "4"]
+        assert summary["appointments"] == 6
+        assert summary["warmed"] == 2
+        assert summary["cached"] == 1
+        assert summary["failed"] == 1
+        assert summary["over_budget"] == 1
+        stats = scheduler.get_stats()
+        assert stats["budget_used"] == 2
+        assert stats["pending"] == 0
+
+    async def test_load_by_dfn_caches_under_icn(self, mock_vista_client):
+        """Test that a patient loaded by DFN is found by ICN afterwards"""
+        mock_vista_client.invoke_rpc.return_value = VPR_PAYLOAD
+        with patch.object(
+            patient_data, "_cache_instance", PatientDataCache(MemoryCacheBackend())
+        ):
+            loaded = await patient_data.load_patient_data_by_dfn(
+                mock_vista_client, "500", "100022", "123"
+            )
+            version = await patient_data.get_patient_data_version(
+                "500", "1000220000V123456", "123"
+            )
+
+        assert loaded.patient_icn == "1000220000V123456"
+        assert version == loaded.content_version
+        parameters = mock_vista_client.invoke_rpc.call_args.kwargs["parameters"]
+        assert parameters == [{"namedArray": {"patientId": "100022"}}]
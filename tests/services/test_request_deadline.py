@@ -0,0 +1,111 @@
+"""Tests for request-scoped deadlines"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from src.models.responses.metadata import PerformanceMetrics
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.cache.multi_tier import MultiTierCacheBackend
+from src.services.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    current_deadline,
+    deadline_from_headers,
+    get_deadline,
+    run_with_deadline,
+    start_deadline,
+)
+from src.services.rpc import execute_rpc
+
+
+@pytest.fixture
+def deadline():
+    """Factory that starts a deadline and clears it after the test"""
+
+    def _start(budget_seconds: float) -> Deadline:
+        start_deadline(budget_seconds)
+        current = get_deadline()
+        assert current is not None
+        return current
+
+    yield _start
+
+    current_deadline.set(None)
+
+
+class TestDeadline:
+    """Test the deadline primitives"""
+
+    def test_clamp_to_remaining_budget(self, deadline):
+        """Test that a layer's timeout is clamped to the remaining budget"""
+        current = deadline(0.5)
+        assert current.clamp(30.0) <= 0.5
+        assert current.clamp(0.1) == 0.1
+
+    def test_deadline_from_headers(self):
+        """Test that client headers are parsed as milliseconds"""
+        assert deadline_from_headers({"X-Vista-Deadline-Ms": "2500"}) == 2.5
+        assert deadline_from_headers({"x-request-timeout-ms": "100"}) == 0.1
+        assert deadline_from_headers({"x-vista-deadline-ms": "soon"}) is None
+        assert deadline_from_headers({}) is None
+
+    async def test_stage_exhaustion_is_reported(self, deadline):
+        """Test that a stage running past the budget is recorded as exhausted"""
+        current = deadline(0.05)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await run_with_deadline("slow_stage", asyncio.sleep(1))
+
+        assert exc_info.value.stage == "slow_stage"
+        assert current.report()["exhausted_stages"] == ["slow_stage"]
+
+        metrics = PerformanceMetrics(duration_ms=50, start_time=datetime.now(UTC))
+        assert metrics.deadline is not None
+        assert metrics.deadline.exhausted_stages == ["slow_stage"]
+
+    def test_metrics_omit_deadline_within_budget(self, deadline):
+        """Test that no deadline block is added when every stage fit"""
+        deadline(10)
+        metrics = PerformanceMetrics(duration_ms=5, start_time=datetime.now(UTC))
+        assert metrics.deadline is None
+
+    async def test_multi_tier_skips_lower_tiers_near_deadline(self, deadline):
+        """Test that slower tiers and write-through are skipped near the deadline"""
+        fast, slow = MemoryCacheBackend(), MemoryCacheBackend()
+        await slow.set("key", "value")
+        cache = MultiTierCacheBackend([fast, slow], tier_names=["fast", "slow"])
+
+        current = deadline(0.0)
+
+        assert await cache.get("key") is None
+        assert await cache.set("other", "value")
+        assert await slow.get("other") is None
+        assert current.report()["skipped_stages"] == [
+            "cache_tier_slow",
+            "cache_write_through",
+        ]
+
+    async def test_execute_rpc_reports_deadline(self, deadline, mock_vista_client):
+        """Test that a slow RPC becomes an error response instead of hanging"""
+
+        async def slow_rpc(**kwargs):
+            await asyncio.sleep(1)
+            return "never"
+
+        mock_vista_client.invoke_rpc.side_effect = slow_rpc
+        deadline(0.05)
+
+        result = await execute_rpc(
+            vista_client=mock_vista_client,
+            rpc_name="ORWU DT",
+            parameters=[],
+            parser=lambda r: r,
+            station="500",
+            caller_duz="123",
+            error_response_builder=lambda error, metadata: {"error": error},
+        )
+
+        assert "timed out" in result["error"]
+        assert "rpc:ORWU DT" in result["error"]
@@ -0,0 +1,67 @@
+"""Tests for RPC response cache keys"""
+
+from src.services.rpc.parameter_builder import (
+    RPC_CACHE_KEY_VERSION,
+    RpcParameters,
+    build_empty_params,
+    build_icn_only_named_array_param,
+    build_multi_param,
+    build_rpc_cache_key,
+    build_single_string_param,
+)
+
+
+class TestRpcCacheKey:
+    """Test canonical cache key generation"""
+
+    def test_builders_still_behave_like_lists(self):
+        """Test that built parameters compare equal to plain lists"""
+        assert build_empty_params() == []
+        assert build_single_string_param("NOW") == [{"string": "NOW"}]
+        assert build_icn_only_named_array_param("123V456") == [
+            {"namedArray": {"patientId": ";123V456"}}
+        ]
+
+    def test_prebuilt_and_plain_lists_share_keys(self):
+        """Test that the precomputed fragment matches on-the-fly encoding"""
+        for params in (
+            build_empty_params(),
+            build_single_string_param("NOW"),
+            build_icn_only_named_array_param("123V456"),
+            build_multi_param("A", "B"),
+        ):
+            assert build_rpc_cache_key("500", "1", "RPC", params) == (
+                build_rpc_cache_key("500", "1", "RPC", list(params))
+            )
+        assert build_rpc_cache_key("500", "1", "RPC", None) == build_rpc_cache_key(
+            "500", "1", "RPC", []
+        )
+
+    def test_keys_are_versioned_and_distinct(self):
+        """Test version prefix and that different parameters never collide"""
+        key = build_rpc_cache_key(
+            "500", "1", "ORWU DT", build_single_string_param("NOW")
+        )
+        assert key.startswith(f"rpc:{RPC_CACHE_KEY_VERSION}:500:1:ORWU DT:")
+
+        keys = {
+            build_rpc_cache_key("500", "1", "RPC", params)
+            for params in (
+                [],
+                [{"string": ""}],
+                [{"string": "A"}, {"string": "B"}],
+                [{"string": "A=B"}],
+                [{"namedArray": {"A": "B"}}],
+                [{"namedArray": {"A": "B", "C": "D"}}],
+                [{"namedArray": {"A": "B\x1fC=D"}}],
+                [{"namedArray": {"patientId": 1}}],
+                [{"namedArray": {"patientId": "1"}}],
+            )
+        }
+        assert len(keys) == 9
+
+    def test_named_array_order_does_not_matter(self):
+        """Test that named-array fields are sorted before hashing"""
+        a = RpcParameters([{"namedArray": {"a": "1", "b": "2"}}])
+        b = RpcParameters([{"namedArray": {"b": "2", "a": "1"}}])
+        assert a.cache_fragment == b.cache_fragment
@@ -0,0 +1,223 @@
+"""Tests for concurrent bulk RPC invocation"""
+
+import asyncio
+import base64
+import json as jsonlib
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.services.cache.memory import MemoryCacheBackend
+from src.services.rpc import execute_rpcs
+from src.vista.base import VistaAPIError
+from src.vista.client import VistaAPIClient
+
+
+def make_token(lifetime_seconds=3600):
+    """Build an unsigned JWT that expires after lifetime_seconds"""
+
+    def encode(part):
+        return (
+            base64.urlsafe_b64encode(jsonlib.dumps(part).encode()).decode().rstrip("=")
+        )
+
+    payload = {"exp": int(time.time()) + lifetime_seconds}
+    return f"{encode({'alg': 'none'})}.{encode(payload)}.signature"
+
+
+def make_token_response():
+    """Build a mocked auth service response"""
+    response = AsyncMock()
+    response.status_code = 200
+    response.json = Mock(return_value={"data": {"token": make_token()}})
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def make_rpc_response(result):
+    """Build a successful mocked RPC response"""
+    response = AsyncMock()
+    response.status_code = 200
+    response.json = Mock(return_value={"payload": {"result": result}})
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def make_error_response(status_code, error_type):
+    """Build a mocked RPC response that raises HTTPStatusError"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = "error"
+    response.json = Mock(
+        return_value={
+            "errorType": error_type,
+            "errorCode": "ERR",
+            "message": "Simulated failure",
+        }
+    )
+    response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("error", request=Mock(), response=response)
+    )
+    return response
+
+
+@pytest.mark.asyncio
+class TestInvokeMany:
+    """Test VistaAPIClient.invoke_many"""
+
+    @pytest.fixture
+    def mock_httpx_client(self):
+        """Mock httpx client answering each RPC with its own name"""
+        client = AsyncMock()
+
+        async def post(url, json, headers, timeout):
+            if url.endswith("/auth/token"):
+                await asyncio.sleep(0.01)
+                return make_token_response()
+            if json["rpc"] == "ORWDX SAVE":
+                return make_error_response(400, "RpcFault")
+            return make_rpc_response(f"{json['rpc']} result")
+
+        client.post.side_effect = post
+        return client
+
+    @pytest.fixture
+    def cache_backend(self):
+        """In-memory response cache"""
+        return MemoryCacheBackend()
+
+    @pytest.fixture
+    def vista_client(self, mock_httpx_client, cache_backend):
+        """Create Vista client with mocked httpx"""
+        with patch("src.vista.client.httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = mock_httpx_client
+            client = VistaAPIClient(
+                base_url="http://localhost:8888",
+                api_key="test-key",
+                auth_url="http://localhost:8888",
+                response_cache_backend=cache_backend,
+            )
+            client.client = mock_httpx_client
+            return client
+
+    async def test_results_in_call_order_with_errors_in_place(self, vista_client):
+        """Test that a failing call does not affect the others"""
+        results = await vista_client.invoke_many(
+            [
+                {"station": "500", "caller_duz": "123", "rpc_name": "ORWU DT"},
+                {"station": "500", "caller_duz": "123", "rpc_name": "ORWDX SAVE"},
+                {"station": "500", "caller_duz": "123", "rpc_name": "XWB IM HERE"},
+            ]
+        )
+
+        assert results[0] == "ORWU DT result"
+        assert isinstance(results[1], VistaAPIError)
+        assert results[1].error_type == "RpcFault"
+        assert results[2] == "XWB IM HERE result"
+
+    async def test_token_fetched_once(self, vista_client, mock_httpx_client):
+        """Test that concurrent calls share one token fetch"""
+        await vista_client.invoke_many(
+            [
+                {"station": "500", "caller_duz": "123", "rpc_name": f"RPC {i}"}
+                for i in range(10)
+            ]
+        )
+
+        token_requests = [
+            call
+            for call in mock_httpx_client.post.call_args_list
+            if call.args[0].endswith("/auth/token")
+        ]
+        assert len(token_requests) == 1
+
+    async def test_cached_responses_served_from_get_many(
+        self, vista_client, mock_httpx_client, cache_backend
+    ):
+        """Test that cache hits are resolved in one batched lookup"""
+        calls = [
+            {"station": "500", "caller_duz": "123", "rpc_name": "ORWU DT"},
+            {"station": "500", "caller_duz": "123", "rpc_name": "ORWU VERSRV"},
+        ]
+        await vista_client.invoke_many(calls)
+        # One token request plus one request per RPC
+        assert mock_httpx_client.post.call_count == 3
+
+        with patch.object(
+            cache_backend, "get_many", wraps=cache_backend.get_many
+        ) as get_many:
+            results = await vista_client.invoke_many(calls)
+
+        assert results == ["ORWU DT result", "ORWU VERSRV result"]
+        assert mock_httpx_client.post.call_count == 3
+        get_many.assert_called_once()
+
+    async def test_concurrency_is_bounded(self, vista_client, mock_httpx_client):
+        """Test that no more than max_concurrency calls are in flight"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(url, json, headers, timeout):
+            nonlocal in_flight, peak
+            if url.endswith("/auth/token"):
+                return make_token_response()
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_rpc_response("OK")
+
+        mock_httpx_client.post.side_effect = slow_post
+
+        results = await vista_client.invoke_many(
+            [
+                {
+                    "station": "500",
+                    "caller_duz": "123",
+                    "rpc_name": f"RPC {i}",
+                    "use_cache": False,
+                }
+                for i in range(12)
+            ],
+            max_concurrency=3,
+        )
+
+        assert results == ["OK"] * 12
+        assert peak == 3
+
+
+@pytest.mark.asyncio
+class TestExecuteRpcs:
+    """Test the bulk counterpart of execute_rpc"""
+
+    async def test_each_request_gets_its_own_response(self, mock_vista_client):
+        """Test parsed results and error responses line up with the requests"""
+        mock_vista_client.invoke_many = AsyncMock(
+            return_value=["1", VistaAPIError("RpcFault", "X", "bad", 400)]
+        )
+
+        heartbeat, version = await execute_rpcs(
+            vista_client=mock_vista_client,
+            requests=[
+                {
+                    "rpc_name": "XWB IM HERE",
+                    "parameters": [],
+                    "parser": lambda r: r == "1",
+                },
+                {
+                    "rpc_name": "ORWU VERSRV",
+                    "parameters": [],
+                    "parser": lambda r: r.strip(),
+                },
+            ],
+            station="500",
+            caller_duz="123",
+            error_response_builder=lambda error, metadata: {"error": error},
+        )
+
+        assert heartbeat["parsed_data"] is True
+        assert heartbeat["metadata"]["rpc"]["rpc"] == "XWB IM HERE"
+        assert "error" in version
+        mock_vista_client.invoke_many.assert_awaited_once()
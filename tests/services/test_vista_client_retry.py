@@ -0,0 +1,235 @@
+"""Tests for Vista client retry and hedging policies"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.vista.base import VistaAPIError
+from src.vista.client import VistaAPIClient
+from src.vista.retry import (
+    LatencyTracker,
+    RetryPolicy,
+    RetryPolicyRegistry,
+    build_default_retry_registry,
+    is_retryable_error,
+)
+
+
+def make_rpc_response(result="OK"):
+    """Build a successful mocked RPC response"""
+    response = AsyncMock()
+    response.status_code = 200
+    response.json = Mock(return_value={"payload": {"result": result}})
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def make_error_response(status_code, error_type="VistaLinkFault"):
+    """Build a mocked RPC response that raises HTTPStatusError"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = "error"
+    response.json = Mock(
+        return_value={
+            "errorType": error_type,
+            "errorCode": "ERR",
+            "message": "Simulated failure",
+        }
+    )
+    response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("error", request=Mock(), response=response)
+    )
+    return response
+
+
+class TestRetryPolicy:
+    """Test retry policy primitives"""
+
+    def test_backoff_is_bounded(self):
+        """Test jittered backoff stays within the exponential ceiling"""
+        policy = RetryPolicy(
+            idempotent=True,
+            max_attempts=5,
+            base_delay_seconds=0.1,
+            max_delay_seconds=0.3,
+        )
+        for _ in range(50):
+            assert 0 <= policy.backoff_delay(1) <= 0.1
+            assert 0 <= policy.backoff_delay(2) <= 0.2
+            assert 0 <= policy.backoff_delay(6) <= 0.3
+
+    def test_default_registry_covers_idempotent_rpcs(self):
+        """Test that only read-only RPCs get retries by default"""
+        registry = build_default_retry_registry()
+        for rpc_name in ("VPR GET PATIENT DATA JSON", "XWB IM HERE", "ORWU DT"):
+            assert registry.get(rpc_name).idempotent
+        assert not registry.get("ORWDX SAVE").idempotent
+        assert registry.get("ORWDX SAVE").max_attempts == 1
+
+    def test_retryable_errors(self):
+        """Test classification of transient failures"""
+        assert is_retryable_error(VistaAPIError("VistaLinkFault", "X", "down", 500))
+        assert is_retryable_error(VistaAPIError("HTTPError", "503", "busy", 503))
+        assert is_retryable_error(httpx.ConnectTimeout("timeout"))
+        assert not is_retryable_error(VistaAPIError("SecurityFault", "X", "no", 403))
+        assert not is_retryable_error(VistaAPIError("RpcFault", "X", "bad", 400))
+        assert not is_retryable_error(ValueError("boom"))
+
+    def test_latency_quantile_requires_samples(self):
+        """Test that quantiles are only reported with enough history"""
+        tracker = LatencyTracker(min_samples=10)
+        for i in range(9):
+            tracker.record("ORWU DT", i / 100)
+        assert tracker.quantile("ORWU DT", 0.95) is None
+        tracker.record("ORWU DT", 0.5)
+        assert tracker.quantile("ORWU DT", 0.95) == 0.5
+
+
+@pytest.mark.asyncio
+class TestVistaClientRetry:
+    """Test retry behavior in Vista client"""
+
+    @pytest.fixture
+    def mock_httpx_client(self):
+        """Mock httpx client"""
+        return AsyncMock()
+
+    def make_client(self, mock_httpx_client, registry):
+        """Create Vista client with mocked httpx and a fixed token"""
+        with patch("src.vista.client.httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = mock_httpx_client
+            client = VistaAPIClient(
+                base_url="http://localhost:8888",
+                api_key="test-key",
+                auth_url="http://localhost:8888",
+                timeout=30.0,
+                retry_policies=registry,
+            )
+            client.client = mock_httpx_client
+            client._ensure_valid_token = AsyncMock(return_value="token")  # type: ignore[method-assign]
+            return client
+
+    @pytest.fixture
+    def registry(self):
+        """Registry with fast retries for ORWU DT"""
+        registry = RetryPolicyRegistry()
+        registry.register(
+            "ORWU DT",
+            RetryPolicy(
+                idempotent=True,
+                max_attempts=3,
+                base_delay_seconds=0.001,
+                max_delay_seconds=0.002,
+                deadline_seconds=5,
+            ),
+        )
+        return registry
+
+    async def test_idempotent_rpc_retried_on_transient_error(
+        self, mock_httpx_client, registry
+    ):
+        """Test that a VistaLink fault is retried and the retry succeeds"""
+        client = self.make_client(mock_httpx_client, registry)
+        mock_httpx_client.post.side_effect = [
+            make_error_response(500),
+            make_rpc_response("3251018"),
+        ]
+
+        result = await client.invoke_rpc("500", "123", "ORWU DT", use_cache=False)
+
+        assert result == "3251018"
+        assert mock_httpx_client.post.call_count == 2
+
+    async def test_attempts_exhausted_raises_last_error(
+        self, mock_httpx_client, registry
+    ):
+        """Test that the error is raised once attempts run out"""
+        client = self.make_client(mock_httpx_client, registry)
+        mock_httpx_client.post.side_effect = [make_error_response(500)] * 3
+
+        with pytest.raises(VistaAPIError) as exc_info:
+            await client.invoke_rpc("500", "123", "ORWU DT", use_cache=False)
+
+        assert exc_info.value.error_type == "VistaLinkFault"
+        assert mock_httpx_client.post.call_count == 3
+
+    async def test_non_idempotent_rpc_not_retried(self, mock_httpx_client, registry):
+        """Test that RPCs without a policy are sent exactly once"""
+        client = self.make_client(mock_httpx_client, registry)
+        mock_httpx_client.post.side_effect = [
+            make_error_response(500),
+            make_rpc_response(),
+        ]
+
+        with pytest.raises(VistaAPIError):
+            await client.invoke_rpc("500", "123", "ORWDX SAVE", use_cache=False)
+
+        assert mock_httpx_client.post.call_count == 1
+
+    async def test_client_errors_not_retried(self, mock_httpx_client, registry):
+        """Test that security faults are not retried"""
+        client = self.make_client(mock_httpx_client, registry)
+        mock_httpx_client.post.side_effect = [
+            make_error_response(403, "SecurityFault"),
+            make_rpc_response(),
+        ]
+
+        with pytest.raises(VistaAPIError) as exc_info:
+            await client.invoke_rpc("500", "123", "ORWU DT", use_cache=False)
+
+        assert exc_info.value.error_type == "SecurityFault"
+        assert mock_httpx_client.post.call_count == 1
+
+    async def test_deadline_stops_retries(self, mock_httpx_client):
+        """Test that retries stop when the backoff would pass the deadline"""
+        registry = RetryPolicyRegistry()
+        registry.register(
+            "ORWU DT",
+            RetryPolicy(
+                idempotent=True,
+                max_attempts=10,
+                base_delay_seconds=1.0,
+                max_delay_seconds=1.0,
+                deadline_seconds=0.01,
+            ),
+        )
+        client = self.make_client(mock_httpx_client, registry)
+        with patch("src.vista.retry.random.uniform", return_value=1.0):
+            mock_httpx_client.post.side_effect = [make_error_response(500)] * 10
+
+            with pytest.raises(VistaAPIError):
+                await client.invoke_rpc("500", "123", "ORWU DT", use_cache=False)
+
+        assert mock_httpx_client.post.call_count == 1
+
+    async def test_hedged_request_returns_first_answer(self, mock_httpx_client):
+        """Test that a slow request is hedged and the faster answer wins"""
+        registry = RetryPolicyRegistry()
+        registry.register(
+            "XWB IM HERE",
+            RetryPolicy(idempotent=True, hedge=True, hedge_min_delay_seconds=0.01),
+        )
+        client = self.make_client(mock_httpx_client, registry)
+        for _ in range(client._latency_tracker.min_samples):
+            client._latency_tracker.record("XWB IM HERE", 0.01)
+
+        calls = 0
+
+        async def post(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+                return make_rpc_response("slow")
+            return make_rpc_response("fast")
+
+        mock_httpx_client.post.side_effect = post
+
+        result = await asyncio.wait_for(
+            client.invoke_rpc("500", "123", "XWB IM HERE", use_cache=False), 1
+        )
+
+        assert result == "fast"
+        assert calls == 2
@@ -0,0 +1,75 @@
+"""Tests for validating a domain's items in one batch"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from src.models.patient import PurposeOfVisit
+from src.services.parsers.patient import batch
+from src.services.parsers.patient.batch import (
+    parse_datetime_columns,
+    validate_items,
+)
+from src.services.parsers.patient.patient_parser import PatientDataParser
+
+
+def pov_item(index: int, **fields) -> dict:
+    return {
+        "uid": f"urn:va:pov:500:100022:{index}",
+        "localId": str(index),
+        "name": "Essential hypertension",
+        "type": "P",
+        "encounterName": "CARDIOLOGY CLINIC",
+        "encounterUid": "urn:va:visit:500:100022:H2001",
+        "facilityCode": "500",
+        "facilityName": "CAMP MASTER",
+        "entered": "20231201143000",
+        **fields,
+    }
+
+
+class TestValidateItems:
+    """Test validate_items"""
+
+    def test_invalid_items_are_skipped(self):
+        """Test that failures are logged and the rest keep their order"""
+        items = [pov_item(1), pov_item(2, uid=None), pov_item(3), pov_item(4, type=7)]
+
+        with patch.object(batch, "logger") as logger:
+            povs = validate_items(PurposeOfVisit, items, "POV")
+
+        assert [pov.local_id for pov in povs] == ["1", "3"]
+        failures = [call.args[0] for call in logger.warning.call_args_list]
+        assert len(failures) == 2
+        assert all(failure.startswith("Failed to parse POV") for failure in failures)
+        assert "urn:va:pov:500:100022:4" in failures[1]
+
+    def test_parse_datetime_columns(self):
+        """Test that impossible dates are left for model validation to reject"""
+        items = [pov_item(1), pov_item(2, entered=20230230)]
+
+        parse_datetime_columns(items, ["entered"])
+
+        assert items[0]["entered"] == datetime(2023, 12, 1, 14, 30, tzinfo=UTC)
+        assert items[1]["entered"] == 20230230
+        povs = validate_items(PurposeOfVisit, items, "POV")
+        assert [pov.local_id for pov in povs] == ["1"]
+
+    def test_one_bad_order_keeps_the_rest(self):
+        """Test that orders are no longer dropped together"""
+        parser = PatientDataParser(station="500", icn="123456")
+        order = {
+            "uid": "urn:va:order:500:100022:1",
+            "facilityCode": "500",
+            "facilityName": "CAMP MASTER",
+            "entered": 20240115143045,
+            "service": "PSO",
+            "statusCode": "urn:va:order-status:actv",
+            "statusName": "ACTIVE",
+            "statusVuid": "urn:va:vuid:4501095",
+            "displayGroup": "O RX",
+        }
+        orders = [order, {**order, "uid": None}]
+
+        parsed = parser._parse_orders(orders)
+
+        assert list(parsed) == ["urn:va:order:500:100022:1"]
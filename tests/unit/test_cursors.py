@@ -0,0 +1,132 @@
+"""Tests for cursor paging pinned to a patient data snapshot"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.models.patient.clinical import LabResult
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.models.responses.metadata import PaginationMetadata
+from src.services.data import CursorError, ResultPin
+from src.services.data.cursors import _pinned_results
+from src.tools.patient.get_patient_labs_tool import build_labs_data
+
+ICN = "1008684701V329302"
+RETRIEVED_AT = datetime(2025, 6, 1, tzinfo=UTC)
+FILTERS = {"abnormal_only": False, "n_most_recent": 0, "days_back": 30}
+
+
+def make_collection(lab_count: int) -> PatientDataCollection:
+    """Collection with lab_count daily glucose results"""
+    now = datetime.now(UTC)
+    labs = [
+        LabResult(
+            uid=f"urn:va:lab:84F0:237:{index}",
+            localId=str(index),
+            typeCode="urn:va:ien:60:175:72",
+            typeName="GLUCOSE",
+            displayName="GLU",
+            result=str(90 + index),
+            units="mg/dL",
+            observed=now - timedelta(days=index),
+            resulted=now - timedelta(days=index),
+            facilityCode="500",
+            facilityName="CAMP MASTER",
+            statusCode="urn:va:lab-status:completed",
+            statusName="completed",
+        )
+        for index in range(lab_count)
+    ]
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=ICN,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        lab_results_dict={lab.uid: lab for lab in labs},
+        source_station="84F0",
+        source_icn=ICN,
+        retrieved_at=RETRIEVED_AT,
+    )
+
+
+def labs_page(collection, cursor=None, limit=2, **filters):
+    """One page of labs as the tool builds it"""
+    arguments = {**FILTERS, **filters}
+    pin = ResultPin(
+        collection, "get_patient_labs", arguments, limit=limit, cursor=cursor
+    )
+    data, total = build_labs_data(
+        collection, **arguments, offset=pin.offset, limit=limit, pin=pin
+    )
+    return [lab.uid for lab in data.labs], total, pin
+
+
+class TestResultPin:
+    """Test pinning and resuming paged results"""
+
+    def test_pages_follow_the_cursor(self):
+        """Test that cursors walk the pinned results without gaps or repeats"""
+        collection = make_collection(5)
+        first, total, pin = labs_page(collection)
+
+        assert total == 5
+        assert (pin.version, pin.query) in _pinned_results
+        second, _, pin = labs_page(make_collection(5), cursor=pin.next_cursor)
+        third, _, _ = labs_page(make_collection(5), cursor=pin.next_cursor)
+
+        every = [lab.uid for lab in collection.lab_results_by_time.items]
+        assert first + second + third == every
+
+    def test_single_page_is_not_pinned(self):
+        """Test that results fitting on one page are not stored"""
+        _, total, pin = labs_page(make_collection(2), limit=5)
+
+        assert total == 2
+        assert (pin.version, pin.query) not in _pinned_results
+
+    def test_changed_data_rejects_cursor(self):
+        """Test that a cursor cannot resume on a different data snapshot"""
+        _, _, pin = labs_page(make_collection(5))
+
+        with pytest.raises(CursorError, match="changed"):
+            labs_page(make_collection(6), cursor=pin.next_cursor)
+
+    def test_other_query_rejects_cursor(self):
+        """Test that a cursor only resumes the query that issued it"""
+        _, _, pin = labs_page(make_collection(5))
+
+        with pytest.raises(CursorError, match="different query"):
+            labs_page(make_collection(5), cursor=pin.next_cursor, days_back=10)
+        with pytest.raises(CursorError, match="Invalid"):
+            labs_page(make_collection(5), cursor="not-a-cursor")
+
+
+class TestPaginationCursor:
+    """Test next_cursor in pagination metadata"""
+
+    def test_next_cursor_only_while_more_remain(self):
+        """Test that the cursor is offered for a next page and dropped after"""
+        more = PaginationMetadata(
+            total_available_items=5,
+            returned=2,
+            offset=0,
+            limit=2,
+            next_cursor="abc",
+            tool_name="get_patient_labs",
+            patient_icn=ICN,
+        )
+        last = PaginationMetadata(
+            total_available_items=5, returned=1, offset=4, limit=2, next_cursor="abc"
+        )
+
+        assert more.next_cursor == "abc"
+        assert 'cursor="abc"' in str(more.suggested_next_call)
+        assert last.next_cursor is None
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from src.services.parsers.patient.datetime_parser import (
     parse_date,
     parse_datetime,
+    parse_datetimes,
 )
 
 
@@ -43,6 +44,26 @@ class TestDatetimeParser:
         assert parse_datetime(999) is None
         assert parse_datetime("invalid") is None
 
+    def test_parse_datetime_iso_and_partial(self):
+        """Test ISO strings and values outside the digit fast path"""
+        assert parse_datetime("2024-01-15T14:30:45Z") == datetime(
+            2024, 1, 15, 14, 30, 45, tzinfo=timezone.utc
+        )
+        assert parse_datetime(2002) == datetime(2002, 1, 1, tzinfo=timezone.utc)
+        # Hour 24 is not an hour, so the regex reads "2400" as minute and second
+        assert parse_datetime(202401152400) == datetime(
+            2024, 1, 15, 0, 24, 0, tzinfo=timezone.utc
+        )
+
+    def test_parse_datetimes(self):
+        """Test parsing a column of values"""
+        values = [20240115, "20240115", None, 20240115, "invalid", 202401151430]
+
+        result = parse_datetimes(values)
+
+        assert result == [parse_datetime(value) for value in values]
+        assert result[0] is result[3]
+
     def test_parse_date(self):
         """Test parsing date format"""
         result = parse_date(20240115)
@@ -0,0 +1,121 @@
+"""Tests for the document full-text search index"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.models.patient import (
+    Document,
+    DocumentSearchIndex,
+    PatientDataCollection,
+    PatientDemographics,
+)
+from src.models.patient.search import make_snippet
+from src.services.data import get_document_search_index
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_document(
+    index: int, content: str, days_ago: int = 1, title: str = "PRIMARY CARE NOTE"
+) -> Document:
+    uid = f"urn:va:document:500:{index}"
+    reference = NOW - timedelta(days=days_ago)
+    return Document(
+        uid=uid,
+        localId=str(index),
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+        documentClass="PROGRESS NOTES",
+        documentTypeCode="PN",
+        documentTypeName="Progress Note",
+        localTitle=title,
+        referenceDateTime=reference,
+        statusName="COMPLETED",
+        text=[
+            {
+                "uid": uid,
+                "content": content,
+                "dateTime": reference,
+                "status": "COMPLETED",
+                "clinicians": [
+                    {"name": "PROVIDER,ANNE", "role": "S", "uid": "urn:va:user:1"}
+                ],
+            }
+        ],
+    )
+
+
+class TestDocumentSearchIndex:
+    """Test DocumentSearchIndex"""
+
+    def test_ranking_and_window(self):
+        """Test BM25 ranking, title/author matches and the date window"""
+        index = DocumentSearchIndex(
+            [
+                make_document(1, "Patient stable. Continue metformin."),
+                make_document(2, "Warfarin dose adjusted. Recheck INR on warfarin."),
+                make_document(3, "Started warfarin for atrial fibrillation.", 400),
+                make_document(4, "Routine visit.", title="ANTICOAGULATION CLINIC"),
+            ]
+        )
+
+        matches, total = index.search("warfarin")
+        assert total == 2
+        assert [doc.uid for doc, _ in matches] == [
+            "urn:va:document:500:2",
+            "urn:va:document:500:3",
+        ]
+
+        matches, total = index.search("warfarin", since=NOW - timedelta(days=30))
+        assert total == 1
+
+        assert index.search("anticoagulation")[0][0][0].local_id == "4"
+        assert index.search("provider")[1] == 4
+        assert index.search("aspirin") == ([], 0)
+
+    def test_snippet(self):
+        """Test that the snippet is cut around the first match"""
+        content = "x " * 100 + "INR elevated on Warfarin today. " + "y " * 100
+
+        snippet = make_snippet(content, ["warfarin"])
+
+        assert snippet.startswith("...")
+        assert snippet.endswith("...")
+        assert "Warfarin today." in snippet
+        assert len(snippet) < 200
+
+    @pytest.mark.asyncio
+    async def test_index_shared_across_rehydrated_copies(self):
+        """Test that cached copies of the same snapshot reuse one index"""
+        collection = PatientDataCollection(
+            demographics=PatientDemographics(
+                uid="urn:va:patient:500:237",
+                dfn="237",
+                pid="500;237",
+                icn="1008684701V329302",
+                fullName="PATIENT,TEST",
+                familyName="PATIENT",
+                givenNames="TEST",
+                displayName="PATIENT,TEST",
+                genderCode="M",
+                genderName="Male",
+                dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+                ssn="666001001",
+                sensitive=False,
+                deceased=False,
+            ),
+            documents_dict={
+                "urn:va:document:500:1": make_document(1, "Warfarin started.")
+            },
+            source_station="500",
+            source_icn="1008684701V329302",
+        )
+        restored = PatientDataCollection.model_validate_json(
+            collection.model_dump_json()
+        )
+
+        index = await get_document_search_index(collection)
+
+        assert await get_document_search_index(restored) is index
+        assert index.search("warfarin")[1] == 1
@@ -0,0 +1,137 @@
+"""Tests for memoized item fragments in tool responses"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pydantic_core
+import pytest
+
+from src.models.patient.clinical import LabResult
+from src.models.patient.collection import PatientDataCollection
+from src.models.patient.demographics import PatientDemographics
+from src.models.patient.fragments import _fragments
+from src.models.responses.tool_responses import (
+    LabResultsResponse,
+    LabResultsResponseData,
+    SnapshotResponse,
+    SnapshotResponseData,
+)
+
+ICN = "1008684701V329302"
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_collection(lab_count: int) -> PatientDataCollection:
+    """Collection with lab_count daily glucose results"""
+    labs = [
+        LabResult(
+            uid=f"urn:va:lab:84F0:237:{index}",
+            localId=str(index),
+            typeCode="urn:va:ien:60:175:72",
+            typeName="GLUCOSE",
+            displayName="GLU",
+            result=str(90 + index),
+            units="mg/dL",
+            observed=NOW - timedelta(days=index),
+            resulted=NOW - timedelta(days=index),
+            facilityCode="500",
+            facilityName="CAMP MASTER",
+            statusCode="urn:va:lab-status:completed",
+            statusName="completed",
+        )
+        for index in range(lab_count)
+    ]
+    return PatientDataCollection(
+        demographics=PatientDemographics(
+            dfn="237",
+            icn=ICN,
+            fullName="PATIENT,TEST",
+            familyName="PATIENT",
+            givenNames="TEST",
+            genderCode="M",
+            genderName="Male",
+            dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+            ssn="666001001",
+        ),
+        lab_results_dict={lab.uid: lab for lab in labs},
+        source_station="84F0",
+        source_icn=ICN,
+        retrieved_at=NOW,
+    )
+
+
+def memoized_copy(collection: PatientDataCollection) -> PatientDataCollection:
+    """Collection as rehydrated from the patient cache"""
+    copy = PatientDataCollection.model_validate_json(collection.model_dump_json())
+    copy.memoize_fragments()
+    return copy
+
+
+def labs_response(collection: PatientDataCollection) -> LabResultsResponse:
+    return LabResultsResponse(
+        success=True,
+        data=LabResultsResponseData(labs=collection.lab_results),
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_fragments():
+    _fragments.clear()
+    yield
+    _fragments.clear()
+
+
+class TestFragments:
+    """Test serving items from memoized fragments"""
+
+    def test_output_matches_plain_serialization(self):
+        """Test that memoized responses serialize exactly as before"""
+        plain = make_collection(3)
+        memoized = memoized_copy(plain)
+
+        for serialize in (pydantic_core.to_json, pydantic_core.to_jsonable_python):
+            assert serialize(labs_response(memoized)) == serialize(labs_response(plain))
+        assert len(_fragments) == 3
+
+    def test_rehydrated_copy_reuses_fragments(self):
+        """Test that another copy of the same snapshot skips serialization"""
+        plain = make_collection(3)
+        first = pydantic_core.to_jsonable_python(labs_response(memoized_copy(plain)))
+        second = pydantic_core.to_jsonable_python(labs_response(memoized_copy(plain)))
+
+        assert len(_fragments) == 3
+        assert second == first
+
+    def test_new_version_is_serialized_again(self):
+        """Test that a refreshed snapshot does not reuse older fragments"""
+        plain = make_collection(3)
+        pydantic_core.to_json(labs_response(memoized_copy(plain)))
+        refreshed = make_collection(3)
+        refreshed.retrieved_at = NOW + timedelta(minutes=5)
+        refreshed.rebuild_indexes()
+
+        pydantic_core.to_json(labs_response(memoized_copy(refreshed)))
+
+        assert len(_fragments) == 6
+
+    def test_projection_and_snapshot_slices(self):
+        """Test that projected responses and nested slices stay correct"""
+        memoized = memoized_copy(make_collection(2))
+
+        projected = json.loads(
+            pydantic_core.to_json(labs_response(memoized).project(["result"]))
+        )
+        snapshot = SnapshotResponse(
+            success=True,
+            data=SnapshotResponseData(
+                labs=LabResultsResponseData(labs=memoized.lab_results)
+            ),
+        )
+
+        assert projected["data"]["labs"][0].keys() == {"uid", "result"}
+        labs = pydantic_core.to_jsonable_python(snapshot)["data"]["labs"]["labs"]
+        assert (
+            labs
+            == pydantic_core.to_jsonable_python(labs_response(memoized))["data"]["labs"]
+        )
+        assert len(_fragments) == 2
@@ -0,0 +1,66 @@
+"""Tests for sharing repeated values of patient items"""
+
+from datetime import UTC, datetime
+
+import pydantic_core
+
+from src.models.patient import Document
+from src.models.patient.interning import INTERN_MAX_CHARS, ValueTable
+
+
+def fresh(value: str) -> str:
+    """Equal string that is a separate object"""
+    return "".join(list(value))
+
+
+def make_document(index: int) -> Document:
+    uid = f"urn:va:document:500:{index}"
+    return Document(
+        uid=uid,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+        documentClass="PROGRESS NOTES",
+        documentTypeCode="PN",
+        documentTypeName="Progress Note",
+        referenceDateTime=datetime(2025, 6, 1, tzinfo=UTC),
+        statusName="COMPLETED",
+        text=[
+            {
+                "uid": uid,
+                "content": "x" * (INTERN_MAX_CHARS + 1),
+                "status": "COMPLETED",
+                "clinicians": [
+                    {"name": "PROVIDER,ONE", "role": "A", "uid": "urn:va:user:1"}
+                ],
+            }
+        ],
+    )
+
+
+class TestValueTable:
+    """Test ValueTable"""
+
+    def test_items_share_strings_and_fields_sets(self):
+        """Test that equal values point at one object and output is unchanged"""
+        first, second = make_document(1), make_document(2)
+        # Values set by validators (here, by assignment) are not shared yet
+        second.facility_name = fresh("CAMP MASTER")
+        before = pydantic_core.to_json([first, second])
+
+        ValueTable().share([first, second])
+
+        assert second.facility_name is first.facility_name
+        assert second.__pydantic_fields_set__ is first.__pydantic_fields_set__
+        nested = [document.text[0].clinicians[0] for document in (first, second)]
+        assert nested[1].__pydantic_fields_set__ is nested[0].__pydantic_fields_set__
+        assert pydantic_core.to_json([first, second]) == before
+
+    def test_share_data(self):
+        """Test sharing strings of dumped JSON-like data"""
+        data = [make_document(index).model_dump(mode="json") for index in (1, 2)]
+
+        ValueTable().share_data(data)
+
+        assert data[0]["status_name"] is data[1]["status_name"]
+        assert data[0]["reference_date_time"] is data[1]["reference_date_time"]
+        assert data[0]["text"][0]["content"] is not data[1]["text"][0]["content"]
@@ -0,0 +1,115 @@
+"""Tests for parsing very large VPR records in worker processes"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.services.parsers.patient import parallel, patient_parser
+from src.services.parsers.patient.parallel import (
+    chunk_items,
+    get_parse_pool,
+    shutdown_parse_pool,
+)
+from src.services.parsers.patient.patient_parser import parse_vpr_patient_data
+
+RECORD = (
+    Path(__file__).parent.parent.parent
+    / "mock_server"
+    / "src"
+    / "data"
+    / "_VistARawSheba.json"
+)
+
+
+@pytest.fixture(scope="module")
+def vpr_data():
+    return json.loads(RECORD.read_text())
+
+
+def dump(collection) -> dict:
+    data = collection.model_dump(mode="json")
+    data.pop("retrieved_at")
+    return data
+
+
+class TestChunkItems:
+    """Test chunk_items"""
+
+    def test_small_domain_is_not_chunked(self):
+        assert chunk_items([{"uid": "a"}] * 4, size=5) == []
+
+    def test_chunks_keep_order(self):
+        items = [{"uid": str(i)} for i in range(7)]
+
+        chunks = chunk_items(items, size=3)
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert [item for chunk in chunks for item in chunk] == items
+
+
+class TestGetParsePool:
+    """Test get_parse_pool"""
+
+    def test_small_record_is_parsed_in_process(self):
+        with patch.object(parallel, "_pool", None):
+            assert get_parse_pool(parallel.PARALLEL_PARSE_MIN_ITEMS - 1) is None
+
+    def test_one_worker_turns_it_off(self):
+        with (
+            patch.object(parallel, "_pool", None),
+            patch.object(parallel, "PARALLEL_PARSE_WORKERS", 1),
+        ):
+            assert get_parse_pool(10**9) is None
+
+    def test_shutdown_stops_the_workers(self):
+        pool = Mock()
+        with patch.object(parallel, "_pool", pool):
+            shutdown_parse_pool()
+
+            pool.shutdown.assert_called_once_with(cancel_futures=True)
+            assert parallel._pool is None
+
+
+class TestParallelParse:
+    """Test parsing domains in chunks"""
+
+    def test_matches_sequential_parse(self, vpr_data):
+        """Test that reassembled chunks give the same collection"""
+        expected = dump(parse_vpr_patient_data(vpr_data, "500", "1008684701V329302"))
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(patient_parser, "get_parse_pool", return_value=pool),
+            patch.object(patient_parser, "chunk_items", partial(chunk_items, size=7)),
+        ):
+            collection = parse_vpr_patient_data(vpr_data, "500", "1008684701V329302")
+
+        assert dump(collection) == expected
+
+    def test_failed_chunk_is_parsed_in_process(self, vpr_data):
+        """Test that a domain whose worker fails is parsed again here"""
+        expected = dump(parse_vpr_patient_data(vpr_data, "500", "1008684701V329302"))
+
+        def fail(*args):
+            raise RuntimeError("worker died")
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(patient_parser, "get_parse_pool", return_value=pool),
+            patch.object(patient_parser, "chunk_items", partial(chunk_items, size=7)),
+            patch.object(patient_parser, "_parse_chunk", fail),
+            patch.object(patient_parser, "logger") as logger,
+        ):
+            collection = parse_vpr_patient_data(vpr_data, "500", "1008684701V329302")
+
+        assert dump(collection) == expected
+        retries = [
+            call.args[0]
+            for call in logger.warning.call_args_list
+            if call.args[0].startswith("Parallel parse of")
+        ]
+        assert retries
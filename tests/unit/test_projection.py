@@ -0,0 +1,129 @@
+"""Tests for field projection of tool responses"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import jsonschema
+import pydantic_core
+from pydantic import TypeAdapter
+
+from src.models.patient.clinical import LabResult, VitalSign
+from src.models.responses.tool_responses import (
+    LabResultsResponse,
+    LabResultsResponseData,
+)
+from src.tools.patient.get_items_by_uid_tool import (
+    GetItemsByUidResponse,
+    ItemsByUidResponseData,
+)
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_lab(index: int) -> LabResult:
+    observed = NOW - timedelta(days=index)
+    return LabResult(
+        uid=f"urn:va:lab:500:237:{index}",
+        localId=str(index),
+        typeCode="urn:va:ien:60:175:72",
+        typeName="GLUCOSE",
+        displayName="GLU",
+        result=str(100 + index),
+        units="mg/dL",
+        low="70",
+        high="110",
+        observed=observed,
+        resulted=observed,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+        statusCode="urn:va:lab-status:completed",
+        statusName="completed",
+    )
+
+
+def make_vital(index: int) -> VitalSign:
+    observed = NOW - timedelta(days=index)
+    return VitalSign(
+        uid=f"urn:va:vital:500:{index}",
+        localId=str(index),
+        typeCode="urn:va:vuid:4500639",
+        typeName="PULSE",
+        displayName="P",
+        result="72",
+        observed=observed,
+        resulted=observed,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+    )
+
+
+LABS = [make_lab(index) for index in range(6)]
+
+
+def labs_response() -> LabResultsResponse:
+    return LabResultsResponse(
+        success=True,
+        data=LabResultsResponseData(
+            abnormal_count=1,
+            by_type={"GLUCOSE": [LABS[0].uid]},
+            labs=LABS,
+        ),
+    )
+
+
+def dump(response) -> dict:
+    return json.loads(pydantic_core.to_json(response))
+
+
+class TestProjection:
+    """Test ToolResponse.project"""
+
+    def test_items_projected_payload_kept(self):
+        """Test that items keep only the requested fields and uid"""
+        body = dump(labs_response().project(["typeName", "result"]))
+
+        assert body["success"] is True
+        assert body["data"]["abnormal_count"] == 1
+        assert body["data"]["by_type"] == {"GLUCOSE": [LABS[0].uid]}
+        assert len(body["data"]["labs"]) == 6
+        for lab in body["data"]["labs"]:
+            assert set(lab) == {"uid", "typeName", "result"}
+
+    def test_attribute_names_and_unknown_fields(self):
+        """Test that attribute names work and unknown names are ignored"""
+        body = dump(labs_response().project(["type_name", "not_a_field"]))
+
+        assert set(body["data"]["labs"][0]) == {"uid", "typeName"}
+
+    def test_no_projection(self):
+        """Test that None or an empty list keeps full items"""
+        full = dump(labs_response())
+
+        assert dump(labs_response().project(None)) == full
+        assert dump(labs_response().project([])) == full
+        assert "facilityName" in full["data"]["labs"][0]
+
+    def test_mixed_item_mapping(self):
+        """Test projection of a uid -> item mapping of different models"""
+        lab = LABS[0]
+        vital = make_vital(1)
+        response = GetItemsByUidResponse(
+            success=True,
+            data=ItemsByUidResponseData(
+                items={lab.uid: lab, vital.uid: vital},
+                requested_count=2,
+                found_count=2,
+            ),
+        ).project(["typeName", "observed"])
+
+        items = dump(response)["data"]["items"]
+
+        assert set(items[lab.uid]) == {"uid", "typeName", "observed"}
+        assert set(items[vital.uid]) == {"uid", "typeName", "observed"}
+
+    def test_projected_output_matches_schema(self):
+        """Test that projected output validates against the output schema"""
+        schema = TypeAdapter(LabResultsResponse).json_schema(mode="serialization")
+
+        jsonschema.validate(dump(labs_response().project(["result"])), schema)
+        jsonschema.validate(dump(labs_response()), schema)
@@ -0,0 +1,156 @@
+"""Tests for declarative domain queries"""
+
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+
+import pytest
+
+from src.models.patient import Query, SeriesIndex, TimeIndex
+from src.models.patient.query import (
+    contains,
+    equals,
+    flag,
+    paginate,
+    unflagged,
+    where,
+)
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+class Kind(str, Enum):
+    OUTPATIENT = "Outpatient"
+    INPATIENT = "Inpatient"
+
+
+class Facility:
+    def __init__(self, name):
+        self.name = name
+
+
+class Item:
+    """Minimal domain item"""
+
+    def __init__(
+        self, name, days_ago, active=True, removed=False, kind=None, site=None
+    ):
+        self.name = name
+        self.when = NOW - timedelta(days=days_ago) if days_ago is not None else None
+        self.is_active = active
+        self.removed = removed
+        self.kind = kind
+        self.facility = Facility(site) if site else None
+
+
+ITEMS = [
+    Item("a", 1, kind=Kind.OUTPATIENT, site="CAMP MASTER"),
+    Item("b", 5, active=False, kind="inpatient", site="CAMP BEE"),
+    Item("c", 10, removed=True, kind=Kind.INPATIENT),
+    Item("d", 40, kind=Kind.OUTPATIENT, site="camp master annex"),
+    Item("undated", None),
+]
+
+
+def names(items):
+    return [item.name for item in items]
+
+
+class TestFilters:
+    """Test filter compilation"""
+
+    def test_disabled_filters_compile_to_nothing(self):
+        """Test that unset arguments add no predicate"""
+        query = Query(
+            flag("is_active", False),
+            unflagged("removed", False),
+            equals("kind", None),
+            contains("name", ""),
+            where(None),
+        )
+
+        assert query.predicate is None
+        assert names(query.all(ITEMS)) == names(ITEMS)
+
+    def test_flags_and_conjunction(self):
+        """Test that every active filter must match"""
+        query = Query(flag("is_active"), unflagged("removed"))
+
+        assert names(query.all(ITEMS)) == ["a", "d", "undated"]
+
+    def test_equals_ignores_case_and_enum_names(self):
+        """Test case-insensitive equality against enum values and strings"""
+        query = Query(equals("kind", "INPATIENT", ignore_case=True))
+
+        assert names(query.all(ITEMS)) == ["b", "c"]
+        assert names(Query(equals("name", "a")).all(ITEMS)) == ["a"]
+
+    def test_contains_follows_dotted_paths(self):
+        """Test substring matching through a possibly missing parent"""
+        query = Query(contains("facility.name", "master"))
+
+        assert names(query.all(ITEMS)) == ["a", "d"]
+
+
+class TestQuery:
+    """Test date windows, ordering and paging"""
+
+    def test_window_on_list_and_time_index(self):
+        """Test that a date window gives the same items from either source"""
+        query = Query(
+            flag("is_active"), since=NOW - timedelta(days=30), time_attr="when"
+        )
+        index = TimeIndex(ITEMS, lambda item: item.when)
+
+        assert names(query.all(ITEMS)) == ["a", "c"]
+        # The index yields newest first
+        assert names(query.all(index)) == ["a", "c"]
+        bounded = Query(since=NOW - timedelta(days=20), until=NOW - timedelta(days=2))
+        assert names(bounded.all(index)) == ["b", "c"]
+
+    def test_window_on_list_requires_time_attr(self):
+        """Test that a list source cannot be windowed without time_attr"""
+        with pytest.raises(ValueError):
+            Query(since=NOW).all(ITEMS)
+
+    def test_page_counts_all_matches(self):
+        """Test that a page stops early but still counts every match"""
+        query = Query(flag("is_active"))
+
+        assert query.page(iter(ITEMS), offset=1, limit=2) == (
+            [ITEMS[2], ITEMS[3]],
+            4,
+        )
+        assert query.page(ITEMS, offset=10, limit=2) == ([], 4)
+
+    def test_sorted_page_is_stable(self):
+        """Test that sorted pages match a full stable sort"""
+        items = [Item(str(i), i % 3) for i in range(10)]
+        query = Query(order_by=lambda item: item.when, descending=True)
+
+        expected = sorted(items, key=lambda item: item.when, reverse=True)
+        assert query.all(items) == expected
+        assert query.page(items, offset=3, limit=4) == (expected[3:7], 10)
+
+    def test_invalid_page_bounds(self):
+        """Test that bad offsets and limits are rejected"""
+        with pytest.raises(ValueError):
+            paginate(ITEMS, offset=-1)
+        with pytest.raises(ValueError):
+            Query().page(ITEMS, limit=0)
+
+    def test_values_match_literally(self):
+        """Test that filter values are compared as data and paths validated"""
+        tricky = Item("{v0}) or (True", 1)
+        query = Query(equals("name", "{v0}) or (True"))
+
+        assert query.all([*ITEMS, tricky]) == [tricky]
+        with pytest.raises(ValueError):
+            flag("is_active or True")
+
+    def test_most_recent_keeps_both_bounds(self):
+        """Test that n most recent per series honours since and until"""
+        index = SeriesIndex(ITEMS, lambda item: "all", lambda item: item.when)
+        query = Query(since=NOW - timedelta(days=20), until=NOW - timedelta(days=2))
+
+        assert names(query.most_recent(index, 1)) == ["b"]
+        assert names(query.most_recent(index, 5)) == ["b", "c"]
@@ -0,0 +1,72 @@
+"""Tests for retaining the raw VPR payload of parsed patient data"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.parsers.patient import raw_data
+from src.services.parsers.patient.patient_parser import parse_vpr_patient_data
+from src.services.parsers.patient.raw_data import RawDataSpill
+
+ICN = "1000220000V123456"
+
+VPR_PAYLOAD = {
+    "data": {
+        "items": [
+            {
+                "uid": "urn:va:patient:500:100022:100022",
+                "localId": 100022,
+                "dfn": "100022",
+                "icn": ICN,
+                "fullName": "PATIENT,TEST",
+                "familyName": "PATIENT",
+                "givenNames": "TEST",
+                "genderCode": "urn:va:pat-gender:M",
+                "genderName": "Male",
+                "dateOfBirth": 19350407,
+                "ssn": 666001001,
+            }
+        ]
+    }
+}
+
+
+class TestRawDataRetention:
+    """Test the RAW_DATA_RETENTION modes"""
+
+    @pytest.fixture(autouse=True)
+    def spill_ring(self, tmp_path):
+        """Spill into a temporary directory"""
+        self.spill = RawDataSpill(tmp_path, max_files=2)
+        with patch.object(raw_data, "_spill_instance", self.spill):
+            yield
+
+    @pytest.mark.parametrize("mode", ["off", "unknown"])
+    def test_dropped_by_default(self, mode):
+        """Test that the payload is not held or written"""
+        with patch.object(raw_data, "RAW_DATA_RETENTION", mode):
+            collection = parse_vpr_patient_data(VPR_PAYLOAD, "500", ICN)
+
+        assert collection.raw_data is None
+        assert collection.raw_data_path is None
+        assert list(self.spill.directory.iterdir()) == []
+
+    def test_keep(self):
+        """Test that the payload is held on the collection"""
+        with patch.object(raw_data, "RAW_DATA_RETENTION", "keep"):
+            collection = parse_vpr_patient_data(VPR_PAYLOAD, "500", ICN)
+
+        assert collection.raw_data == VPR_PAYLOAD
+
+    def test_spill_ring(self):
+        """Test that spilled payloads round-trip and only the newest are kept"""
+        with patch.object(raw_data, "RAW_DATA_RETENTION", "spill"):
+            paths = [
+                parse_vpr_patient_data(VPR_PAYLOAD, "500", ICN).raw_data_path
+                for _ in range(3)
+            ]
+        self.spill.flush()
+
+        spilled = sorted(str(path) for path in self.spill.directory.iterdir())
+        assert spilled == paths[1:]
+        assert RawDataSpill.load(paths[2]) == VPR_PAYLOAD
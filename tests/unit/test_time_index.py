@@ -0,0 +1,229 @@
+"""Tests for time-sorted and per-type patient collection indexes"""
+
+from datetime import UTC, datetime, timedelta
+
+from src.models.patient import (
+    PatientDataCollection,
+    PatientDemographics,
+    SeriesIndex,
+    TimeIndex,
+    UidIndex,
+)
+from src.models.patient.clinical import VitalSign
+from src.models.patient.collection import DOMAIN_FIELDS
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+class Stamped:
+    """Minimal item with an optional timestamp"""
+
+    def __init__(self, name, when, kind="", flagged=False):
+        self.name = name
+        self.when = when
+        self.kind = kind
+        self.flagged = flagged
+
+
+def make_vital(uid: str, observed: datetime) -> VitalSign:
+    return VitalSign(
+        uid=uid,
+        localId=uid,
+        typeCode="urn:va:vuid:4500635",
+        typeName="PULSE",
+        displayName="P",
+        result="72",
+        observed=observed,
+        resulted=observed,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+    )
+
+
+class TestTimeIndex:
+    """Test bisect-based date windows"""
+
+    def test_since_returns_newest_first(self):
+        """Test window boundaries and ordering regardless of input order"""
+        items = [
+            Stamped(str(days), NOW - timedelta(days=days)) for days in (5, 1, 30, 10)
+        ]
+        index = TimeIndex(items, lambda item: item.when)
+
+        assert [item.name for item in index.items] == ["1", "5", "10", "30"]
+        assert [item.name for item in index.since(NOW - timedelta(days=10))] == [
+            "1",
+            "5",
+            "10",
+        ]
+        assert index.since(NOW) == []
+        assert len(index.since(NOW - timedelta(days=365))) == 4
+
+    def test_between_and_missing_timestamps(self):
+        """Test closed ranges and that undated items are left out"""
+        items = [
+            Stamped("a", NOW - timedelta(days=1)),
+            Stamped("undated", None),
+            Stamped("b", NOW - timedelta(days=3)),
+            Stamped("c", NOW - timedelta(days=3)),
+        ]
+        index = TimeIndex(items, lambda item: item.when)
+
+        assert len(index) == 3
+        # Ties keep their original order
+        assert [
+            item.name
+            for item in index.between(NOW - timedelta(days=3), NOW - timedelta(days=2))
+        ] == ["b", "c"]
+
+
+class TestSeriesIndex:
+    """Test n-most-recent-per-type queries"""
+
+    def make_index(self):
+        items = [
+            Stamped("a1", NOW - timedelta(days=1), "A"),
+            Stamped("b1", NOW - timedelta(days=2), "B", flagged=True),
+            Stamped("a2", NOW - timedelta(days=3), "A", flagged=True),
+            Stamped("b2", NOW - timedelta(days=40), "B"),
+            Stamped("a3", NOW - timedelta(days=50), "A", flagged=True),
+        ]
+        return SeriesIndex(items, lambda item: item.kind, lambda item: item.when)
+
+    def test_most_recent_per_series(self):
+        """Test per-series limits, windows and series ordering"""
+        index = self.make_index()
+
+        assert [item.name for item in index.most_recent(2)] == ["a1", "a2", "b1", "b2"]
+        assert [
+            item.name for item in index.most_recent(5, since=NOW - timedelta(days=30))
+        ] == ["a1", "a2", "b1"]
+
+    def test_item_and_series_filters(self):
+        """Test that filters select within and between series"""
+        index = self.make_index()
+
+        # The newest flagged B is newer than the newest flagged A
+        assert [
+            item.name for item in index.most_recent(1, where=lambda i: i.flagged)
+        ] == ["b1", "a2"]
+        assert [
+            item.name
+            for item in index.most_recent(
+                3, series_filter=lambda item: item.kind == "B"
+            )
+        ] == ["b1", "b2"]
+
+
+class TestUidIndex:
+    """Test UidIndex"""
+
+    def test_prefix_patterns_and_limit(self):
+        """Test exact and prefix lookups in request order"""
+        index = UidIndex(
+            {
+                "labs": {
+                    "urn:va:lab:500:1": "lab1",
+                    "urn:va:lab:500:2": "lab2",
+                    "urn:va:lab:501:1": "other",
+                },
+                "vitals": {"urn:va:vital:500:1": "vital"},
+            }
+        )
+
+        assert index.get_many(["urn:va:vital:500:1", "urn:va:lab:500:*", "x"]) == {
+            "urn:va:vital:500:1": "vital",
+            "urn:va:lab:500:1": "lab1",
+            "urn:va:lab:500:2": "lab2",
+        }
+        assert list(index.get_many(["urn:va:lab:*"], limit=2)) == [
+            "urn:va:lab:500:1",
+            "urn:va:lab:500:2",
+        ]
+
+    def test_replace_domain(self):
+        """Test that replacing one domain leaves the others untouched"""
+        index = UidIndex({"labs": {"a": 1, "b": 2}, "vitals": {"v": 3}})
+
+        index.replace_domain("labs", {"b": 20, "c": 30})
+
+        assert dict(index.items) == {"b": 20, "c": 30, "v": 3}
+        assert "a" not in index
+        assert index.with_prefix("") == ["b", "c", "v"]
+
+
+class TestCollectionIndexes:
+    """Test indexes on PatientDataCollection"""
+
+    def test_indexes_survive_rehydration(self):
+        """Test that indexes are rebuilt after a JSON round trip"""
+        vitals = {
+            f"v{days}": make_vital(f"v{days}", NOW - timedelta(days=days))
+            for days in (40, 2, 15)
+        }
+        collection = PatientDataCollection(
+            demographics=PatientDemographics(
+                uid="urn:va:patient:500:237",
+                dfn="237",
+                pid="500;237",
+                icn="1008684701V329302",
+                fullName="PATIENT,TEST",
+                familyName="PATIENT",
+                givenNames="TEST",
+                displayName="PATIENT,TEST",
+                genderCode="M",
+                genderName="Male",
+                dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+                ssn="666001001",
+                sensitive=False,
+                deceased=False,
+            ),
+            vital_signs_dict=vitals,
+            source_station="500",
+            source_icn="1234567890V123456",
+        )
+
+        restored = PatientDataCollection.model_validate_json(
+            collection.model_dump_json()
+        )
+
+        for data in (collection, restored):
+            recent = data.vital_signs_by_time.since(NOW - timedelta(days=30))
+            assert [vital.uid for vital in recent] == ["v2", "v15"]
+            latest = data.vital_signs_by_type.most_recent(1)
+            assert [vital.uid for vital in latest] == ["v2"]
+
+    def test_uid_index_covers_all_domains(self):
+        """Test that every domain dict is reachable by UID"""
+        collection = PatientDataCollection(
+            demographics=PatientDemographics(
+                uid="urn:va:patient:500:237",
+                dfn="237",
+                pid="500;237",
+                icn="1008684701V329302",
+                fullName="PATIENT,TEST",
+                familyName="PATIENT",
+                givenNames="TEST",
+                displayName="PATIENT,TEST",
+                genderCode="M",
+                genderName="Male",
+                dateOfBirth=datetime(1935, 4, 7, tzinfo=UTC).date(),
+                ssn="666001001",
+                sensitive=False,
+                deceased=False,
+            ),
+            vital_signs_dict={"v1": make_vital("v1", NOW)},
+            source_station="500",
+            source_icn="1234567890V123456",
+        )
+        assert set(DOMAIN_FIELDS) == {
+            name
+            for name in PatientDataCollection.model_fields
+            if name.endswith("_dict")
+        }
+
+        collection.vital_signs_dict["v2"] = make_vital("v2", NOW)
+        assert "v2" not in collection.all_items
+        collection.rebuild_indexes(["vital_signs_dict"])
+        assert set(collection.all_items) == {"v1", "v2"}
+        assert len(collection.vital_signs_by_time) == 2
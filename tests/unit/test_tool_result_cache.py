@@ -0,0 +1,142 @@
+"""Tests for the tool result cache and its middleware"""
+
+from datetime import UTC, datetime
+
+import pytest
+from fastmcp import Client, FastMCP
+
+import src.middleware.result_cache_middleware as middleware_module
+from src.middleware.result_cache_middleware import ToolResultCacheMiddleware
+from src.services.cache.results import ToolResultCache
+
+
+class TestToolResultCache:
+    """Test keys, memory bound and statistics"""
+
+    def test_key_ignores_argument_order(self):
+        """Test that equal arguments give equal keys"""
+        key = ToolResultCache.make_key("tool", {"a": 1, "b": 2}, "500", "1", "v1")
+
+        assert key == ToolResultCache.make_key(
+            "tool", {"b": 2, "a": 1}, "500", "1", "v1"
+        )
+        assert key != ToolResultCache.make_key(
+            "tool", {"a": 1, "b": 2}, "500", "2", "v1"
+        )
+        assert key != ToolResultCache.make_key(
+            "tool", {"a": 1, "b": 2}, "500", "1", "v2"
+        )
+
+    def test_total_payload_size_is_bounded(self):
+        """Test that the oldest results are evicted past max_bytes"""
+        cache = ToolResultCache(max_bytes=100)
+
+        for key in ("a", "b", "c"):
+            assert cache.put(key, "x" * 40)
+        assert not cache.put("d", "x" * 101)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 80
+        assert cache.get("tool", "a") is None
+
+    def test_hit_rate_per_tool(self):
+        """Test that hits and misses are counted per tool"""
+        cache = ToolResultCache()
+        cache.put("k", "{}")
+
+        cache.get("labs", "k")
+        cache.get("labs", "missing")
+        cache.get("vitals", "missing")
+
+        assert cache.get_stats()["tools"] == {
+            "labs": {"hits": 1, "misses": 1, "hit_rate": 0.5},
+            "vitals": {"hits": 0, "misses": 1, "hit_rate": 0.0},
+        }
+
+
+@pytest.fixture
+def cached_server(monkeypatch):
+    """Server with one patient tool behind the result cache middleware"""
+    cache = ToolResultCache()
+    versions = {"current": "v1"}
+    calls = []
+
+    async def _version(station, patient_icn, caller_duz):
+        return versions["current"]
+
+    monkeypatch.setattr(middleware_module, "get_tool_result_cache", lambda: cache)
+    monkeypatch.setattr(middleware_module, "get_patient_data_version", _version)
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(ToolResultCacheMiddleware())
+
+    @mcp.tool()
+    async def get_patient_thing(patient_icn: str, limit: int = 5) -> dict:
+        calls.append(limit)
+        now = datetime.now(UTC).isoformat()
+        return {
+            "success": True,
+            "call": len(calls),
+            "metadata": {
+                "performance": {"duration_ms": 5, "start_time": now, "end_time": now}
+            },
+        }
+
+    return mcp, cache, versions, calls
+
+
+class TestToolResultCacheMiddleware:
+    """Test serving repeated calls from the cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_with_its_own_timing(self, cached_server):
+        """Test that a repeat (even with explicit defaults) skips the tool"""
+        mcp, cache, _, calls = cached_server
+
+        async with Client(mcp) as client:
+            first = await client.call_tool("get_patient_thing", {"patient_icn": "1"})
+            second = await client.call_tool(
+                "get_patient_thing", {"patient_icn": "1", "limit": 5}
+            )
+
+        assert calls == [5]
+        assert second.structured_content["call"] == 1
+        performance = second.structured_content["metadata"]["performance"]
+        assert performance["result_cache_age_ms"] >= 0
+        assert performance["start_time"] != (
+            first.structured_content["metadata"]["performance"]["start_time"]
+        )
+        assert cache.get_stats()["tools"]["get_patient_thing"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_data_version_rebuilds(self, cached_server):
+        """Test that refreshed patient data is never served an old result"""
+        mcp, _, versions, calls = cached_server
+
+        async with Client(mcp) as client:
+            await client.call_tool("get_patient_thing", {"patient_icn": "1"})
+            versions["current"] = "v2"
+            result = await client.call_tool("get_patient_thing", {"patient_icn": "1"})
+
+        assert calls == [5, 5]
+        assert result.structured_content["call"] == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_during_call_is_not_stored(self, cached_server, monkeypatch):
+        """Test that a result is not stored under the version read before a refresh"""
+        mcp, cache, _, calls = cached_server
+        reads = iter(["v1", "v2"])
+
+        async def _version(station, patient_icn, caller_duz):
+            return next(reads, "v2")
+
+        monkeypatch.setattr(middleware_module, "get_patient_data_version", _version)
+
+        async with Client(mcp) as client:
+            await client.call_tool("get_patient_thing", {"patient_icn": "1"})
+            assert cache.get_stats()["entries"] == 0
+            await client.call_tool("get_patient_thing", {"patient_icn": "1"})
+
+        assert calls == [5, 5]
+        assert cache.get_stats()["entries"] == 1
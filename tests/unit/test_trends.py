@@ -0,0 +1,87 @@
+"""Tests for columnar numeric series and trend summaries"""
+
+from datetime import UTC, datetime, timedelta
+
+from src.models.patient import SeriesIndex
+from src.models.patient.clinical import VitalSign
+from src.models.patient.trends import build_numeric_series
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_vital(
+    index: int,
+    type_name: str,
+    result: str,
+    days_ago: float,
+    low: float | None = None,
+    high: float | None = None,
+) -> VitalSign:
+    uid = f"urn:va:vital:500:{index}"
+    observed = NOW - timedelta(days=days_ago)
+    return VitalSign(
+        uid=uid,
+        localId=str(index),
+        typeCode=f"urn:va:vuid:{type_name}",
+        typeName=type_name,
+        displayName=type_name[:2],
+        result=result,
+        low=low,
+        high=high,
+        observed=observed,
+        resulted=observed,
+        facilityCode="500",
+        facilityName="CAMP MASTER",
+    )
+
+
+def build(vitals: list[VitalSign]):
+    index = SeriesIndex(
+        vitals, lambda vital: vital.type_code, lambda vital: vital.observed
+    )
+    return {series.name: series for series in build_numeric_series(index)}
+
+
+class TestNumericSeries:
+    """Test NumericSeries and build_numeric_series"""
+
+    def test_summary_statistics_and_streaks(self):
+        """Test min/max/mean, slope, baseline delta and out-of-range streaks"""
+        values = [90, 110, 120, 95, 105, 115]
+        vitals = [
+            make_vital(i, "PULSE", str(value), days_ago=365 - i * 73, high=100)
+            for i, value in enumerate(values)
+        ]
+        vitals.append(make_vital(99, "PULSE", "REFUSED", days_ago=1))
+
+        summary = build(vitals)["PULSE"].summarize()
+
+        assert summary is not None
+        assert summary.count == 6
+        assert (summary.min, summary.max, summary.latest) == (90, 120, 115)
+        assert summary.mean == 105.83
+        assert summary.baseline == 90
+        assert summary.delta_from_baseline == 25
+        assert summary.slope_per_year is not None and summary.slope_per_year > 0
+        assert summary.out_of_range_count == 4
+        assert summary.longest_out_of_range_streak == 2
+        assert summary.current_out_of_range_streak == 2
+
+    def test_window_and_blood_pressure_split(self):
+        """Test that blood pressure is split and the window excludes old points"""
+        vitals = [
+            make_vital(1, "BLOOD PRESSURE", "150/95", days_ago=400),
+            make_vital(2, "BLOOD PRESSURE", "140/90", days_ago=60),
+            make_vital(3, "BLOOD PRESSURE", "130/80", days_ago=30),
+        ]
+
+        series = build(vitals)
+        since = NOW - timedelta(days=365)
+        systolic = series["BLOOD PRESSURE SYSTOLIC"].summarize(since)
+        diastolic = series["BLOOD PRESSURE DIASTOLIC"].summarize(since)
+
+        assert "BLOOD PRESSURE" not in series
+        assert systolic is not None and diastolic is not None
+        assert (systolic.count, systolic.baseline, systolic.latest) == (2, 140, 130)
+        assert diastolic.delta_from_baseline == -10
+        assert series["BLOOD PRESSURE SYSTOLIC"].summarize(NOW) is None